@@ -0,0 +1,153 @@
+"""
+Compares the time `re_create_id_set` takes over a content repository with the time it takes in a baseline version of
+demisto-sdk (checked out from a git ref of this repository), and ensures both create the same id_set.
+
+Every run is done in a new process, from the content repository, with the same hash seed.
+
+Usage:
+    python benchmarks/id_set_creation.py [--content-path PATH] [--baseline-ref REF] [--repeat N] [--marketplace MP]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from tabulate import tabulate
+
+SDK_PATH = Path(__file__).resolve().parent.parent
+
+
+def create_id_set(output_dir: Path, marketplace: str):
+    """
+    Runs in the benchmarked process: creates the id_set of the current directory, and writes it (like **create-id-set**
+    does), its excluded items and the time it took to the output directory.
+    """
+    from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+    from demisto_sdk.commands.common.update_id_set import re_create_id_set
+
+    start = time.perf_counter()
+    id_set, excluded_items_by_pack, excluded_items_by_type = re_create_id_set(
+        id_set_path=None, print_logs=False, marketplace=marketplace
+    )
+    duration = time.perf_counter() - start
+    with open(output_dir / "id_set.json", "w") as id_set_file:
+        json.dump(id_set, id_set_file, indent=4)
+    with open(output_dir / "excluded_items.json", "w") as excluded_items_file:
+        json.dump(
+            {
+                "by_pack": {
+                    pack: sorted(map(list, items))
+                    for pack, items in excluded_items_by_pack.items()
+                },
+                "by_type": {
+                    item_type: sorted(items)
+                    for item_type, items in excluded_items_by_type.items()
+                },
+            },
+            excluded_items_file,
+            indent=4,
+        )
+    (output_dir / "duration").write_text(str(duration))
+
+
+def run(sdk_path: Path, content_path: Path, marketplace: str) -> Tuple[float, bytes]:
+    """Creates the id_set with the demisto-sdk at `sdk_path`, returns the time it took and its output."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--create-id-set",
+                output_dir,
+                "--marketplace",
+                marketplace,
+            ],
+            cwd=content_path,
+            env={
+                **os.environ,
+                "PYTHONPATH": str(sdk_path),
+                "DEMISTO_SDK_ID_SET_REFRESH_INTERVAL": "-1",
+                # some lists of the id_set are built from sets, in the order of their hashes
+                "PYTHONHASHSEED": "0",
+            },
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        output_path = Path(output_dir)
+        return (
+            float((output_path / "duration").read_text()),
+            (output_path / "id_set.json").read_bytes()
+            + (output_path / "excluded_items.json").read_bytes(),
+        )
+
+
+def checkout(ref: str, path: Path):
+    subprocess.run(
+        ["git", "worktree", "add", "--detach", str(path), ref],
+        cwd=SDK_PATH,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def remove_checkout(path: Path):
+    subprocess.run(
+        ["git", "worktree", "remove", "--force", str(path)],
+        cwd=SDK_PATH,
+        check=False,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--content-path", type=Path, default=Path.cwd())
+    parser.add_argument("--baseline-ref", default="HEAD")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--marketplace", default="")
+    parser.add_argument("--create-id-set", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.create_id_set:
+        create_id_set(args.create_id_set, args.marketplace)
+        return
+
+    baseline_path = Path(tempfile.mkdtemp()) / "demisto-sdk"
+    checkout(args.baseline_ref, baseline_path)
+    try:
+        versions = {
+            f"baseline ({args.baseline_ref})": baseline_path,
+            "current": SDK_PATH,
+        }
+        outputs: Dict[str, bytes] = {}
+        results: List[list] = []
+        for name, sdk_path in versions.items():
+            best = float("inf")
+            for _ in range(args.repeat):
+                duration, outputs[name] = run(
+                    sdk_path, args.content_path.resolve(), args.marketplace
+                )
+                best = min(best, duration)
+            results.append([name, f"{best:.2f}"])
+    finally:
+        remove_checkout(baseline_path)
+
+    baseline = float(results[0][1])
+    for row in results:
+        row.append(f"{baseline / float(row[1]):.2f}x")
+    print(  # noqa: T201
+        f"Created the id_set of {args.content_path}, best of {args.repeat} runs\n"
+        + tabulate(results, headers=["Version", "Total (s)", "Speedup"])
+    )
+    baseline_output, current_output = outputs.values()
+    if baseline_output != current_output:
+        print("\nThe id_sets are different")  # noqa: T201
+        raise SystemExit(1)
+    print("\nThe id_sets are identical")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
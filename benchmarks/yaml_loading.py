@@ -0,0 +1,116 @@
+"""
+Compares the YAML loaders used by `get_file` over the integration ymls of a content repository.
+
+Usage:
+    python -m benchmarks.yaml_loading [--content-path PATH] [--glob GLOB] [--repeat N]
+"""
+import argparse
+import io
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from tabulate import tabulate
+
+from demisto_sdk.commands.common.handlers import LIBYAML_Handler, YAML_Handler
+
+LOAD_ERROR = "<failed to load>"
+DEFAULT_GLOBS = ("Packs/*/Integrations/*/*.yml", "demisto_sdk/tests/test_files/*.yml")
+
+ruamel_rt = YAML_Handler()
+ruamel_safe = YAML_Handler(typ="safe")
+libyaml = LIBYAML_Handler()
+
+
+def load_ruamel_round_trip(text: str):
+    return ruamel_rt.load(
+        io.StringIO(re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', text))
+    )
+
+
+def load_ruamel_safe(text: str):
+    """The read-only loading path of `get_file` before the libyaml handler."""
+    return ruamel_safe.load(
+        io.StringIO(re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', text))
+    )
+
+
+def load_libyaml(text: str):
+    return libyaml.load(text)
+
+
+LOADERS: Dict[str, Callable] = {
+    "ruamel round-trip (keep_order=True)": load_ruamel_round_trip,
+    "ruamel safe (previous keep_order=False)": load_ruamel_safe,
+    "libyaml (keep_order=False)": load_libyaml,
+}
+
+
+def safe_load(loader: Callable, text: str):
+    try:
+        return loader(text)
+    except Exception:
+        # invalid files are expected to fail in all the loaders
+        return LOAD_ERROR
+
+
+def collect_files(content_path: Path, globs: List[str]) -> List[Path]:
+    for pattern in globs:
+        if files := sorted(content_path.glob(pattern)):
+            return files
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--content-path", type=Path, default=Path.cwd())
+    parser.add_argument("--glob", action="append", dest="globs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = collect_files(args.content_path, args.globs or list(DEFAULT_GLOBS))
+    if not files:
+        raise SystemExit(f"No yml files found under {args.content_path}")
+    texts = [file.read_text(encoding="utf8") for file in files]
+
+    results = []
+    loaded: Dict[str, list] = {}
+    for name, loader in LOADERS.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            loaded[name] = [safe_load(loader, text) for text in texts]
+            best = min(best, time.perf_counter() - start)
+        results.append([name, f"{best:.3f}", f"{best / len(texts) * 1000:.2f}"])
+
+    baseline = float(results[1][1])
+    for row in results:
+        row.append(f"{baseline / float(row[1]):.2f}x")
+    mismatches = [
+        str(file)
+        for file, old, new in zip(
+            files,
+            loaded["ruamel safe (previous keep_order=False)"],
+            loaded["libyaml (keep_order=False)"],
+        )
+        if old != new
+    ]
+
+    print(  # noqa: T201
+        f"Loaded {len(files)} files, best of {args.repeat} runs "
+        f"(libyaml {'available' if libyaml.is_accelerated else 'NOT available'})\n"
+        + tabulate(
+            results,
+            headers=["Loader", "Total (s)", "Per file (ms)", "Speedup vs ruamel safe"],
+        )
+    )
+    if mismatches:
+        print(  # noqa: T201
+            f"\n{len(mismatches)} files loaded differently:\n" + "\n".join(mismatches)
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
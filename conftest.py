@@ -9,6 +9,21 @@ from _pytest.fixtures import FixtureRequest
 from _pytest.tmpdir import TempPathFactory, _mk_tmp
 
 import demisto_sdk.commands.common.tools as tools
+from demisto_sdk.commands.common.content_hash_index import ContentHashIndex
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+from demisto_sdk.commands.common.docker_helper import (
+    DockerImagesMetadataStore,
+    set_docker_images_metadata_store,
+)
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    clear_file_flags_cache,
+)
+from demisto_sdk.commands.common.http_client import HttpClient, set_http_client
+from demisto_sdk.commands.validate.parallel_validation import (
+    ValidationDurationsStore,
+    set_validation_durations_store,
+)
 from TestSuite.integration import Integration
 from TestSuite.json_based import JSONBased
 from TestSuite.pack import Pack
@@ -146,4 +161,12 @@ def mock_update_id_set_cpu_count() -> Generator:
 
 @pytest.fixture(autouse=True)
 def clear_cache():
-    tools.get_file.cache_clear()
+    tools.get_file_cache().clear()
+    ContentRepoIndex.clear()
+    ContentHashIndex.clear()
+    GitObjectReader.clear()
+    clear_file_flags_cache()
+    # a fresh client for every test, without the on-disk response cache, and without retrying the unreachable hosts
+    set_http_client(HttpClient(retries=0))
+    set_docker_images_metadata_store(DockerImagesMetadataStore())
+    set_validation_durations_store(ValidationDurationsStore())
@@ -8,9 +8,6 @@ from pathlib import Path
 from typing import IO, Any, Dict, Iterable, Tuple, Union
 
 import click
-import git
-import typer
-from pkg_resources import DistributionNotFound, get_distribution
 
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
@@ -18,40 +15,14 @@ from demisto_sdk.commands.common.constants import (
     FileType,
     MarketplaceVersions,
 )
-from demisto_sdk.commands.common.content_constant_paths import (
-    ALL_PACKS_DEPENDENCIES_DEFAULT_PATH,
-    CONTENT_PATH,
-)
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
-from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
-from demisto_sdk.commands.common.logger import handle_deprecated_args, logging_setup
-from demisto_sdk.commands.common.tools import (
-    find_type,
-    get_last_remote_release_version,
-    get_release_note_entries,
-    is_external_repository,
-    is_sdk_defined_working_offline,
-    parse_marketplace_kwargs,
-)
-from demisto_sdk.commands.content_graph.commands.create import create
-from demisto_sdk.commands.content_graph.commands.get_relationships import (
-    get_relationships,
-)
-from demisto_sdk.commands.content_graph.commands.update import update
-from demisto_sdk.commands.content_graph.objects.repository import all_content_repo
-from demisto_sdk.commands.generate_modeling_rules import generate_modeling_rules
-from demisto_sdk.commands.prepare_content.prepare_upload_manager import (
-    PrepareUploadManager,
-)
-from demisto_sdk.commands.split.ymlsplitter import YmlSplitter
-from demisto_sdk.commands.test_content.test_modeling_rule import (
-    init_test_data,
-    test_modeling_rule,
-)
-from demisto_sdk.commands.upload.upload import upload_content_entity
+from demisto_sdk.utils.lazy_group import LazyGroup
 from demisto_sdk.utils.utils import check_configuration_file
 
+# Command implementations are imported inside the commands, so that running one command (or --help)
+# does not import the implementation of all the others. See demisto_sdk/tests/import_time_test.py.
+
 SDK_OFFLINE_ERROR_MESSAGE = (
     "[red]An internet connection is required for this command. If connected to the "
     "internet, un-set the DEMISTO_SDK_OFFLINE_ENV environment variable.[/red]"
@@ -151,6 +122,11 @@ def logging_setup_decorator(func, *args, **kwargs):
     )
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        from demisto_sdk.commands.common.logger import (
+            handle_deprecated_args,
+            logging_setup,
+        )
+
         logging_setup(
             console_log_threshold=kwargs.get("console-log-threshold") or logging.INFO,
             file_log_threshold=kwargs.get("file-log-threshold") or logging.DEBUG,
@@ -164,6 +140,7 @@ def logging_setup_decorator(func, *args, **kwargs):
 
 
 @click.group(
+    cls=LazyGroup,
     invoke_without_command=True,
     no_args_is_help=True,
     context_settings=dict(max_content_width=100),
@@ -188,6 +165,17 @@ def logging_setup_decorator(func, *args, **kwargs):
 @pass_config
 @click.pass_context
 def main(ctx, config, version, release_notes, **kwargs):
+    from pkg_resources import DistributionNotFound, get_distribution
+
+    from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+    from demisto_sdk.commands.common.logger import handle_deprecated_args, logging_setup
+    from demisto_sdk.commands.common.tools import (
+        check_last_remote_release_version_in_background,
+        get_cached_last_remote_release_version,
+        get_release_note_entries,
+        is_sdk_defined_working_offline,
+    )
+
     logging_setup(
         console_log_threshold=kwargs.get("console-log-threshold", logging.INFO),
         file_log_threshold=kwargs.get("file-log-threshold", logging.DEBUG),
@@ -216,7 +204,9 @@ def main(ctx, config, version, release_notes, **kwargs):
             if not os.environ.get(
                 "CI"
             ):  # Check only when not running in CI (e.g running locally).
-                last_release = get_last_remote_release_version()
+                # the banner uses the version found by a previous check, the check itself never delays the command
+                last_release = get_cached_last_remote_release_version()
+                check_last_remote_release_version_in_background()
             logger.info(f"[yellow]You are using demisto-sdk {__version__}.[/yellow]")
             if last_release and __version__ != last_release:
                 logger.info(
@@ -285,7 +275,9 @@ def split(ctx, config, **kwargs):
     """Split the code, image and description files from a Demisto integration or script yaml file
     to multiple files(To a package format - https://demisto.pan.dev/docs/package-dir).
     """
+    from demisto_sdk.commands.common.tools import find_type
     from demisto_sdk.commands.split.jsonsplitter import JsonSplitter
+    from demisto_sdk.commands.split.ymlsplitter import YmlSplitter
 
     check_configuration_file("split", kwargs)
     file_type: FileType = find_type(kwargs.get("input", ""), ignore_sub_categories=True)
@@ -347,6 +339,7 @@ def split(ctx, config, **kwargs):
 @logging_setup_decorator
 def extract_code(ctx, config, **kwargs):
     """Extract code from a Demisto integration or script yaml file."""
+    from demisto_sdk.commands.common.tools import find_type
     from demisto_sdk.commands.split.ymlsplitter import YmlSplitter
 
     check_configuration_file("extract-code", kwargs)
@@ -427,6 +420,12 @@ def prepare_content(ctx, **kwargs):
     """
     This command is used to prepare the content to be used in the platform.
     """
+    from demisto_sdk.commands.common.tools import find_type, parse_marketplace_kwargs
+    from demisto_sdk.commands.content_graph.objects.repository import all_content_repo
+    from demisto_sdk.commands.prepare_content.prepare_upload_manager import (
+        PrepareUploadManager,
+    )
+
     assert (
         sum([bool(kwargs["all"]), bool(kwargs["input"])]) == 1
     ), "Exactly one of the '-a' or '-i' parameters must be provided."
@@ -528,6 +527,7 @@ main.add_command(prepare_content, name="unify")
 @logging_setup_decorator
 def zip_packs(ctx, **kwargs) -> int:
     """Generating zipped packs that are ready to be uploaded to Cortex XSOAR machine."""
+    from demisto_sdk.commands.common.tools import parse_marketplace_kwargs
     from demisto_sdk.commands.upload.uploader import Uploader
     from demisto_sdk.commands.zip_packs.packs_zipper import (
         EX_FAIL,
@@ -705,22 +705,67 @@ def zip_packs(ctx, **kwargs) -> int:
 )
 @click.option(
     "--no-multiprocessing",
-    help="run validate all without multiprocessing, for debugging purposes.",
+    help="run validate without multiprocessing, for debugging purposes.",
     is_flag=True,
     default=False,
 )
+@click.option(
+    "--jobs",
+    help="The number of processes to validate with. Defaults to the number of CPUs.",
+    type=click.IntRange(min=1),
+)
 @click.option(
     "-sv",
     "--run-specific-validations",
     help="Run specific validations by stating the error codes.",
     is_flag=False,
 )
+@click.option(
+    "--profile",
+    help="Measure the time of every validation, by validator, file type and pack, and write the report to this "
+    "JSON file path. The slowest validations are also printed.",
+    type=click.Path(dir_okay=False, resolve_path=True),
+)
+@click.option(
+    "--profile-trace",
+    help="Measure the time of every validation, and write a trace of the validated files and validations to this "
+    "file path, in the Chrome trace format (open it with chrome://tracing or https://ui.perfetto.dev).",
+    type=click.Path(dir_okay=False, resolve_path=True),
+)
+@click.option(
+    "--use-cache",
+    help="Replay the results of the files which did not change since an earlier run on this machine (in the last day), "
+    "instead of validating them again. The content graph and the pack level validations always run.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--daemon",
+    help="Run a validation daemon for this repository, which keeps the repository state, the schemas and the MDX "
+    "server loaded, and validates the paths it is requested to (with --use-daemon, or by editors over its socket) "
+    "with the other options given here. Runs until stopped with ctrl+c.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--use-daemon",
+    help="Validate the input paths with the validation daemon of this repository (see --daemon), with the options "
+    "it was started with. Validates in this process when no daemon is running.",
+    is_flag=True,
+    default=False,
+)
 @click.argument("file_paths", nargs=-1, type=click.Path(exists=True, resolve_path=True))
 @pass_config
 @click.pass_context
 @logging_setup_decorator
 def validate(ctx, config, file_paths: str, **kwargs):
     """Validate your content files. If no additional flags are given, will validated only committed files."""
+    import git
+
+    from demisto_sdk.commands.common.tools import (
+        is_external_repository,
+        is_sdk_defined_working_offline,
+    )
     from demisto_sdk.commands.validate.validate_manager import ValidateManager
 
     if is_sdk_defined_working_offline():
@@ -741,13 +786,37 @@ def validate(ctx, config, file_paths: str, **kwargs):
             "[red]Could not supply the staged flag with the post-commit flag[/red]"
         )
         sys.exit(1)
+    if kwargs["daemon"] and (
+        kwargs.get("validate_all") or kwargs["use_git"] or file_path
+    ):
+        logger.info(
+            "[red]The daemon validates the paths it is requested to, it can not be started with -a, -g or "
+            "input paths[/red]"
+        )
+        sys.exit(1)
+    if kwargs["use_daemon"] and file_path:
+        from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+        from demisto_sdk.commands.validate.daemon import validate_with_daemon
+
+        exit_code = validate_with_daemon(file_path.split(","), CONTENT_PATH)
+        if exit_code is not None:
+            return exit_code
+        logger.info(
+            "[yellow]No validation daemon is running for this repository, validating in this process[/yellow]"
+        )
     try:
         is_external_repo = is_external_repository()
         # default validate to -g --post-commit
-        if not kwargs.get("validate_all") and not kwargs["use_git"] and not file_path:
+        if (
+            not kwargs.get("validate_all")
+            and not kwargs["use_git"]
+            and not file_path
+            and not kwargs["daemon"]
+        ):
             kwargs["use_git"] = True
             kwargs["post_commit"] = True
-        validator = ValidateManager(
+        create_validate_manager = functools.partial(
+            ValidateManager,
             is_backward_check=not kwargs["no_backward_comp"],
             only_committed_files=kwargs["post_commit"],
             prev_ver=kwargs["prev_ver"],
@@ -773,10 +842,23 @@ def validate(ctx, config, file_paths: str, **kwargs):
             include_untracked=kwargs.get("include_untracked"),
             quiet_bc=kwargs.get("quiet_bc_validation"),
             multiprocessing=run_with_mp,
+            jobs=kwargs.get("jobs"),
+            profile_path=kwargs.get("profile"),
+            profile_trace_path=kwargs.get("profile_trace"),
+            use_cache=kwargs.get("use_cache"),
             check_is_unskipped=not kwargs.get("allow_skipped", False),
             specific_validations=kwargs.get("run_specific_validations"),
         )
-        return validator.run_validation()
+        if kwargs["daemon"]:
+            from demisto_sdk.commands.common.content_constant_paths import (
+                CONTENT_PATH,
+            )
+            from demisto_sdk.commands.validate.daemon import ValidationDaemon
+
+            return ValidationDaemon(
+                create_validate_manager, CONTENT_PATH
+            ).serve_forever()
+        return create_validate_manager().run_validation()
     except (git.InvalidGitRepositoryError, git.NoSuchPathError, FileNotFoundError) as e:
         logger.info(f"[red]{e}[/red]")
         logger.info(
@@ -1115,10 +1197,11 @@ def lint(ctx, **kwargs):
 
 # ====================== coverage-analyze ====================== #
 @main.command(
+    short_help="Print and analyze coverage reports.",
     context_settings=dict(
         ignore_unknown_options=True,
         allow_extra_args=True,
-    )
+    ),
 )
 @click.help_option("-h", "--help")
 @click.option(
@@ -1170,6 +1253,8 @@ def lint(ctx, **kwargs):
 )
 @click.pass_context
 def coverage_analyze(ctx, **kwargs):
+    from demisto_sdk.commands.common.logger import logging_setup
+
     logger = logging_setup(
         console_log_threshold=kwargs.get("console-log-threshold") or logging.INFO,
         file_log_threshold=kwargs.get("file-log-threshold") or logging.DEBUG,
@@ -1313,6 +1398,8 @@ def format(
     incidenttype/indicatortype/layout/dashboard/classifier/mapper/widget/report file/genericfield/generictype/
     genericmodule/genericdefinition.
     """
+    from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+    from demisto_sdk.commands.common.tools import is_sdk_defined_working_offline
     from demisto_sdk.commands.format.format_module import format_manager
 
     if is_sdk_defined_working_offline():
@@ -1421,6 +1508,8 @@ def upload(ctx, **kwargs):
     DEMISTO_API_KEY environment variable should contain a valid Demisto API Key.
     * Note: Uploading classifiers to Cortex XSOAR is available from version 6.0.0 and up. *
     """
+    from demisto_sdk.commands.upload.upload import upload_content_entity
+
     return upload_content_entity(**kwargs)
 
 
@@ -1882,6 +1971,7 @@ def generate_outputs(ctx, **kwargs):
 @logging_setup_decorator
 def generate_test_playbook(ctx, **kwargs):
     """Generate test playbook from integration or script"""
+    from demisto_sdk.commands.common.tools import find_type
     from demisto_sdk.commands.generate_test_playbook.test_playbook_generator import (
         PlaybookTestsGenerator,
     )
@@ -1968,6 +2058,7 @@ def init(ctx, **kwargs):
     If the script/integration flags are not present, we will create a pack with the given name.
     Otherwise when using the flags we will generate a script/integration based on your selection.
     """
+    from demisto_sdk.commands.common.tools import parse_marketplace_kwargs
     from demisto_sdk.commands.init.initiator import Initiator
 
     check_configuration_file("init", kwargs)
@@ -2108,7 +2199,7 @@ def generate_docs(ctx, **kwargs):
 
 def _generate_docs_for_file(kwargs: Dict[str, Any]):
     """Helper function for supporting Playbooks directory as an input and not only a single yml file."""
-
+    from demisto_sdk.commands.common.tools import find_type
     from demisto_sdk.commands.generate_docs.generate_integration_doc import (
         generate_integration_doc,
     )
@@ -2281,6 +2372,90 @@ def create_id_set(ctx, **kwargs):
         id_set_creator.save_id_set()
 
 
+# ====================== update-id-set ====================== #
+@main.command(hidden=True)
+@click.help_option("-h", "--help")
+@click.option(
+    "-o",
+    "--output",
+    help="The path of the id set to update, the default is the Tests directory.",
+    default="",
+)
+@click.option(
+    "-p",
+    "--packs",
+    help="A comma separated list of the packs to update. The default is the packs modified since the id set was "
+    "created.",
+    default="",
+)
+@click.option(
+    "-g",
+    "--use-git",
+    help="Update the packs changed in the current branch (including untracked files) instead.",
+    is_flag=True,
+)
+@click.option(
+    "--prev-ver", help="The branch against which to find the changed packs.", default=""
+)
+@click.option(
+    "-fd",
+    "--fail-duplicates",
+    help="Fails the process if any duplicates are found.",
+    is_flag=True,
+)
+@click.pass_context
+@logging_setup_decorator
+def update_id_set(ctx, **kwargs):
+    """Update the content dependency tree by ids with the modified packs only.
+    The id set is created again if it cannot be updated (when it was created by another demisto-sdk version, or
+    content which is not part of a pack was modified)."""
+    from demisto_sdk.commands.common.constants import PACKS_DIR
+    from demisto_sdk.commands.common.git_util import GitUtil
+    from demisto_sdk.commands.common.update_id_set import load_id_set_state
+    from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+    from demisto_sdk.commands.find_dependencies.find_dependencies import (
+        remove_dependencies_from_id_set,
+    )
+
+    check_configuration_file("update-id-set", kwargs)
+    packs = None
+    if kwargs["packs"]:
+        packs = {pack.strip() for pack in kwargs["packs"].split(",") if pack.strip()}
+    elif kwargs["use_git"]:
+        git_util = GitUtil()
+        changed_files = git_util.get_all_changed_files(
+            kwargs["prev_ver"], include_untracked=True
+        ) | git_util.deleted_files(kwargs["prev_ver"], include_untracked=True)
+        packs = {
+            file.parts[1]
+            for file in changed_files
+            if len(file.parts) > 1 and file.parts[0] == PACKS_DIR
+        }
+    id_set_creator = IDSetCreator(
+        output=kwargs["output"], fail_duplicates=kwargs["fail_duplicates"]
+    )
+    id_set_creator.resolve_output()
+    state = load_id_set_state(id_set_creator.output)
+    updated_id_set = id_set_creator.update_id_set(packs)
+    if updated_id_set is None:
+        logger.info(
+            f"[yellow]Could not update the id set {id_set_creator.output}, creating it again.[/yellow]"
+        )
+        if state:
+            id_set_creator.marketplace = state["marketplace"]
+        updated_id_set = id_set_creator.create_id_set()
+    id_set, excluded_items_by_pack, excluded_items_by_type = updated_id_set
+
+    if excluded_items_by_pack:
+        remove_dependencies_from_id_set(
+            id_set,
+            excluded_items_by_pack,
+            excluded_items_by_type,
+            id_set_creator.marketplace,
+        )
+        id_set_creator.save_id_set()
+
+
 # ====================== merge-id-sets ====================== #
 @main.command(hidden=True)
 @click.help_option("-h", "--help")
@@ -2317,6 +2492,28 @@ def merge_id_sets(ctx, **kwargs):
             sys.exit(1)
 
 
+# ====================== convert-id-set ====================== #
+@main.command(hidden=True)
+@click.help_option("-h", "--help")
+@click.option(
+    "-i", "--input", help="The id_set file path, json or store", required=True
+)
+@click.option(
+    "-o",
+    "--output",
+    help="The converted id_set file path, an id_set store if it ends with .db, json otherwise",
+    required=True,
+)
+@click.pass_context
+@logging_setup_decorator
+def convert_id_set(ctx, **kwargs):
+    """Convert an id_set between json and the id_set store, which loads its sections lazily"""
+    from demisto_sdk.commands.common.id_set_store import load_id_set, write_id_set
+
+    write_id_set(load_id_set(kwargs["input"]), kwargs["output"])
+    logger.info(f"[green]Converted {kwargs['input']} to {kwargs['output']}[/green]")
+
+
 # ====================== update-release-notes =================== #
 @main.command(
     context_settings=dict(
@@ -2379,6 +2576,7 @@ def merge_id_sets(ctx, **kwargs):
 @logging_setup_decorator
 def update_release_notes(ctx, **kwargs):
     """Auto-increment pack version and generate release notes template."""
+    from demisto_sdk.commands.common.tools import is_sdk_defined_working_offline
     from demisto_sdk.commands.update_release_notes.update_rn_manager import (
         UpdateReleaseNotesManager,
     )
@@ -2491,6 +2689,9 @@ def update_release_notes(ctx, **kwargs):
 @logging_setup_decorator
 def find_dependencies(ctx, **kwargs):
     """Find pack dependencies and update pack metadata."""
+    from demisto_sdk.commands.common.content_constant_paths import (
+        ALL_PACKS_DEPENDENCIES_DEFAULT_PATH,
+    )
     from demisto_sdk.commands.find_dependencies.find_dependencies import (
         PackDependencies,
     )
@@ -2581,6 +2782,8 @@ def postman_codegen(
     **kwargs,
 ):
     """Generates a Cortex XSOAR integration given a Postman collection 2.1 JSON file."""
+    from demisto_sdk.commands.common.logger import logging_setup
+
     logger = logging_setup(
         console_log_threshold=kwargs.get("console-log-threshold") or logging.INFO,
         file_log_threshold=kwargs.get("file-log-threshold") or logging.DEBUG,
@@ -3242,6 +3445,8 @@ def create_content_graph(
     output_path: Path = None,
     **kwargs,
 ):
+    from demisto_sdk.commands.content_graph.commands.create import create
+
     ctx.invoke(
         create,
         ctx,
@@ -3325,6 +3530,8 @@ def update_content_graph(
     output_path: Path = None,
     **kwargs,
 ):
+    from demisto_sdk.commands.content_graph.commands.update import update
+
     ctx.invoke(
         update,
         ctx,
@@ -3502,30 +3709,67 @@ def exit_from_program(result=0, **kwargs):
 
 # ====================== modeling-rules command group ====================== #
 
-app = typer.Typer(name="modeling-rules", hidden=True, no_args_is_help=True)
-app.command("test", no_args_is_help=True)(test_modeling_rule.test_modeling_rule)
-app.command("init-test-data", no_args_is_help=True)(init_test_data.init_test_data)
-typer_click_object = typer.main.get_command(app)
-main.add_command(typer_click_object, "modeling-rules")
 
-app_generate_modeling_rules = typer.Typer(
-    name="generate-modeling-rules", no_args_is_help=True
-)
-app_generate_modeling_rules.command("generate-modeling-rules", no_args_is_help=True)(
-    generate_modeling_rules.generate_modeling_rules
-)
+def modeling_rules_command() -> click.Command:
+    import typer
+
+    from demisto_sdk.commands.test_content.test_modeling_rule import (
+        init_test_data,
+        test_modeling_rule,
+    )
+
+    app = typer.Typer(name="modeling-rules", hidden=True, no_args_is_help=True)
+    app.command("test", no_args_is_help=True)(test_modeling_rule.test_modeling_rule)
+    app.command("init-test-data", no_args_is_help=True)(init_test_data.init_test_data)
+    return typer.main.get_command(app)
 
-typer_click_object2 = typer.main.get_command(app_generate_modeling_rules)
-main.add_command(typer_click_object2, "generate-modeling-rules")
+
+main.add_lazy_command("modeling-rules", modeling_rules_command, hidden=True)
+
+
+def generate_modeling_rules_command() -> click.Command:
+    import typer
+
+    from demisto_sdk.commands.generate_modeling_rules import generate_modeling_rules
+
+    app_generate_modeling_rules = typer.Typer(
+        name="generate-modeling-rules", no_args_is_help=True
+    )
+    app_generate_modeling_rules.command(
+        "generate-modeling-rules", no_args_is_help=True
+    )(generate_modeling_rules.generate_modeling_rules)
+    return typer.main.get_command(app_generate_modeling_rules)
+
+
+main.add_lazy_command(
+    "generate-modeling-rules",
+    generate_modeling_rules_command,
+    short_help="Generates modeling rules from a mapping file and a raw event.",
+)
 
 
 # ====================== graph command group ====================== #
 
-graph_cmd_group = typer.Typer(name="graph", hidden=True, no_args_is_help=True)
-graph_cmd_group.command("create", no_args_is_help=False)(create)
-graph_cmd_group.command("update", no_args_is_help=False)(update)
-graph_cmd_group.command("get-relationships", no_args_is_help=True)(get_relationships)
-main.add_command(typer.main.get_command(graph_cmd_group), "graph")
+
+def graph_command() -> click.Command:
+    import typer
+
+    from demisto_sdk.commands.content_graph.commands.create import create
+    from demisto_sdk.commands.content_graph.commands.get_relationships import (
+        get_relationships,
+    )
+    from demisto_sdk.commands.content_graph.commands.update import update
+
+    graph_cmd_group = typer.Typer(name="graph", hidden=True, no_args_is_help=True)
+    graph_cmd_group.command("create", no_args_is_help=False)(create)
+    graph_cmd_group.command("update", no_args_is_help=False)(update)
+    graph_cmd_group.command("get-relationships", no_args_is_help=True)(
+        get_relationships
+    )
+    return typer.main.get_command(graph_cmd_group)
+
+
+main.add_lazy_command("graph", graph_command, hidden=True)
 
 
 if __name__ == "__main__":
@@ -98,6 +98,14 @@ EVENT_COLLECTOR = "EventCollector"
 # ENV VARIABLES
 
 ENV_DEMISTO_SDK_MARKETPLACE = "DEMISTO_SDK_MARKETPLACE"
+ENV_DEMISTO_SDK_CACHE_DIR = "DEMISTO_SDK_CACHE_DIR"
+ENV_DEMISTO_SDK_FILE_CACHE_MAX_MB = "DEMISTO_SDK_FILE_CACHE_MAX_MB"
+ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE = "DEMISTO_SDK_PERSISTENT_FILE_CACHE"
+ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE_MAX_MB = (
+    "DEMISTO_SDK_PERSISTENT_FILE_CACHE_MAX_MB"
+)
+ENV_DEMISTO_SDK_HTTP_CACHE = "DEMISTO_SDK_HTTP_CACHE"
+ENV_DEMISTO_SDK_HTTP_CACHE_MAX_MB = "DEMISTO_SDK_HTTP_CACHE_MAX_MB"
 
 
 class FileType(str, Enum):
@@ -1,33 +1,79 @@
+"""
+Paths in the content repository.
+
+The content path is found with git, so every constant of this module is only resolved on first access
+(see `__getattr__`), and importing the module is cheap.
+"""
 import logging
 from pathlib import Path
+from typing import Any, Callable, Dict, List
 
 from demisto_sdk.commands.common.constants import TESTS_DIR
-from demisto_sdk.commands.common.tools import get_content_path
 
 logger = logging.getLogger("demisto-sdk")
 
-CONTENT_PATH = Path(get_content_path())  # type: ignore
 
-ALL_PACKS_DEPENDENCIES_DEFAULT_PATH = CONTENT_PATH / "all_packs_dependencies.json"
+def _content_path() -> Path:
+    from demisto_sdk.commands.common.tools import get_content_path
+
+    return Path(get_content_path())  # type: ignore
+
+
+def _python_path() -> List[Path]:
+    content_path = _resolve("CONTENT_PATH")
+    python_path = [
+        Path(content_path),
+        Path(content_path / "Packs" / "Base" / "Scripts" / "CommonServerPython"),
+        Path(content_path / TESTS_DIR / "demistomock"),
+        Path(__file__).parent.parent / "lint" / "resources" / "pylint_plugins",
+    ]
+    try:
+        python_path.extend(
+            Path(content_path / "Packs" / "ApiModules" / "Scripts").iterdir()
+        )
+    except FileNotFoundError:
+        logger.info("ApiModules not found, skipping adding to PYTHONPATH")
+    return python_path
+
+
+_LAZY_PATHS: Dict[str, Callable[[], Any]] = {
+    "CONTENT_PATH": _content_path,
+    "ALL_PACKS_DEPENDENCIES_DEFAULT_PATH": lambda: _resolve("CONTENT_PATH")
+    / "all_packs_dependencies.json",
+    "CONF_PATH": lambda: _resolve("CONTENT_PATH") / TESTS_DIR / "conf.json",
+    "DEFAULT_ID_SET_PATH": lambda: _resolve("CONTENT_PATH") / TESTS_DIR / "id_set.json",
+    "MP_V2_ID_SET_PATH": lambda: _resolve("CONTENT_PATH")
+    / TESTS_DIR
+    / "id_set_mp_v2.json",
+    "XPANSE_ID_SET_PATH": lambda: _resolve("CONTENT_PATH")
+    / TESTS_DIR
+    / "id_set_xpanse.json",
+    "LANDING_PAGE_SECTIONS_PATH": lambda: _resolve("CONTENT_PATH")
+    / TESTS_DIR
+    / "Marketplace"
+    / "landingPage_sections.json",
+    "PYTHONPATH": _python_path,
+}
+
+CONTENT_PATH: Path
+ALL_PACKS_DEPENDENCIES_DEFAULT_PATH: Path
+CONF_PATH: Path
+DEFAULT_ID_SET_PATH: Path
+MP_V2_ID_SET_PATH: Path
+XPANSE_ID_SET_PATH: Path
+LANDING_PAGE_SECTIONS_PATH: Path
+PYTHONPATH: List[Path]
 
-CONF_PATH = CONTENT_PATH / TESTS_DIR / "conf.json"
 
-DEFAULT_ID_SET_PATH = CONTENT_PATH / TESTS_DIR / "id_set.json"
-MP_V2_ID_SET_PATH = CONTENT_PATH / TESTS_DIR / "id_set_mp_v2.json"
-XPANSE_ID_SET_PATH = CONTENT_PATH / TESTS_DIR / "id_set_xpanse.json"
-LANDING_PAGE_SECTIONS_PATH = (
-    CONTENT_PATH / TESTS_DIR / "Marketplace" / "landingPage_sections.json"
-)
+def _resolve(name: str) -> Any:
+    module_globals = globals()
+    if name not in module_globals:
+        # resolved once, the following lookups of the module attribute do not reach __getattr__
+        module_globals[name] = _LAZY_PATHS[name]()
+    return module_globals[name]
 
 
-PYTHONPATH = [
-    Path(CONTENT_PATH),
-    Path(CONTENT_PATH / "Packs" / "Base" / "Scripts" / "CommonServerPython"),
-    Path(CONTENT_PATH / TESTS_DIR / "demistomock"),
-    Path(__file__).parent.parent / "lint" / "resources" / "pylint_plugins",
-]
-try:
-    PYTHONPATH.extend(Path(CONTENT_PATH / "Packs" / "ApiModules" / "Scripts").iterdir())
-except FileNotFoundError:
-    logger.info("ApiModules not found, skipping adding to PYTHONPATH")
-    pass
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_PATHS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _resolve(name)
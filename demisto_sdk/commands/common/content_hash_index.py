@@ -0,0 +1,302 @@
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from demisto_sdk.commands.common.constants import PACKS_DIR
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir, get_sdk_version
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    get_persistent_file_cache,
+    sha1_file,
+)
+
+HASH_INDEX_CACHE_DIR = "hash_index"
+HASH_INDEX_FORMAT_VERSION = 1
+README_SUFFIX = "_README"
+IGNORED_FILE_NAMES = frozenset((".DS_Store",))
+IGNORED_DIR_NAMES = frozenset(("__pycache__",))
+
+PathLike = Union[str, Path]
+
+
+class FileHash(NamedTuple):
+    size: int
+    mtime_ns: int
+    sha1: str
+
+
+class HashSnapshot(NamedTuple):
+    packs: Dict[str, str]
+    items: Dict[str, str]
+
+
+def content_item_key(relative_path: str) -> Optional[str]:
+    """
+    Returns the content item a file belongs to, e.g. `Packs/MyPack/Integrations/MyIntegration`,
+    or None for pack level files (e.g. pack_metadata.json).
+
+    Files kept directly under a content entity directory are grouped by name, so a playbook yml and its
+    `_README.md` are a single content item.
+    """
+    parts = relative_path.split("/")
+    if len(parts) < 4:
+        return None
+    if len(parts) > 4:
+        return "/".join(parts[:4])
+    name = parts[3].rsplit(".", 1)[0]
+    if name.endswith(README_SUFFIX):
+        name = name[: -len(README_SUFFIX)]
+    return "/".join((*parts[:3], name))
+
+
+def merkle_hash(children: Iterable[Tuple[str, str]]) -> str:
+    """Hashes (name, hash) pairs in a stable order."""
+    hash_ = sha1()
+    for name, child_hash in sorted(children):
+        hash_.update(name.encode())
+        hash_.update(b"\0")
+        hash_.update(child_hash.encode())
+        hash_.update(b"\n")
+    return hash_.hexdigest()
+
+
+class ContentHashIndex:
+    """
+    A Merkle hash index of the content packs: a sha1 per file, per content item and per pack.
+
+    A content item hash covers all of its files (yml, code, description, image, README, ...), and a pack hash covers
+    its content items and pack level files, so comparing hashes tells which packs and content items changed.
+    File hashes are recomputed (in parallel) only for files whose size or mtime changed since they were hashed.
+
+    Named snapshots of the pack and content item hashes can be taken, to later ask which of them changed since.
+    When the persistent cache is enabled (DEMISTO_SDK_PERSISTENT_FILE_CACHE), the index and its snapshots are saved on
+    exit and loaded by the next run.
+    """
+
+    _indexes: Dict[Path, "ContentHashIndex"] = {}
+
+    def __init__(self, root: PathLike):
+        self.root = Path(os.path.abspath(root))
+        self._root_str = str(self.root)
+        self._files: Dict[str, FileHash] = {}
+        self._items: Dict[str, str] = {}
+        self._packs: Dict[str, str] = {}
+        self._snapshots: Dict[str, HashSnapshot] = {}
+        self._dirty = False
+
+    @classmethod
+    def get(cls, root: PathLike, persistent: bool = False) -> "ContentHashIndex":
+        """
+        Returns the up to date hash index of the repository at `root`, shared by the whole process.
+
+        Args:
+            root: The repository root.
+            persistent: Whether to keep the index between runs, even when the persistent cache is disabled.
+        """
+        root = Path(os.path.abspath(root))
+        if (index := cls._indexes.get(root)) is None:
+            index = cls(root)
+            if persistent or get_persistent_file_cache():
+                index.load()
+                atexit.register(index.save)
+            cls._indexes[root] = index
+        return index.update()
+
+    @classmethod
+    def clear(cls):
+        """Drops all the indexes loaded by this process."""
+        cls._indexes.clear()
+
+    @property
+    def cache_path(self) -> Path:
+        return (
+            get_sdk_cache_dir()
+            / HASH_INDEX_CACHE_DIR
+            / f"{sha1(self._root_str.encode()).hexdigest()}.json"
+        )
+
+    def _stat_and_hash(
+        self, relative_path: str
+    ) -> Tuple[str, Optional[FileHash], bool]:
+        """Returns the file hash, and whether it had to be recomputed. The hash is None if the file was removed."""
+        abs_path = os.path.join(self._root_str, relative_path)
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return relative_path, None, False
+        previous = self._files.get(relative_path)
+        if previous and (previous.size, previous.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            return relative_path, previous, False
+        try:
+            return (
+                relative_path,
+                FileHash(stat.st_size, stat.st_mtime_ns, sha1_file(abs_path)),
+                True,
+            )
+        except OSError:
+            return relative_path, None, False
+
+    def _list_files(self) -> List[str]:
+        repo_index = ContentRepoIndex.get(self.root, refresh=True).build()
+        return [
+            indexed_file.path
+            for indexed_file in repo_index.iter_files(PACKS_DIR)
+            if indexed_file.pack
+            and indexed_file.path.rsplit("/", 1)[-1] not in IGNORED_FILE_NAMES
+            and not IGNORED_DIR_NAMES.intersection(indexed_file.path.split("/"))
+        ]
+
+    def update(self) -> "ContentHashIndex":
+        """Re-hashes the new and modified files, and recomputes the content item and pack hashes."""
+        paths = self._list_files()
+        rehashed = 0
+        files: Dict[str, FileHash] = {}
+        # hashlib releases the GIL while hashing, so threads are enough to hash in parallel
+        with ThreadPoolExecutor(max_workers=cpu_count()) as executor:
+            for relative_path, file_hash, is_rehashed in executor.map(
+                self._stat_and_hash, paths, chunksize=64
+            ):
+                if file_hash is not None:
+                    files[relative_path] = file_hash
+                rehashed += is_rehashed
+        if rehashed or files.keys() != self._files.keys():
+            self._dirty = True
+        self._files = files
+
+        item_files: Dict[str, List[Tuple[str, str]]] = {}
+        pack_children: Dict[str, List[Tuple[str, str]]] = {}
+        for relative_path, file_hash in files.items():
+            pack = relative_path.split("/", 2)[1]
+            if (item := content_item_key(relative_path)) is None:
+                pack_children.setdefault(pack, []).append(
+                    (relative_path, file_hash.sha1)
+                )
+            else:
+                item_files.setdefault(item, []).append((relative_path, file_hash.sha1))
+        self._items = {
+            item: merkle_hash(children) for item, children in item_files.items()
+        }
+        for item, item_hash in self._items.items():
+            pack_children.setdefault(item.split("/", 2)[1], []).append(
+                (item, item_hash)
+            )
+        self._packs = {
+            pack: merkle_hash(children) for pack, children in pack_children.items()
+        }
+        logger.debug(
+            f"Hash index of {self.root}: re-hashed {rehashed} of {len(files)} files"
+        )
+        return self
+
+    def file_hash(self, relative_path: str) -> Optional[str]:
+        return file_hash.sha1 if (file_hash := self._files.get(relative_path)) else None
+
+    def item_hash(self, item: str) -> Optional[str]:
+        """Returns the hash of a content item, e.g. `Packs/MyPack/Integrations/MyIntegration`."""
+        return self._items.get(item)
+
+    def pack_hash(self, pack: str) -> Optional[str]:
+        return self._packs.get(pack)
+
+    @property
+    def packs(self) -> Dict[str, str]:
+        return dict(self._packs)
+
+    @property
+    def items(self) -> Dict[str, str]:
+        return dict(self._items)
+
+    def take_snapshot(self, name: str) -> HashSnapshot:
+        """Records the current pack and content item hashes under `name`, replacing a previous snapshot of that name."""
+        snapshot = HashSnapshot(dict(self._packs), dict(self._items))
+        self._snapshots[name] = snapshot
+        self._dirty = True
+        return snapshot
+
+    def snapshot(self, name: str) -> Optional[HashSnapshot]:
+        return self._snapshots.get(name)
+
+    @staticmethod
+    def _changed(current: Dict[str, str], previous: Dict[str, str]) -> Set[str]:
+        return {
+            key
+            for key in current.keys() | previous.keys()
+            if current.get(key) != previous.get(key)
+        }
+
+    def changed_packs(self, since: str) -> Optional[Set[str]]:
+        """
+        Returns the names of the packs that were added, removed or modified since the snapshot `since` was taken,
+        or None if there is no such snapshot.
+        """
+        if (snapshot := self._snapshots.get(since)) is None:
+            return None
+        return self._changed(self._packs, snapshot.packs)
+
+    def changed_items(self, since: str) -> Optional[Set[str]]:
+        """
+        Returns the content items that were added, removed or modified since the snapshot `since` was taken,
+        or None if there is no such snapshot.
+        """
+        if (snapshot := self._snapshots.get(since)) is None:
+            return None
+        return self._changed(self._items, snapshot.items)
+
+    def load(self) -> bool:
+        """Loads the index saved by a previous run, returns whether it was loaded."""
+        try:
+            with self.cache_path.open() as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return False
+        if (
+            data.get("format_version") != HASH_INDEX_FORMAT_VERSION
+            or data.get("sdk_version") != get_sdk_version()
+            or data.get("root") != self._root_str
+        ):
+            return False
+        self._files = {
+            relative_path: FileHash(*file_hash)
+            for relative_path, file_hash in data["files"].items()
+        }
+        self._snapshots = {
+            name: HashSnapshot(snapshot["packs"], snapshot["items"])
+            for name, snapshot in data["snapshots"].items()
+        }
+        self._dirty = False
+        return True
+
+    def save(self):
+        """Saves the index for the next runs, if it changed."""
+        if not self._dirty:
+            return
+        data = {
+            "format_version": HASH_INDEX_FORMAT_VERSION,
+            "sdk_version": get_sdk_version(),
+            "root": self._root_str,
+            "files": {
+                relative_path: list(file_hash)
+                for relative_path, file_hash in self._files.items()
+            },
+            "snapshots": {
+                name: snapshot._asdict() for name, snapshot in self._snapshots.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with temp_path.open("w") as index_file:
+                json.dump(data, index_file)
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not save the hash index of {self.root}: {e}")
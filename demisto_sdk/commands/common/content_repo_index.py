@@ -0,0 +1,378 @@
+import atexit
+import fnmatch
+import glob
+import os
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from demisto_sdk.commands.common.constants import (
+    CONTENT_ENTITIES_DIRS,
+    PACKS_DIR,
+    FileType,
+)
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir, get_sdk_version
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.tools import (
+    find_type_by_path,
+    get_persistent_file_cache,
+)
+
+REPO_INDEX_CACHE_DIR = "repo_index"
+INDEX_FORMAT_VERSION = 1
+# only these top level directories of the repository are indexed (legacy, non-pack, content is kept at the top level)
+INDEXED_ROOT_DIRS = frozenset((PACKS_DIR, *CONTENT_ENTITIES_DIRS))
+
+PathLike = Union[str, Path]
+
+
+class IndexEntry(NamedTuple):
+    name: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+
+class IndexedFile(NamedTuple):
+    path: str  # relative to the repository root, posix style
+    size: int
+    mtime_ns: int
+    pack: Optional[str]
+    entity_dir: Optional[str]
+
+
+class ContentRepoIndex:
+    """
+    An index of the content repository files, shared by the commands that iterate the repository
+    (validate -a, create-id-set, graph create, lint -a).
+
+    Directories are listed with `os.scandir` at most once, either all at once by `build`, or lazily when first queried.
+    Every directory listing records the directory mtime, so `refresh` re-lists only the directories whose entries
+    were added, removed or renamed since they were listed.
+    When the persistent cache is enabled (DEMISTO_SDK_PERSISTENT_FILE_CACHE), the index is saved on exit and loaded
+    by the next run, which then only needs to refresh it.
+
+    The query methods accept paths relative to the current working directory, or absolute paths, like `os` does.
+    Paths outside the indexed part of the repository (including the root itself) are passed to `os` as is.
+    Note that file sizes and mtimes are the ones recorded when their directory was last listed.
+    """
+
+    _indexes: Dict[Path, "ContentRepoIndex"] = {}
+
+    def __init__(self, root: PathLike):
+        self.root = Path(os.path.abspath(root))
+        self._root_str = str(self.root)
+        # relative dir path -> (dir mtime_ns, {name: entry})
+        self._dirs: Dict[str, Tuple[int, Dict[str, IndexEntry]]] = {}
+        self._file_types: Dict[str, Optional[FileType]] = {}
+        self._dirty = False
+
+    @classmethod
+    def get(cls, root: PathLike, refresh: bool = False) -> "ContentRepoIndex":
+        """
+        Returns the index of the repository at `root`, shared by the whole process.
+
+        Args:
+            root: The repository root.
+            refresh: Whether to refresh the index, if it was already loaded by this process.
+        """
+        root = Path(os.path.abspath(root))
+        if index := cls._indexes.get(root):
+            if refresh:
+                index.refresh()
+            return index
+        index = cls(root)
+        if get_persistent_file_cache():
+            if index.load():
+                index.refresh()
+            atexit.register(index.save)
+        cls._indexes[root] = index
+        return index
+
+    @classmethod
+    def clear(cls):
+        """Drops all the indexes loaded by this process."""
+        cls._indexes.clear()
+
+    @property
+    def cache_path(self) -> Path:
+        return (
+            get_sdk_cache_dir()
+            / REPO_INDEX_CACHE_DIR
+            / f"{sha1(self._root_str.encode()).hexdigest()}.json"
+        )
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        """Returns the path relative to the repository root, or None if it is not in the indexed part of the repo."""
+        abs_path = os.path.abspath(path)
+        if not abs_path.startswith(self._root_str + os.sep):
+            return None
+        relative = abs_path[len(self._root_str) + 1 :].replace(os.sep, "/")
+        if relative.split("/", 1)[0] not in INDEXED_ROOT_DIRS:
+            return None
+        return relative
+
+    def _scan(self, relative_dir: str) -> Optional[Dict[str, IndexEntry]]:
+        """Lists a single directory, returns None if it does not exist."""
+        abs_dir = os.path.join(self._root_str, relative_dir)
+        entries = {}
+        try:
+            dir_mtime = os.stat(abs_dir).st_mtime_ns
+            with os.scandir(abs_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    if not relative_dir and dir_entry.name not in INDEXED_ROOT_DIRS:
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:  # a broken symlink
+                        continue
+                    is_dir = dir_entry.is_dir()
+                    entries[dir_entry.name] = IndexEntry(
+                        dir_entry.name,
+                        is_dir,
+                        0 if is_dir else stat.st_size,
+                        stat.st_mtime_ns,
+                    )
+        except (FileNotFoundError, NotADirectoryError):
+            self._forget(relative_dir)
+            return None
+        self._dirs[relative_dir] = (dir_mtime, entries)
+        self._dirty = True
+        return entries
+
+    def _forget(self, relative_dir: str):
+        """Removes a directory and all of its sub directories from the index."""
+        prefix = f"{relative_dir}/"
+        for known_dir in [
+            known_dir
+            for known_dir in self._dirs
+            if known_dir == relative_dir or known_dir.startswith(prefix)
+        ]:
+            del self._dirs[known_dir]
+            self._dirty = True
+
+    def _entries(self, relative_dir: str) -> Optional[Dict[str, IndexEntry]]:
+        if (listing := self._dirs.get(relative_dir)) is not None:
+            return listing[1]
+        return self._scan(relative_dir)
+
+    def build(self) -> "ContentRepoIndex":
+        """Lists every directory of the repository that was not listed yet, in a single pass."""
+        to_visit = [""]
+        while to_visit:
+            relative_dir = to_visit.pop()
+            entries = self._entries(relative_dir) or {}
+            to_visit.extend(
+                f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                for entry in entries.values()
+                if entry.is_dir
+            )
+        return self
+
+    def refresh(self) -> "ContentRepoIndex":
+        """Re-lists the directories that changed since they were listed, and forgets the removed ones."""
+        changed = 0
+        for relative_dir in sorted(self._dirs):
+            if relative_dir not in self._dirs:  # removed with its parent
+                continue
+            recorded_mtime, old_entries = self._dirs[relative_dir]
+            try:
+                current_mtime = os.stat(
+                    os.path.join(self._root_str, relative_dir)
+                ).st_mtime_ns
+            except OSError:
+                self._forget(relative_dir)
+                continue
+            if current_mtime == recorded_mtime:
+                continue
+            changed += 1
+            new_entries = self._scan(relative_dir) or {}
+            for name, entry in old_entries.items():
+                if entry.is_dir and not (
+                    name in new_entries and new_entries[name].is_dir
+                ):
+                    self._forget(f"{relative_dir}/{name}" if relative_dir else name)
+        if changed:
+            self._file_types.clear()
+        logger.debug(f"Refreshed {changed} changed directories of {self.root} index")
+        return self
+
+    def load(self) -> bool:
+        """Loads the index saved by a previous run, returns whether it was loaded."""
+        try:
+            with self.cache_path.open() as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            return False
+        if (
+            data.get("format_version") != INDEX_FORMAT_VERSION
+            or data.get("sdk_version") != get_sdk_version()
+            or data.get("root") != self._root_str
+        ):
+            return False
+        self._dirs = {
+            relative_dir: (
+                dir_mtime,
+                {entry[0]: IndexEntry(*entry) for entry in entries},
+            )
+            for relative_dir, (dir_mtime, entries) in data["dirs"].items()
+        }
+        self._dirty = False
+        logger.debug(f"Loaded the index of {self.root} from {self.cache_path}")
+        return True
+
+    def save(self):
+        """Saves the index for the next runs, if it changed."""
+        if not self._dirty:
+            return
+        data = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "sdk_version": get_sdk_version(),
+            "root": self._root_str,
+            "dirs": {
+                relative_dir: [dir_mtime, [list(entry) for entry in entries.values()]]
+                for relative_dir, (dir_mtime, entries) in self._dirs.items()
+            },
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with temp_path.open("w") as index_file:
+                json.dump(data, index_file)
+            os.replace(
+                temp_path, self.cache_path
+            )  # atomic, concurrent runs never see a partial file
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not save the index of {self.root}: {e}")
+
+    def _entry(self, relative_path: str) -> Optional[IndexEntry]:
+        parent, _, name = relative_path.rpartition("/")
+        entries = self._entries(parent)
+        return entries.get(name) if entries else None
+
+    def listdir(self, path: PathLike) -> List[str]:
+        """Like `os.listdir`."""
+        relative_dir = self._relative(path)
+        if relative_dir is None:
+            return os.listdir(path)
+        if (entries := self._entries(relative_dir)) is None:
+            raise FileNotFoundError(f"No such directory: '{path}'")
+        return list(entries)
+
+    def exists(self, path: PathLike) -> bool:
+        """Like `os.path.exists`."""
+        relative_path = self._relative(path)
+        if relative_path is None:
+            return os.path.exists(path)  # noqa: PTH110
+        return self._entry(relative_path) is not None
+
+    def is_dir(self, path: PathLike) -> bool:
+        """Like `os.path.isdir`."""
+        relative_path = self._relative(path)
+        if relative_path is None:
+            return os.path.isdir(path)
+        entry = self._entry(relative_path)
+        return entry is not None and entry.is_dir
+
+    def is_file(self, path: PathLike) -> bool:
+        """Like `os.path.isfile`."""
+        relative_path = self._relative(path)
+        if relative_path is None:
+            return os.path.isfile(path)  # noqa: PTH113
+        entry = self._entry(relative_path)
+        return entry is not None and not entry.is_dir
+
+    def glob(self, pattern: str) -> List[str]:
+        """Like `glob.glob` (without recursive `**` support), the paths are in the same (file system) order."""
+        parts = pattern.split(os.sep)
+        paths = [os.sep] if os.path.isabs(pattern) else [""]
+        if os.path.isabs(pattern):
+            parts = parts[1:]
+        for index, part in enumerate(parts):
+            is_last = index == len(parts) - 1
+            if not part:  # a trailing separator matches directories only
+                paths = [path + os.sep for path in paths if self.is_dir(path)]
+                continue
+            next_paths = []
+            for path in paths:
+                if glob.has_magic(part):
+                    if not self.is_dir(path or os.curdir):
+                        continue
+                    next_paths.extend(
+                        os.path.join(path, name)
+                        for name in self.listdir(path or os.curdir)
+                        if (part.startswith(".") or not name.startswith("."))
+                        and fnmatch.fnmatch(name, part)
+                    )
+                elif is_last and self.exists(os.path.join(path, part)):
+                    next_paths.append(os.path.join(path, part))
+                elif not is_last:
+                    next_paths.append(os.path.join(path, part))
+            paths = next_paths
+        return paths
+
+    def file_type(self, path: PathLike) -> Optional[FileType]:
+        """Classifies an indexed path with `find_type_by_path`, the result is kept for the following calls."""
+        relative_path = self._relative(path)
+        if relative_path is None:
+            return find_type_by_path(path)
+        if relative_path not in self._file_types:
+            self._file_types[relative_path] = find_type_by_path(relative_path)
+        return self._file_types[relative_path]
+
+    def iter_files(self, path: PathLike = PACKS_DIR) -> Iterator[IndexedFile]:
+        """Yields all the files under a directory (recursively), with their pack and content entity directory."""
+        relative_root = self._relative(
+            path if os.path.isabs(path) else self.root / path
+        )
+        if relative_root is None:
+            return
+        to_visit = [relative_root]
+        while to_visit:
+            relative_dir = to_visit.pop()
+            for entry in (self._entries(relative_dir) or {}).values():
+                relative_path = (
+                    f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                )
+                if entry.is_dir:
+                    to_visit.append(relative_path)
+                    continue
+                parts = relative_path.split("/")
+                is_in_pack = parts[0] == PACKS_DIR and len(parts) > 2
+                yield IndexedFile(
+                    relative_path,
+                    entry.size,
+                    entry.mtime_ns,
+                    parts[1] if is_in_pack else None,
+                    parts[2] if is_in_pack and len(parts) > 3 else None,
+                )
+
+    def modified_since(self, mtime_ns: int) -> List[str]:
+        """
+        Returns the files and directories of the repository modified after `mtime_ns`, relative to its root.
+        A directory is modified when its entries are added, removed or renamed, so deleted files are reported through
+        their directory. The files are stat-ed again, as a file changed in place does not change its directory mtime.
+        """
+        modified = [
+            relative_dir
+            for relative_dir, (dir_mtime, _) in self._dirs.items()
+            if relative_dir and dir_mtime > mtime_ns
+        ]
+        for root_dir in sorted(self._entries("") or {}):
+            for indexed_file in self.iter_files(root_dir):
+                try:
+                    file_mtime = os.stat(
+                        os.path.join(self._root_str, indexed_file.path)
+                    ).st_mtime_ns
+                except OSError:
+                    file_mtime = mtime_ns + 1  # removed since its directory was listed
+                if file_mtime > mtime_ns:
+                    modified.append(indexed_file.path)
+        return modified
+
+    def packs(self) -> List[str]:
+        """Returns the names of all the pack directories."""
+        entries = self._entries(PACKS_DIR) or {}
+        return sorted(entry.name for entry in entries.values() if entry.is_dir)
@@ -5,8 +5,11 @@ import re
 import shutil
 import tarfile
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 import docker
 import requests
@@ -23,6 +26,9 @@ from demisto_sdk.commands.common.constants import (
     TYPE_PYTHON2,
     TYPE_PYTHON3,
 )
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.http_client import http_get
 from demisto_sdk.commands.common.logger import logger
 
 DOCKER_CLIENT = None
@@ -36,6 +42,13 @@ CAN_MOUNT_FILES = bool(os.getenv("CONTENT_GITLAB_CI", False)) or (
     )
 )
 
+DOCKER_IMAGES_METADATA_CACHE_NAME = "docker_images.json"
+# how long (in seconds) the metadata of an image is used before it is resolved again.
+# the tags of the demisto images are immutable, except for "latest".
+DOCKER_IMAGE_METADATA_TTL = 7 * 24 * 60 * 60
+LATEST_DOCKER_IMAGE_METADATA_TTL = 60 * 60
+PREFETCH_WORKERS = 8
+
 PYTHON_IMAGE_REGEX = re.compile(r"[\d\w]+/python3?:(?P<python_version>[23]\.\d+)")
 
 TEST_REQUIREMENTS_DIR = Path(__file__).parent.parent / "lint" / "resources"
@@ -410,7 +423,7 @@ def _get_docker_hub_token(repo: str) -> str:
         logger.debug("Using docker hub credentials to get token")
         auth = (docker_user, docker_pass)
 
-    response = requests.get(
+    response = http_get(
         f"https://auth.docker.io/token?service=registry.docker.io&scope=repository:{repo}:pull",
         auth=auth,
     )
@@ -423,7 +436,7 @@ def _get_docker_hub_token(repo: str) -> str:
 
 
 def _get_image_digest(repo: str, tag: str, token: str) -> str:
-    response = requests.get(
+    response = http_get(
         f"https://registry-1.docker.io/v2/{repo}/manifests/{tag}",
         headers={
             "Accept": "application/vnd.docker.distribution.manifest.v2+json",
@@ -440,7 +453,7 @@ def _get_image_digest(repo: str, tag: str, token: str) -> str:
 
 @functools.lru_cache
 def _get_image_env(repo: str, digest: str, token: str) -> List[str]:
-    response = requests.get(
+    response = http_get(
         f"https://registry-1.docker.io/v2/{repo}/blobs/{digest}",
         headers={
             "Accept": "application/vnd.docker.distribution.manifest.v2+json",
@@ -466,10 +479,8 @@ def _get_python_version_from_env(env: List[str]) -> Version:
     )
 
 
-@functools.lru_cache
-def get_python_version(image: Optional[str]) -> Version:
-    log_prompt = f"Get python version from image {image}"
-    logger.debug(f"{log_prompt} - Start")
+def _get_python_version_from_image_name(image: Optional[str]) -> Optional[Version]:
+    """Returns the python version of the images that can be told without docker (e.g. powershell images)."""
     if not image or "pwsh" in image or "powershell" in image:
         # When no docker_image is specified, we use the default python version which is Python 2.7.18
         logger.debug(
@@ -478,36 +489,36 @@ def get_python_version(image: Optional[str]) -> Version:
         return Version(DEFAULT_PYTHON2_VERSION)
     if match := PYTHON_IMAGE_REGEX.match(image):
         return Version(match.group("python_version"))
-    try:
-        return _get_python_version_from_image_client(image)
-    except Exception:
-        logger.debug(
-            "Could not get the python version from client. Trying with API",
-            exc_info=True,
-        )
-        return _get_python_version_from_dockerhub_api(image)
+    return None
+
+
+@functools.lru_cache
+def get_python_version(image: Optional[str]) -> Version:
+    log_prompt = f"Get python version from image {image}"
+    logger.debug(f"{log_prompt} - Start")
+    if python_version := _get_python_version_from_image_name(image):
+        return python_version
+    return Version(
+        get_docker_images_metadata_store().get(image).python_version  # type: ignore[arg-type]
+    )
 
 
-def _get_python_version_from_image_client(image: str) -> Version:
-    """Get python version from docker image
+def prefetch_python_versions(images: Iterable[Optional[str]]):
+    """Resolves the python versions of many images concurrently, ahead of calling get_python_version for each of them."""
+    get_docker_images_metadata_store().prefetch(
+        image for image in images if not _get_python_version_from_image_name(image)
+    )
 
-    Args:
-        image(str): Docker image id or name
 
-    Returns:
-        Version: Python version X.Y (3.7, 3.6, ..)
-    """
-    try:
-        image_model = DockerBase.pull_image(image)
-        env = image_model.attrs["Config"]["Env"]
-        logger.debug(f"Got {env=} from {image=}")
-        return _get_python_version_from_env(env)
-    except Exception:
-        logger.exception(f"Failed detecting Python version for {image=}")
-        raise
+def _get_image_metadata_from_client(image: str) -> Tuple[str, List[str]]:
+    """Returns the digest and env of an image that is available in the local docker daemon, without pulling it."""
+    docker_image = init_global_docker_client(
+        log_prompt="docker images metadata"
+    ).images.get(image)
+    return docker_image.attrs.get("Id", ""), docker_image.attrs["Config"]["Env"]
 
 
-def _get_python_version_from_dockerhub_api(image: str):
+def _get_image_metadata_from_dockerhub_api(image: str) -> Tuple[str, List[str]]:
     if ":" not in image:
         repo = image
         tag = "latest"
@@ -518,13 +529,173 @@ def _get_python_version_from_dockerhub_api(image: str):
     if os.getenv("CONTENT_GITLAB_CI"):
         # we need to remove the gitlab prefix, as we query the API
         repo = repo.replace("docker-io.art.code.pan.run/", "")
-    try:
-        token = _get_docker_hub_token(repo)
-        digest = _get_image_digest(repo, tag, token)
-        env = _get_image_env(repo, digest, token)
-        return _get_python_version_from_env(env)
-    except Exception as e:
-        logger.error(
-            f"Failed to get python version from docker hub for image {image}: {e}"
+    token = _get_docker_hub_token(repo)
+    digest = _get_image_digest(repo, tag, token)
+    return digest, _get_image_env(repo, digest, token)
+
+
+def _get_image_metadata_from_pulled_image(image: str) -> Tuple[str, List[str]]:
+    docker_image = DockerBase.pull_image(image)
+    return docker_image.attrs.get("Id", ""), docker_image.attrs["Config"]["Env"]
+
+
+class DockerImageMetadata(NamedTuple):
+    digest: str
+    env: List[str]
+    python_version: str
+    last_seen: float
+
+
+class DockerImagesMetadataStore:
+    """
+    The metadata (digest, env and python version) of docker images, keyed by image:tag, and kept between runs.
+
+    An image which is not in the store, or whose entry expired, is resolved from the local docker daemon when the image
+    is present there, otherwise from the docker hub API, and is pulled only as a last resort.
+    Without a path, the store is kept in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._images: Optional[Dict[str, DockerImageMetadata]] = None
+        self._updated_images: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, DockerImageMetadata]:
+        if self.path is None:
+            return {}
+        try:
+            with self.path.open() as store_file:
+                return {
+                    image: DockerImageMetadata(**metadata)
+                    for image, metadata in json.load(store_file).items()
+                }
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Could not load the docker images metadata {self.path}: {e}")
+            return {}
+
+    @property
+    def images(self) -> Dict[str, DockerImageMetadata]:
+        with self._lock:
+            if self._images is None:
+                self._images = self._load()
+            return self._images
+
+    def save(self):
+        """Writes the images resolved by this process, on top of the ones written by others in the meantime."""
+        if self.path is None or not self._updated_images:
+            return
+        with self._lock:
+            images = self._load()
+            images.update({image: self.images[image] for image in self._updated_images})
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with temp_path.open("w") as store_file:
+                    json.dump(
+                        {
+                            image: metadata._asdict()
+                            for image, metadata in images.items()
+                        },
+                        store_file,
+                    )
+                os.replace(temp_path, self.path)
+                self._updated_images.clear()
+            except OSError as e:
+                logger.debug(f"Could not save the docker images metadata: {e}")
+
+    @staticmethod
+    def _is_fresh(image: str, metadata: DockerImageMetadata) -> bool:
+        ttl = (
+            DOCKER_IMAGE_METADATA_TTL
+            if ":" in image and not image.endswith(":latest")
+            else LATEST_DOCKER_IMAGE_METADATA_TTL
         )
-        raise
+        return time.time() - metadata.last_seen < ttl
+
+    def _resolve(self, image: str) -> DockerImageMetadata:
+        errors = []
+        for source, resolver in (
+            ("the docker daemon", _get_image_metadata_from_client),
+            ("the docker hub API", _get_image_metadata_from_dockerhub_api),
+            ("a pulled image", _get_image_metadata_from_pulled_image),
+        ):
+            try:
+                digest, env = resolver(image)
+                break
+            except Exception as e:
+                logger.debug(
+                    f"Could not get the metadata of {image=} from {source}: {e}"
+                )
+                errors.append(e)
+        else:
+            raise RuntimeError(
+                f"Failed detecting Python version for image {image}"
+            ) from errors[-1]
+        logger.debug(f"Got {env=} from {image=}")
+        return DockerImageMetadata(
+            digest=digest,
+            env=env,
+            python_version=str(_get_python_version_from_env(env)),
+            last_seen=time.time(),
+        )
+
+    def _fetch(self, image: str) -> DockerImageMetadata:
+        metadata = self._resolve(image)
+        with self._lock:
+            self.images[image] = metadata
+            self._updated_images.add(image)
+        return metadata
+
+    def _prefetch_image(self, image: str):
+        try:
+            self._fetch(image)
+        except Exception as e:  # reported when the image is used
+            logger.debug(f"Could not prefetch the metadata of {image=}: {e}")
+
+    def get(self, image: str) -> DockerImageMetadata:
+        if (metadata := self.images.get(image)) and self._is_fresh(image, metadata):
+            return metadata
+        metadata = self._fetch(image)
+        self.save()
+        return metadata
+
+    def prefetch(self, images: Iterable[str]) -> int:
+        """Resolves all the images that are missing from the store (or expired) concurrently, returns how many were."""
+        images_to_fetch = [
+            image
+            for image in dict.fromkeys(images)
+            if not (
+                (metadata := self.images.get(image)) and self._is_fresh(image, metadata)
+            )
+        ]
+        if not images_to_fetch:
+            return 0
+        with ThreadPoolExecutor(
+            max_workers=min(PREFETCH_WORKERS, len(images_to_fetch))
+        ) as executor:
+            list(executor.map(self._prefetch_image, images_to_fetch))
+        self.save()
+        logger.debug(f"Prefetched the metadata of {len(images_to_fetch)} docker images")
+        return len(images_to_fetch)
+
+
+_docker_images_metadata_store: Optional[DockerImagesMetadataStore] = None
+
+
+def get_docker_images_metadata_store() -> DockerImagesMetadataStore:
+    """Returns the docker images metadata store shared by the whole process, kept under the SDK cache dir."""
+    global _docker_images_metadata_store
+    if _docker_images_metadata_store is None:
+        _docker_images_metadata_store = DockerImagesMetadataStore(
+            get_sdk_cache_dir() / DOCKER_IMAGES_METADATA_CACHE_NAME
+        )
+    return _docker_images_metadata_store
+
+
+def set_docker_images_metadata_store(store: Optional[DockerImagesMetadataStore]):
+    """Replaces the shared store (e.g. with an in-memory one), None resets it to the default."""
+    global _docker_images_metadata_store
+    _docker_images_metadata_store = store
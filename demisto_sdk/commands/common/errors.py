@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
 import decorator
 from packaging.version import Version
@@ -27,8 +28,72 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.content_constant_paths import CONF_PATH
 from demisto_sdk.commands.common.tools import is_external_repository
 
-FOUND_FILES_AND_ERRORS: list = []
-FOUND_FILES_AND_IGNORED_ERRORS: list = []
+
+class ReportedErrors(list):
+    """
+    A list of the reported "<file path> - [<error code>]" entries, in the order they were reported, which checks
+    whether an entry was already reported in O(1): noisy packs report thousands of errors, and each of them is
+    checked against all the ones reported before it.
+    """
+
+    def __init__(self, entries: Iterable[str] = ()):
+        super().__init__(entries)
+        self._entries = set(self)
+
+    def __contains__(self, entry) -> bool:
+        return entry in self._entries
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def append(self, entry: str):
+        super().append(entry)
+        self._entries.add(entry)
+
+    def extend(self, entries: Iterable[str]):
+        entries = list(entries)
+        super().extend(entries)
+        self._entries.update(entries)
+
+    def __iadd__(self, entries: Iterable[str]):  # type: ignore[override,misc]
+        self.extend(entries)
+        return self
+
+    def insert(self, index, entry: str):
+        super().insert(index, entry)
+        self._entries.add(entry)
+
+    # removing entries is rare (e.g. a worker process dropping the entries it already reported), so the set is rebuilt
+
+    def remove(self, entry: str):
+        super().remove(entry)
+        self._entries = set(self)
+
+    def pop(self, index=-1):
+        entry = super().pop(index)
+        self._entries = set(self)
+        return entry
+
+    def clear(self):
+        super().clear()
+        self._entries.clear()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._entries = set(self)
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._entries = set(self)
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._entries = set(self)
+        return self
+
+
+FOUND_FILES_AND_ERRORS: list = ReportedErrors()
+FOUND_FILES_AND_IGNORED_ERRORS: list = ReportedErrors()
 
 # predefined errors to be ignored in partner/community supported packs even if they do not appear in .pack-ignore
 PRESET_ERROR_TO_IGNORE = {
@@ -1560,6 +1625,7 @@ ALLOWED_IGNORE_ERRORS = (
         "GR103",
     ]
 )
+ALLOWED_IGNORE_ERROR_CODES = frozenset(ALLOWED_IGNORE_ERRORS)
 
 
 def get_all_error_codes() -> List:
@@ -1570,11 +1636,17 @@ def get_all_error_codes() -> List:
     return error_codes
 
 
+@lru_cache(maxsize=None)
+def _get_error_objects_by_code() -> Dict[str, Dict]:
+    error_objects: Dict[str, Dict] = {}
+    for error in ERROR_CODE.values():
+        # the first error with a code is the one returned by a scan of ERROR_CODE
+        error_objects.setdefault(error.get("code"), error)
+    return error_objects
+
+
 def get_error_object(error_code: str) -> Dict:
-    for error in ERROR_CODE:
-        if error_code == ERROR_CODE[error].get("code"):
-            return ERROR_CODE[error]
-    return {}
+    return _get_error_objects_by_code().get(error_code, {})
 
 
 @decorator.decorator
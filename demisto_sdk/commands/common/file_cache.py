@@ -0,0 +1,333 @@
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(
+    "demisto-sdk"
+)  # not using the standard logger, due to circular import
+
+DEFAULT_FILE_CACHE_MAX_MB = 256
+PERSISTENT_FILE_CACHE_NAME = "parsed_files.sqlite"
+DEFAULT_PERSISTENT_FILE_CACHE_MAX_MB = 512
+# the fraction of the max size the cache is trimmed to, once it exceeds the max size
+EVICTION_TARGET_RATIO = 0.8
+# how many writes are done between two size checks
+EVICTION_CHECK_INTERVAL = 200
+SQLITE_TIMEOUT_SECONDS = 30
+
+
+def get_sdk_version() -> str:
+    """Returns the installed demisto-sdk version, or "dev" when running from source."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return "dev"
+    try:
+        return version("demisto-sdk")
+    except PackageNotFoundError:
+        return "dev"
+
+
+def get_sdk_cache_dir() -> Path:
+    """
+    Returns the directory the SDK keeps its cross-run caches in.
+    Defaults to `~/.demisto-sdk/cache`, and can be overridden with the DEMISTO_SDK_CACHE_DIR environment variable.
+    """
+    from demisto_sdk.commands.common.constants import ENV_DEMISTO_SDK_CACHE_DIR
+
+    if cache_dir := os.getenv(ENV_DEMISTO_SDK_CACHE_DIR):
+        return Path(cache_dir)
+    return Path.home() / ".demisto-sdk" / "cache"
+
+
+def serialize(data: Any) -> Optional[bytes]:
+    """Serializes parsed file content for caching, returns None if the content can not be serialized."""
+    try:
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.debug(f"Could not serialize parsed content for caching: {e}")
+        return None
+
+
+def deserialize(blob: bytes) -> Any:
+    return pickle.loads(blob)
+
+
+class _CacheEntry(NamedTuple):
+    size: int
+    mtime_ns: int
+    payload: Union[str, bytes]
+    is_serialized: bool
+    nbytes: int
+
+
+class InMemoryFileCache:
+    """
+    A memory-budgeted, copy-safe, in-process cache of file contents.
+
+    Parsed content is kept serialized, and every `get` returns a freshly deserialized object. Callers may freely
+    mutate what they get, without affecting the cache or other callers.
+    Raw text content is immutable and is kept as is.
+
+    Entries are validated against the file size and mtime_ns on every `get`, so files written during the run
+    (e.g. by format) are re-read automatically. Once the held bytes exceed `max_size_bytes`, the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_FILE_CACHE_MAX_MB * 1024 * 1024):
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_held = 0
+        self._entries: "OrderedDict[Tuple[str, Any], _CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, path: Union[Path, str], variant: Any, stat: os.stat_result
+    ) -> Tuple[bool, Any]:
+        """
+        Args:
+            path: The absolute path of the file.
+            variant: Distinguishes different representations of the same file (e.g. raw content or keep_order).
+            stat: The current stat of the file.
+
+        Returns:
+            A (found, content) tuple.
+        """
+        key = (str(path), variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry.size, entry.mtime_ns) != (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        if entry.is_serialized:
+            return True, deserialize(entry.payload)  # type: ignore[arg-type]
+        return True, entry.payload
+
+    def set(
+        self,
+        path: Union[Path, str],
+        variant: Any,
+        stat: os.stat_result,
+        payload: Union[str, bytes],
+        is_serialized: bool,
+    ):
+        """
+        Stores the content of a file. `payload` is either the raw text of the file, or its serialized parsed content.
+        """
+        nbytes = len(payload) if is_serialized else sys.getsizeof(payload)
+        if nbytes > self.max_size_bytes:
+            return
+        key = (str(path), variant)
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self.bytes_held -= previous.nbytes
+            self._entries[key] = _CacheEntry(
+                stat.st_size, stat.st_mtime_ns, payload, is_serialized, nbytes
+            )
+            self.bytes_held += nbytes
+            while self.bytes_held > self.max_size_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes_held -= evicted.nbytes
+                self.evictions += 1
+
+    def invalidate(self, path: Union[Path, str]):
+        """Removes all the cached representations of a single file."""
+        path = str(path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self.bytes_held -= self._entries.pop(key).nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes_held = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes_held": self.bytes_held,
+        }
+
+
+class PersistentFileCache:
+    """
+    An on-disk cache of parsed yml/json files, shared between runs and between worker processes.
+
+    Entries are keyed by (absolute path, keep_order) and are valid only while the file size, mtime_ns and
+    the sdk version match the ones that were recorded when the file was parsed.
+    Parsed objects are stored as pickle blobs (see `serialize`), so round-trip (keep_order) ruamel objects keep their comments.
+    The cache is bounded by `max_size_bytes`, least recently used entries are evicted first.
+
+    Every process opens its own sqlite connection, so the cache can be safely used from forked workers.
+    Any sqlite error disables the cache for the rest of the process, it is never allowed to fail a command.
+    """
+
+    def __init__(
+        self,
+        cache_path: Union[Path, str],
+        max_size_bytes: int = DEFAULT_PERSISTENT_FILE_CACHE_MAX_MB * 1024 * 1024,
+        sdk_version: Optional[str] = None,
+    ):
+        self.cache_path = Path(cache_path)
+        self.max_size_bytes = max_size_bytes
+        self.sdk_version = sdk_version or get_sdk_version()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.disabled = False
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+        # a connection must never be shared with a forked child, open a new one per process.
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            str(self.cache_path),
+            timeout=SQLITE_TIMEOUT_SECONDS,
+            isolation_level=None,  # autocommit, every statement is its own transaction
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS parsed_files ("
+            "path TEXT NOT NULL, "
+            "keep_order INTEGER NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "sdk_version TEXT NOT NULL, "
+            "data BLOB NOT NULL, "
+            "last_access REAL NOT NULL, "
+            "PRIMARY KEY (path, keep_order))"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS parsed_files_last_access ON parsed_files (last_access)"
+        )
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+
+    def _disable(self, error: Exception):
+        logger.debug(
+            f"Disabling the persistent file cache at {self.cache_path}: {error}",
+            exc_info=True,
+        )
+        self.disabled = True
+
+    def get(
+        self, path: Path, stat: os.stat_result, keep_order: bool
+    ) -> Optional[bytes]:
+        """
+        Returns the serialized parsed content of `path`, or None if there is no valid entry for its current stat.
+        """
+        if self.disabled:
+            return None
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT size, mtime_ns, sdk_version, data FROM parsed_files WHERE path=? AND keep_order=?",
+                (str(path), int(keep_order)),
+            ).fetchone()
+            if row is None or tuple(row[:3]) != (
+                stat.st_size,
+                stat.st_mtime_ns,
+                self.sdk_version,
+            ):
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE parsed_files SET last_access=? WHERE path=? AND keep_order=?",
+                (time.time(), str(path), int(keep_order)),
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+            return None
+        self.hits += 1
+        return bytes(row[3])
+
+    def set(self, path: Path, stat: os.stat_result, keep_order: bool, blob: bytes):
+        """Stores the serialized parsed content of `path`, replacing any previous entry of the same path."""
+        if self.disabled:
+            return
+        try:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO parsed_files "
+                "(path, keep_order, size, mtime_ns, sdk_version, data, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(path),
+                    int(keep_order),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    self.sdk_version,
+                    sqlite3.Binary(blob),
+                    time.time(),
+                ),
+            )
+            self.writes += 1
+            if self.writes % EVICTION_CHECK_INTERVAL == 1:
+                self.evict()
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+
+    def evict(self):
+        """Removes the least recently used entries, until the cache is below its target size."""
+        connection = self._connect()
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM parsed_files"
+        ).fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+        to_free = total_size - int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+        freed = 0
+        stale_keys = []
+        for path, keep_order, size in connection.execute(
+            "SELECT path, keep_order, LENGTH(data) FROM parsed_files ORDER BY last_access"
+        ):
+            if freed >= to_free:
+                break
+            stale_keys.append((path, keep_order))
+            freed += size
+        connection.executemany(
+            "DELETE FROM parsed_files WHERE path=? AND keep_order=?", stale_keys
+        )
+        self.evictions += len(stale_keys)
+        logger.debug(
+            f"Evicted {len(stale_keys)} entries ({freed} bytes) from the persistent file cache"
+        )
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        try:
+            self._connect().execute("DELETE FROM parsed_files")
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
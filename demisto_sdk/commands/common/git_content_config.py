@@ -15,6 +15,7 @@ import requests
 
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.http_client import http_get
 
 logger = logging.getLogger("demisto-sdk")
 
@@ -264,7 +265,7 @@ class GitContentConfig:
             return github_hostname, repo_name
         github_hostname = GitContentConfig.GITHUB_TO_USERCONTENT.get(api_host, api_host)
         try:
-            r = requests.get(
+            r = http_get(
                 f"https://api.{api_host}/repos/{repo_name}",
                 headers={
                     "Authorization": f"Bearer {GitContentConfig.CREDENTIALS.github_token}"
@@ -277,7 +278,7 @@ class GitContentConfig:
             )
             if r.ok:
                 return github_hostname, repo_name
-            r = requests.get(
+            r = http_get(
                 f"https://api.{api_host}/repos/{repo_name}",
                 verify=False,
                 params={"token": GitContentConfig.CREDENTIALS.github_token},
@@ -330,7 +331,7 @@ class GitContentConfig:
         try:
             res = None
             if project_id:
-                res = requests.get(
+                res = http_get(
                     f"https://{gitlab_hostname}/api/v4/projects/{project_id}",
                     headers={
                         "PRIVATE-TOKEN": GitContentConfig.CREDENTIALS.gitlab_token
@@ -342,7 +343,7 @@ class GitContentConfig:
                     return gitlab_hostname, project_id
 
             if repo_name:
-                res = requests.get(
+                res = http_get(
                     f"https://{gitlab_hostname}/api/v4/projects",
                     params={"search": repo_name},
                     headers={
@@ -0,0 +1,152 @@
+import atexit
+import logging
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+logger = logging.getLogger(
+    "demisto-sdk"
+)  # not using the standard logger, due to circular import
+
+PathLike = Union[str, Path]
+
+
+class GitObject(NamedTuple):
+    sha: str
+    type: str
+    content: bytes
+
+
+class GitObjectReader:
+    """
+    Reads objects (e.g. `origin/master:Packs/MyPack/pack_metadata.json`) from a git repository, through one long-lived
+    `git cat-file --batch` process per repository, instead of spawning git for every file.
+
+    Object names are resolved once, and the object contents are cached by their sha, so the same blob requested under
+    different names (e.g. a renamed file, or the same branch through different refs) is read once.
+    `prefetch` reads many objects in a single round trip.
+    """
+
+    _readers: Dict[Path, "GitObjectReader"] = {}
+    _readers_lock = threading.Lock()
+
+    def __init__(self, repo_path: PathLike):
+        self.repo_path = Path(repo_path)
+        self._lock = threading.RLock()
+        self._process: Optional[subprocess.Popen] = None
+        self._process_pid: Optional[int] = None
+        self._object_shas: Dict[str, Optional[str]] = {}
+        self._objects: Dict[str, GitObject] = {}
+
+    @classmethod
+    def get(cls, repo_path: PathLike) -> "GitObjectReader":
+        """Returns the reader of the repository at `repo_path`, shared by the whole process."""
+        repo_path = Path(os.path.abspath(repo_path))
+        with cls._readers_lock:
+            if (reader := cls._readers.get(repo_path)) is None:
+                if not cls._readers:
+                    atexit.register(cls.clear)
+                reader = cls._readers[repo_path] = cls(repo_path)
+        return reader
+
+    @classmethod
+    def clear(cls):
+        """Stops the git processes and drops the objects read by this process."""
+        with cls._readers_lock:
+            for reader in cls._readers.values():
+                reader.close()
+            cls._readers.clear()
+
+    def close(self):
+        with self._lock:
+            process, self._process = self._process, None
+            # a process inherited from the parent (after a fork) belongs to the parent
+            if process and self._process_pid == os.getpid():
+                try:
+                    process.stdin.close()  # type: ignore[union-attr]
+                    process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    process.kill()
+
+    def _get_process(self) -> subprocess.Popen:
+        if (
+            self._process is None
+            or self._process_pid != os.getpid()
+            or self._process.poll() is not None
+        ):
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._process_pid = os.getpid()
+        return self._process
+
+    def _read_response(self, process: subprocess.Popen, name: str):
+        header = process.stdout.readline()  # type: ignore[union-attr]
+        if not header:
+            raise OSError(f"git cat-file exited while reading {name}")
+        parts = header.decode().split()
+        if len(parts) != 3 or parts[-1] in ("missing", "ambiguous"):
+            # `<name> missing`, the name itself may contain spaces
+            self._object_shas[name] = None
+            return
+        sha, object_type, size = parts
+        content = process.stdout.read(int(size))  # type: ignore[union-attr]
+        process.stdout.read(1)  # type: ignore[union-attr]
+        self._object_shas[name] = sha
+        self._objects.setdefault(sha, GitObject(sha, object_type, content))
+
+    def _fetch(self, names: List[str]):
+        """Requests all the names at once, and reads the responses while they are written."""
+        process = self._get_process()
+        request = "".join(f"{name}\n" for name in names).encode()
+
+        def write_request():
+            try:
+                process.stdin.write(request)  # type: ignore[union-attr]
+                process.stdin.flush()  # type: ignore[union-attr]
+            except OSError:  # the process exited, reported by the reads
+                pass
+
+        # writing in another thread, as git blocks once its output is not read
+        writer = threading.Thread(target=write_request, daemon=True)
+        writer.start()
+        try:
+            for name in names:
+                self._read_response(process, name)
+        except (OSError, ValueError):
+            process.kill()
+            self._process = None
+            raise
+        finally:
+            writer.join()
+
+    def prefetch(self, names: Iterable[str]) -> int:
+        """Reads all the objects that were not read yet in one batch, returns how many were requested."""
+        with self._lock:
+            names_to_fetch = [
+                name
+                for name in dict.fromkeys(names)
+                if name not in self._object_shas and "\n" not in name
+            ]
+            if names_to_fetch:
+                self._fetch(names_to_fetch)
+            logger.debug(
+                f"Prefetched {len(names_to_fetch)} git objects from {self.repo_path}"
+            )
+            return len(names_to_fetch)
+
+    def read(self, name: str) -> Optional[GitObject]:
+        """Returns the object of the given name (e.g. `origin/master:README.md`), or None if it does not exist."""
+        with self._lock:
+            if name not in self._object_shas:
+                if "\n" in name:
+                    return None
+                self._fetch([name])
+            sha = self._object_shas[name]
+            return self._objects[sha] if sha else None
@@ -1,15 +1,213 @@
 import os
 import re
+from functools import cached_property
 from pathlib import Path
-from typing import Set, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import click
 import gitdb
-from git import InvalidGitRepositoryError, Repo
+from git import GitCommandError, InvalidGitRepositoryError, Repo
+from git.compat import safe_decode
 from git.diff import Lit_change_type
 from git.remote import Remote
 
 from demisto_sdk.commands.common.constants import PACKS_FOLDER
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+
+
+class ChangedFile(NamedTuple):
+    status: str
+    score: Optional[int]
+    a_path: Path
+    b_path: Path
+
+
+def parse_name_status(output: str) -> List[ChangedFile]:
+    """Parses the output of `git diff --name-status -z`.
+    Args:
+        output (str): the git output.
+    Returns:
+        List: of the changed files, the score is set for renames (R) and copies (C) only.
+    """
+    tokens = output.split("\0")
+    changed_files = []
+    i = 0
+    while i < len(tokens) and tokens[i]:
+        status = tokens[i]
+        if status[0] in ("R", "C"):
+            a_path, b_path = tokens[i + 1], tokens[i + 2]
+            changed_files.append(
+                ChangedFile(status[0], int(status[1:] or 0), Path(a_path), Path(b_path))
+            )
+            i += 3
+        else:
+            changed_files.append(
+                ChangedFile(status[0], None, Path(tokens[i + 1]), Path(tokens[i + 1]))
+            )
+            i += 2
+    return changed_files
+
+
+def parse_untracked_files(git_status: List[str], requested_status: str) -> set:
+    """return all untracked files of the given requested status.
+    Args:
+        git_status (List): the lines of `git status --short -u`.
+        requested_status (str): M, A, R, D - the git status to return
+    Returns:
+        Set: of path strings which include the untracked files of a certain status.
+    """
+    # in case there are no local changes - return
+    if git_status == [""]:
+        return set()
+
+    extracted_paths = set()
+    for line in git_status:
+        line = line.strip()
+        file_status = line.split()[0].upper() if not line.startswith("?") else "A"
+        if file_status.startswith(requested_status):
+            if requested_status == "R":
+                if file_status == "R100":
+                    extracted_paths.add(
+                        (Path(line.split()[-2]), Path(line.split()[-1]))
+                    )
+            else:
+                extracted_paths.add(Path(line.split()[-1]))  # type: ignore
+
+    return extracted_paths
+
+
+class GitChangeSnapshot:
+    """
+    The changes of the current branch against prev_ver, each read from git once and memoized.
+
+    The committed changes are read with one `git diff --name-status -M` against prev_ver, and the staged changes with
+    one `git diff --cached --name-status -M`, so the `*_files` methods of GitUtil all derive from the same few git
+    calls instead of diffing the branch for every file status.
+    A snapshot is taken for a given HEAD, prev_ver commit and git index (see `GitUtil.change_snapshot`). The untracked
+    and unstaged changes are not part of it, and are read with `git status` whenever they are requested.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        remote: Optional[str],
+        branch: str,
+        current_branch_or_hash: str,
+        current_hash: str,
+    ):
+        self.repo = repo
+        # if remote does not exist we are checking against the commit sha1
+        self.base = f"{remote}/{branch}" if remote else branch
+        self.current_branch_or_hash = current_branch_or_hash
+        self.current_hash = current_hash
+
+    @cached_property
+    def committed(self) -> List[ChangedFile]:
+        """The changes from prev_ver, which can include files that were not touched on this branch."""
+        return parse_name_status(
+            self.repo.git.diff(
+                "--name-status",
+                "-M",
+                "-z",
+                "--no-color",
+                self.base,
+                self.current_branch_or_hash,
+            )
+        )
+
+    @cached_property
+    def staged(self) -> List[ChangedFile]:
+        return parse_name_status(
+            self.repo.git.diff(
+                "--cached", "--name-status", "-M", "-z", "--no-color", "HEAD"
+            )
+        )
+
+    @cached_property
+    def branch_changed_files(self) -> Set[Path]:
+        """All the files that were touched on this branch, regardless of status."""
+        return {
+            Path(os.path.join(item))
+            for item in self.repo.git.diff(
+                "--name-only", f"{self.base}...{self.current_hash}"
+            ).split("\n")
+            if item
+        }
+
+    @cached_property
+    def branch_statuses(self) -> Dict[Path, str]:
+        """The status (M, A, D, ...) of every file that was touched on this branch, without rename detection."""
+        return {
+            changed_file.b_path: changed_file.status
+            for changed_file in parse_name_status(
+                self.repo.git.diff(
+                    "--name-status",
+                    "--no-renames",
+                    "-z",
+                    "--no-color",
+                    f"{self.base}...{self.current_branch_or_hash}",
+                )
+            )
+        }
+
+    def read_git_status(self) -> List[str]:
+        # without refreshing the index, which would change it and invalidate the snapshot
+        return self.repo.git.status(
+            "--short", "-u", env={"GIT_OPTIONAL_LOCKS": "0"}
+        ).split("\n")
+
+    @staticmethod
+    def of_type(changes: List[ChangedFile], change_type: str) -> List[ChangedFile]:
+        """The changes of a given type, like git.DiffIndex.iter_change_type.
+        Args:
+            changes (List): the changes to filter.
+            change_type (str): M, A, R, D - the requested change type.
+        Returns:
+            List: of the changes of the requested type, non 100% renames and type changes are modified as well.
+        """
+        if change_type == "M":
+            return [
+                changed_file
+                for changed_file in changes
+                if changed_file.status in ("M", "T")
+                or (changed_file.status == "R" and changed_file.score != 100)
+            ]
+        return [
+            changed_file
+            for changed_file in changes
+            if changed_file.status == change_type
+        ]
+
+    def committed_files(self, change_type: str) -> Set[Path]:
+        return {
+            changed_file.a_path
+            for changed_file in self.of_type(self.committed, change_type)
+        }
+
+    def staged_files(self, change_type: str) -> Set[Path]:
+        return {
+            changed_file.a_path
+            for changed_file in self.of_type(self.staged, change_type)
+        }
+
+    def untracked_files(self, requested_status: str) -> set:
+        return parse_untracked_files(self.read_git_status(), requested_status)
+
+    def wrong_renamed_files(self, status: str, staged_only: bool) -> Set[Path]:
+        """Get all the files that are recognized as non-100% rename, and are of a given status on this branch.
+        Args:
+            status (str): the requested file status
+            staged_only (bool): whether to bring only staged files
+        Returns:
+            Set: of Paths to non 100% renamed files which are of a given status.
+        """
+        changes = self.staged if staged_only else self.committed
+        return {
+            changed_file.b_path
+            for changed_file in self.of_type(changes, "R")
+            if (changed_file.score or 0) < 100
+            and self.branch_statuses.get(changed_file.b_path, "") == status
+        }
 
 
 class GitUtil:
@@ -25,6 +223,65 @@ class GitUtil:
                 )
         else:
             self.repo = repo
+        # the snapshots by (remote, branch), along with the commit of prev_ver they were taken at
+        self._change_snapshots: Dict[
+            Tuple[Optional[str], str], Tuple[GitChangeSnapshot, Optional[str]]
+        ] = {}
+        self._change_snapshots_state: Optional[Tuple] = None
+
+    def change_snapshot(self, prev_ver: str = "") -> GitChangeSnapshot:
+        """Get the memoized changes of the current branch against prev_ver.
+
+        The snapshot is taken again once HEAD moves, prev_ver points to another commit (e.g. after a fetch), or the
+        git index changes (e.g. after staging a file).
+        Args:
+            prev_ver (str): The base branch against which the comparison is made.
+        Returns:
+            GitChangeSnapshot: the changes against prev_ver.
+        """
+        return self._change_snapshot(*self.handle_prev_ver(prev_ver))
+
+    def _change_snapshot(self, remote: Optional[str], branch: str) -> GitChangeSnapshot:
+        current_branch_or_hash = self.get_current_git_branch_or_hash()
+        current_hash = self.get_current_commit_hash()
+        # the snapshots of the same HEAD and index, the snapshot of every prev_ver is kept along with its commit
+        state = (current_branch_or_hash, current_hash, self._index_state())
+        if self._change_snapshots_state != state:
+            self._change_snapshots = {}
+            self._change_snapshots_state = state
+        base_sha = self._resolve_commit(f"{remote}/{branch}" if remote else branch)
+        snapshot_and_sha = self._change_snapshots.get((remote, branch))
+        if snapshot_and_sha is None or snapshot_and_sha[1] != base_sha:
+            snapshot_and_sha = self._change_snapshots[(remote, branch)] = (
+                GitChangeSnapshot(
+                    self.repo, remote, branch, current_branch_or_hash, current_hash
+                ),
+                base_sha,
+            )
+        return snapshot_and_sha[0]
+
+    def clear_change_snapshots(self):
+        """Drops the memoized changes, so they are read again from git."""
+        self._change_snapshots = {}
+        self._change_snapshots_state = None
+
+    def _index_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(os.path.join(self.repo.git_dir, "index"))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _resolve_commit(self, rev: str) -> Optional[str]:
+        try:
+            return self.repo.rev_parse(rev).hexsha
+        except (gitdb.exc.BadName, ValueError):
+            return None
+
+    @property
+    def object_reader(self) -> GitObjectReader:
+        """The reader of the objects of the repository, shared by all the GitUtil instances of the process."""
+        return GitObjectReader.get(self.repo.working_tree_dir or self.repo.git_dir)
 
     def get_all_files(self) -> Set[Path]:
         return set(map(Path, self.repo.git.ls_files().split("\n")))
@@ -47,9 +304,6 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the modified files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="M")
         if last_commit:
@@ -58,19 +312,12 @@ class GitUtil:
             )
             return last_commit
 
+        snapshot = self.change_snapshot(prev_ver)
+
         # get all renamed files - some of these can be identified as modified by git,
         # but we want to identify them as renamed - so will remove them from the returned files.
         renamed = {item[0] for item in self.renamed_files(prev_ver, committed_only, staged_only)}  # type: ignore[index]
 
-        # handle a case where a file is wrongly recognized as renamed (not 100% score) and
-        # is actually of modified status
-        untrue_rename_staged = self.handle_wrong_renamed_status(
-            status="M", remote=remote, branch=branch, staged_only=True
-        )
-        untrue_rename_committed = self.handle_wrong_renamed_status(
-            status="M", remote=remote, branch=branch, staged_only=False
-        )
-
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         committed = set()
@@ -78,23 +325,10 @@ class GitUtil:
         if not staged_only:
             # get all committed files identified as modified which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("M")
-                }.union(untrue_rename_committed)
+            # a file wrongly recognized as renamed (not 100% score) can actually be of modified status.
+            committed = snapshot.committed_files("M").union(
+                snapshot.wrong_renamed_files(status="M", staged_only=False)
+            )
 
             # identify all files that were touched on this branch regardless of status
             # intersect these with all the committed files to identify the committed modified files.
@@ -113,16 +347,13 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked modified files
-            untracked = self._get_untracked_files("M")
+            untracked = snapshot.untracked_files("M")
 
         # get all the files that are staged on the branch and identified as modified.
         staged = (
-            {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.head.commit.diff().iter_change_type("M")
-            }
+            snapshot.staged_files("M")
             .union(untracked)
-            .union(untrue_rename_staged)
+            .union(snapshot.wrong_renamed_files(status="M", staged_only=True))
         )
 
         # If a file is Added in regards to prev_ver
@@ -130,25 +361,7 @@ class GitUtil:
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will remove it from the staged modified files.
         # also remove the deleted and renamed files as well.
-        if remote:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed_added = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }
-
-        staged = staged - committed_added - renamed - deleted
+        staged = staged - snapshot.committed_files("A") - renamed - deleted
 
         if staged_only:
             self.debug_print(
@@ -180,9 +393,6 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the added files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="A")
         if last_commit:
@@ -191,35 +401,16 @@ class GitUtil:
             )
             return last_commit
 
-        deleted = self.deleted_files(prev_ver, committed_only, staged_only)
+        snapshot = self.change_snapshot(prev_ver)
 
-        # handle a case where a file is wrongly recognized as renamed (not 100% score) and is actually of added status
-        untrue_rename_staged = self.handle_wrong_renamed_status(
-            status="A", remote=remote, branch=branch, staged_only=True
-        )
-        untrue_rename_committed = self.handle_wrong_renamed_status(
-            status="A", remote=remote, branch=branch, staged_only=False
-        )
+        deleted = self.deleted_files(prev_ver, committed_only, staged_only)
 
         # get all committed files identified as added which are changed from prev_ver.
         # this can result in extra files identified which were not touched on this branch.
-        if remote:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            committed = {
-                Path(os.path.join(item.a_path))
-                for item in self.repo.commit(rev=branch)
-                .diff(current_branch_or_hash)
-                .iter_change_type("A")
-            }.union(untrue_rename_committed)
+        # a file wrongly recognized as renamed (not 100% score) can actually be of added status.
+        committed = snapshot.committed_files("A").union(
+            snapshot.wrong_renamed_files(status="A", staged_only=False)
+        )
 
         # identify all files that were touched on this branch regardless of status
         # intersect these with all the committed files to identify the committed added files.
@@ -238,27 +429,26 @@ class GitUtil:
         untracked_added: Set = set()
         untracked_modified: Set = set()
         if include_untracked:
+            git_status = snapshot.read_git_status()
             # get all untracked added files
-            untracked_added = self._get_untracked_files("A")
+            untracked_added = parse_untracked_files(git_status, "A")
 
             # get all untracked modified files
-            untracked_modified = self._get_untracked_files("M")
+            untracked_modified = parse_untracked_files(git_status, "M")
 
         # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("A")
-        }.union(untrue_rename_staged)
+        staged = snapshot.staged_files("A").union(
+            snapshot.wrong_renamed_files(status="A", staged_only=True)
+        )
 
         # If a file is Added in regards to prev_ver
         # and is then modified locally after being committed - it is identified as modified
         # but we want to identify the file as Added (its actual status against prev_ver) -
         # so will added it from the staged added files.
         # same goes to untracked files - can be identified as modified but are actually added against prev_ver
-        committed_added_locally_modified = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("M")
-        }.intersection(committed)
+        committed_added_locally_modified = snapshot.staged_files("M").intersection(
+            committed
+        )
         untracked = untracked_added.union(untracked_modified.intersection(committed))
 
         staged = staged.union(committed_added_locally_modified).union(untracked)
@@ -294,39 +484,22 @@ class GitUtil:
         Returns:
             Set: A set of Paths to the deleted files.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="D")
         if last_commit:
             return last_commit
 
+        snapshot = self.change_snapshot(prev_ver)
+
         committed = set()
 
         if not staged_only:
-            # get all committed files identified as added which are changed from prev_ver.
+            # get all committed files identified as deleted which are changed from prev_ver.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    Path(os.path.join(item.a_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("D")
-                }
+            committed = snapshot.committed_files("D")
 
             # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
+            # intersect these with all the committed files to identify the committed deleted files.
             all_branch_changed_files = self._get_all_changed_files(prev_ver)
             committed = committed.intersection(all_branch_changed_files)
 
@@ -336,13 +509,10 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked deleted files
-            untracked = self._get_untracked_files("D")
+            untracked = snapshot.untracked_files("D")
 
-        # get all the files that are staged on the branch and identified as added.
-        staged = {
-            Path(os.path.join(item.a_path))
-            for item in self.repo.head.commit.diff().iter_change_type("D")
-        }.union(untracked)
+        # get all the files that are staged on the branch and identified as deleted.
+        staged = snapshot.staged_files("D").union(untracked)
 
         if staged_only:
             return staged
@@ -370,9 +540,6 @@ class GitUtil:
             Set: A set of Tuples of Paths to the renamed files -
             first element being the old file path and the second is the new.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
         # when checking branch against itself only return the last commit.
         last_commit = self._only_last_commit(prev_ver, requested_status="R")
         if last_commit:
@@ -381,34 +548,22 @@ class GitUtil:
             )
             return last_commit
 
+        snapshot = self.change_snapshot(prev_ver)
+
         deleted = self.deleted_files(prev_ver, committed_only, staged_only)
         committed = set()
 
         if not staged_only:
             # get all committed files identified as renamed which are changed from prev_ver and are with 100% score.
             # this can result in extra files identified which were not touched on this branch.
-            if remote:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.remote(name=remote)
-                    .refs[branch]
-                    .commit.diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
-
-            # if remote does not exist we are checking against the commit sha1
-            else:
-                committed = {
-                    (Path(item.a_path), Path(item.b_path))
-                    for item in self.repo.commit(rev=branch)
-                    .diff(current_branch_or_hash)
-                    .iter_change_type("R")
-                    if item.score == 100
-                }
+            committed = {
+                (item.a_path, item.b_path)
+                for item in snapshot.of_type(snapshot.committed, "R")
+                if item.score == 100
+            }
 
             # identify all files that were touched on this branch regardless of status
-            # intersect these with all the committed files to identify the committed added files.
+            # intersect these with all the committed files to identify the committed renamed files.
             all_branch_changed_files = self._get_all_changed_files(prev_ver)
             committed = {
                 tuple_item
@@ -432,12 +587,12 @@ class GitUtil:
         untracked: Set = set()
         if include_untracked:
             # get all untracked renamed files
-            untracked = self._get_untracked_files("R")
+            untracked = snapshot.untracked_files("R")
 
         # get all the files that are staged on the branch and identified as renamed and are with 100% score.
         staged = {
-            (Path(item.a_path), Path(item.b_path))
-            for item in self.repo.head.commit.diff().iter_change_type("R")
+            (item.a_path, item.b_path)
+            for item in snapshot.of_type(snapshot.staged, "R")
             if item.score == 100
         }.union(untracked)
 
@@ -476,26 +631,9 @@ class GitUtil:
         Returns:
             Set: of path strings which include the untracked files of a certain status.
         """
-        git_status = self.repo.git.status("--short", "-u").split("\n")
-
-        # in case there are no local changes - return
-        if git_status == [""]:
-            return set()
-
-        extracted_paths = set()
-        for line in git_status:
-            line = line.strip()
-            file_status = line.split()[0].upper() if not line.startswith("?") else "A"
-            if file_status.startswith(requested_status):
-                if requested_status == "R":
-                    if file_status == "R100":
-                        extracted_paths.add(
-                            (Path(line.split()[-2]), Path(line.split()[-1]))
-                        )
-                else:
-                    extracted_paths.add(Path(line.split()[-1]))  # type: ignore
-
-        return extracted_paths
+        return parse_untracked_files(
+            self.repo.git.status("--short", "-u").split("\n"), requested_status
+        )
 
     def _get_staged_files(self) -> Set[Path]:
         """Get only staged files
@@ -516,27 +654,7 @@ class GitUtil:
         Returns:
             Set: of Paths to files changed in the current branch.
         """
-        remote, branch = self.handle_prev_ver(prev_ver)
-        current_hash = self.get_current_commit_hash()
-
-        if remote:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{remote}/{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        else:
-            return {
-                Path(os.path.join(item))
-                for item in self.repo.git.diff(
-                    "--name-only", f"{branch}...{current_hash}"
-                ).split("\n")
-                if item
-            }
+        return set(self.change_snapshot(prev_ver).branch_changed_files)
 
     def _only_last_commit(
         self, prev_ver: str, requested_status: Lit_change_type
@@ -668,45 +786,9 @@ class GitUtil:
         Returns:
             Set: of Paths to non 100% renamed files which are of a given status.
         """
-        current_branch_or_hash = self.get_current_git_branch_or_hash()
-
-        if staged_only:
-            return {
-                Path(item.b_path)
-                for item in self.repo.head.commit.diff().iter_change_type("R")
-                if item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        if remote:
-            return {
-                Path(item.b_path)
-                for item in self.repo.remote(name=remote)
-                .refs[branch]
-                .commit.diff(current_branch_or_hash)
-                .iter_change_type("R")
-                if item.score < 100
-                and self._check_file_status(
-                    file_path=str(item.b_path), remote=remote, branch=branch
-                )
-                == status
-            }
-
-        # if remote does not exist we are checking against the commit sha1
-        return {
-            Path(item.b_path)
-            for item in self.repo.commit(rev=branch)
-            .diff(current_branch_or_hash)
-            .iter_change_type("R")
-            if item.score < 100
-            and self._check_file_status(
-                file_path=str(item.b_path), remote=remote, branch=branch
-            )
-            == status
-        }
+        return self._change_snapshot(remote, branch).wrong_renamed_files(
+            status=status, staged_only=staged_only
+        )
 
     def _check_file_status(self, file_path: str, remote: str, branch: str) -> str:
         """Get the git status of a given file path
@@ -747,8 +829,18 @@ class GitUtil:
         Returns:
             The fetched file content.
         """
-        file_content = self.repo.git.show(git_file_path)
-        return file_content
+        git_object = self.object_reader.read(git_file_path)
+        if git_object is None:
+            raise GitCommandError(
+                ["git", "cat-file", "--batch"],
+                128,
+                f"fatal: invalid object name '{git_file_path}'",
+            )
+        if git_object.type != "blob":
+            return self.repo.git.show(git_file_path)
+        # like `git show`, without the trailing newline
+        file_content = safe_decode(git_object.content)
+        return file_content[:-1] if file_content.endswith("\n") else file_content
 
     def get_local_remote_file_path(self, full_file_path: str, tag: str) -> str:
         """Get local file path of remote branch. For example get origin/master:README.md
@@ -760,7 +852,10 @@ class GitUtil:
         Returns:
             The git file path. For example get origin/master:README.md
         """
-        relative_file_path = os.path.relpath(full_file_path, self.git_path())
+        relative_file_path = os.path.relpath(
+            os.path.realpath(full_file_path),
+            os.path.realpath(self.repo.working_tree_dir),  # type: ignore[arg-type]
+        )
         try:
             remote_name: Union[Remote, str] = self.repo.remote()
         except ValueError as exc:
@@ -0,0 +1,109 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common.handlers import LIBYAML_Handler, YAML_Handler
+from demisto_sdk.commands.common.handlers.yaml import libyaml_handler
+from demisto_sdk.commands.common.legacy_git_tools import git_path
+
+TEST_FILES = Path(git_path()) / "demisto_sdk" / "tests" / "test_files"
+
+
+class TestLIBYAMLHandler:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "a: 017",
+            "a: 0o17",
+            "a: 0x1F",
+            "a: yes",
+            "a: off",
+            "a: 1_000",
+            "a: 1:20",
+            "a: .5",
+            "a: -.inf",
+            "a: ~",
+            "a:",
+            "a: 2020-01-01",
+            "a: 2001-12-14t21:59:43.10-05:00",
+            "a: 1e3",
+            "a: +12",
+            "base: &base {x: 1}\nchild:\n  <<: *base\n  y: 2",
+        ],
+    )
+    def test_same_as_ruamel_safe(self, text: str):
+        """
+        Given
+            - A yml text with values that are resolved differently between YAML 1.1 and YAML 1.2
+        When
+            - Loading it with the libyaml handler
+        Then
+            - Ensure the result is the same as ruamel's safe loader (YAML 1.2)
+        """
+        assert LIBYAML_Handler().load(text) == YAML_Handler(typ="safe").load(
+            StringIO(text)
+        )
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "fake_integration.yml",
+            "test_playbook_value_starting_with_equal_sign.yml",
+            "playbook-Test_playbook.yml",
+        ],
+    )
+    def test_same_as_ruamel_safe_files(self, file_name: str):
+        """
+        Given
+            - A content yml file
+        When
+            - Loading it with the libyaml handler
+        Then
+            - Ensure the result is the same as loading it with ruamel's safe loader (after the `simple: =` fix)
+        """
+        text = (TEST_FILES / file_name).read_text()
+        fixed_text = libyaml_handler.SIMPLE_VALUE_EQUALS_PATTERN.sub(r'\1"\2"\3', text)
+        assert LIBYAML_Handler().load(text) == YAML_Handler(typ="safe").load(
+            StringIO(fixed_text)
+        )
+
+    def test_simple_equals_sign(self):
+        """
+        Given
+            - A playbook condition whose value is a plain `=`
+        When
+            - Loading it with the libyaml handler
+        Then
+            - Ensure the value is loaded as a string, without rewriting the text beforehand
+        """
+        assert LIBYAML_Handler().load("value:\n  simple: =\n") == {
+            "value": {"simple": "="}
+        }
+
+    def test_duplicate_keys(self):
+        """
+        Given
+            - A yml with duplicate keys
+        When
+            - Loading it with the libyaml handler
+        Then
+            - Ensure an error is raised, like ruamel does
+        """
+        with pytest.raises(Exception, match="duplicate key"):
+            LIBYAML_Handler().load("a: 1\na: 2\n")
+
+    def test_fallback_to_ruamel(self, monkeypatch):
+        """
+        Given
+            - libyaml is not available
+        When
+            - Loading a yml with the libyaml handler
+        Then
+            - Ensure ruamel is used, and the `simple: =` fix is still applied
+        """
+        monkeypatch.setattr(libyaml_handler, "CSafeLoader", None)
+        handler = LIBYAML_Handler()
+
+        assert not handler.is_accelerated
+        assert handler.load(StringIO("simple: =\n")) == {"simple": "="}
@@ -0,0 +1,167 @@
+import re
+from io import StringIO
+from typing import IO, Any, Union
+
+from ruamel.yaml.util import (  # noqa:TID251 - the timestamps are constructed like ruamel does
+    create_timestamp,
+    timestamp_regexp,
+)
+
+from demisto_sdk.commands.common.handlers.xsoar_handler import XSOAR_Handler
+from demisto_sdk.commands.common.handlers.yaml.ruamel_handler import RUAMEL_Handler
+
+try:
+    from yaml import CSafeLoader
+    from yaml.constructor import ConstructorError
+    from yaml.nodes import MappingNode, ScalarNode
+    from yaml.resolver import Resolver
+except ImportError:  # PyYAML is not installed, or was built without libyaml
+    CSafeLoader = None
+
+# some playbooks use a plain `=` as a value (e.g. `simple: =`), which YAML resolves to the unsupported `value` tag.
+SIMPLE_VALUE_EQUALS_PATTERN = re.compile(r"(simple: \s*\n*)(=)(\s*\n)")
+
+if CSafeLoader is not None:
+
+    class _YAML12Resolver(Resolver):
+        """Resolves plain scalars the same way ruamel's safe loader does (YAML 1.2), instead of PyYAML's YAML 1.1."""
+
+        yaml_implicit_resolvers: dict = {}
+
+    for tag, regexp, first_chars in (
+        (
+            "tag:yaml.org,2002:bool",
+            r"^(?:true|True|TRUE|false|False|FALSE)$",
+            list("tTfF"),
+        ),
+        (
+            "tag:yaml.org,2002:float",
+            r"""^(?:
+             [-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+            |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+            |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+            |[-+]?\.(?:inf|Inf|INF)
+            |\.(?:nan|NaN|NAN))$""",
+            list("-+0123456789."),
+        ),
+        (
+            "tag:yaml.org,2002:int",
+            r"""^(?:[-+]?0b[0-1_]+
+            |[-+]?0o?[0-7_]+
+            |[-+]?[0-9_]+
+            |[-+]?0x[0-9a-fA-F_]+)$""",
+            list("-+0123456789"),
+        ),
+        ("tag:yaml.org,2002:merge", r"^(?:<<)$", ["<"]),
+        ("tag:yaml.org,2002:null", r"^(?: ~ |null|Null|NULL | )$", ["~", "n", "N", ""]),
+        (
+            "tag:yaml.org,2002:timestamp",
+            r"""^(?:[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+            |[0-9][0-9][0-9][0-9] -[0-9][0-9]? -[0-9][0-9]?
+            (?:[Tt]|[ \t]+)[0-9][0-9]?
+            :[0-9][0-9] :[0-9][0-9] (?:\.[0-9]*)?
+            (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?)$""",
+            list("0123456789"),
+        ),
+        ("tag:yaml.org,2002:value", r"^(?:=)$", ["="]),
+    ):
+        _YAML12Resolver.add_implicit_resolver(
+            tag, re.compile(regexp, re.X), first_chars
+        )
+
+    class _ReadOnlyLoader(CSafeLoader, _YAML12Resolver):  # type: ignore[misc,valid-type]
+        """libyaml based loader, producing the same objects as ruamel's safe loader."""
+
+        def construct_yaml_int(self, node):
+            # YAML 1.2 - a leading zero does not mean octal, and there are no sexagesimal ints
+            value = self.construct_scalar(node).replace("_", "")
+            sign = -1 if value[0] == "-" else 1
+            if value[0] in "+-":
+                value = value[1:]
+            if value.startswith("0b"):
+                return sign * int(value[2:], 2)
+            if value.startswith("0x"):
+                return sign * int(value[2:], 16)
+            if value.startswith("0o"):
+                return sign * int(value[2:], 8)
+            return sign * int(value)
+
+        def construct_yaml_timestamp(self, node):
+            # constructed by ruamel, as whether a timestamp with a timezone is naive UTC or aware depends on its version
+            match = timestamp_regexp.match(self.construct_scalar(node))
+            if match is None:
+                raise ConstructorError(
+                    None,
+                    None,
+                    f'failed to construct timestamp from "{node.value}"',
+                    node.start_mark,
+                )
+            return create_timestamp(**match.groupdict())
+
+        def construct_yaml_value(self, node):
+            # applies the `simple: =` fix while loading, rather than rewriting the whole text beforehand
+            return self.construct_scalar(node)
+
+        def construct_mapping(self, node, deep=False):
+            # like ruamel (allow_duplicate_keys=False), fail on duplicate keys rather than silently keeping the last
+            if isinstance(node, MappingNode):
+                keys = [
+                    key_node.value
+                    for key_node, _ in node.value
+                    if isinstance(key_node, ScalarNode)
+                ]
+                if len(keys) != len(set(keys)):
+                    duplicate = next(key for key in keys if keys.count(key) > 1)
+                    raise ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f'found duplicate key "{duplicate}"',
+                        node.start_mark,
+                    )
+            return super().construct_mapping(node, deep=deep)
+
+    _ReadOnlyLoader.add_constructor(
+        "tag:yaml.org,2002:int", _ReadOnlyLoader.construct_yaml_int
+    )
+    _ReadOnlyLoader.add_constructor(
+        "tag:yaml.org,2002:timestamp", _ReadOnlyLoader.construct_yaml_timestamp
+    )
+    _ReadOnlyLoader.add_constructor(
+        "tag:yaml.org,2002:value", _ReadOnlyLoader.construct_yaml_value
+    )
+
+
+class LIBYAML_Handler(XSOAR_Handler):
+    """
+    Read-only, C-accelerated (libyaml) YAML handler.
+    Loads plain dicts and lists, like RUAMEL_Handler(typ="safe"), but considerably faster.
+    Use it only where the loaded data is not written back - dumping falls back to ruamel,
+    and comments and key order are not preserved.
+    When libyaml is not available, ruamel's safe loader is used.
+    """
+
+    def __init__(self):
+        self._fallback = RUAMEL_Handler(typ="safe")
+
+    @property
+    def is_accelerated(self) -> bool:
+        return CSafeLoader is not None
+
+    def load(self, stream: Union[IO[str], str]) -> Any:
+        if self.is_accelerated:
+            loader = _ReadOnlyLoader(stream)  # type: ignore[name-defined]
+            try:
+                return loader.get_single_data()
+            finally:
+                loader.dispose()
+        if not isinstance(stream, str):
+            stream = stream.read()
+        return self._fallback.load(
+            StringIO(SIMPLE_VALUE_EQUALS_PATTERN.sub(r'\1"\2"\3', stream))
+        )
+
+    def dump(self, data, stream, indent=0, sort_keys=False, **kwargs):
+        self._fallback.dump(data, stream, indent=indent, sort_keys=sort_keys, **kwargs)
+
+    def dumps(self, data, indent=0, sort_keys=False, **kwargs):
+        return self._fallback.dumps(data, indent=indent, sort_keys=sort_keys, **kwargs)
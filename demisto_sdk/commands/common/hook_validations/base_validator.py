@@ -1,6 +1,18 @@
 import os
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from demisto_sdk.commands.common.constants import (
     PACK_METADATA_SUPPORT,
@@ -9,7 +21,7 @@ from demisto_sdk.commands.common.constants import (
     FileType,
 )
 from demisto_sdk.commands.common.errors import (
-    ALLOWED_IGNORE_ERRORS,
+    ALLOWED_IGNORE_ERROR_CODES,
     FOUND_FILES_AND_ERRORS,
     FOUND_FILES_AND_IGNORED_ERRORS,
     PRESET_ERROR_TO_CHECK,
@@ -20,6 +32,7 @@ from demisto_sdk.commands.common.errors import (
 )
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.timers import get_validation_profiler
 from demisto_sdk.commands.common.tools import (
     find_type,
     get_file_displayed_name,
@@ -30,26 +43,167 @@ from demisto_sdk.commands.common.tools import (
     str2bool,
 )
 
+# the error codes declared by every check decorated with `error_codes`, by the qualified name of the check
+VALIDATION_CHECKS_ERROR_CODES: Dict[str, FrozenSet[str]] = {}
+
+# the flags read from files (deprecated, support level), by the kind of flag and the absolute path of the file,
+# along with the size and modification time of the file they were read at
+_FILE_FLAGS_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+# the size and modification time of the json output files, as this process last wrote them
+_JSON_OUTPUT_FILES_STATE: Dict[str, Tuple[int, int]] = {}
+# when not None, the json outputs of all the validators of this process are collected here instead of being written
+_collected_json_outputs: Optional[List[dict]] = None
+
+
+def _get_file_state(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _cached_by_file_state(kind: str, path: str, read: Callable[[], Any]) -> Any:
+    """
+    Returns `read()`, which reads a flag of the file at `path`, reading it again only once the file changed.
+    Files which can not be stat-ed are always read.
+    """
+    if (file_state := _get_file_state(path)) is None:
+        return read()
+    key = (kind, os.path.abspath(path))
+    cached = _FILE_FLAGS_CACHE.get(key)
+    if cached is not None and cached[0] == file_state:
+        return cached[1]
+    value = read()
+    _FILE_FLAGS_CACHE[key] = (file_state, value)
+    return value
+
+
+def clear_file_flags_cache():
+    _FILE_FLAGS_CACHE.clear()
+    _JSON_OUTPUT_FILES_STATE.clear()
+
+
+@lru_cache(maxsize=None)
+def _get_reverse_error_codes(errors_to_check: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(
+        error_code
+        for error_code in get_all_error_codes()
+        if error_code not in errors_to_check and error_code[:2] not in errors_to_check
+    )
+
+
+def append_json_outputs(json_file_path: str, outputs: List[dict]):
+    """
+    Appends outputs to the list in a json output file, as `json.dump(existing + outputs, indent=4)` would write it.
+
+    When the file is as this process last wrote it, the outputs are written in place of its closing bracket,
+    rather than reading and writing the whole file again for every output.
+    """
+    if not outputs:
+        return
+    last_state = _JSON_OUTPUT_FILES_STATE.get(json_file_path)
+    if last_state is not None and last_state == _get_file_state(json_file_path):
+        # the outputs are dumped as a list, and their items are written without the list brackets
+        items = json.dumps(outputs, indent=4)[2:-2]
+        with open(json_file_path, "r+b") as f:
+            f.seek(-2, os.SEEK_END)
+            appended = f.read(2) == b"\n]"
+            if appended:
+                f.seek(-2, os.SEEK_END)
+                f.write(f",\n{items}\n]".encode())
+        if appended:
+            if (file_state := _get_file_state(json_file_path)) is not None:
+                _JSON_OUTPUT_FILES_STATE[json_file_path] = file_state
+            return
+
+    json_contents = []
+    if Path(json_file_path).exists():
+        existing_json: Any = ""
+        try:
+            existing_json = get_json(json_file_path)
+        except ValueError:
+            pass
+        if isinstance(existing_json, list):
+            json_contents = existing_json
+    json_contents.extend(outputs)
+    with open(json_file_path, "w") as f:
+        json.dump(json_contents, f, indent=4)
+    if (file_state := _get_file_state(json_file_path)) is not None:
+        _JSON_OUTPUT_FILES_STATE[json_file_path] = file_state
+
+
+@contextmanager
+def collect_json_outputs() -> Iterator[List[dict]]:
+    """
+    Collects the json outputs of all the validators of this process into the yielded list, instead of writing them to
+    their json output file (e.g. in a worker process, whose outputs are written by the main process).
+    """
+    global _collected_json_outputs
+    previous_json_outputs = _collected_json_outputs
+    _collected_json_outputs = []
+    try:
+        yield _collected_json_outputs
+    finally:
+        _collected_json_outputs = previous_json_outputs
+
 
 def error_codes(error_codes_str: str):
+    """
+    Declares the error codes a check may report, and registers it in VALIDATION_CHECKS_ERROR_CODES.
+    The check is skipped (as valid) when none of its error codes were selected with --run-specific-validations,
+    and is measured when validations are profiled.
+    """
+    check_error_codes = frozenset(
+        error_code.strip() for error_code in error_codes_str.split(",")
+    )
+
     def error_codes_decorator(func):
+        VALIDATION_CHECKS_ERROR_CODES[
+            f"{func.__module__}.{func.__qualname__}"
+        ] = check_error_codes
+
+        @wraps(func)
         def wrapper(self, *args, **kwargs):
-            if self.specific_validations:
-                error_codes = error_codes_str.split(",")
-                for error_code in error_codes:
-                    if self.should_run_validation(error_code):
-                        return func(self, *args, **kwargs)
-            else:
-                return func(self, *args, **kwargs)
+            if self.specific_validations and not any(
+                self.should_run_validation(error_code)
+                for error_code in check_error_codes
+            ):
+                return True
 
-            return True
+            profiler = get_validation_profiler()
+            if profiler is None:
+                return func(self, *args, **kwargs)
+            with profiler.check(type(self).__name__, func.__name__):
+                return func(self, *args, **kwargs)
 
+        wrapper.error_codes = check_error_codes  # type: ignore[attr-defined]
         return wrapper
 
     return error_codes_decorator
 
 
+@lru_cache(maxsize=None)
+def get_validator_error_codes(validator_class: type) -> Optional[FrozenSet[str]]:
+    """
+    All the error codes a validator may report, as declared by its checks with `error_codes`.
+    None for a validator which reports errors outside of these checks (any validator which does not set
+    `ERROR_CODES_DECLARED`), as it may report any error.
+    """
+    if not getattr(validator_class, "ERROR_CODES_DECLARED", False):
+        return None
+    return frozenset(
+        error_code
+        for base in validator_class.__mro__
+        for member in vars(base).values()
+        for error_code in getattr(member, "error_codes", ())
+    )
+
+
 class BaseValidator:
+    # set by the validators whose errors are all reported by their checks declaring them with `error_codes`
+    ERROR_CODES_DECLARED = False
+
     def __init__(
         self,
         ignored_errors=None,
@@ -111,7 +265,7 @@ class BaseValidator:
         return (
             error_code in ignored_errors_pack_ignore
             or error_type in ignored_errors_pack_ignore
-        ) and (error_code in ALLOWED_IGNORE_ERRORS)
+        ) and (error_code in ALLOWED_IGNORE_ERROR_CODES)
 
     @staticmethod
     def is_error_not_allowed_in_pack_ignore(error_code, ignored_errors_pack_ignore):
@@ -130,7 +284,7 @@ class BaseValidator:
         return (
             error_code in ignored_errors_pack_ignore
             or error_type in ignored_errors_pack_ignore
-        ) and (error_code not in ALLOWED_IGNORE_ERRORS)
+        ) and (error_code not in ALLOWED_IGNORE_ERROR_CODES)
 
     def should_run_validation(self, error_code: str):
         if not self.specific_validations:
@@ -140,6 +294,53 @@ class BaseValidator:
             or error_code[:2] in self.specific_validations
         )
 
+    def get_ignored_errors_of_file(
+        self, file_path: str, file_name: str, rel_file_path: str
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """The ignored errors of a file: from the .pack-ignore, by deprecation and by the support level of its pack."""
+        return (
+            self.ignored_errors.get(file_name)
+            or self.ignored_errors.get(rel_file_path)
+            or [],
+            self.predefined_deprecated_ignored_errors.get(file_name)
+            or self.predefined_deprecated_ignored_errors.get(rel_file_path)
+            or [],
+            self.predefined_by_support_ignored_errors.get(file_path)
+            or self.predefined_by_support_ignored_errors.get(rel_file_path)
+            or [],
+        )
+
+    def should_report_any(self, error_codes: Iterable[str], file_path: str) -> bool:
+        """
+        Whether `handle_error` would report any of the error codes for the file: they were selected with
+        --run-specific-validations, and are not all ignored for the file.
+        Used to skip checks up front, rather than throwing away their errors after they ran.
+        """
+        selected_error_codes = [
+            error_code
+            for error_code in error_codes
+            if self.should_run_validation(error_code)
+        ]
+        if not selected_error_codes:
+            return False
+        if self.print_as_warnings:
+            # ignored errors are printed as warnings
+            return True
+
+        file_path = str(file_path)
+        file_name = os.path.basename(file_path)
+        try:
+            self.check_file_flags(file_name, file_path)
+        except FileNotFoundError:
+            return True
+        ignored_errors = self.get_ignored_errors_of_file(
+            file_path, file_name, get_relative_path_from_packs_dir(file_path)
+        )
+        return not all(
+            self.should_ignore_error(error_code, *ignored_errors)
+            for error_code in selected_error_codes
+        )
+
     def handle_error(
         self,
         error_message,
@@ -205,21 +406,11 @@ class BaseValidator:
             file_name = "No-Name"
             rel_file_path = "No-Name"
 
-        ignored_errors_pack_ignore = (
-            self.ignored_errors.get(file_name)
-            or self.ignored_errors.get(rel_file_path)
-            or []
-        )
-        predefined_deprecated_ignored_errors = (
-            self.predefined_deprecated_ignored_errors.get(file_name)
-            or self.predefined_deprecated_ignored_errors.get(rel_file_path)
-            or []
-        )
-        predefined_by_support_ignored_errors = (
-            self.predefined_by_support_ignored_errors.get(file_path)
-            or self.predefined_by_support_ignored_errors.get(rel_file_path)
-            or []
-        )
+        (
+            ignored_errors_pack_ignore,
+            predefined_deprecated_ignored_errors,
+            predefined_by_support_ignored_errors,
+        ) = self.get_ignored_errors_of_file(file_path, file_name, rel_file_path)
 
         is_error_not_allowed_in_pack_ignore = self.is_error_not_allowed_in_pack_ignore(
             error_code=error_code, ignored_errors_pack_ignore=ignored_errors_pack_ignore
@@ -282,9 +473,15 @@ class BaseValidator:
 
     def check_deprecated(self, file_path):
         if file_path.endswith(".yml"):
-            yml_dict = get_yaml(file_path)
-            if not isinstance(yml_dict, list) and yml_dict.get("deprecated"):
+
+            def is_deprecated():
+                yml_dict = get_yaml(file_path)
                 # yml files may be list or dict-like
+                return not isinstance(yml_dict, list) and bool(
+                    yml_dict.get("deprecated")
+                )
+
+            if _cached_by_file_state("deprecated", file_path, is_deprecated):
                 self.add_flag_to_ignore_list(file_path, "deprecated")
 
     @staticmethod
@@ -303,42 +500,35 @@ class BaseValidator:
             metadata_path = os.path.join(
                 PACKS_DIR, pack_name, PACKS_PACK_META_FILE_NAME
             )
-            metadata_json = self.get_metadata_file_content(metadata_path)
-            support = metadata_json.get(PACK_METADATA_SUPPORT)
+            support = _cached_by_file_state(
+                "support",
+                metadata_path,
+                lambda: self.get_metadata_file_content(metadata_path).get(
+                    PACK_METADATA_SUPPORT
+                ),
+            )
 
             if support in ("partner", "community"):
                 self.add_flag_to_ignore_list(file_path, support)
 
     @staticmethod
     def create_reverse_ignored_errors_list(errors_to_check):
-        ignored_error_list = []
-        all_errors = get_all_error_codes()
-        for error_code in all_errors:
-            error_type = error_code[:2]
-            if error_code not in errors_to_check and error_type not in errors_to_check:
-                ignored_error_list.append(error_code)
-
-        return ignored_error_list
+        return list(_get_reverse_error_codes(tuple(errors_to_check)))
 
     def add_flag_to_ignore_list(self, file_path, flag):
         if flag in PRESET_ERROR_TO_IGNORE:
-            for predefined_error_code in PRESET_ERROR_TO_IGNORE[flag]:
-                if file_path not in self.predefined_by_support_ignored_errors:
-                    self.predefined_by_support_ignored_errors[file_path] = []
-                self.predefined_by_support_ignored_errors[file_path].append(
-                    predefined_error_code
-                )
+            if predefined_error_codes := PRESET_ERROR_TO_IGNORE[flag]:
+                self.predefined_by_support_ignored_errors.setdefault(
+                    file_path, []
+                ).extend(predefined_error_codes)
 
         elif flag in PRESET_ERROR_TO_CHECK:
-            deprecated_ignored_errors = self.create_reverse_ignored_errors_list(
+            if deprecated_ignored_errors := self.create_reverse_ignored_errors_list(
                 PRESET_ERROR_TO_CHECK[flag]
-            )
-            for ignored_error in deprecated_ignored_errors:
-                if file_path not in self.predefined_deprecated_ignored_errors:
-                    self.predefined_deprecated_ignored_errors[file_path] = []
-                self.predefined_deprecated_ignored_errors[file_path].append(
-                    ignored_error
-                )
+            ):
+                self.predefined_deprecated_ignored_errors.setdefault(
+                    file_path, []
+                ).extend(deprecated_ignored_errors)
 
     @staticmethod
     def add_to_report_error_list(error_code, file_path, error_list) -> bool:
@@ -372,16 +562,6 @@ class BaseValidator:
             "linter": "validate",
         }
 
-        json_contents = []
-        existing_json = ""
-        if Path(self.json_file_path).exists():
-            try:
-                existing_json = get_json(self.json_file_path)
-            except ValueError:
-                pass
-            if isinstance(existing_json, list):
-                json_contents = existing_json
-
         file_type = find_type(file_path)
         entity_type = file_type.value if file_type else "pack"
 
@@ -398,9 +578,10 @@ class BaseValidator:
             "linter": "validate",
             **output,
         }
-        json_contents.append(formatted_error_output)
-        with open(self.json_file_path, "w") as f:
-            json.dump(json_contents, f, indent=4)
+        if _collected_json_outputs is not None:
+            _collected_json_outputs.append(formatted_error_output)
+        else:
+            append_json_outputs(self.json_file_path, [formatted_error_output])
 
     @staticmethod
     def validate_xsiam_content_item_title(file_path):
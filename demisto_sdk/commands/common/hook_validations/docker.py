@@ -16,6 +16,7 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator,
     error_codes,
 )
+from demisto_sdk.commands.common.http_client import http_get
 from demisto_sdk.commands.common.tools import get_pack_metadata, get_yaml
 
 # disable insecure warnings
@@ -31,6 +32,10 @@ ACCEPT_HEADER = {
 TIMEOUT = 60
 DEFAULT_REGISTRY = "registry-1.docker.io"
 DEPRECATED_DOCKER_IMAGE_LIST_URL = "https://raw.githubusercontent.com/demisto/dockerfiles/master/docker/deprecated_images.json"
+# how long (in seconds) docker hub, iron bank and the deprecated images responses are reused between runs
+DOCKER_HUB_CACHE_TTL = 30 * 60
+IRON_BANK_CACHE_TTL = 30 * 60
+DEPRECATED_DOCKER_IMAGES_CACHE_TTL = 60 * 60
 
 
 class DockerImageValidator(BaseValidator):
@@ -234,7 +239,7 @@ class DockerImageValidator(BaseValidator):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
+        res = http_get(
             f"https://{registry}/v2/",
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
@@ -251,7 +256,7 @@ class DockerImageValidator(BaseValidator):
                 if parse_auth:
                     realm, service = parse_auth
             params = {"scope": f"repository:{image_name}:pull", "service": service}
-            res = requests.get(
+            res = http_get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -333,17 +338,11 @@ class DockerImageValidator(BaseValidator):
             The last_updated value of the docker
         """
         last_updated = None
-        auth_token = DockerImageValidator.docker_auth(
-            docker_image_name, False, DEFAULT_REGISTRY
-        )
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
-        # first try to get the docker image tags using normal http request
-        res = requests.get(
+        res = http_get(
             url=f"https://hub.docker.com/v2/repositories/{docker_image_name}/tags/{docker_image_tag}",
             verify=False,
             timeout=TIMEOUT,
+            cache_ttl=DOCKER_HUB_CACHE_TTL,
         )
         if res.status_code == 200:
             last_updated = res.json().get("last_updated", "")
@@ -362,17 +361,12 @@ class DockerImageValidator(BaseValidator):
             The latest tag for the docker image.
         """
         tag = ""
-        auth_token = DockerImageValidator.docker_auth(
-            docker_image_name, False, DEFAULT_REGISTRY
-        )
-        headers = ACCEPT_HEADER.copy()
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
         # first try to get the docker image tags using normal http request
-        res = requests.get(
+        res = http_get(
             url=f"https://hub.docker.com/v2/repositories/{docker_image_name}/tags",
             verify=False,
             timeout=TIMEOUT,
+            cache_ttl=DOCKER_HUB_CACHE_TTL,
         )
         if res.status_code == 200:
             tags = res.json().get("results", [])
@@ -383,7 +377,13 @@ class DockerImageValidator(BaseValidator):
         else:
             # if http request did not succeed than get tags using the API.
             # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-            res = requests.get(
+            auth_token = DockerImageValidator.docker_auth(
+                docker_image_name, False, DEFAULT_REGISTRY
+            )
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers["Authorization"] = f"Bearer {auth_token}"
+            res = http_get(
                 f"https://{DEFAULT_REGISTRY}/v2/{docker_image_name}/tags/list",
                 headers=headers,
                 timeout=TIMEOUT,
@@ -525,8 +525,12 @@ class DockerImageValidator(BaseValidator):
     @staticmethod
     def _get_manifest_from_commit(manifest_url, commit_id):
         # gets the manifest file from the specified commit in Iron Bank:
-        res = requests.get(
-            url=manifest_url, params={"ref": commit_id}, verify=False, timeout=TIMEOUT
+        res = http_get(
+            url=manifest_url,
+            params={"ref": commit_id},
+            verify=False,
+            timeout=TIMEOUT,
+            cache_ttl=IRON_BANK_CACHE_TTL,
         )
 
         # If file does not exists in the last commit:
@@ -538,7 +542,7 @@ class DockerImageValidator(BaseValidator):
     @staticmethod
     def _get_latest_commit(commits_url, docker_image_name):
         # Get latest commit in master which passed the pipeline of the project in Iron Bank:
-        res = requests.get(
+        res = http_get(
             url=commits_url,
             params={
                 "ref": "master",
@@ -548,6 +552,7 @@ class DockerImageValidator(BaseValidator):
             },
             verify=False,
             timeout=TIMEOUT,
+            cache_ttl=IRON_BANK_CACHE_TTL,
         )
 
         # Project may not be existing and needs to be created.
@@ -575,8 +580,10 @@ class DockerImageValidator(BaseValidator):
         returns: Dict contains the following keys: image_name, reason and created_time_utc.
         """
         try:
-            dockers_request = requests.get(
-                DEPRECATED_DOCKER_IMAGE_LIST_URL, verify=False
+            dockers_request = http_get(
+                DEPRECATED_DOCKER_IMAGE_LIST_URL,
+                verify=False,
+                cache_ttl=DEPRECATED_DOCKER_IMAGES_CACHE_TTL,
             )
             dockers_request.raise_for_status()
             deprecated_dockers_json = dockers_request.json()
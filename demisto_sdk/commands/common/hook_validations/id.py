@@ -13,6 +13,7 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator,
     error_codes,
 )
+from demisto_sdk.commands.common.id_set_index import IDSetIndex
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     get_script_or_sub_playbook_tasks_from_playbook,
@@ -61,6 +62,7 @@ class IDSetValidations(BaseValidator):
     MAPPERS_SECTION = "Mappers"
     INCIDENT_TYPES_SECTION = "IncidentTypes"
     PACKS_SECTION = "Packs"
+    ERROR_CODES_DECLARED = True
 
     def __init__(
         self,
@@ -105,13 +107,7 @@ class IDSetValidations(BaseValidator):
         incident_type_name = list(incident_type_data.keys())[0]
         incident_type_playbook = incident_type_data[incident_type_name].get("playbooks")
         if incident_type_playbook:
-            # setting initially to false, if the default playbook is in the id_set, it will be valid
-            is_valid = False
-            for checked_playbook in self.playbook_set:
-                checked_playbook_name = list(checked_playbook.keys())[0]
-                if incident_type_playbook == checked_playbook_name:
-                    is_valid = True
-                    break
+            is_valid = IDSetIndex.of(self.playbook_set).has_id(incident_type_playbook)
             if not is_valid:  # add error message if not valid
                 (
                     error_message,
@@ -269,10 +265,12 @@ class IDSetValidations(BaseValidator):
         Returns:
             A sub set of the input scripts set which contains only scripts that are not in the id set.
         """
-        for checked_script in self.script_set:
-            checked_script_id = list(checked_script.keys())[0]
-            if checked_script_id in scripts_in_entity:
-                scripts_in_entity.remove(checked_script_id)
+        scripts_index = IDSetIndex.of(self.script_set)
+        scripts_in_entity = {
+            script_id
+            for script_id in scripts_in_entity
+            if not scripts_index.has_id(script_id)
+        }
 
         # Ignore Builtin scripts because they are implemented on the server side and thus not in the id_set.json
         scripts_in_entity = self._remove_builtin_scripts(scripts_in_entity)
@@ -319,14 +317,14 @@ class IDSetValidations(BaseValidator):
         for script_id in scripts_set:
             if "|||" in script_id:
                 integration_id, integration_command = script_id.split("|||")
-                for checked_integration in self.integration_set:
-                    checked_integration_id = list(checked_integration.keys())[0]
-                    if checked_integration_id == integration_id:
-                        commands = checked_integration.get(
-                            checked_integration_id, {}
-                        ).get("commands")
-                        if integration_command in commands:
-                            validated_scripts_set.remove(script_id)
+                if any(
+                    integration_command
+                    in checked_integration[integration_id].get("commands")
+                    for checked_integration in IDSetIndex.of(
+                        self.integration_set
+                    ).by_id(integration_id)
+                ):
+                    validated_scripts_set.remove(script_id)
         return validated_scripts_set
 
     def _get_layouts_container_tabs(self, layouts_container):
@@ -400,13 +398,9 @@ class IDSetValidations(BaseValidator):
             "classifiers", ""
         )  # there is only 1 classifier per integration
         if integration_classifier:
-            # setting initially to false, if the classifier is in the id_set, it will be valid
-            is_valid_classifier = False
-            for classifier in self.classifiers_set:
-                checked_classifier_name = list(classifier.keys())[0]
-                if integration_classifier == checked_classifier_name:
-                    is_valid_classifier = True
-                    break
+            is_valid_classifier = IDSetIndex.of(self.classifiers_set).has_id(
+                integration_classifier
+            )
             if not is_valid_classifier:  # add error message if not valid
                 error_message, error_code = Errors.integration_non_existent_classifier(
                     integration_classifier
@@ -421,13 +415,7 @@ class IDSetValidations(BaseValidator):
             0
         ]  # there is only 1 mapper per integration
         if integration_mapper:
-            # setting initially to false, if the mapper is in the id_set, it will be valid
-            is_valid_mapper = False
-            for mapper in self.mappers_set:
-                checked_mapper_name = list(mapper.keys())[0]
-                if integration_mapper == checked_mapper_name:
-                    is_valid_mapper = True
-                    break
+            is_valid_mapper = IDSetIndex.of(self.mappers_set).has_id(integration_mapper)
             if not is_valid_mapper:  # add error message if not valid
                 error_message, error_code = Errors.integration_non_existent_mapper(
                     integration_mapper
@@ -454,13 +442,13 @@ class IDSetValidations(BaseValidator):
         if classifier_incident_types:
             # setting initially to false, if the incident types is in the id_set, it will be valid
             is_valid = False
-            for incident_type in self.incident_types_set:
-                incident_type_name = list(incident_type.keys())[0]
-                # remove a related incident types if exists in the id_set
-                if incident_type_name in classifier_incident_types:
-                    classifier_incident_types.remove(incident_type_name)
-                    if not classifier_incident_types:
-                        break
+            # remove the related incident types which exist in the id_set
+            incident_types_index = IDSetIndex.of(self.incident_types_set)
+            classifier_incident_types = {
+                incident_type
+                for incident_type in classifier_incident_types
+                if not incident_types_index.has_id(incident_type)
+            }
 
             if (
                 not classifier_incident_types
@@ -495,13 +483,13 @@ class IDSetValidations(BaseValidator):
         if mapper_incident_types:
             # setting initially to false, if the incident types is in the id_set, it will be valid
             is_valid = False
-            for incident_type in self.incident_types_set:
-                incident_type_name = list(incident_type.keys())[0]
-                # remove a related incident types if exists in the id_set
-                if incident_type_name in mapper_incident_types:
-                    mapper_incident_types.remove(incident_type_name)
-                    if not mapper_incident_types:
-                        break
+            # remove the related incident types which exist in the id_set
+            incident_types_index = IDSetIndex.of(self.incident_types_set)
+            mapper_incident_types = {
+                incident_type
+                for incident_type in mapper_incident_types
+                if not incident_types_index.has_id(incident_type)
+            }
 
             if (
                 not mapper_incident_types
@@ -583,11 +571,14 @@ class IDSetValidations(BaseValidator):
         # Get a dict with all playbook fields from the playbook data dict.
         playbook_data_2nd_level = playbook_data.get(list(playbook_data.keys())[0])
         main_playbook_name = playbook_data_2nd_level.get("name")
-        sub_playbooks_list = playbook_data_2nd_level.get("implementing_playbooks", [])
-        for playbook_dict in self.playbook_set:
-            playbook_name = list(playbook_dict.values())[0].get("name")
-            if playbook_name in sub_playbooks_list:
-                sub_playbooks_list.remove(playbook_name)
+        playbooks_index = IDSetIndex.of(self.playbook_set)
+        sub_playbooks_list = [
+            playbook_name
+            for playbook_name in playbook_data_2nd_level.get(
+                "implementing_playbooks", []
+            )
+            if not playbooks_index.has_name(playbook_name)
+        ]
 
         if sub_playbooks_list:
             error_message, error_code = Errors.invalid_subplaybook_name(
@@ -609,14 +600,9 @@ class IDSetValidations(BaseValidator):
             dictionary. Playbook's 'command_to_integration' dict.
         """
         commands_to_integration = {}
-        for playbook_dict in self.playbook_set:
-            playbook_name = list(playbook_dict.keys())[0]
-            playbook_path = playbook_dict[playbook_name].get("file_path")
-            is_this_the_playbook = (
-                playbook_name == file_name and file_path == playbook_path
-            )
-            if is_this_the_playbook:
-                playbook_data = playbook_dict[playbook_name]
+        for playbook_dict in IDSetIndex.of(self.playbook_set).by_id(file_name):
+            playbook_data = playbook_dict[file_name]
+            if file_path == playbook_data.get("file_path"):
                 commands_to_integration = playbook_data.get(
                     "command_to_integration", {}
                 )
@@ -681,7 +667,10 @@ class IDSetValidations(BaseValidator):
         implemented_ids_in_id_set = set()
 
         entity_ids_with_min_version: Dict[str, tuple] = {}
-        for entity in entity_set_from_id_set:
+        for entity in IDSetIndex.of(entity_set_from_id_set).find(
+            ids=implemented_entity_list_from_playbook,
+            names=implemented_entity_list_from_playbook,
+        ):
             entity_id = list(entity.keys())[0]
             entity_data = entity.get(entity_id)
             entity_name = (
@@ -802,11 +791,11 @@ class IDSetValidations(BaseValidator):
 
     def get_integration_version(self, integration_to_search):
         general_version = ""  # i.e integration has no specific version
-        for integration_dict in self.integration_set:
-            integration_name = list(integration_dict.keys())[0]
-            if integration_name == integration_to_search:
-                integration_data = integration_dict[integration_name]
-                return integration_data.get("fromversion", "")
+        for integration_dict in IDSetIndex.of(self.integration_set).by_id(
+            integration_to_search
+        ):
+            integration_data = integration_dict[integration_to_search]
+            return integration_data.get("fromversion", "")
         return general_version
 
     def is_file_valid_in_set(self, file_path, file_type, ignored_errors=None):
@@ -1,6 +1,6 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from packaging.version import Version
 
@@ -93,7 +93,7 @@ class LayoutBaseValidator(ContentEntityValidator, ABC):
 
         Args:
             layout_tabs (list): a list of the layout tabs.
-            content_fields (list): a list of the content field items.
+            content_fields (set): the content field items.
 
         Returns:
             list[str]: incident fields which do not exist in the content items.
@@ -113,7 +113,7 @@ class LayoutBaseValidator(ContentEntityValidator, ABC):
         return non_existent_incident_fields
 
     @staticmethod
-    def get_fields_from_id_set(id_set_file: Dict[str, List]) -> List[str]:
+    def get_fields_from_id_set(id_set_file: Dict[str, List]) -> Set[str]:
         """
         Get all the available layout fields from the id set.
 
@@ -121,12 +121,12 @@ class LayoutBaseValidator(ContentEntityValidator, ABC):
             id_set_file (dict): content of the id set file.
 
         Returns:
-            list[str]: available indicator/incident fields from the id set file.
+            set[str]: available indicator/incident fields from the id set file.
         """
         return (
             get_all_incident_and_indicator_fields_from_id_set(id_set_file, "layout")
-            + [field.lower() for field in BUILT_IN_FIELDS]
-            + LAYOUT_AND_MAPPER_BUILT_IN_FIELDS
+            | {field.lower() for field in BUILT_IN_FIELDS}
+            | set(LAYOUT_AND_MAPPER_BUILT_IN_FIELDS)
         )
 
     @abstractmethod
@@ -233,8 +233,8 @@ class MapperValidator(ContentEntityValidator):
 
         content_incident_fields = (
             get_all_incident_and_indicator_fields_from_id_set(id_set_file, "mapper")
-            + [field.lower() for field in BUILT_IN_FIELDS]
-            + LAYOUT_AND_MAPPER_BUILT_IN_FIELDS
+            | {field.lower() for field in BUILT_IN_FIELDS}
+            | set(LAYOUT_AND_MAPPER_BUILT_IN_FIELDS)
         )
 
         invalid_incident_fields = []
@@ -10,6 +10,7 @@ from demisto_sdk.commands.common.hook_validations.base_validator import error_co
 from demisto_sdk.commands.common.hook_validations.content_entity_validator import (
     ContentEntityValidator,
 )
+from demisto_sdk.commands.common.id_set_index import IDSetIndex
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import is_string_uuid
 
@@ -611,9 +612,7 @@ class PlaybookValidator(ContentEntityValidator):
         Returns:
             True if script_used_in_task exists in id_set
         """
-        return any(
-            [script_id_used_in_task in id_set_dict for id_set_dict in id_set_scripts]
-        )
+        return IDSetIndex.of(id_set_scripts).has_id(script_id_used_in_task)
 
     def check_integration_command(
         self,
@@ -635,17 +634,14 @@ class PlaybookValidator(ContentEntityValidator):
         integration_id, integration_command = integration_id_used_in_task.split("|||")
         if integration_id == "Builtin":  # skipping Builtin
             return True
-        for id_integration_dict in id_set_integrations:
-            id_integration_id = list(id_integration_dict.keys())[0]
-            if (
-                command_without_brand and not integration_id
-            ) or id_integration_id == integration_id:
-                commands = id_integration_dict.get(id_integration_id, {}).get(
-                    "commands", []
-                )
-                if integration_command in commands:
-                    return True
-        return False
+        integrations_index = IDSetIndex.of(id_set_integrations)
+        if command_without_brand and not integration_id:
+            return bool(integrations_index.by_command(integration_command))
+        return any(
+            integration_command
+            in id_integration_dict[integration_id].get("commands", [])
+            for id_integration_dict in integrations_index.by_id(integration_id)
+        )
 
     def check_script_name(self, pb_script_name, id_set_scripts):
         """
@@ -656,13 +652,7 @@ class PlaybookValidator(ContentEntityValidator):
         Returns:
             True if pb_script_name exists in id_set
         """
-        return any(
-            [
-                pb_script_name == id_set_dict[key].get("name")
-                for id_set_dict in id_set_scripts
-                for key in id_set_dict
-            ]
-        )
+        return IDSetIndex.of(id_set_scripts).has_name(pb_script_name)
 
     def _is_else_path_in_condition_task(self, task):
         next_tasks: Dict = task.get("nexttasks", {})
@@ -8,8 +8,6 @@ import re
 import string
 from typing import List, Optional, Tuple
 
-from pykwalify.core import Core
-
 from demisto_sdk.commands.common.configuration import Configuration
 from demisto_sdk.commands.common.constants import (
     ACCEPTED_FILE_EXTENSIONS,
@@ -27,6 +25,7 @@ from demisto_sdk.commands.common.hook_validations.base_validator import (
     error_codes,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.schema_validation import get_compiled_schema
 from demisto_sdk.commands.common.tools import get_remote_file, is_file_path_in_pack
 
 
@@ -175,13 +174,8 @@ class StructureValidator(BaseValidator):
                 # reactivating pykwalify ERROR level logs
                 logging.disable(logging.ERROR)
             scheme_file_name = "integration" if self.scheme_name.value == "betaintegration" else self.scheme_name.value  # type: ignore
-            path = os.path.normpath(
-                os.path.join(
-                    __file__, "..", "..", self.SCHEMAS_PATH, f"{scheme_file_name}.yml"
-                )
-            )
-            core = Core(source_file=self.file_path, schema_files=[path])
-            core.validate(raise_exception=True)
+            # the schema is compiled once per process, and the file content is already loaded
+            get_compiled_schema(scheme_file_name).validate(self.current_file)
         except Exception as err:
             try:
                 return self.parse_error_msg(err)
@@ -0,0 +1,445 @@
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from demisto_sdk.commands.common.constants import (
+    ENV_DEMISTO_SDK_HTTP_CACHE,
+    ENV_DEMISTO_SDK_HTTP_CACHE_MAX_MB,
+)
+from demisto_sdk.commands.common.file_cache import (
+    EVICTION_CHECK_INTERVAL,
+    EVICTION_TARGET_RATIO,
+    get_sdk_cache_dir,
+)
+
+logger = logging.getLogger(
+    "demisto-sdk"
+)  # not using the standard logger, due to circular import
+
+HTTP_CACHE_DIR_NAME = "http"
+# the index of when every cached response was last used, kept in the cache dir
+HTTP_CACHE_INDEX_NAME = "last_access.sqlite"
+DEFAULT_TIMEOUT = 60
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+POOL_MAXSIZE = 16
+# request headers that change the content of the response, and are part of the response cache key
+CACHE_KEY_HEADERS = ("Accept",)
+# request headers carrying credentials, the responses to such requests are never cached
+CREDENTIAL_HEADERS = ("Authorization", "PRIVATE-TOKEN", "JOB-TOKEN", "Cookie")
+# how long a host that could not be connected to is not tried again
+UNREACHABLE_HOST_BACKOFF_SECONDS = 30
+DEFAULT_HTTP_CACHE_MAX_MB = 128
+# the maximal age of a cached response which is still returned when the server can not be reached
+DEFAULT_HTTP_CACHE_MAX_STALE_SECONDS = 7 * 24 * 60 * 60
+
+
+def _normalize_url(url: str, params: Any = None) -> str:
+    return requests.Request("GET", url, params=params).prepare().url  # type: ignore[return-value]
+
+
+class HttpClient:
+    """
+    The HTTP layer of the SDK, to be used instead of bare `requests.get` calls.
+
+    - Keeps one pooled session per host, so connections are reused between requests (and between threads).
+    - Retries connection errors and 429/5xx responses with exponential backoff.
+      A host that could not be connected to (after the retries) is not tried again for `unreachable_host_backoff`
+      seconds.
+    - GET responses can be cached on disk between runs, by passing `cache_ttl` (seconds).
+      Within the TTL a cached response is returned without any request. Once it expired, it is revalidated with its
+      ETag / Last-Modified, and is also returned when the server can not be reached, up to `max_stale_age` seconds
+      after it was stored.
+      Only successful responses to requests without credentials (see CREDENTIAL_HEADERS) are cached.
+      The cache is bounded by `max_cache_size_bytes`, least recently used responses (by the last access recorded in
+      the index of the cache dir) are evicted first.
+    - `host_overrides` redirects hosts (e.g. `https://hub.docker.com`) to other base urls, such as a local fake server.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[Path, str]] = None,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        host_overrides: Optional[Dict[str, str]] = None,
+        unreachable_host_backoff: float = UNREACHABLE_HOST_BACKOFF_SECONDS,
+        max_cache_size_bytes: int = DEFAULT_HTTP_CACHE_MAX_MB * 1024 * 1024,
+        max_stale_age: float = DEFAULT_HTTP_CACHE_MAX_STALE_SECONDS,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.unreachable_host_backoff = unreachable_host_backoff
+        self.max_cache_size_bytes = max_cache_size_bytes
+        self.max_stale_age = max_stale_age
+        self.host_overrides = {
+            host.rstrip("/"): base_url.rstrip("/")
+            for host, base_url in (host_overrides or {}).items()
+        }
+        self.requests_sent = 0
+        self.cache_hits = 0
+        self.cache_writes = 0
+        self.cache_evictions = 0
+        self._sessions: Dict[Tuple[str, str], requests.Session] = {}
+        self._sessions_pid: Optional[int] = None
+        # the hosts that could not be connected to, and the time they may be tried again at
+        self._unreachable_hosts: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._index_connection: Optional[sqlite3.Connection] = None
+        self._index_pid: Optional[int] = None
+        self._index_disabled = False
+        # the last access recorded by this process, every access is recorded strictly after the previous one
+        self._last_access_ns = 0
+
+    def _resolve(self, url: str) -> str:
+        parts = urlsplit(url)
+        if base_url := self.host_overrides.get(f"{parts.scheme}://{parts.netloc}"):
+            base = urlsplit(base_url)
+            return urlunsplit(
+                (
+                    base.scheme,
+                    base.netloc,
+                    base.path + parts.path,
+                    parts.query,
+                    parts.fragment,
+                )
+            )
+        return url
+
+    def _new_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=POOL_MAXSIZE)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def session(self, url: str) -> requests.Session:
+        """Returns the pooled session of the host of `url`."""
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        with self._lock:
+            # pooled connections must never be shared with a forked child
+            if self._sessions_pid != os.getpid():
+                self._sessions = {}
+                self._sessions_pid = os.getpid()
+            if (session := self._sessions.get(host)) is None:
+                session = self._sessions[host] = self._new_session()
+        return session
+
+    def close(self):
+        with self._lock:
+            if self._sessions_pid == os.getpid():
+                for session in self._sessions.values():
+                    session.close()
+            self._sessions = {}
+        with self._index_lock:
+            if self._index_connection is not None and self._index_pid == os.getpid():
+                self._index_connection.close()
+            self._index_connection = self._index_pid = None
+        self.forget_unreachable_hosts()
+
+    def forget_unreachable_hosts(self):
+        """Lets the hosts which could not be connected to be tried again right away."""
+        self._unreachable_hosts.clear()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        url = self._resolve(url)
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.netloc)
+        if time.monotonic() < self._unreachable_hosts.get(host, 0):
+            raise requests.exceptions.ConnectionError(
+                f"{parts.netloc} could not be reached recently, not trying again yet"
+            )
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        self.requests_sent += 1
+        try:
+            response = self.session(url).request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError:
+            self._unreachable_hosts[host] = (
+                time.monotonic() + self.unreachable_host_backoff
+            )
+            raise
+        self._unreachable_hosts.pop(host, None)
+        return response
+
+    def get(
+        self, url: str, cache_ttl: Optional[float] = None, **kwargs
+    ) -> requests.Response:
+        """
+        Args:
+            url: The url to get.
+            cache_ttl: How long (in seconds) the response may be served from the on-disk cache without revalidating it.
+                When None, or when the request carries credentials, the response is not cached.
+            **kwargs: Passed to `requests.Session.request`.
+        """
+        headers = CaseInsensitiveDict(kwargs.pop("headers", None) or {})
+        if (
+            cache_ttl is None
+            or self.cache_dir is None
+            or kwargs.get("stream")
+            or kwargs.get("auth")
+            or any(headers.get(name) for name in CREDENTIAL_HEADERS)
+        ):
+            return self.request("GET", url, headers=headers, **kwargs)
+
+        cache_path = self._cache_path(url, kwargs.get("params"), headers)
+        cached = self._load(cache_path)
+        if cached and time.time() - cached["stored_at"] < cache_ttl:
+            self.cache_hits += 1
+            self._record_access(cache_path)
+            return self._build_response(cached)
+
+        if cached and cached["headers"].get("ETag"):
+            headers["If-None-Match"] = cached["headers"]["ETag"]
+        if cached and cached["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = cached["headers"]["Last-Modified"]
+        try:
+            response = self.request("GET", url, headers=headers, **kwargs)
+        except requests.exceptions.ConnectionError:
+            if not cached or time.time() - cached["stored_at"] > self.max_stale_age:
+                raise
+            logger.debug(f"Could not reach {url}, using the cached response")
+            self.cache_hits += 1
+            return self._build_response(cached)
+
+        if response.status_code == 304 and cached:
+            cached["stored_at"] = time.time()
+            self._store(cache_path, cached)
+            self.cache_hits += 1
+            return self._build_response(cached)
+        if response.status_code == 200:
+            self._store(
+                cache_path,
+                {
+                    "url": response.url,
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": response.content,
+                    "stored_at": time.time(),
+                },
+            )
+        return response
+
+    def _cache_path(self, url: str, params: Any, headers: CaseInsensitiveDict) -> Path:
+        key = "\n".join(
+            [_normalize_url(self._resolve(url), params)]
+            + [f"{name}: {headers.get(name, '')}" for name in CACHE_KEY_HEADERS]
+        )
+        return self.cache_dir / hashlib.sha256(key.encode()).hexdigest()  # type: ignore[operator]
+
+    @staticmethod
+    def _load(cache_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with cache_path.open("rb") as cache_file:
+                return pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Could not load the cached response {cache_path}: {e}")
+            return None
+
+    def _index(self) -> Optional[sqlite3.Connection]:
+        """
+        The index of when every cached response was last used, shared by the processes using the cache dir.
+        Every process opens its own connection, and any sqlite error disables the index for the rest of the process
+        (the eviction then falls back to the modification times of the cached responses).
+        """
+        if self._index_disabled or self.cache_dir is None:
+            return None
+        if self._index_connection is not None and self._index_pid == os.getpid():
+            return self._index_connection
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.cache_dir / HTTP_CACHE_INDEX_NAME),
+                timeout=10,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS last_access "
+                "(name TEXT PRIMARY KEY, accessed_at INTEGER NOT NULL)"
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Could not open the HTTP cache index: {e}")
+            self._index_disabled = True
+            return None
+        self._index_connection = connection
+        self._index_pid = os.getpid()
+        return connection
+
+    def _record_access(self, cache_path: Path):
+        """Marks a cached response as the most recently used one, the eviction removes the least recently used first."""
+        with self._index_lock:
+            self._last_access_ns = max(time.time_ns(), self._last_access_ns + 1)
+            if (connection := self._index()) is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO last_access (name, accessed_at) VALUES (?, ?)",
+                    (cache_path.name, self._last_access_ns),
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Could not record the access to {cache_path}: {e}")
+                self._index_disabled = True
+
+    def _store(self, cache_path: Path, cached: Dict[str, Any]):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with temp_path.open("wb") as cache_file:
+                pickle.dump(cached, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not cache the response in {cache_path}: {e}")
+            return
+        self._record_access(cache_path)
+        self.cache_writes += 1
+        if self.cache_writes % EVICTION_CHECK_INTERVAL == 1:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the cached responses which were not used for longer than `max_stale_age`, and then the least recently
+        used ones, until the cache is below its target size.
+        """
+        if self.cache_dir is None:
+            return
+        with self._index_lock:
+            connection = self._index()
+            try:
+                last_access = (
+                    dict(
+                        connection.execute("SELECT name, accessed_at FROM last_access")
+                    )
+                    if connection
+                    else {}
+                )
+            except sqlite3.Error as e:
+                logger.debug(f"Could not read the HTTP cache index: {e}")
+                last_access = {}
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as cache_files:
+                for cache_file in cache_files:
+                    if cache_file.is_file() and not cache_file.name.startswith(
+                        HTTP_CACHE_INDEX_NAME
+                    ):
+                        stat = cache_file.stat()
+                        # a response not in the index was last used when it was written
+                        accessed_at = last_access.get(cache_file.name, stat.st_mtime_ns)
+                        entries.append((accessed_at, cache_file.name, stat.st_size))
+        except OSError as e:
+            logger.debug(f"Could not list the HTTP cache {self.cache_dir}: {e}")
+            return
+        entries.sort()
+        oldest_kept = time.time_ns() - int(self.max_stale_age * 1_000_000_000)
+        total_size = sum(size for _, _, size in entries)
+        target_size = (
+            int(self.max_cache_size_bytes * EVICTION_TARGET_RATIO)
+            if total_size > self.max_cache_size_bytes
+            else total_size
+        )
+        evicted_names = []
+        for accessed_at, name, size in entries:
+            if accessed_at >= oldest_kept and total_size <= target_size:
+                break
+            try:
+                (self.cache_dir / name).unlink()
+            except OSError:
+                continue
+            total_size -= size
+            evicted_names.append(name)
+        kept_names = {name for _, name, _ in entries}.difference(evicted_names)
+        with self._index_lock:
+            if (connection := self._index()) is not None:
+                try:
+                    connection.executemany(
+                        "DELETE FROM last_access WHERE name=?",
+                        [(name,) for name in last_access if name not in kept_names],
+                    )
+                except sqlite3.Error as e:
+                    logger.debug(f"Could not update the HTTP cache index: {e}")
+        evicted = len(evicted_names)
+        if evicted:
+            self.cache_evictions += evicted
+            logger.debug(f"Evicted {evicted} responses from the HTTP cache")
+
+    @staticmethod
+    def _build_response(cached: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.url = cached["url"]
+        response.status_code = cached["status_code"]
+        response.headers = CaseInsensitiveDict(cached["headers"])
+        response._content = cached["content"]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the HTTP client shared by the whole process.
+    The on-disk response cache is kept under the SDK cache dir, and can be disabled by setting
+    DEMISTO_SDK_HTTP_CACHE to false. Its size (in MB) can be set using DEMISTO_SDK_HTTP_CACHE_MAX_MB.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            cache_enabled = os.getenv(ENV_DEMISTO_SDK_HTTP_CACHE, "true").lower() in (
+                "true",
+                "yes",
+                "1",
+            )
+            max_size_mb = os.getenv(ENV_DEMISTO_SDK_HTTP_CACHE_MAX_MB, "")
+            _http_client = HttpClient(
+                cache_dir=get_sdk_cache_dir() / HTTP_CACHE_DIR_NAME
+                if cache_enabled
+                else None,
+                max_cache_size_bytes=(
+                    int(max_size_mb)
+                    if max_size_mb.isdigit()
+                    else DEFAULT_HTTP_CACHE_MAX_MB
+                )
+                * 1024
+                * 1024,
+            )
+        return _http_client
+
+
+def set_http_client(client: Optional[HttpClient]):
+    """Replaces the shared HTTP client (e.g. with one pointing to a fake server), None resets it to the default."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is not None and _http_client is not client:
+            _http_client.close()
+        _http_client = client
+
+
+def http_get(url: str, cache_ttl: Optional[float] = None, **kwargs):
+    """A drop-in replacement for `requests.get`, through the shared HTTP client."""
+    return get_http_client().get(url, cache_ttl=cache_ttl, **kwargs)
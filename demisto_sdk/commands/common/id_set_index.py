@@ -0,0 +1,253 @@
+from functools import wraps
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from packaging.version import Version
+
+from demisto_sdk.commands.common.constants import (
+    DEFAULT_CONTENT_ITEM_FROM_VERSION,
+    DEFAULT_CONTENT_ITEM_TO_VERSION,
+    FileType,
+)
+
+# the id_set section of every content entity type
+ID_SET_SECTION_BY_FILE_TYPE = {
+    FileType.INTEGRATION.value: "integrations",
+    FileType.BETA_INTEGRATION.value: "integrations",
+    FileType.SCRIPT.value: "scripts",
+    FileType.PLAYBOOK.value: "playbooks",
+    FileType.TEST_PLAYBOOK.value: "TestPlaybooks",
+    FileType.CLASSIFIER.value: "Classifiers",
+    FileType.MAPPER.value: "Mappers",
+    FileType.DASHBOARD.value: "Dashboards",
+    FileType.INCIDENT_FIELD.value: "IncidentFields",
+    FileType.INCIDENT_TYPE.value: "IncidentTypes",
+    FileType.INDICATOR_FIELD.value: "IndicatorFields",
+    FileType.REPUTATION.value: "IndicatorTypes",
+    FileType.LAYOUT.value: "Layouts",
+    FileType.LAYOUTS_CONTAINER.value: "Layouts",
+    FileType.REPORT.value: "Reports",
+    FileType.WIDGET.value: "Widgets",
+    FileType.GENERIC_TYPE.value: "GenericTypes",
+    FileType.GENERIC_FIELD.value: "GenericFields",
+    FileType.GENERIC_MODULE.value: "GenericModules",
+    FileType.GENERIC_DEFINITION.value: "GenericDefinitions",
+    FileType.LISTS.value: "Lists",
+    FileType.JOB.value: "Jobs",
+    FileType.PARSING_RULE.value: "ParsingRules",
+    FileType.MODELING_RULE.value: "ModelingRules",
+    FileType.CORRELATION_RULE.value: "CorrelationRules",
+    FileType.XSIAM_DASHBOARD.value: "XSIAMDashboards",
+    FileType.XSIAM_REPORT.value: "XSIAMReports",
+    FileType.TRIGGER.value: "Triggers",
+    FileType.WIZARD.value: "Wizards",
+    FileType.XDRC_TEMPLATE.value: "XDRCTemplates",
+    FileType.LAYOUT_RULE.value: "LayoutRules",
+}
+
+
+class IDSetSectionIndex:
+    """
+    Hash indexes of the items of an id_set section (a list of single key dicts of {id: details}), by their id, name,
+    lowercase name, pack, integration commands and aliases.
+
+    Every lookup returns the items of the section (the {id: details} dicts themselves) in the order of the section.
+    """
+
+    def __init__(self, items: List[dict]):
+        self.items = items
+        self._by_id: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        self._by_lowercase_name: Dict[str, List[int]] = {}
+        self._by_pack: Dict[str, List[int]] = {}
+        self._by_command: Dict[str, List[int]] = {}
+        self._by_alias: Dict[str, List[int]] = {}
+        for position, item in enumerate(items):
+            for item_id, details in item.items():
+                self._by_id.setdefault(item_id, []).append(position)
+                name = details.get("name", "")
+                self._by_name.setdefault(name, []).append(position)
+                if isinstance(name, str):
+                    self._by_lowercase_name.setdefault(name.lower(), []).append(
+                        position
+                    )
+                if pack := details.get("pack"):
+                    self._by_pack.setdefault(pack, []).append(position)
+                for command in set(details.get("commands") or ()):
+                    self._by_command.setdefault(command, []).append(position)
+                for alias in set(details.get("aliases") or ()):
+                    self._by_alias.setdefault(alias, []).append(position)
+
+    def find(
+        self,
+        ids: Iterable[str] = (),
+        names: Iterable[str] = (),
+        lowercase_names: Iterable[str] = (),
+        packs: Iterable[str] = (),
+        commands: Iterable[str] = (),
+        aliases: Iterable[str] = (),
+    ) -> List[dict]:
+        """Returns the items matching any of the given ids, names, packs, integration commands or field aliases."""
+        positions: Set[int] = set()
+        for index, keys in (
+            (self._by_id, ids),
+            (self._by_name, names),
+            (self._by_lowercase_name, (name.lower() for name in lowercase_names)),
+            (self._by_pack, packs),
+            (self._by_command, commands),
+            (self._by_alias, aliases),
+        ):
+            for key in keys:
+                positions.update(index.get(key, ()))
+        return [self.items[position] for position in sorted(positions)]
+
+    def by_id(self, *item_ids: str) -> List[dict]:
+        return self.find(ids=item_ids)
+
+    def by_name(self, *names: str, ignore_case: bool = False) -> List[dict]:
+        if ignore_case:
+            return self.find(lowercase_names=names)
+        return self.find(names=names)
+
+    def by_pack(self, *packs: str) -> List[dict]:
+        return self.find(packs=packs)
+
+    def by_command(self, *commands: str) -> List[dict]:
+        """The integrations implementing any of the given commands."""
+        return self.find(commands=commands)
+
+    def ids(self) -> Iterable[str]:
+        return self._by_id.keys()
+
+    def names(self, lowercase: bool = False) -> Iterable[str]:
+        return (self._by_lowercase_name if lowercase else self._by_name).keys()
+
+    def has_id(self, item_id: str) -> bool:
+        return item_id in self._by_id
+
+    def has_name(self, name: str, ignore_case: bool = False) -> bool:
+        if ignore_case:
+            return name.lower() in self._by_lowercase_name
+        return name in self._by_name
+
+
+def _drops_index(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class IDSetSection(list):
+    """
+    A section of a loaded id_set, which keeps the index of its items along with them.
+
+    The index is built when the section is first queried, and dropped whenever the section list is modified, so it
+    is built once per loaded id_set however many times the id_set is queried. The details of the items are not
+    expected to be modified once the id_set is loaded.
+    """
+
+    _index: Optional[IDSetSectionIndex] = None
+
+    @property
+    def index(self) -> IDSetSectionIndex:
+        if self._index is None:
+            self._index = IDSetSectionIndex(self)
+        return self._index
+
+    def __reduce_ex__(self, protocol):
+        # pickled and copied without the index
+        return IDSetSection, (list(self),)
+
+    __setitem__ = _drops_index(list.__setitem__)
+    __delitem__ = _drops_index(list.__delitem__)
+    __iadd__ = _drops_index(list.__iadd__)
+    __imul__ = _drops_index(list.__imul__)
+    append = _drops_index(list.append)
+    extend = _drops_index(list.extend)
+    insert = _drops_index(list.insert)
+    pop = _drops_index(list.pop)
+    remove = _drops_index(list.remove)
+    clear = _drops_index(list.clear)
+    sort = _drops_index(list.sort)
+    reverse = _drops_index(list.reverse)
+
+
+def index_id_set_sections(id_set: Dict[str, Any]) -> Dict[str, Any]:
+    """Makes the list sections of a loaded id_set `IDSetSection`s, which keep the indexes of their items."""
+    for section, value in id_set.items():
+        if isinstance(value, list) and not isinstance(value, IDSetSection):
+            id_set[section] = IDSetSection(value)
+    return id_set
+
+
+class IDSetIndex:
+    """
+    Hash indexes over the sections of an id_set, replacing the scans of the section lists.
+
+    The index of an `IDSetSection` (a section of an id_set loaded by the SDK) is kept by the section itself, any
+    other section list is indexed again whenever it is queried.
+
+    Args:
+        id_set: The id_set, its sections are looked up when queried.
+    """
+
+    def __init__(self, id_set: Optional[dict]):
+        self.id_set = id_set or {}
+
+    @staticmethod
+    def of(items: Optional[List[dict]]) -> IDSetSectionIndex:
+        """Returns the index of a section list."""
+        if isinstance(items, IDSetSection):
+            return items.index
+        return IDSetSectionIndex(items or [])
+
+    def section(self, section: str) -> IDSetSectionIndex:
+        return self.of(self.id_set.get(section))
+
+    def by_type(self, entity_type: str) -> IDSetSectionIndex:
+        """
+        Returns the index of the section of a content entity type.
+
+        Args:
+            entity_type: A `FileType` value, e.g. 'script' or 'incidentfield'.
+        """
+        return self.section(ID_SET_SECTION_BY_FILE_TYPE[entity_type])
+
+    @staticmethod
+    def filter_items(
+        items: Iterable[dict],
+        marketplace: str = "",
+        from_version: str = "",
+        to_version: str = "",
+    ) -> List[dict]:
+        """
+        Filters id_set items by their marketplaces and versions.
+
+        Args:
+            items: The {id: details} items to filter.
+            marketplace: Keep only the items of this marketplace.
+            from_version: Keep only the items available in this version or later (by their toversion).
+            to_version: Keep only the items available in this version or earlier (by their fromversion).
+
+        Returns:
+            The items which match all of the given filters.
+        """
+        minimum_version = Version(from_version) if from_version else None
+        maximum_version = Version(to_version) if to_version else None
+        filtered_items = []
+        for item in items:
+            details = next(iter(item.values()))
+            if marketplace and marketplace not in details.get("marketplaces", []):
+                continue
+            if minimum_version and minimum_version > Version(
+                details.get("toversion") or DEFAULT_CONTENT_ITEM_TO_VERSION
+            ):
+                continue
+            if maximum_version and maximum_version < Version(
+                details.get("fromversion") or DEFAULT_CONTENT_ITEM_FROM_VERSION
+            ):
+                continue
+            filtered_items.append(item)
+        return filtered_items
@@ -0,0 +1,227 @@
+import os
+import sqlite3
+import threading
+import zlib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_index import (
+    IDSetSection,
+    index_id_set_sections,
+)
+
+ID_SET_STORE_SUFFIX = ".db"
+ID_SET_STORE_FORMAT_VERSION = 1
+SQLITE_HEADER = b"SQLite format 3\x00"
+# the kinds of the id_set sections: a list of {id: details} items (e.g. scripts), a dict of {id: details} (Packs),
+# or any other value
+LIST_SECTION = "list"
+DICT_SECTION = "dict"
+VALUE_SECTION = "value"
+
+PathLike = Union[str, Path]
+
+
+def is_id_set_store(path: PathLike) -> bool:
+    """Whether the file at `path` is an id_set store (rather than an id_set json)."""
+    try:
+        with open(path, "rb") as id_set_file:
+            return id_set_file.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value).encode())
+
+
+def _unpack(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data))
+
+
+def save_id_set_store(id_set: Dict[str, Any], path: PathLike):
+    """
+    Saves an id_set as an id_set store: a sqlite database with a row per item of every section, so a single section or
+    item can be loaded without loading the rest of the id_set.
+    The sections, and the items of every section, keep their order, so the id_set loaded from the store is equal to the
+    saved one, and is dumped to the same json.
+
+    The store is written to a temporary file which then replaces `path`, so readers never see a partial store.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.unlink(missing_ok=True)
+    connection = sqlite3.connect(str(temp_path))
+    try:
+        connection.executescript(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE sections (position INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, kind TEXT NOT NULL);"
+            "CREATE TABLE items ("
+            "section TEXT NOT NULL, position INTEGER NOT NULL, id TEXT, data BLOB NOT NULL, "
+            "PRIMARY KEY (section, position)) WITHOUT ROWID;"
+        )
+        connection.execute(
+            "INSERT INTO meta VALUES ('format_version', ?)",
+            (str(ID_SET_STORE_FORMAT_VERSION),),
+        )
+        for section_position, (section, value) in enumerate(id_set.items()):
+            if isinstance(value, list) and all(
+                isinstance(item, dict) for item in value
+            ):
+                kind = LIST_SECTION
+                rows = (
+                    (section, position, next(iter(item), None), _pack(item))
+                    for position, item in enumerate(value)
+                )
+            elif isinstance(value, dict):
+                kind = DICT_SECTION
+                rows = (
+                    (section, position, item_id, _pack(details))
+                    for position, (item_id, details) in enumerate(value.items())
+                )
+            else:
+                kind = VALUE_SECTION
+                rows = iter([(section, 0, None, _pack(value))])
+            connection.execute(
+                "INSERT INTO sections VALUES (?, ?, ?)",
+                (section_position, section, kind),
+            )
+            connection.executemany("INSERT INTO items VALUES (?, ?, ?, ?)", rows)
+        connection.execute("CREATE INDEX items_by_id ON items (section, id)")
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temp_path, path)
+
+
+class IDSetStore(Mapping):
+    """
+    A read-only id_set loaded lazily from an id_set store (see `save_id_set_store`).
+
+    It is a mapping of the id_set sections, like the id_set dict, but a section is loaded (and kept) only when it is
+    first accessed, and single items can be loaded by their id with `get_items` without loading their section.
+    When sent to another process it is sent by its path, and the other process loads the sections it uses.
+    """
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self._sections: Dict[str, Any] = {}
+        self._kinds: Optional[Dict[str, str]] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__init__(state["path"])  # type: ignore[misc]
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+        connection = sqlite3.connect(
+            f"{self.path.absolute().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        (format_version,) = connection.execute(
+            "SELECT value FROM meta WHERE key='format_version'"
+        ).fetchone()
+        if int(format_version) != ID_SET_STORE_FORMAT_VERSION:
+            connection.close()
+            raise ValueError(
+                f"The id_set store {self.path} is of an unsupported format version {format_version}"
+            )
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+
+    def _query(self, query: str, parameters: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._connect().execute(query, parameters).fetchall()
+
+    @property
+    def kinds(self) -> Dict[str, str]:
+        """The kind of every section, in the order of the id_set."""
+        if self._kinds is None:
+            self._kinds = dict(
+                self._query("SELECT name, kind FROM sections ORDER BY position")
+            )
+        return self._kinds
+
+    def __getitem__(self, section: str) -> Any:
+        if section in self._sections:
+            return self._sections[section]
+        kind = self.kinds[section]
+        rows = self._query(
+            "SELECT id, data FROM items WHERE section=? ORDER BY position", (section,)
+        )
+        if kind == LIST_SECTION:
+            value: Any = IDSetSection(_unpack(data) for _, data in rows)
+        elif kind == DICT_SECTION:
+            value = {item_id: _unpack(data) for item_id, data in rows}
+        else:
+            value = _unpack(rows[0][1])
+        self._sections[section] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.kinds)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def get_items(self, section: str, item_id: str) -> List[Any]:
+        """
+        Returns the items of a section with the given id, loading only them if the section was not loaded.
+        These are the {id: details} items for sections which are lists, or the details for dict sections (Packs).
+        """
+        kind = self.kinds.get(section)
+        if kind not in (LIST_SECTION, DICT_SECTION):
+            return []
+        if section in self._sections:
+            loaded_section = self._sections[section]
+            if kind == DICT_SECTION:
+                return [loaded_section[item_id]] if item_id in loaded_section else []
+            return [item for item in loaded_section if item_id in item]
+        return [
+            _unpack(data)
+            for (data,) in self._query(
+                "SELECT data FROM items WHERE section=? AND id=? ORDER BY position",
+                (section, item_id),
+            )
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Loads the whole id_set."""
+        return {section: self[section] for section in self}
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = self._connection_pid = None
+
+
+def load_id_set(path: PathLike) -> Dict[str, Any]:
+    """Loads the whole id_set from an id_set json or an id_set store."""
+    if is_id_set_store(path):
+        store = IDSetStore(path)
+        try:
+            return store.to_dict()
+        finally:
+            store.close()
+    with open(path) as id_set_file:
+        return index_id_set_sections(json.load(id_set_file))
+
+
+def write_id_set(id_set: Dict[str, Any], path: PathLike):
+    """Writes an id_set to `path`, as an id_set store if its suffix is ID_SET_STORE_SUFFIX, and as json otherwise."""
+    if Path(path).suffix == ID_SET_STORE_SUFFIX:
+        save_id_set_store(id_set, path)
+    else:
+        with open(path, "w+") as id_set_file:
+            json.dump(id_set, id_set_file, indent=4)
@@ -8,7 +8,6 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
-from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.tools import parse_int_or_default, string_to_bool
 
 logger: logging.Logger = logging.getLogger("demisto-sdk")
@@ -22,8 +21,7 @@ FILE_HANDLER = "file-handler"
 LOG_FILE_NAME: str = "demisto_sdk_debug.log"
 log_file_name_notified = False
 
-LOG_FILE_PATH: Path = CONTENT_PATH / LOG_FILE_NAME
-current_log_file_path: Path = LOG_FILE_PATH
+current_log_file_path: Optional[Path] = None
 
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
@@ -303,7 +301,7 @@ class NoColorFileFormatter(logging.Formatter):
 def logging_setup(
     console_log_threshold: Union[int, str] = logging.INFO,
     file_log_threshold: Union[int, str] = logging.DEBUG,
-    log_file_path: Optional[Union[str, Path]] = LOG_FILE_PATH,
+    log_file_path: Optional[Union[str, Path]] = None,
 ) -> logging.Logger:
     """Init logger object for logging in demisto-sdk
         For more info - https://docs.python.org/3/library/logging.html
@@ -311,7 +309,7 @@ def logging_setup(
     Args:
         console_log_threshold: Minimum console log threshold. Defaults to logging.INFO
         file_log_threshold: Minimum console log threshold. Defaults to logging.INFO
-        log_file_path: Path to log file. Defaults to LOG_FILE_PATH
+        log_file_path: Path to log file. Defaults to LOG_FILE_NAME under the content path
 
     Returns:
         logging.Logger: logger object
@@ -331,7 +329,7 @@ def logging_setup(
     if custom_log_path := os.getenv("DEMISTO_SDK_LOG_FILE_PATH"):
         current_log_file_path = Path(custom_log_path)
     else:
-        current_log_file_path = Path(log_file_path or LOG_FILE_PATH)
+        current_log_file_path = Path(log_file_path or get_default_log_file_path())
         if current_log_file_path.is_dir():
             current_log_file_path = current_log_file_path / LOG_FILE_NAME
     file_handler = RotatingFileHandler(
@@ -393,5 +391,12 @@ def set_demisto_handlers_to_logger(
     logger.level = min(console_handler.level, file_handler.level)
 
 
-def get_log_file() -> Path:
+def get_default_log_file_path() -> Path:
+    # the content path is resolved with git, only when logging is set up
+    from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+
+    return CONTENT_PATH / LOG_FILE_NAME
+
+
+def get_log_file() -> Optional[Path]:
     return current_log_file_path
@@ -0,0 +1,67 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import pykwalify
+from pykwalify.compat import yml
+from pykwalify.core import Core
+from pykwalify.rule import Rule
+
+SCHEMAS_DIR = Path(__file__).parent / "schemas"
+PARTIAL_SCHEMA_PREFIX = "schema;"
+
+
+class CompiledSchema:
+    """
+    A pykwalify schema whose rules are built once, to validate any number of already loaded files.
+
+    `pykwalify.core.Core` re-reads and re-parses the schema (and the validated file) on every validation,
+    while building the rules of a schema takes longer than validating most files with them.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.partial_rules: Dict[str, Rule] = {}
+        self.schema: Dict[str, Any] = {}
+        for key, value in schema.items():
+            if key.startswith(PARTIAL_SCHEMA_PREFIX):
+                self.partial_rules[key[len(PARTIAL_SCHEMA_PREFIX) :]] = Rule(
+                    schema=value
+                )
+            else:
+                self.schema[key] = value
+        self.root_rule = Rule(schema=self.schema)
+
+    @classmethod
+    def from_file(cls, schema_path: Path) -> "CompiledSchema":
+        with schema_path.open() as schema_file:
+            # loaded like `Core(schema_files=[schema_path])` does
+            return cls(yml.load(schema_file))
+
+    def validate(self, data: Any):
+        """
+        Validates loaded content with the schema.
+
+        Raises:
+            SchemaError: with the same message `Core.validate(raise_exception=True)` raises, when the content is invalid.
+            CoreError: when there is no content.
+        """
+        _CompiledSchemaCore(self, data).validate(raise_exception=True)
+
+
+class _CompiledSchemaCore(Core):
+    def __init__(self, compiled_schema: CompiledSchema, data: Any):
+        super().__init__(source_data=data, schema_data=compiled_schema.schema)
+        self.compiled_schema = compiled_schema
+
+    def _start_validate(self, value=None):
+        self.errors = []
+        # the partial schemas are looked up by name in a global of pykwalify, which other schemas may override
+        pykwalify.partial_schemas.update(self.compiled_schema.partial_rules)
+        self.root_rule = self.compiled_schema.root_rule
+        self._validate(value, self.root_rule, "", [])
+
+
+@lru_cache(maxsize=None)
+def get_compiled_schema(schema_name: str) -> CompiledSchema:
+    """Returns the compiled schema of `schemas/<schema_name>.yml`, compiling it once per process."""
+    return CompiledSchema.from_file(SCHEMAS_DIR / f"{schema_name}.yml")
@@ -14,7 +14,10 @@ from demisto_sdk.commands.common.errors import (
     Errors,
 )
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
-from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    BaseValidator,
+    append_json_outputs,
+)
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import get_yaml
 from TestSuite.pack import Pack
@@ -666,6 +669,28 @@ class TestJsonOutput:
 
             assert json_output.sort() == expected_json_1.sort()
 
+    def test_append_json_outputs(self, tmp_path):
+        """
+        Given
+        - A json outputs file written by this process, and then one changed outside of it.
+
+        When
+        - Appending outputs to the file.
+
+        Then
+        - Ensure the file is written as dumping all the outputs at once would write it.
+        """
+        json_path = tmp_path / "outputs.json"
+        outputs = [{"errorCode": f"BA10{i}", "message": f"error {i}"} for i in range(4)]
+
+        for output in outputs[:3]:
+            append_json_outputs(str(json_path), [output])
+        assert json_path.read_text() == json.dumps(outputs[:3], indent=4)
+
+        json_path.write_text(json.dumps(outputs[:1], indent=4))
+        append_json_outputs(str(json_path), outputs[1:])
+        assert json_path.read_text() == json.dumps(outputs, indent=4)
+
 
 def test_content_items_naming(repo):
     """
@@ -714,3 +739,80 @@ def test_content_items_naming(repo):
 
     for entity in valid_entities_paths:
         assert base_validator.validate_xsiam_content_item_title(entity)
+
+
+def test_get_validator_error_codes():
+    """
+    Given
+    - The id_set validator, which reports all of its errors by checks declaring them, and the docker image and
+      README validators, which also report errors outside of such checks (e.g. RM103 reported by the MDX server).
+
+    When
+    - Getting the error codes each of them may report.
+
+    Then
+    - Ensure the codes declared with `error_codes` are returned for the id_set validator.
+    - Ensure no codes are returned for the docker image and README validators, as they may report any error.
+    """
+    from demisto_sdk.commands.common.hook_validations.base_validator import (
+        VALIDATION_CHECKS_ERROR_CODES,
+        get_validator_error_codes,
+    )
+    from demisto_sdk.commands.common.hook_validations.docker import (
+        DockerImageValidator,
+    )
+    from demisto_sdk.commands.common.hook_validations.id import IDSetValidations
+    from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+
+    id_set_error_codes = get_validator_error_codes(IDSetValidations)
+
+    assert VALIDATION_CHECKS_ERROR_CODES[
+        "demisto_sdk.commands.common.hook_validations.docker.DockerImageValidator.is_docker_image_latest_tag"
+    ] == {"DO100", "DO101", "DO106"}
+    assert {"IT104", "PB110", "PB117", "PB111"} <= id_set_error_codes
+    assert not any(code.startswith("DO") for code in id_set_error_codes)
+    assert get_validator_error_codes(DockerImageValidator) is None
+    assert get_validator_error_codes(ReadMeValidator) is None
+
+
+@pytest.mark.parametrize(
+    "specific_validations, ignored_errors, support, expected",
+    [
+        (None, {}, "xsoar", True),
+        (["RM"], {}, "xsoar", True),
+        (["DO106"], {}, "xsoar", False),
+        (None, {"integration.yml": ["RM100", "RM102"]}, "xsoar", False),
+        (None, {"integration.yml": ["RM100"]}, "xsoar", True),
+        (None, {"integration.yml": ["RM"]}, "xsoar", False),
+        (None, {}, "community", False),
+        (None, {}, "partner", True),
+    ],
+)
+def test_should_report_any(
+    repo, specific_validations, ignored_errors, support, expected
+):
+    """
+    Given
+    - A check which may report RM100 and RM102, both allowed in .pack-ignore.
+    - Or one which may report CJ104 and BC100, which are ignored for community packs.
+
+    When
+    - Deciding whether to run it, with specific validations, with ignored errors in the .pack-ignore, and for packs of
+      different support levels.
+
+    Then
+    - Ensure the check runs only when any of its errors would be reported.
+    """
+    pack = repo.create_pack("pack")
+    integration = pack.create_integration("integration")
+    pack.pack_metadata.write_json({PACK_METADATA_SUPPORT: support})
+    error_codes = ["RM100", "RM102"] if support == "xsoar" else ["CJ104", "BC100"]
+
+    with ChangeCWD(repo.path):
+        base_validator = BaseValidator(
+            ignored_errors=ignored_errors, specific_validations=specific_validations
+        )
+        assert (
+            base_validator.should_report_any(error_codes, integration.yml.rel_path)
+            is expected
+        )
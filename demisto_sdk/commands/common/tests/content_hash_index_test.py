@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common import content_hash_index
+from demisto_sdk.commands.common.content_hash_index import (
+    ContentHashIndex,
+    content_item_key,
+)
+
+INTEGRATION = "Packs/MyPack/Integrations/MyIntegration"
+PLAYBOOK = "Packs/MyPack/Playbooks/playbook-MyPlaybook"
+
+
+@pytest.fixture
+def content_repo(tmp_path: Path) -> Path:
+    integration = tmp_path / INTEGRATION
+    integration.mkdir(parents=True)
+    (integration / "MyIntegration.yml").write_text("name: MyIntegration")
+    (integration / "MyIntegration.py").write_text("")
+    playbooks = tmp_path / "Packs" / "MyPack" / "Playbooks"
+    playbooks.mkdir()
+    (playbooks / "playbook-MyPlaybook.yml").write_text("name: MyPlaybook")
+    (playbooks / "playbook-MyPlaybook_README.md").write_text("")
+    (tmp_path / "Packs" / "MyPack" / "pack_metadata.json").write_text("{}")
+    (tmp_path / "Packs" / "OtherPack").mkdir()
+    (tmp_path / "Packs" / "OtherPack" / "pack_metadata.json").write_text("{}")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        (f"{INTEGRATION}/MyIntegration.yml", INTEGRATION),
+        (f"{INTEGRATION}/README.md", INTEGRATION),
+        (f"{PLAYBOOK}.yml", PLAYBOOK),
+        (f"{PLAYBOOK}_README.md", PLAYBOOK),
+        ("Packs/MyPack/pack_metadata.json", None),
+    ],
+)
+def test_content_item_key(path, expected):
+    assert content_item_key(path) == expected
+
+
+class TestContentHashIndex:
+    def test_hashes(self, content_repo: Path):
+        """
+        Given
+            - A content repository
+        When
+            - Indexing it
+        Then
+            - Ensure every file, content item and pack has a hash, and identical packs hash the same
+        """
+        index = ContentHashIndex(content_repo).update()
+
+        assert set(index.packs) == {"MyPack", "OtherPack"}
+        assert set(index.items) == {INTEGRATION, PLAYBOOK}
+        assert index.file_hash("Packs/MyPack/pack_metadata.json") == index.file_hash(
+            "Packs/OtherPack/pack_metadata.json"
+        )
+        assert index.pack_hash("MyPack") != index.pack_hash("OtherPack")
+
+    def test_changed_since_snapshot(self, content_repo: Path):
+        """
+        Given
+            - A snapshot of the index
+        When
+            - Modifying an integration file and adding a pack
+        Then
+            - Ensure only the modified content item and packs are reported as changed
+        """
+        index = ContentHashIndex(content_repo).update()
+        index.take_snapshot("base")
+        (content_repo / INTEGRATION / "MyIntegration.py").write_text("print(1)")
+        (content_repo / "Packs" / "NewPack").mkdir()
+        (content_repo / "Packs" / "NewPack" / "README.md").write_text("")
+
+        index.update()
+
+        assert index.changed_packs("base") == {"MyPack", "NewPack"}
+        assert index.changed_items("base") == {INTEGRATION}
+        assert index.changed_packs("unknown") is None
+
+    def test_only_modified_files_are_rehashed(self, content_repo: Path, mocker):
+        """
+        Given
+            - An index
+        When
+            - Updating it after a single file was modified
+        Then
+            - Ensure only that file is hashed again
+        """
+        index = ContentHashIndex(content_repo).update()
+        yml = content_repo / INTEGRATION / "MyIntegration.yml"
+        yml.write_text("name: MyIntegration2")
+        sha1_file = mocker.spy(content_hash_index, "sha1_file")
+
+        index.update()
+
+        sha1_file.assert_called_once_with(str(yml))
+
+    def test_persistence(
+        self, content_repo: Path, tmp_path_factory, monkeypatch, mocker
+    ):
+        """
+        Given
+            - An index and snapshot saved by a previous run
+        When
+            - Loading it in a new run
+        Then
+            - Ensure the snapshot is loaded and unchanged files are not hashed again
+        """
+        monkeypatch.setenv(
+            "DEMISTO_SDK_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+        )
+        index = ContentHashIndex(content_repo).update()
+        index.take_snapshot("base")
+        index.save()
+
+        loaded = ContentHashIndex(content_repo)
+        assert loaded.load()
+        sha1_file = mocker.spy(content_hash_index, "sha1_file")
+        assert loaded.update().changed_packs("base") == set()
+        assert loaded.packs == index.packs
+        assert not sha1_file.called
@@ -0,0 +1,215 @@
+import glob
+import os
+from pathlib import Path
+
+import pytest
+
+from demisto_sdk.commands.common import content_repo_index
+from demisto_sdk.commands.common.constants import FileType
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+from TestSuite.test_tools import ChangeCWD
+
+
+@pytest.fixture
+def content_repo(tmp_path: Path) -> Path:
+    integration = tmp_path / "Packs" / "MyPack" / "Integrations" / "MyIntegration"
+    integration.mkdir(parents=True)
+    (integration / "MyIntegration.yml").write_text("name: MyIntegration")
+    (integration / "MyIntegration.py").write_text("")
+    (tmp_path / "Packs" / "MyPack" / "pack_metadata.json").write_text("{}")
+    (tmp_path / "Packs" / ".DS_Store").write_text("")
+    (tmp_path / "Scripts" / "MyScript").mkdir(parents=True)
+    (tmp_path / "docs").mkdir()
+    return tmp_path
+
+
+class TestContentRepoIndex:
+    def test_queries(self, content_repo: Path):
+        """
+        Given
+            - A content repository
+        When
+            - Querying its index
+        Then
+            - Ensure the results are the same as the os results
+        """
+        index = ContentRepoIndex(content_repo)
+        pack = content_repo / "Packs" / "MyPack"
+
+        assert index.packs() == ["MyPack"]
+        assert sorted(index.listdir(pack)) == sorted(os.listdir(pack))
+        assert index.is_file(pack / "pack_metadata.json")
+        assert not index.is_dir(pack / "pack_metadata.json")
+        assert index.is_dir(pack / "Integrations")
+        assert not index.exists(pack / "Scripts")
+        assert index.listdir(content_repo) == os.listdir(content_repo)
+        with pytest.raises(FileNotFoundError):
+            index.listdir(pack / "Scripts")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "Packs/*/Integrations/*",
+            "Packs/*/Integrations/*/",
+            "Packs/*/pack_metadata.json",
+            "Packs/*/Integrations/*/*.yml",
+            "Packs/*",
+            "Scripts/*/",
+            "*/*",
+        ],
+    )
+    def test_glob(self, content_repo: Path, pattern: str):
+        """
+        Given
+            - A content repository
+        When
+            - Globbing relative and absolute patterns with the index
+        Then
+            - Ensure the results are the same as glob.glob results, in the same order
+        """
+        for pack in ("TestPack", "ForTesting", "Zoo", "Alpha"):
+            (content_repo / "Packs" / pack / "Integrations" / pack).mkdir(parents=True)
+            (content_repo / "Packs" / pack / "pack_metadata.json").write_text("{}")
+        index = ContentRepoIndex(content_repo)
+        with ChangeCWD(str(content_repo)):
+            assert index.glob(pattern) == glob.glob(pattern)
+        absolute_pattern = os.path.join(content_repo, pattern)
+        assert index.glob(absolute_pattern) == glob.glob(absolute_pattern)
+
+    def test_directories_are_listed_once(self, content_repo: Path, mocker):
+        """
+        Given
+            - A built index
+        When
+            - Querying it
+        Then
+            - Ensure the file system is not listed again
+        """
+        index = ContentRepoIndex(content_repo).build()
+        scandir = mocker.spy(content_repo_index.os, "scandir")
+
+        index.packs()
+        index.listdir(content_repo / "Packs" / "MyPack" / "Integrations")
+        assert len(list(index.iter_files())) == 4
+
+        assert not scandir.called
+
+    def test_refresh(self, content_repo: Path, mocker):
+        """
+        Given
+            - A built index
+        When
+            - Adding a file, and removing a directory, and refreshing the index
+        Then
+            - Ensure only the changed directories are listed again, and the changes are reflected
+        """
+        index = ContentRepoIndex(content_repo).build()
+        integrations = content_repo / "Packs" / "MyPack" / "Integrations"
+        (integrations / "MyIntegration" / "README.md").write_text("")
+        (content_repo / "Scripts" / "MyScript").rmdir()
+        scandir = mocker.spy(content_repo_index.os, "scandir")
+
+        index.refresh()
+
+        assert scandir.call_count == 2
+        assert index.is_file(integrations / "MyIntegration" / "README.md")
+        assert index.glob(str(content_repo / "Scripts" / "*")) == []
+
+    def test_iter_files(self, content_repo: Path):
+        """
+        Given
+            - A content repository
+        When
+            - Iterating the files of all packs
+        Then
+            - Ensure the files are returned with their pack and content entity directory
+        """
+        files = {
+            indexed_file.path: indexed_file
+            for indexed_file in ContentRepoIndex(content_repo).iter_files()
+        }
+
+        integration_yml = files[
+            "Packs/MyPack/Integrations/MyIntegration/MyIntegration.yml"
+        ]
+        assert integration_yml.pack == "MyPack"
+        assert integration_yml.entity_dir == "Integrations"
+        assert integration_yml.size == len("name: MyIntegration")
+        assert files["Packs/MyPack/pack_metadata.json"].entity_dir is None
+        assert files["Packs/.DS_Store"].pack is None
+
+    def test_modified_since(self, content_repo: Path):
+        """
+        Given
+            - A built index of a content repository
+        When
+            - Changing a file in place, and removing a directory
+        Then
+            - Ensure the changed file, and the directory of the removed one, are the ones modified since
+        """
+        for root, dirs, files in os.walk(content_repo):
+            for name in dirs + files:
+                os.utime(os.path.join(root, name), ns=(10**9, 10**9))
+        index = ContentRepoIndex(content_repo).build()
+        integration_py = (
+            content_repo / "Packs" / "MyPack" / "Integrations" / "MyIntegration"
+        ) / "MyIntegration.py"
+        integration_py.write_text("print('changed')")
+        (content_repo / "Scripts" / "MyScript").rmdir()
+
+        index.refresh()
+
+        assert set(index.modified_since(2 * 10**9)) == {
+            "Scripts",
+            "Packs/MyPack/Integrations/MyIntegration/MyIntegration.py",
+        }
+
+    def test_file_type(self, content_repo: Path, mocker):
+        """
+        Given
+            - An indexed file
+        When
+            - Getting its type twice
+        Then
+            - Ensure it is classified only once
+        """
+        index = ContentRepoIndex(content_repo)
+        find_type_by_path = mocker.spy(content_repo_index, "find_type_by_path")
+        path = content_repo / "Packs" / "MyPack" / "pack_metadata.json"
+
+        assert index.file_type(path) == FileType.METADATA
+        assert index.file_type(path) == FileType.METADATA
+        assert find_type_by_path.call_count == 1
+
+    def test_persistence(self, content_repo: Path, tmp_path_factory, monkeypatch):
+        """
+        Given
+            - An index saved by a previous run
+        When
+            - Loading it in a new run, after a file was added
+        Then
+            - Ensure the saved index is used, and refreshed
+        """
+        monkeypatch.setenv(
+            "DEMISTO_SDK_CACHE_DIR", str(tmp_path_factory.mktemp("cache"))
+        )
+        index = ContentRepoIndex(content_repo).build()
+        index.save()
+        (content_repo / "Packs" / "NewPack").mkdir()
+
+        loaded = ContentRepoIndex(content_repo)
+        assert loaded.load()
+        assert loaded.packs() == ["MyPack"]
+        assert loaded.refresh().packs() == ["MyPack", "NewPack"]
+
+    def test_get_is_shared(self, content_repo: Path):
+        """
+        Given
+            - A content repository
+        When
+            - Getting its index twice, with equivalent paths
+        Then
+            - Ensure the same index is returned
+        """
+        with ChangeCWD(str(content_repo)):
+            assert ContentRepoIndex.get(".") is ContentRepoIndex.get(content_repo)
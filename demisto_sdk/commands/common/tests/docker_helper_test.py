@@ -1,4 +1,5 @@
 import os
+import time
 from unittest import mock
 
 import pytest
@@ -68,3 +69,89 @@ def test_cache_of_get_python_version_from_image():
     docker_helper.get_python_version(image)
     cache_info = docker_helper.get_python_version.cache_info()
     assert cache_info.hits == cache_info_before.hits + 1
+
+
+class TestDockerImagesMetadataStore:
+    IMAGE = "demisto/pan-os-python:1.0.0.12345"
+    ENV = ["PYTHON_VERSION=3.10.11", "LANG=C.UTF-8"]
+
+    def test_persisted_between_runs(self, mocker, tmp_path):
+        """
+        Given
+            - An image which is available in the local docker daemon
+        When
+            - Getting its metadata, and then getting it again from a new store (a new run)
+        Then
+            - Ensure it is read from the docker daemon once, and the registry is not called
+            - Ensure the stored digest, env and python version are returned by the new store
+        """
+        image_mock = mocker.MagicMock(
+            attrs={"Id": "sha256:1", "Config": {"Env": self.ENV}}
+        )
+        client = mocker.patch.object(dhelper, "init_global_docker_client")
+        client.return_value.images.get.return_value = image_mock
+        api = mocker.patch.object(dhelper, "_get_image_metadata_from_dockerhub_api")
+        store_path = tmp_path / "docker_images.json"
+
+        assert (
+            dhelper.DockerImagesMetadataStore(store_path).get(self.IMAGE).python_version
+            == "3.10.11"
+        )
+        metadata = dhelper.DockerImagesMetadataStore(store_path).get(self.IMAGE)
+
+        assert metadata.digest == "sha256:1"
+        assert metadata.env == self.ENV
+        assert client.return_value.images.get.call_count == 1
+        assert not api.called
+
+    def test_prefetch_from_registry(self, mocker):
+        """
+        Given
+            - Images which are not available in the local docker daemon
+        When
+            - Prefetching them, and then getting the python version of each of them
+        Then
+            - Ensure each image is resolved once from the registry API, and never pulled
+        """
+        mocker.patch.object(
+            dhelper,
+            "_get_image_metadata_from_client",
+            side_effect=dhelper.docker.errors.ImageNotFound("not found"),
+        )
+        api = mocker.patch.object(
+            dhelper,
+            "_get_image_metadata_from_dockerhub_api",
+            return_value=("sha256:1", self.ENV),
+        )
+        pull = mocker.patch.object(dhelper, "_get_image_metadata_from_pulled_image")
+        images = [f"demisto/image{i}:1.0.0.{i}" for i in range(5)]
+        dhelper.get_python_version.cache_clear()
+
+        dhelper.prefetch_python_versions(images + ["demisto/python3:3.10.1.1", None])
+        versions = {dhelper.get_python_version(image) for image in images}
+
+        assert versions == {Version("3.10.11")}
+        assert api.call_count == 5
+        assert not pull.called
+
+    def test_expired_metadata(self, mocker, tmp_path):
+        """
+        Given
+            - Stored metadata of an image tag, and of a latest image, which were last seen two days ago
+        When
+            - Getting their metadata
+        Then
+            - Ensure only the latest image is resolved again
+        """
+        store = dhelper.DockerImagesMetadataStore(tmp_path / "docker_images.json")
+        stale = dhelper.DockerImageMetadata(
+            "sha256:0", self.ENV, "3.10.11", time.time() - 2 * 24 * 60 * 60
+        )
+        store.images.update({self.IMAGE: stale, "demisto/python3:latest": stale})
+        resolve = mocker.patch.object(
+            dhelper, "_get_image_metadata_from_client", return_value=("sha256:1", [])
+        )
+
+        assert store.get(self.IMAGE).digest == "sha256:0"
+        assert store.get("demisto/python3:latest").digest == "sha256:1"
+        assert resolve.call_count == 1
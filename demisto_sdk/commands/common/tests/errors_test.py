@@ -169,6 +169,19 @@ class TestErrors(unittest.TestCase):
                 error
             ), f"{error} does not match an error code format"
 
+    def test_reported_errors(self):
+        from demisto_sdk.commands.common.errors import ReportedErrors
+
+        reported_errors = ReportedErrors(["a - [BA100]"])
+        reported_errors.append("b - [BA101]")
+        assert "b - [BA101]" in reported_errors
+        reported_errors.remove("a - [BA100]")
+        assert "a - [BA100]" not in reported_errors
+        del reported_errors[:]
+        assert "b - [BA101]" not in reported_errors
+        reported_errors.extend(["c - [BA102]"])
+        assert reported_errors == ["c - [BA102]"]
+
     def test_error_code_format(self):
         from demisto_sdk.commands.common.errors import ERROR_CODE
 
@@ -0,0 +1,191 @@
+import os
+from pathlib import Path
+
+from demisto_sdk.commands.common.file_cache import (
+    InMemoryFileCache,
+    PersistentFileCache,
+    deserialize,
+    serialize,
+)
+
+
+class TestInMemoryFileCache:
+    def test_get_returns_a_copy(self, tmp_path: Path):
+        """
+        Given
+            - Parsed content stored in the cache
+        When
+            - Getting it twice, and modifying the first result
+        Then
+            - Ensure the second result is not affected
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        cache = InMemoryFileCache()
+        cache.set(file_path, False, file_path.stat(), serialize({"a": [1]}), True)
+
+        found, first = cache.get(file_path, False, file_path.stat())
+        assert found
+        first["a"].append(2)
+        assert cache.get(file_path, False, file_path.stat()) == (True, {"a": [1]})
+
+    def test_eviction_by_size(self, tmp_path: Path):
+        """
+        Given
+            - A cache with a memory budget
+        When
+            - Storing more bytes than the budget
+        Then
+            - Ensure the least recently used entries are evicted, and the held bytes stay within the budget
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        stat = file_path.stat()
+        cache = InMemoryFileCache(max_size_bytes=2500)
+        for i in range(5):
+            cache.set(f"file{i}", False, stat, serialize("a" * 1000), True)
+
+        assert cache.stats()["entries"] == 2
+        assert cache.evictions == 3
+        assert cache.bytes_held <= 2500
+        assert not cache.get("file0", False, stat)[0]
+        assert cache.get("file4", False, stat)[0]
+
+    def test_invalidate(self, tmp_path: Path):
+        """
+        Given
+            - Several representations of two files in the cache
+        When
+            - Invalidating one file
+        Then
+            - Ensure all of its representations are removed, and the other file is kept
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        stat = file_path.stat()
+        cache = InMemoryFileCache()
+        cache.set("first", True, stat, serialize({}), True)
+        cache.set("first", "content", stat, "{}", False)
+        cache.set("second", True, stat, serialize({}), True)
+
+        cache.invalidate("first")
+
+        assert cache.stats()["entries"] == 1
+        assert cache.get("second", True, stat)[0]
+
+
+class TestPersistentFileCache:
+    def test_get_after_set(self, tmp_path: Path):
+        """
+        Given
+            - A parsed file stored in the persistent cache
+        When
+            - Getting the file from a new cache instance (a new run)
+        Then
+            - Ensure the parsed content is returned, and a hit is counted
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        stat = file_path.stat()
+        PersistentFileCache(tmp_path / "cache.sqlite").set(
+            file_path, stat, False, serialize({"a": 1})
+        )
+
+        cache = PersistentFileCache(tmp_path / "cache.sqlite")
+        assert deserialize(cache.get(file_path, stat, False)) == {"a": 1}
+        assert cache.get(file_path, stat, True) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_modified_file_is_a_miss(self, tmp_path: Path):
+        """
+        Given
+            - A parsed file stored in the persistent cache
+        When
+            - The file is modified
+        Then
+            - Ensure the stale content is not returned
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        cache = PersistentFileCache(tmp_path / "cache.sqlite")
+        cache.set(file_path, file_path.stat(), False, serialize({"a": 1}))
+
+        file_path.write_text('{"a": 22}')
+        assert cache.get(file_path, file_path.stat(), False) is None
+
+    def test_sdk_version_change_is_a_miss(self, tmp_path: Path):
+        """
+        Given
+            - A parsed file stored in the persistent cache by a certain sdk version
+        When
+            - Getting the file with another sdk version
+        Then
+            - Ensure the cached content is not returned
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        PersistentFileCache(tmp_path / "cache.sqlite", sdk_version="1.0.0").set(
+            file_path, file_path.stat(), False, serialize({"a": 1})
+        )
+        cache = PersistentFileCache(tmp_path / "cache.sqlite", sdk_version="1.0.1")
+        assert cache.get(file_path, file_path.stat(), False) is None
+
+    def test_eviction(self, tmp_path: Path):
+        """
+        Given
+            - A persistent cache with a small max size
+        When
+            - Storing more data than the max size
+        Then
+            - Ensure the least recently used entries are evicted
+        """
+        cache = PersistentFileCache(tmp_path / "cache.sqlite", max_size_bytes=5000)
+        paths = []
+        for i in range(10):
+            file_path = tmp_path / f"file{i}.json"
+            file_path.write_text("{}")
+            paths.append(file_path)
+            cache.set(file_path, file_path.stat(), False, b"a" * 1000)
+        cache.evict()
+
+        assert cache.evictions
+        assert cache.get(paths[0], paths[0].stat(), False) is None
+        assert cache.get(paths[-1], paths[-1].stat(), False) == b"a" * 1000
+
+    def test_broken_cache_file_disables_cache(self, tmp_path: Path):
+        """
+        Given
+            - A cache path which is not a valid sqlite database
+        When
+            - Using the cache
+        Then
+            - Ensure no error is raised, and the cache is disabled
+        """
+        (tmp_path / "cache.sqlite").write_text("not a database")
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        cache = PersistentFileCache(tmp_path / "cache.sqlite")
+
+        assert cache.get(file_path, file_path.stat(), False) is None
+        cache.set(file_path, file_path.stat(), False, serialize({}))
+        assert cache.disabled
+
+    def test_reconnects_in_child_process(self, tmp_path: Path, mocker):
+        """
+        Given
+            - A cache that was used by a parent process
+        When
+            - Using it from a forked process (simulated by a pid change)
+        Then
+            - Ensure a new connection is opened
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text("{}")
+        cache = PersistentFileCache(tmp_path / "cache.sqlite")
+        cache.set(file_path, file_path.stat(), False, serialize({}))
+        parent_connection = cache._connection
+
+        mocker.patch.object(os, "getpid", return_value=-1)
+        assert deserialize(cache.get(file_path, file_path.stat(), False)) == {}
+        assert cache._connection is not parent_connection
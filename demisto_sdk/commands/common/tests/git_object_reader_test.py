@@ -0,0 +1,89 @@
+import subprocess
+
+import pytest
+from git import GitCommandError, Repo
+
+from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+from demisto_sdk.commands.common.git_util import GitUtil
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Repo:
+    repo = Repo.init(tmp_path)
+    repo.git.checkout("-b", "master")
+    repo.git.config("user.email", "automatic@example.com")
+    repo.git.config("user.name", "AutomaticTest")
+    for i in range(50):
+        (tmp_path / f"file_{i}.yml").write_text(f"id: file_{i}\n" * 1000)
+    (tmp_path / "copy.yml").write_text("id: file_0\n" * 1000)
+    repo.git.add(".")
+    repo.git.commit("-m", "initial commit")
+    return repo
+
+
+def test_read(git_repo):
+    """
+    Given
+        - A git repository
+
+    When
+        - Reading an existing file, and a missing file of the master branch
+
+    Then
+        - Ensure the content of the existing file is returned, like `git show`
+        - Ensure None is returned for the missing file
+    """
+    reader = GitObjectReader.get(git_repo.working_dir)
+
+    git_object = reader.read("master:file_1.yml")
+
+    assert git_object.type == "blob"
+    assert git_object.content.decode() == git_repo.git.show("master:file_1.yml") + "\n"
+    assert git_object.sha == git_repo.git.rev_parse("master:file_1.yml")
+    assert reader.read("master:missing.yml") is None
+
+
+def test_prefetch_in_a_single_process(git_repo, mocker):
+    """
+    Given
+        - A git repository
+
+    When
+        - Prefetching many files of the master branch, and then reading them
+
+    Then
+        - Ensure a single git process is started for all of them
+        - Ensure files with the same content are stored once
+    """
+    popen = mocker.spy(subprocess, "Popen")
+    reader = GitObjectReader.get(git_repo.working_dir)
+    names = [f"master:file_{i}.yml" for i in range(50)] + ["master:copy.yml"]
+
+    assert reader.prefetch(names) == 51
+    assert reader.prefetch(names) == 0
+    git_objects = [reader.read(name) for name in names]
+
+    assert popen.call_count == 1
+    assert all(git_objects)
+    assert git_objects[0] is git_objects[-1]
+
+
+def test_get_local_remote_file_content(git_repo):
+    """
+    Given
+        - A git repository
+
+    When
+        - Getting the content of a file of the master branch with GitUtil, and of a missing file
+
+    Then
+        - Ensure the content is returned like `git show`
+        - Ensure GitCommandError is raised for the missing file, like `git show`
+    """
+    git_util = GitUtil(git_repo)
+
+    assert git_util.get_local_remote_file_content(
+        "master:file_2.yml"
+    ) == git_repo.git.show("master:file_2.yml")
+    with pytest.raises(GitCommandError):
+        git_util.get_local_remote_file_content("master:missing.yml")
@@ -1,3 +1,6 @@
+from pathlib import Path
+
+
 def test_find_primary_branch():
     """
     Given
@@ -49,3 +52,140 @@ def test_find_primary_branch():
     refs_other.refs = ["a", "b"]
     repo_with_remotes_refs_other.remotes.append(refs_other)
     assert not GitUtil.find_primary_branch(repo_with_remotes_refs_other)
+
+
+def test_parse_name_status():
+    """
+    Given
+        - The output of `git diff --name-status -M -z`, with a modification, a rename, an addition and a deletion
+
+    When
+        - Parsing it
+
+    Then
+        - Ensure every change is parsed with its status, score and paths
+    """
+    from demisto_sdk.commands.common.git_util import ChangedFile, parse_name_status
+
+    output = "M\0a.yml\0R086\0old.yml\0new.yml\0A\0added.md\0D\0deleted.py\0"
+
+    assert parse_name_status(output) == [
+        ChangedFile("M", None, Path("a.yml"), Path("a.yml")),
+        ChangedFile("R", 86, Path("old.yml"), Path("new.yml")),
+        ChangedFile("A", None, Path("added.md"), Path("added.md")),
+        ChangedFile("D", None, Path("deleted.py"), Path("deleted.py")),
+    ]
+    assert parse_name_status("") == []
+
+
+def test_changed_files_from_a_single_snapshot(tmp_path, mocker):
+    """
+    Given
+        - A branch with committed, staged and untracked changes against a commit of master
+
+    When
+        - Getting its modified, added, deleted and renamed files
+
+    Then
+        - Ensure the files of every status are returned
+        - Ensure the branch is diffed only once for all of them
+    """
+    from git import Git, Repo
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    repo = Repo.init(tmp_path)
+    repo.git.checkout("-b", "master")
+    repo.git.config("user.email", "automatic@example.com")
+    repo.git.config("user.name", "AutomaticTest")
+    for name in ("modified", "renamed", "deleted", "staged"):
+        (tmp_path / f"{name}.txt").write_text(
+            "\n".join(f"{name} {i}" for i in range(100))
+        )
+    repo.git.add(".")
+    repo.git.commit("-m", "initial commit")
+    prev_ver = repo.head.commit.hexsha
+    repo.git.checkout("-b", "branch")
+    with (tmp_path / "modified.txt").open("a") as modified_file:
+        modified_file.write("\nmodified")
+    repo.git.mv("renamed.txt", "new_name.txt")
+    repo.git.rm("deleted.txt")
+    (tmp_path / "added.txt").write_text("added")
+    repo.git.add(".")
+    repo.git.commit("-m", "branch commit")
+    with (tmp_path / "staged.txt").open("a") as staged_file:
+        staged_file.write("\nstaged")
+    repo.git.add("staged.txt")
+    (tmp_path / "untracked.txt").write_text("untracked")
+
+    git_util = GitUtil(repo)
+    git_execute = mocker.spy(Git, "execute")
+
+    assert git_util.modified_files(prev_ver, include_untracked=True) == {
+        Path("modified.txt"),
+        Path("staged.txt"),
+    }
+    assert git_util.added_files(prev_ver, include_untracked=True) == {
+        Path("added.txt"),
+        Path("untracked.txt"),
+    }
+    assert git_util.deleted_files(prev_ver) == {Path("deleted.txt")}
+    assert git_util.renamed_files(prev_ver) == {
+        (Path("renamed.txt"), Path("new_name.txt"))
+    }
+    assert git_util.modified_files(prev_ver, committed_only=True) == {
+        Path("modified.txt")
+    }
+    assert git_util.modified_files(prev_ver, staged_only=True) == {Path("staged.txt")}
+    # the committed changes, the staged changes and the files touched on the branch
+    git_diffs = [
+        call_args
+        for call_args in git_execute.call_args_list
+        if "diff" in call_args[0][1]
+    ]
+    assert len(git_diffs) == 3
+
+
+def test_snapshot_taken_again_once_the_index_or_prev_ver_change(tmp_path):
+    """
+    Given
+        - A branch with an added file against origin/master
+
+    When
+        - Getting its added files again after adding an untracked file, staging it, and fetching a newer origin/master
+
+    Then
+        - Ensure the untracked, staged and committed changes are read again, rather than taken from the first snapshot
+    """
+    from git import Repo
+
+    from demisto_sdk.commands.common.git_util import GitUtil
+
+    Repo.init(tmp_path / "origin", bare=True)
+    repo_path = tmp_path / "repo"
+    repo = Repo.init(repo_path)
+    repo.git.checkout("-b", "master")
+    repo.git.config("user.email", "automatic@example.com")
+    repo.git.config("user.name", "AutomaticTest")
+    repo.create_remote("origin", str(tmp_path / "origin"))
+    (repo_path / "initial.txt").write_text("initial")
+    repo.git.add(".")
+    repo.git.commit("-m", "initial commit")
+    repo.git.push("origin", "master")
+    repo.git.checkout("-b", "branch")
+    (repo_path / "committed.txt").write_text("committed")
+    repo.git.add(".")
+    repo.git.commit("-m", "branch commit")
+    git_util = GitUtil(repo)
+
+    assert git_util.added_files("origin/master") == {Path("committed.txt")}
+    (repo_path / "new.txt").write_text("new")
+    assert git_util.added_files("origin/master", include_untracked=True) == {
+        Path("committed.txt"),
+        Path("new.txt"),
+    }
+    repo.git.add("new.txt")
+    assert git_util.added_files("origin/master", staged_only=True) == {Path("new.txt")}
+    repo.git.push("origin", "branch:master")
+    repo.git.fetch("origin")
+    assert git_util.added_files("origin/master", committed_only=True) == set()
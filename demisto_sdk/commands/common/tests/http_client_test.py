@@ -0,0 +1,252 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+import requests
+
+from demisto_sdk.commands.common.hook_validations.docker import (
+    DockerImageValidator,
+)
+from demisto_sdk.commands.common.http_client import (
+    HTTP_CACHE_INDEX_NAME,
+    HttpClient,
+    get_http_client,
+    http_get,
+    set_http_client,
+)
+
+
+class FakeServer(ThreadingHTTPServer):
+    """A local server returning the configured responses (with an ETag), and recording the requests it got."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeHandler)
+        self.responses: Dict[str, bytes] = {}
+        self.failures_left = 0
+        self.requests: List[str] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    server: FakeServer
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.server.failures_left:
+            self.server.failures_left -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if (body := self.server.responses.get(self.path)) is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"{hash(body)}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeServer]:
+    server = FakeServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_cache_within_ttl(fake_server: FakeServer, tmp_path: Path):
+    """
+    Given
+        - A client with an on-disk cache
+    When
+        - Getting the same url twice within the cache TTL, and then from a new client (a new run)
+    Then
+        - Ensure a single request is sent, and the cached response has the same content
+    """
+    fake_server.responses["/tags"] = b'{"results": []}'
+    url = f"{fake_server.url}/tags"
+
+    assert HttpClient(tmp_path).get(url, cache_ttl=60).json() == {"results": []}
+    client = HttpClient(tmp_path)
+    response = client.get(url, cache_ttl=60)
+
+    assert response.json() == {"results": []}
+    assert response.from_cache
+    assert client.requests_sent == 0
+    assert fake_server.requests == ["/tags"]
+
+
+def test_revalidate_with_etag(fake_server: FakeServer, tmp_path: Path):
+    """
+    Given
+        - A cached response whose TTL expired
+    When
+        - Getting it again, before and after its content changed on the server
+    Then
+        - Ensure the cached response is revalidated, and the new content is returned once it changed
+    """
+    fake_server.responses["/file"] = b"1"
+    client = HttpClient(tmp_path)
+    url = f"{fake_server.url}/file"
+
+    assert client.get(url, cache_ttl=0).text == "1"
+    assert client.get(url, cache_ttl=0).text == "1"
+    assert client.cache_hits == 1
+    fake_server.responses["/file"] = b"2"
+    assert client.get(url, cache_ttl=0).text == "2"
+    assert len(fake_server.requests) == 3
+
+
+def test_retry_and_unreachable_host(fake_server: FakeServer):
+    """
+    Given
+        - A server which fails with 503 twice, and a host which can not be connected to
+    When
+        - Getting a url from each of them
+    Then
+        - Ensure the failed requests are retried
+        - Ensure the unreachable host is not tried again
+    """
+    fake_server.responses["/file"] = b"content"
+    fake_server.failures_left = 2
+    client = HttpClient(backoff_factor=0, retries=2)
+
+    assert client.get(f"{fake_server.url}/file").text == "content"
+    assert len(fake_server.requests) == 3
+
+    fake_server.shutdown()
+    fake_server.server_close()
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get(f"{fake_server.url}/file")
+    assert len(fake_server.requests) == 3
+
+
+def test_host_overrides(fake_server: FakeServer):
+    """
+    Given
+        - The shared client replaced with a client redirecting docker hub to a fake server
+    When
+        - Getting the latest tag of a docker image
+    Then
+        - Ensure the tags are taken from the fake server, and the same session is used for all the requests
+    """
+    fake_server.responses[
+        "/v2/repositories/demisto/python3/tags"
+    ] = b'{"results": [{"name": "3.10.1.1", "last_updated": "2023-01-01T00:00:00.000000Z"}]}'
+    set_http_client(
+        HttpClient(host_overrides={"https://hub.docker.com": fake_server.url})
+    )
+
+    assert (
+        DockerImageValidator.get_docker_image_latest_tag_request.__wrapped__(
+            "demisto/python3"
+        )
+        == "3.10.1.1"
+    )
+    assert http_get("https://hub.docker.com/v2/repositories/demisto/python3/tags").ok
+    assert get_http_client().session(fake_server.url) is get_http_client().session(
+        f"{fake_server.url}/other"
+    )
+    assert len(fake_server.requests) == 2
+
+
+def test_credentials_not_cached(fake_server: FakeServer, tmp_path: Path):
+    """
+    Given
+        - A client with an on-disk cache
+    When
+        - Getting the same url twice with a cache TTL, with a credentials header
+    Then
+        - Ensure both requests are sent, and nothing is stored in the cache
+    """
+    fake_server.responses["/private"] = b"secret"
+    client = HttpClient(tmp_path)
+    url = f"{fake_server.url}/private"
+
+    for token in ("token1", "token2"):
+        assert (
+            client.get(url, cache_ttl=60, headers={"PRIVATE-TOKEN": token}).text
+            == "secret"
+        )
+
+    assert len(fake_server.requests) == 2
+    assert not list(tmp_path.iterdir())
+
+
+def test_unreachable_host_backoff(fake_server: FakeServer, tmp_path: Path):
+    """
+    Given
+        - A cached response which is older than the max stale age, and a host which can not be connected to
+    When
+        - Getting the response after the unreachable host backoff passed
+    Then
+        - Ensure the host is tried again, and the stale response is not returned
+    """
+    fake_server.responses["/file"] = b"content"
+    url = f"{fake_server.url}/file"
+    client = HttpClient(
+        tmp_path, retries=0, unreachable_host_backoff=0, max_stale_age=0
+    )
+    assert client.get(url, cache_ttl=0).text == "content"
+    fake_server.shutdown()
+    fake_server.server_close()
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get(url, cache_ttl=0)
+    assert client.requests_sent == 3
+
+
+def test_evict(fake_server: FakeServer, tmp_path: Path):
+    """
+    Given
+        - A client whose cache holds more responses than its max size, the first of them used again last
+    When
+        - Evicting the cache
+    Then
+        - Ensure the least recently used responses are removed, until the cache is below its max size
+        - Ensure the response used last is kept, although it was written first
+    """
+    client = HttpClient(tmp_path, max_cache_size_bytes=1500)
+    for i in range(5):
+        fake_server.responses[f"/file{i}"] = b"x" * 300
+        client.get(f"{fake_server.url}/file{i}", cache_ttl=60)
+    client.get(f"{fake_server.url}/file0", cache_ttl=60)
+
+    client.evict()
+
+    cached_files = [
+        path
+        for path in tmp_path.iterdir()
+        if not path.name.startswith(HTTP_CACHE_INDEX_NAME)
+    ]
+    assert sum(path.stat().st_size for path in cached_files) <= 1200
+    assert client.cache_evictions == 5 - len(cached_files)
+    assert len(fake_server.requests) == 5
+    assert client.get(f"{fake_server.url}/file0", cache_ttl=60).from_cache
+    assert client.get(f"{fake_server.url}/file4", cache_ttl=60).from_cache
+    assert not hasattr(
+        client.get(f"{fake_server.url}/file1", cache_ttl=60), "from_cache"
+    )
@@ -0,0 +1,143 @@
+import pickle
+
+import pytest
+
+from demisto_sdk.commands.common.id_set_index import (
+    IDSetIndex,
+    IDSetSection,
+    index_id_set_sections,
+)
+
+ID_SET = {
+    "integrations": [
+        {
+            "Integration1": {
+                "name": "Integration1",
+                "pack": "Pack1",
+                "commands": ["test-command", "command1"],
+                "fromversion": "6.0.0",
+                "marketplaces": ["xsoar"],
+            }
+        },
+        {
+            "Integration2": {
+                "name": "Integration2",
+                "pack": "Pack2",
+                "commands": ["test-command"],
+                "toversion": "5.9.9",
+                "marketplaces": ["xsoar", "marketplacev2"],
+            }
+        },
+    ],
+    "scripts": [
+        {"Script1": {"name": "MyScript", "pack": "Pack1"}},
+        {"Script2": {"name": "Script2", "pack": "Pack2"}},
+        {"Script1": {"name": "MyScript", "pack": "Pack2", "fromversion": "6.5.0"}},
+    ],
+    "IncidentFields": [
+        {
+            "incident_field1": {
+                "name": "Field 1",
+                "pack": "Pack1",
+                "aliases": ["field1alias"],
+            }
+        }
+    ],
+}
+
+
+class TestIDSetIndex:
+    def test_lookups(self):
+        """
+        Given
+            - An id_set
+        When
+            - Looking up its items by id, name, pack, integration command and alias
+        Then
+            - Ensure the matching items are returned, in the order of their section
+        """
+        id_set_index = IDSetIndex(ID_SET)
+        scripts = ID_SET["scripts"]
+        integrations = ID_SET["integrations"]
+
+        assert id_set_index.section("scripts").by_id("Script1") == [
+            scripts[0],
+            scripts[2],
+        ]
+        assert id_set_index.by_type("script").by_name("myscript") == []
+        assert id_set_index.by_type("script").by_name("myscript", ignore_case=True) == [
+            scripts[0],
+            scripts[2],
+        ]
+        assert id_set_index.section("scripts").by_pack("Pack2") == scripts[1:]
+        integrations_index = id_set_index.section("integrations")
+        assert integrations_index.by_command("test-command") == integrations
+        assert integrations_index.by_command("command1") == [integrations[0]]
+        fields_index = id_set_index.section("IncidentFields")
+        assert fields_index.find(aliases=["field1alias"]) == ID_SET["IncidentFields"]
+        assert (
+            id_set_index.section("scripts").find(ids=["Script2"], names=["MyScript"])
+            == scripts
+        )
+        assert id_set_index.section("Layouts").by_id("Script1") == []
+        assert id_set_index.section("scripts").has_name("Script2")
+        assert not id_set_index.section("scripts").has_id("Script3")
+
+    def test_kept_by_section(self):
+        """
+        Given
+            - A section of a loaded id_set which was already indexed
+        When
+            - Indexing it again, before and after replacing an item of the section, and after pickling the section
+        Then
+            - Ensure the section is indexed once, and indexed again once it was changed
+            - Ensure the section is pickled without its index
+        """
+        scripts = [{"Script1": {"name": "Script1"}}]
+        id_set = index_id_set_sections({"scripts": scripts, "Version": "1.0.0"})
+        assert isinstance(id_set["scripts"], IDSetSection)
+        assert id_set["scripts"] == scripts
+
+        index = IDSetIndex.of(id_set["scripts"])
+        assert IDSetIndex(id_set).section("scripts") is index
+        assert IDSetIndex.of(scripts) is not IDSetIndex.of(scripts)
+
+        id_set["scripts"][0] = {"Script2": {"name": "Script2"}}
+        assert IDSetIndex.of(id_set["scripts"]) is not index
+        assert IDSetIndex.of(id_set["scripts"]).has_id("Script2")
+        assert not IDSetIndex.of(id_set["scripts"]).has_id("Script1")
+
+        unpickled_scripts = pickle.loads(pickle.dumps(id_set["scripts"]))
+        assert unpickled_scripts == id_set["scripts"]
+        assert unpickled_scripts._index is None
+        assert unpickled_scripts.index.has_id("Script2")
+
+    @pytest.mark.parametrize(
+        "marketplace, from_version, to_version, expected_integrations",
+        [
+            ("", "", "", ["Integration1", "Integration2"]),
+            ("marketplacev2", "", "", ["Integration2"]),
+            ("", "6.0.0", "", ["Integration1"]),
+            ("", "", "5.5.0", ["Integration2"]),
+            ("xsoar", "5.0.0", "6.0.0", ["Integration1", "Integration2"]),
+            ("marketplacev2", "6.0.0", "", []),
+        ],
+    )
+    def test_filter_items(
+        self, marketplace, from_version, to_version, expected_integrations
+    ):
+        """
+        Given
+            - Integrations of different marketplaces and versions
+        When
+            - Filtering them by a marketplace and a version range
+        Then
+            - Ensure only the integrations of the marketplace which are available in the version range are returned
+        """
+        integrations = IDSetIndex.filter_items(
+            ID_SET["integrations"], marketplace, from_version, to_version
+        )
+
+        assert [
+            next(iter(integration)) for integration in integrations
+        ] == expected_integrations
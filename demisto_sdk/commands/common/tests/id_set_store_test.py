@@ -0,0 +1,135 @@
+import pickle
+from pathlib import Path
+
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_index import IDSetSection
+from demisto_sdk.commands.common.id_set_store import (
+    IDSetStore,
+    is_id_set_store,
+    load_id_set,
+    write_id_set,
+)
+from demisto_sdk.commands.common.tools import open_id_set_file
+
+ID_SET = {
+    "scripts": [
+        {"Script1": {"name": "Script1", "pack": "Pack1", "tags": ["tag"]}},
+        {"Script2": {"name": "Script2", "pack": "Pack2"}},
+        {"Script1": {"name": "Script1", "pack": "Pack2", "fromversion": "6.5.0"}},
+    ],
+    "integrations": [
+        {"Integration1": {"name": "Integration1", "commands": ["test-command"]}}
+    ],
+    "Layouts": [],
+    "Packs": {
+        "Pack1": {"name": "Pack 1", "ContentItems": {"scripts": ["Script1"]}},
+        "Pack2": {"name": "Pack 2", "ContentItems": {}},
+    },
+    "Version": "1.0.0",
+}
+
+
+class TestIDSetStore:
+    def test_json_round_trip(self, tmp_path: Path):
+        """
+        Given
+            - An id_set json
+        When
+            - Converting it to an id_set store, and the store back to json
+        Then
+            - Ensure the json written from the store is identical to the original json
+        """
+        json_path = tmp_path / "id_set.json"
+        store_path = tmp_path / "id_set.db"
+        converted_json_path = tmp_path / "converted_id_set.json"
+        write_id_set(ID_SET, json_path)
+
+        write_id_set(load_id_set(json_path), store_path)
+        write_id_set(load_id_set(store_path), converted_json_path)
+
+        assert is_id_set_store(store_path)
+        assert not is_id_set_store(json_path)
+        assert converted_json_path.read_bytes() == json_path.read_bytes()
+
+    def test_sections_loaded_lazily(self, tmp_path: Path):
+        """
+        Given
+            - An id_set store
+        When
+            - Accessing one of its sections
+        Then
+            - Ensure only the accessed section is loaded, and it is equal to the section of the id_set
+        """
+        store_path = tmp_path / "id_set.db"
+        write_id_set(ID_SET, store_path)
+        store = IDSetStore(store_path)
+
+        assert list(store) == list(ID_SET)
+        assert store.get("Packs") == ID_SET["Packs"]
+        assert store["Version"] == ID_SET["Version"]
+        assert store.get("Playbooks") is None
+        assert set(store._sections) == {"Packs", "Version"}
+        assert store.to_dict() == ID_SET
+
+    def test_get_items(self, tmp_path: Path):
+        """
+        Given
+            - An id_set store
+        When
+            - Getting the items of a section by their id, before and after loading the section
+        Then
+            - Ensure the items with the id are returned, in the order of their section, without loading the section
+        """
+        store_path = tmp_path / "id_set.db"
+        write_id_set(ID_SET, store_path)
+        store = IDSetStore(store_path)
+        expected_scripts = [ID_SET["scripts"][0], ID_SET["scripts"][2]]
+
+        assert store.get_items("scripts", "Script1") == expected_scripts
+        assert store.get_items("Packs", "Pack2") == [ID_SET["Packs"]["Pack2"]]
+        assert store.get_items("scripts", "Script3") == []
+        assert store.get_items("Version", "Script1") == []
+        assert not store._sections
+
+        assert isinstance(store["scripts"], IDSetSection)
+        assert store.get_items("scripts", "Script1") == expected_scripts
+
+    def test_pickled_by_path(self, tmp_path: Path):
+        """
+        Given
+            - An id_set store with a loaded section
+        When
+            - Pickling it, as done when it is sent to another process
+        Then
+            - Ensure only its path is pickled, and the unpickled store loads the id_set
+        """
+        store_path = tmp_path / "id_set.db"
+        write_id_set(ID_SET, store_path)
+        store = IDSetStore(store_path)
+        assert store["scripts"]
+
+        unpickled_store = pickle.loads(pickle.dumps(store))
+
+        assert not unpickled_store._sections
+        assert unpickled_store.to_dict() == ID_SET
+
+    def test_open_id_set_file(self, tmp_path: Path):
+        """
+        Given
+            - An id_set store and an id_set json
+        When
+            - Opening them with open_id_set_file
+        Then
+            - Ensure the store is opened lazily, and the json is loaded with sections which keep their indexes
+        """
+        store_path = tmp_path / "id_set.db"
+        json_path = tmp_path / "id_set.json"
+        write_id_set(ID_SET, store_path)
+        json_path.write_text(json.dumps(ID_SET))
+
+        id_set = open_id_set_file(store_path)
+
+        assert isinstance(id_set, IDSetStore)
+        assert id_set.get("scripts") == ID_SET["scripts"]
+        assert open_id_set_file(json_path) == ID_SET
+        assert isinstance(open_id_set_file(json_path)["scripts"], IDSetSection)
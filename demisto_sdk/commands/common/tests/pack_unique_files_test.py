@@ -6,7 +6,6 @@ from pathlib import Path
 import pytest
 import requests_mock
 from click.testing import CliRunner
-from git import GitCommandError
 
 from demisto_sdk.__main__ import main
 from demisto_sdk.commands.common import tools
@@ -20,6 +19,7 @@ from demisto_sdk.commands.common.constants import (
     XSOAR_SUPPORT,
 )
 from demisto_sdk.commands.common.errors import Errors
+from demisto_sdk.commands.common.git_object_reader import GitObject, GitObjectReader
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
 from demisto_sdk.commands.common.hook_validations.pack_unique_files import (
@@ -778,7 +778,7 @@ class TestPackUniqueFilesValidator:
         """
         Given:
             - A repo which runs on non-master branch.
-            - git.show command raises GitCommandError.
+            - The pack metadata file does not exist in git.
 
         When:
             - Running get_master_private_repo_meta_file.
@@ -796,18 +796,13 @@ class TestPackUniqueFilesValidator:
 
         class MyRepo:
             active_branch = "not-master"
+            working_tree_dir = repo.path
 
             def remote(self):
                 return "remote_path"
 
-            class gitClass:
-                def show(self, var):
-                    raise GitCommandError("A", "B")
-
-                def rev_parse(self, var):
-                    return repo.path
-
-            git = gitClass()
+        # the object does not exist in git
+        mocker.patch.object(GitObjectReader, "read", return_value=None)
 
         mocker.patch(
             "demisto_sdk.commands.common.hook_validations.pack_unique_files.Repo",
@@ -832,7 +827,7 @@ class TestPackUniqueFilesValidator:
         """
         Given:
             - A repo which runs on non-master branch.
-            - git.show command returns None.
+            - The pack metadata file is empty in git.
 
         When:
             - Running get_master_private_repo_meta_file.
@@ -850,18 +845,14 @@ class TestPackUniqueFilesValidator:
 
         class MyRepo:
             active_branch = "not-master"
+            working_tree_dir = repo.path
 
             def remote(self):
                 return "remote_path"
 
-            class gitClass:
-                def show(self, var):
-                    return None
-
-                def rev_parse(self, var):
-                    return repo.path
-
-            git = gitClass()
+        mocker.patch.object(
+            GitObjectReader, "read", return_value=GitObject("sha", "blob", b"")
+        )
 
         mocker.patch(
             "demisto_sdk.commands.common.hook_validations.pack_unique_files.Repo",
@@ -900,30 +891,24 @@ class TestPackUniqueFilesValidator:
 
         class MyRepo:
             active_branch = "not-master"
+            working_tree_dir = repo.path
 
             def remote(self):
                 return "remote_path"
 
-            class gitClass:
-                remote_file_path = (
-                    "remote_path/prev_ver:Packs/PackName/pack_metadata.json"
-                )
-
-                def show(self, var):
-                    if var == self.remote_file_path:
-                        return json.dumps(PACK_METADATA_PARTNER)
-                    else:
-                        raise Exception(
-                            f"file path {var} does not match expected path {self.remote_file_path}"
-                        )
-
-                def rev_parse(self, var):
-                    return repo.path
+        remote_file_path = "remote_path/prev_ver:Packs/PackName/pack_metadata.json"
 
-                def remote(self):
-                    return "remote_path"
+        def read(name):
+            if name == remote_file_path:
+                return GitObject(
+                    "sha", "blob", json.dumps(PACK_METADATA_PARTNER).encode()
+                )
+            else:
+                raise Exception(
+                    f"file path {name} does not match expected path {remote_file_path}"
+                )
 
-            git = gitClass()
+        mocker.patch.object(GitObjectReader, "read", side_effect=read)
 
         mocker.patch(
             "demisto_sdk.commands.common.hook_validations.pack_unique_files.Repo",
@@ -5,6 +5,8 @@ from shutil import copyfile
 from typing import List, Tuple
 
 import pytest
+from pykwalify.core import Core
+from pykwalify.errors import SchemaError
 
 from demisto_sdk.commands.common.constants import (
     CODE_FILES_REGEX,
@@ -46,6 +48,10 @@ from demisto_sdk.commands.common.hook_validations.structure import (
     StructureValidator,
     checked_type_by_reg,
 )
+from demisto_sdk.commands.common.schema_validation import (
+    SCHEMAS_DIR,
+    get_compiled_schema,
+)
 from demisto_sdk.tests.constants_test import (
     DASHBOARD_TARGET,
     DIR_LIST,
@@ -280,6 +286,43 @@ class TestStructureValidator:
         err = structure.parse_error_line(error)
         assert correct in err[0]
 
+    @pytest.mark.parametrize(
+        "path",
+        [
+            VALID_INTEGRATION_TEST_PATH,
+            INVALID_INTEGRATION_YML_1,
+            INVALID_INTEGRATION_YML_2,
+            INVALID_INTEGRATION_YML_3,
+            INVALID_INTEGRATION_YML_4,
+        ],
+    )
+    def test_compiled_schema_errors(self, path):
+        """
+        Given
+            - A valid integration, and invalid ones
+        When
+            - Validating the loaded integration with the compiled integration schema
+        Then
+            - Ensure the schema is compiled once
+            - Ensure the same errors are found as when pykwalify loads the file and the schema
+        """
+        structure = StructureValidator(file_path=path, predefined_scheme="integration")
+        schema_path = SCHEMAS_DIR / "integration.yml"
+
+        def validation_error(validate) -> str:
+            try:
+                validate()
+            except SchemaError as e:
+                return str(e)
+            return ""
+
+        assert get_compiled_schema("integration") is get_compiled_schema("integration")
+        assert validation_error(
+            lambda: get_compiled_schema("integration").validate(structure.current_file)
+        ) == validation_error(
+            Core(source_file=path, schema_files=[str(schema_path)]).validate
+        )
+
     def test_check_for_spaces_in_file_name(self, mocker):
         mocker.patch.object(
             StructureValidator, "handle_error", return_value="Not-non-string"
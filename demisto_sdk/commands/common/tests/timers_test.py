@@ -5,6 +5,7 @@ from pathlib import Path
 from demisto_sdk.commands.common.timers import (
     MEASURE_TYPE_TO_HEADERS,
     MeasureType,
+    ValidationProfiler,
     report_time_measurements,
     timer,
 )
@@ -70,3 +71,49 @@ def test_timers__no_group_exist(mocker):
         f"There is no timers registered for the group {not_exist_group}"
         in logger.debug.call_args[0][0]
     )
+
+
+def test_validation_profiler__nested_checks_and_merge(mocker):
+    """
+    Given -
+        a check calling another check, outside of any file, measured by two profilers
+    When -
+        merging the measures of one profiler into the other, and reporting them
+    Then -
+        verify the calls are summed, and the time of the inner check is not part of the self time of the outer check
+    """
+    mocker.patch.object(logger, "info")
+    clock = iter(range(100))
+    mocker.patch(
+        "demisto_sdk.commands.common.timers.time.perf_counter", lambda: next(clock)
+    )
+
+    profilers = [ValidationProfiler(), ValidationProfiler()]
+    for profiler in profilers:
+        with profiler.check("Validator", "outer"):
+            with profiler.check("Validator", "inner"):
+                pass
+    profilers[0].merge(profilers[1].pop_profile())
+    report = profilers[0].report()
+
+    assert not profilers[1].profile.checks
+    assert report["checks"] == [
+        {
+            "validator": "Validator",
+            "check": "outer",
+            "calls": 2,
+            "total_time": 6,
+            "self_time": 4,
+        },
+        {
+            "validator": "Validator",
+            "check": "inner",
+            "calls": 2,
+            "total_time": 2,
+            "self_time": 2,
+        },
+    ]
+    assert report["validators"] == [
+        {"validator": "Validator", "calls": 4, "self_time": 6}
+    ]
+    assert report["checks_by_file_type"][0]["file_type"] is None
@@ -1,6 +1,8 @@
 import glob
 import os
 import shutil
+import threading
+import time
 from configparser import ConfigParser
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
@@ -8,7 +10,6 @@ from typing import Callable, List, Optional, Tuple, Union
 
 import git
 import pytest
-import requests
 
 from demisto_sdk.commands.common import tools
 from demisto_sdk.commands.common.constants import (
@@ -64,9 +65,11 @@ from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import (
+    SDK_PYPI_VERSION,
     MarketplaceTagParser,
     TagParser,
     arg_to_list,
+    check_last_remote_release_version_in_background,
     compare_context_path_in_yml_and_readme,
     extract_field_from_mapping,
     field_to_cli_name,
@@ -76,6 +79,7 @@ from demisto_sdk.commands.common.tools import (
     find_type,
     find_type_by_path,
     generate_xsiam_normalized_name,
+    get_cached_last_remote_release_version,
     get_code_lang,
     get_current_repo,
     get_dict_from_file,
@@ -650,7 +654,7 @@ class TestGetRemoteFileLocally:
         class Response:
             ok = False
 
-        mocker.patch.object(requests, "get", return_value=Response)
+        mocker.patch.object(tools, "http_get", return_value=Response)
         mocker.patch.dict(
             os.environ,
             {
@@ -796,6 +800,92 @@ class TestGetFile:
         assert file_data
         assert file_data.get("name") is not None
 
+    @pytest.mark.parametrize("keep_order", (True, False))
+    def test_get_file_persistent_cache(self, mocker, monkeypatch, tmp_path, keep_order):
+        """
+        Given
+            - The persistent file cache is enabled
+        When
+            - Getting the same yml file in two different runs
+        Then
+            - Ensure the second run does not parse the file, and returns the same content
+        """
+        monkeypatch.setenv("DEMISTO_SDK_PERSISTENT_FILE_CACHE", "true")
+        monkeypatch.setenv("DEMISTO_SDK_CACHE_DIR", str(tmp_path))
+        file_path = tmp_path / "integration.yml"
+        file_path.write_text(Path(SOURCE_FORMAT_INTEGRATION_COPY).read_text())
+        tools.get_persistent_file_cache.cache_clear()
+
+        first_run = get_file(file_path, clear_cache=True, keep_order=keep_order)
+
+        tools.get_file_cache().clear()
+        tools.get_persistent_file_cache.cache_clear()
+        parse_file_content = mocker.spy(tools, "_parse_file_content")
+        second_run = get_file(file_path, keep_order=keep_order)
+
+        assert second_run == first_run
+        assert not parse_file_content.called
+        assert tools.get_persistent_file_cache().stats()["hits"] == 1
+        tools.get_persistent_file_cache.cache_clear()
+
+    @pytest.mark.parametrize("keep_order", (True, False))
+    def test_get_file_returns_copies(self, tmp_path, keep_order):
+        """
+        Given
+            - A yml file that was read and modified by a caller
+        When
+            - Getting the file again
+        Then
+            - Ensure the modification did not leak into the cache
+        """
+        file_path = tmp_path / "integration.yml"
+        file_path.write_text("name: test\nscript:\n  commands: []\n")
+
+        first = get_file(file_path, keep_order=keep_order)
+        first["name"] = "modified"
+        first["script"]["commands"].append("command")
+        hits = tools.get_file_cache().hits
+
+        second = get_file(file_path, keep_order=keep_order)
+        assert second == {"name": "test", "script": {"commands": []}}
+        assert tools.get_file_cache().hits == hits + 1
+
+    def test_get_file_modified_on_disk(self, tmp_path):
+        """
+        Given
+            - A cached json file
+        When
+            - The file is re-written with a different content
+        Then
+            - Ensure the new content is returned, without clearing the cache
+        """
+        file_path = tmp_path / "file.json"
+        file_path.write_text('{"a": 1}')
+        assert get_file(file_path) == {"a": 1}
+
+        file_path.write_text('{"a": 22}')
+        assert get_file(file_path) == {"a": 22}
+
+    def test_invalidate_file_cache(self, tmp_path):
+        """
+        Given
+            - Two cached files
+        When
+            - Invalidating one of them
+        Then
+            - Ensure only the invalidated file is removed from the cache
+        """
+        first_path, second_path = tmp_path / "first.json", tmp_path / "second.json"
+        first_path.write_text("{}")
+        second_path.write_text("{}")
+        get_file(first_path)
+        get_file(second_path)
+        get_file(first_path, return_content=True)
+
+        tools.invalidate_file_cache(first_path)
+
+        assert tools.get_file_cache().stats()["entries"] == 1
+
 
 def test_get_latest_release_notes_text_invalid():
     """
@@ -1502,6 +1592,89 @@ def test_get_last_remote_release_version(requests_mock):
     assert get_last_remote_release_version() == expected_version
 
 
+class TestLastRemoteReleaseVersionCheck:
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DEMISTO_SDK_CACHE_DIR", str(tmp_path))
+        get_last_remote_release_version.cache_clear()
+
+    def test_check_in_background(self, requests_mock):
+        """
+        Given
+        - No cached latest version
+        When
+        - Checking the latest version in the background
+        Then
+        - Ensure the version is cached for the next runs, and a second check does not send a request
+        """
+        requests_mock.get(SDK_PYPI_VERSION, json={"info": {"version": "1.3.8"}})
+
+        assert get_cached_last_remote_release_version() == ""
+        check_last_remote_release_version_in_background().join()
+        assert get_cached_last_remote_release_version() == "1.3.8"
+
+        assert check_last_remote_release_version_in_background() is None
+        assert requests_mock.call_count == 1
+
+    def test_check_after_interval(self, requests_mock):
+        """
+        Given
+        - A cached latest version, checked longer ago than the check interval
+        When
+        - Checking the latest version in the background
+        Then
+        - Ensure the cached version is updated
+        """
+        tools._write_latest_version_cache(
+            "1.3.8", time.time() - tools.SDK_LATEST_VERSION_CHECK_INTERVAL_SECONDS - 1
+        )
+        requests_mock.get(SDK_PYPI_VERSION, json={"info": {"version": "1.3.9"}})
+
+        check_last_remote_release_version_in_background().join()
+
+        assert get_cached_last_remote_release_version() == "1.3.9"
+
+    def test_failed_check(self, requests_mock):
+        """
+        Given
+        - No internet connection
+        When
+        - Checking the latest version in the background
+        Then
+        - Ensure no version is cached, and the check is not retried before the check interval passes
+        """
+        requests_mock.get(SDK_PYPI_VERSION, status_code=500)
+
+        check_last_remote_release_version_in_background().join()
+
+        assert get_cached_last_remote_release_version() == ""
+        assert check_last_remote_release_version_in_background() is None
+
+    def test_killed_check(self, requests_mock, mocker):
+        """
+        Given
+        - A check started by a command that exited before the check was completed
+        When
+        - Checking the latest version in the background, while the check is in flight and after it expires
+        Then
+        - Ensure the check is not repeated while in flight, and is retried once the in-flight marker expires
+        """
+        requests_mock.get(SDK_PYPI_VERSION, json={"info": {"version": "1.3.9"}})
+        start = mocker.patch.object(threading.Thread, "start")
+        now = time.time()
+        mocker.patch.object(time, "time", return_value=now)
+
+        assert check_last_remote_release_version_in_background() is not None
+        assert check_last_remote_release_version_in_background() is None
+
+        time.time.return_value = now + tools.SDK_LATEST_VERSION_CHECK_IN_FLIGHT_SECONDS
+        mocker.stop(start)
+        check_last_remote_release_version_in_background().join()
+
+        assert get_cached_last_remote_release_version() == "1.3.9"
+        assert requests_mock.call_count == 1
+
+
 IS_PACK_PATH_INPUTS = [
     ("Packs/BitcoinAbuse", True),
     ("Packs/BitcoinAbuse/Layouts", False),
@@ -3,6 +3,7 @@ import os
 import sys
 import tempfile
 import unittest
+from collections import defaultdict
 from pathlib import Path
 
 import pytest
@@ -19,6 +20,9 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.update_id_set import (
+    ID_SET_STAGES_BY_NAME,
+    IDSet,
+    add_id_set_stage_results,
     add_item_to_exclusion_dict,
     does_dict_have_alternative_key,
     find_duplicates,
@@ -3860,6 +3864,85 @@ def test_merge_id_sets(tmp_path):
     assert not duplicates
 
 
+def test_id_set_add_to_list():
+    """
+    Given
+    - an IDSet with playbooks, grouped by their id
+
+    When
+    - adding playbooks to it, one of them equal to an existing one
+
+    Then
+    - ensure only the new playbooks are added, and are grouped by their id
+    """
+    id_set = IDSet({"playbooks": [{"playbook_foo": {"name": "foo"}}]})
+    assert id_set.get_items_by_id("playbooks") == {
+        "playbook_foo": [{"playbook_foo": {"name": "foo"}}]
+    }
+
+    id_set.add_to_list("playbooks", {"playbook_foo": {"name": "foo"}})
+    id_set.add_to_list("playbooks", {"playbook_foo": {"name": "other foo"}})
+    id_set.add_to_list("playbooks", {"playbook_bar": {"name": "bar"}})
+
+    assert id_set.get_list("playbooks") == [
+        {"playbook_foo": {"name": "foo"}},
+        {"playbook_foo": {"name": "other foo"}},
+        {"playbook_bar": {"name": "bar"}},
+    ]
+    assert id_set.get_items_by_id("playbooks") == {
+        "playbook_foo": [
+            {"playbook_foo": {"name": "foo"}},
+            {"playbook_foo": {"name": "other foo"}},
+        ],
+        "playbook_bar": [{"playbook_bar": {"name": "bar"}}],
+    }
+
+
+def test_add_id_set_stage_results():
+    """
+    Given
+    - the results of the scripts and the test playbooks stages, processed in any order
+
+    When
+    - adding them to the id_set in the order of the stages
+
+    Then
+    - ensure the scripts of the test playbooks are added after the scripts, and only the scripts are added to the pack
+    - ensure the excluded items are added
+    """
+    id_set_lists: dict = defaultdict(list)
+    packs_dict: dict = {"PackA": {}}
+    excluded_items_by_pack: dict = {}
+    excluded_items_by_type: dict = {}
+    results = {
+        "TestPlaybooks": [
+            ({"test_playbook": {"pack": "PackA"}}, {"test_script": {"pack": "PackA"}})
+        ],
+        "Scripts": [
+            ([{"script": {"pack": "PackA"}}], {}),
+            ([], {"PackA": {("script", "excluded_script")}}),
+        ],
+    }
+
+    for stage_name in ("Scripts", "TestPlaybooks"):
+        add_id_set_stage_results(
+            ID_SET_STAGES_BY_NAME[stage_name],
+            results[stage_name],
+            id_set_lists,
+            packs_dict,
+            excluded_items_by_pack,
+            excluded_items_by_type,
+        )
+
+    assert id_set_lists == {
+        "scripts": [{"script": {"pack": "PackA"}}, {"test_script": {"pack": "PackA"}}],
+        "TestPlaybooks": [{"test_playbook": {"pack": "PackA"}}],
+    }
+    assert packs_dict == {"PackA": {"ContentItems": {"scripts": ["script"]}}}
+    assert excluded_items_by_pack == {"PackA": {("script", "excluded_script")}}
+    assert excluded_items_by_type == {"script": {"excluded_script"}}
+
+
 def test_merged_id_sets_with_duplicates(caplog):
     """
     Given
@@ -1,18 +1,21 @@
 # STD python packages
 
+import os
 import time
 from collections import defaultdict, namedtuple
-from dataclasses import astuple, dataclass
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass, field
 from datetime import datetime
 from enum import Enum
 from functools import wraps
 from pathlib import Path
-from typing import Dict, Optional, Sequence
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 # Third party packages
 from tabulate import tabulate
 
 # Local packages
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
 
 StatInfo = namedtuple("StatInfo", ["total_time", "call_count", "avg_time"])
@@ -248,3 +251,286 @@ def write_measure_to_file(
                 file.write(f"\n{','.join(stat)}")
     except Exception as e:
         logger.error(f"can't write time measure to file {e}")
+
+
+# checks shorter than this are left out of the validation trace, so tracing a whole repo fits in memory
+TRACE_MIN_CHECK_DURATION = 0.001
+# the number of checks logged at the end of a profiled validation
+PROFILE_SUMMARY_SIZE = 20
+
+# (validator, check, file type, pack) -> [calls, total time, self time]
+CheckStats = Dict[Tuple[str, str, Optional[str], Optional[str]], List[float]]
+# (file type, pack) -> [files, total time]
+FileStats = Dict[Tuple[Optional[str], Optional[str]], List[float]]
+# (name, category, start in microseconds, duration in microseconds, pid, validated file)
+TraceEvent = Tuple[str, str, int, int, int, Optional[str]]
+
+
+@dataclass
+class ValidationProfile:
+    """The times measured by a `ValidationProfiler`, which can be sent from a worker process and merged."""
+
+    checks: CheckStats = field(default_factory=dict)
+    files: FileStats = field(default_factory=dict)
+    trace_events: List[TraceEvent] = field(default_factory=list)
+
+
+class ValidationProfiler:
+    """
+    Measures the wall time and call count of every validation check (the methods decorated with `error_codes`),
+    by validator class, file type and pack.
+
+    The time of a check includes the checks it calls, while its self time does not, so the self times of all the
+    checks add up to the time spent in checks. The time of validating a file also includes loading it and the
+    code between the checks.
+    """
+
+    def __init__(self, trace: bool = False):
+        self.trace = trace
+        self.profile = ValidationProfile()
+        # the validated file, its type and pack, or Nones outside a file
+        self._file: Tuple[Optional[str], Optional[str], Optional[str]] = (
+            None,
+            None,
+            None,
+        )
+        # the time spent in the checks called by each of the running checks
+        self._children_times: List[float] = []
+
+    @contextmanager
+    def validated_file(self, file_path: str) -> Iterator[None]:
+        """Attributes the checks running in the context to the file."""
+        from demisto_sdk.commands.common.tools import find_type, get_pack_name
+
+        file_type = find_type(file_path)
+        outer_file = self._file
+        self._file = (
+            file_path,
+            file_type.value if file_type else None,
+            get_pack_name(file_path) or None,
+        )
+        start, start_time = time.perf_counter(), time.time()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, file_type_name, pack = self._file
+            stats = self.profile.files.setdefault((file_type_name, pack), [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            if self.trace:
+                self.profile.trace_events.append(
+                    _trace_event(
+                        file_path,
+                        file_type_name or "file",
+                        start_time,
+                        elapsed,
+                        file_path,
+                    )
+                )
+            self._file = outer_file
+
+    @contextmanager
+    def check(self, validator: str, check: str) -> Iterator[None]:
+        start, start_time = time.perf_counter(), time.time()
+        self._children_times.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self_time = elapsed - self._children_times.pop()
+            if self._children_times:
+                self._children_times[-1] += elapsed
+            file_path, file_type, pack = self._file
+            stats = self.profile.checks.setdefault(
+                (validator, check, file_type, pack), [0, 0.0, 0.0]
+            )
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += self_time
+            if self.trace and elapsed >= TRACE_MIN_CHECK_DURATION:
+                self.profile.trace_events.append(
+                    _trace_event(
+                        f"{validator}.{check}", "check", start_time, elapsed, file_path
+                    )
+                )
+
+    def pop_profile(self) -> ValidationProfile:
+        """Returns the times measured so far, and starts measuring from scratch (e.g. after every task of a worker)."""
+        profile, self.profile = self.profile, ValidationProfile()
+        return profile
+
+    def merge(self, profile: ValidationProfile):
+        """Adds the times measured by another profiler (e.g. of a worker process)."""
+        for key, (calls, total_time, self_time) in profile.checks.items():
+            stats = self.profile.checks.setdefault(key, [0, 0.0, 0.0])
+            stats[0] += calls
+            stats[1] += total_time
+            stats[2] += self_time
+        for key, (files, total_time) in profile.files.items():
+            stats = self.profile.files.setdefault(key, [0, 0.0])
+            stats[0] += files
+            stats[1] += total_time
+        self.profile.trace_events.extend(profile.trace_events)
+
+    def report(self) -> dict:
+        """The measured times, by check, validator, file type and pack. Every list is sorted by time, descending."""
+        checks: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        validators: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        checks_by_file_type: Dict[tuple, List[float]] = defaultdict(
+            lambda: [0, 0.0, 0.0]
+        )
+        checks_by_pack: Dict[tuple, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+        for (validator, check, file_type, pack), stats in self.profile.checks.items():
+            for key, aggregated in (
+                ((validator, check), checks),
+                ((validator, check, file_type), checks_by_file_type),
+                ((validator, check, pack), checks_by_pack),
+            ):
+                for i, value in enumerate(stats):
+                    aggregated[key][i] += value
+            validators[validator][0] += stats[0]
+            validators[validator][1] += stats[2]
+        file_types: Dict[Optional[str], List[float]] = defaultdict(lambda: [0, 0.0])
+        packs: Dict[Optional[str], List[float]] = defaultdict(lambda: [0, 0.0])
+        for (file_type, pack), stats in self.profile.files.items():
+            for key, aggregated in ((file_type, file_types), (pack, packs)):
+                aggregated[key][0] += stats[0]
+                aggregated[key][1] += stats[1]
+
+        def check_rows(stats: dict, *names: str) -> List[dict]:
+            return [
+                {
+                    **dict(zip(names, key)),
+                    "calls": int(calls),
+                    "total_time": round(total_time, 6),
+                    "self_time": round(self_time, 6),
+                }
+                for key, (calls, total_time, self_time) in sorted(
+                    stats.items(), key=lambda item: item[1][2], reverse=True
+                )
+            ]
+
+        def file_rows(stats: dict, name: str) -> List[dict]:
+            return [
+                {name: key, "files": int(files), "total_time": round(total_time, 6)}
+                for key, (files, total_time) in sorted(
+                    stats.items(), key=lambda item: item[1][1], reverse=True
+                )
+            ]
+
+        return {
+            "checks": check_rows(checks, "validator", "check"),
+            "validators": [
+                {
+                    "validator": validator,
+                    "calls": int(calls),
+                    "self_time": round(self_time, 6),
+                }
+                for validator, (calls, self_time) in sorted(
+                    validators.items(), key=lambda item: item[1][1], reverse=True
+                )
+            ],
+            "file_types": file_rows(file_types, "file_type"),
+            "packs": file_rows(packs, "pack"),
+            "checks_by_file_type": check_rows(
+                checks_by_file_type, "validator", "check", "file_type"
+            ),
+            "checks_by_pack": check_rows(checks_by_pack, "validator", "check", "pack"),
+        }
+
+    def write_report(
+        self, report_path: Optional[str] = None, trace_path: Optional[str] = None
+    ):
+        """
+        Logs the slowest checks, writes the report as JSON, and writes the trace in the Chrome trace event format,
+        which can be opened with chrome://tracing or https://ui.perfetto.dev.
+        """
+        report = self.report()
+        write_measure_to_logger(
+            "validate",
+            csv_data=[
+                [
+                    f"{row['validator']}.{row['check']}",
+                    f"{row['self_time'] / row['calls']:0.4f}",
+                    f"{row['self_time']:0.4f}",
+                    f"{row['calls']}",
+                ]
+                for row in report["checks"][:PROFILE_SUMMARY_SIZE]
+            ],
+        )
+
+        if report_path:
+            Path(report_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(report_path, "w") as report_file:
+                json.dump(report, report_file, indent=4)
+            logger.info(f"The validation profile was written to {report_path}")
+
+        if trace_path:
+            Path(trace_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(trace_path, "w") as trace_file:
+                json.dump(
+                    {
+                        "traceEvents": [
+                            {
+                                "name": name,
+                                "cat": category,
+                                "ph": "X",
+                                "ts": start,
+                                "dur": duration,
+                                "pid": pid,
+                                "tid": pid,
+                                "args": {"file": file_path} if file_path else {},
+                            }
+                            for name, category, start, duration, pid, file_path in sorted(
+                                self.profile.trace_events, key=lambda event: event[2]
+                            )
+                        ],
+                        "displayTimeUnit": "ms",
+                    },
+                    trace_file,
+                )
+            logger.info(f"The validation trace was written to {trace_path}")
+
+
+def _trace_event(
+    name: str,
+    category: str,
+    start_time: float,
+    elapsed: float,
+    file_path: Optional[str],
+) -> TraceEvent:
+    return (
+        name,
+        category,
+        int(start_time * 1_000_000),
+        int(elapsed * 1_000_000),
+        os.getpid(),
+        file_path,
+    )
+
+
+_validation_profiler: Optional[ValidationProfiler] = None
+
+
+def get_validation_profiler() -> Optional[ValidationProfiler]:
+    """Returns the profiler of the running validation, None when validations are not profiled."""
+    return _validation_profiler
+
+
+def set_validation_profiler(profiler: Optional[ValidationProfiler]):
+    global _validation_profiler
+    _validation_profiler = profiler
+
+
+def profile_file_validation(func):
+    """Attributes the checks run by `func(self, file_path, ...)` to the file, when validations are profiled."""
+
+    @wraps(func)
+    def wrapper(self, file_path, *args, **kwargs):
+        if _validation_profiler is None:
+            return func(self, file_path, *args, **kwargs)
+        with _validation_profiler.validated_file(file_path):
+            return func(self, file_path, *args, **kwargs)
+
+    return wrapper
@@ -1,3 +1,4 @@
+import atexit
 import contextlib
 import glob
 import io
@@ -6,6 +7,8 @@ import os
 import re
 import shlex
 import sys
+import threading
+import time
 import urllib.parse
 from collections import OrderedDict
 from concurrent.futures import as_completed
@@ -22,6 +25,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Dict,
     Iterable,
     List,
@@ -54,7 +58,10 @@ from demisto_sdk.commands.common.constants import (
     DEFAULT_CONTENT_ITEM_FROM_VERSION,
     DEFAULT_CONTENT_ITEM_TO_VERSION,
     DOC_FILES_DIR,
+    ENV_DEMISTO_SDK_FILE_CACHE_MAX_MB,
     ENV_DEMISTO_SDK_MARKETPLACE,
+    ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE,
+    ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE_MAX_MB,
     ENV_SDK_WORKING_OFFLINE,
     ID_IN_COMMONFIELDS,
     ID_IN_ROOT,
@@ -113,18 +120,34 @@ from demisto_sdk.commands.common.constants import (
     urljoin,
 )
 from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.file_cache import (
+    DEFAULT_FILE_CACHE_MAX_MB,
+    DEFAULT_PERSISTENT_FILE_CACHE_MAX_MB,
+    PERSISTENT_FILE_CACHE_NAME,
+    InMemoryFileCache,
+    PersistentFileCache,
+    deserialize,
+    get_sdk_cache_dir,
+    serialize,
+)
 from demisto_sdk.commands.common.git_content_config import GitContentConfig, GitProvider
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
-from demisto_sdk.commands.common.handlers import YAML_Handler
+from demisto_sdk.commands.common.handlers import LIBYAML_Handler
+from demisto_sdk.commands.common.http_client import http_get
+from demisto_sdk.commands.common.id_set_index import (
+    IDSetIndex,
+    index_id_set_sections,
+)
+from demisto_sdk.commands.common.id_set_store import IDSetStore, is_id_set_store
 
 if TYPE_CHECKING:
     from demisto_sdk.commands.content_graph.interface import ContentGraphInterface
 
 logger = logging.getLogger("demisto-sdk")
 
-yaml_safe_load = YAML_Handler(typ="safe")
+yaml_safe_load = LIBYAML_Handler()
 
 urllib3.disable_warnings()
 
@@ -229,6 +252,12 @@ LAYOUT_CONTAINER_FIELDS = {
     "indicatorsDetails",
 }
 SDK_PYPI_VERSION = r"https://pypi.org/pypi/demisto-sdk/json"
+SDK_LATEST_VERSION_CACHE_NAME = "latest_sdk_version.json"
+SDK_LATEST_VERSION_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
+# how long (in seconds) a started check keeps other commands from checking, in case it is never completed
+SDK_LATEST_VERSION_CHECK_IN_FLIGHT_SECONDS = 5 * 60
+# how long (in seconds) a remote file is used without revalidating it (with its ETag) against the remote repository
+REMOTE_FILE_CACHE_TTL = 5 * 60
 
 SUFFIX_TO_REMOVE = ("_dev", "_copy")
 
@@ -471,15 +500,17 @@ def get_remote_file_from_api(
         github_token = git_content_config.CREDENTIALS.github_token
         gitlab_token = git_content_config.CREDENTIALS.gitlab_token
         if git_content_config.git_provider == GitProvider.GitLab:
-            res = requests.get(
+            res = http_get(
                 git_path,
                 params={"ref": tag},
                 headers={"PRIVATE-TOKEN": gitlab_token},
                 verify=False,
+                # files of private repositories are not cached
+                cache_ttl=None if gitlab_token else REMOTE_FILE_CACHE_TTL,
             )
             res.raise_for_status()
         else:  # Github
-            res = requests.get(
+            res = http_get(
                 git_path,
                 verify=False,
                 timeout=10,
@@ -487,9 +518,10 @@ def get_remote_file_from_api(
                     "Authorization": f"Bearer {github_token}" if github_token else "",
                     "Accept": "application/vnd.github.VERSION.raw",
                 },
+                cache_ttl=None if github_token else REMOTE_FILE_CACHE_TTL,
             )  # Sometime we need headers
             if not res.ok:  # sometime we need param token
-                res = requests.get(
+                res = http_get(
                     git_path, verify=False, timeout=10, params={"token": github_token}
                 )
 
@@ -586,6 +618,28 @@ def get_remote_file(
     )
 
 
+def prefetch_remote_files(file_paths: Iterable[Union[str, Path]], tag: str = "master"):
+    """
+    Reads the given files of a remote branch from the local repository in a single batch,
+    so the following `get_remote_file` calls of these files do not spawn git for every file.
+
+    Args:
+        file_paths: The full paths of the files.
+        tag: The branch name. default is 'master'
+    """
+    if is_sdk_defined_working_offline():
+        return
+    tag = tag.replace("origin/", "").replace("demisto/", "")
+    try:
+        git_util = GitUtil(git.Repo(search_parent_directories=True))
+        git_util.object_reader.prefetch(
+            git_util.get_local_remote_file_path(str(file_path), tag)
+            for file_path in file_paths
+        )
+    except Exception as e:
+        logger.debug(f"Could not prefetch the remote files of {tag}: {e}")
+
+
 def filter_files_on_pack(pack: str, file_paths_list="") -> set:
     """
     filter_files_changes_on_pack.
@@ -717,14 +771,15 @@ def is_origin_content_repo():
 
 
 @lru_cache
-def get_last_remote_release_version():
+def get_last_remote_release_version(log_errors: bool = True):
     """
     Get latest release tag from PYPI.
 
+    :param log_errors: Whether to log a failure to get the version, otherwise it is logged in debug level only.
     :return: tag
     """
     try:
-        pypi_request = requests.get(SDK_PYPI_VERSION, verify=False, timeout=5)
+        pypi_request = http_get(SDK_PYPI_VERSION, verify=False, timeout=5)
         pypi_request.raise_for_status()
         pypi_json = pypi_request.json()
         version = pypi_json.get("info", {}).get("version", "")
@@ -736,12 +791,85 @@ def get_last_remote_release_version():
                 f'{exc_msg[exc_msg.find(">") + 3:-3]}.\n'
                 f"This may happen if you are not connected to the internet."
             )
-        logger.info(
+        (logger.info if log_errors else logger.debug)(
             f"[yellow]Could not get latest demisto-sdk version.\nEncountered error: {exc_msg}[/yellow]"
         )
         return ""
 
 
+def _read_latest_version_cache() -> Dict[str, Any]:
+    try:
+        with (get_sdk_cache_dir() / SDK_LATEST_VERSION_CACHE_NAME).open() as cache_file:
+            cache = json.load(cache_file)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_latest_version_cache(
+    version: str, checked_at: float, checking_since: Optional[float] = None
+):
+    cache_path = get_sdk_cache_dir() / SDK_LATEST_VERSION_CACHE_NAME
+    cache: Dict[str, Any] = {"version": version, "checked_at": checked_at}
+    if checking_since is not None:
+        cache["checking_since"] = checking_since
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with temp_path.open("w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not save the latest demisto-sdk version: {e}")
+
+
+def _get_cache_time(cache: Dict[str, Any], key: str) -> float:
+    try:
+        return float(cache.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def get_cached_last_remote_release_version() -> str:
+    """
+    Returns the latest release version found by a previous check (see `check_last_remote_release_version_in_background`),
+    or an empty string if it was never checked, or the check failed.
+    """
+    return str(_read_latest_version_cache().get("version") or "")
+
+
+def check_last_remote_release_version_in_background() -> Optional[threading.Thread]:
+    """
+    Refreshes the cached latest release version in a daemon thread, which never delays the running command.
+    The check is done at most once every SDK_LATEST_VERSION_CHECK_INTERVAL_SECONDS per machine, and is recorded once
+    it is completed. A started check is marked in the cache for SDK_LATEST_VERSION_CHECK_IN_FLIGHT_SECONDS, so
+    concurrent commands do not check again, and a check killed with its command is retried soon after.
+
+    Returns:
+        The thread doing the check, or None if the cached version is recent enough, or it is being checked.
+    """
+    cache = _read_latest_version_cache()
+    now = time.time()
+    checked_at = _get_cache_time(cache, "checked_at")
+    checking_since = _get_cache_time(cache, "checking_since")
+    if 0 <= now - checked_at < SDK_LATEST_VERSION_CHECK_INTERVAL_SECONDS:
+        return None
+    if 0 <= now - checking_since < SDK_LATEST_VERSION_CHECK_IN_FLIGHT_SECONDS:
+        return None
+    cached_version = str(cache.get("version") or "")
+    _write_latest_version_cache(cached_version, checked_at, checking_since=now)
+
+    def check():
+        version = get_last_remote_release_version(log_errors=False)
+        _write_latest_version_cache(version or cached_version, time.time())
+
+    thread = threading.Thread(
+        target=check, name="demisto-sdk-version-check", daemon=True
+    )
+    thread.start()
+    return thread
+
+
 def _read_file(file_path: Path) -> str:
     """returns the body of a text-based file, after reading it as UTF8, or trying to guess its encoding.
 
@@ -795,14 +923,75 @@ def safe_write_unicode(
 
 
 @lru_cache
+def get_file_cache() -> InMemoryFileCache:
+    """
+    Returns the in-process file content cache used by `get_file`.
+    The memory budget (in MB) can be set using DEMISTO_SDK_FILE_CACHE_MAX_MB.
+    """
+    max_size_mb = parse_int_or_default(
+        os.getenv(ENV_DEMISTO_SDK_FILE_CACHE_MAX_MB), DEFAULT_FILE_CACHE_MAX_MB
+    )
+    cache = InMemoryFileCache(max_size_bytes=max_size_mb * 1024 * 1024)
+    atexit.register(lambda: logger.debug(f"File cache stats: {cache.stats()}"))
+    return cache
+
+
+@lru_cache
+def get_persistent_file_cache() -> Optional[PersistentFileCache]:
+    """
+    Returns the cross-run parsed files cache, when enabled with the DEMISTO_SDK_PERSISTENT_FILE_CACHE environment variable.
+    The cache size (in MB) can be set using DEMISTO_SDK_PERSISTENT_FILE_CACHE_MAX_MB.
+    """
+    if not str2bool(os.getenv(ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE)):
+        return None
+    max_size_mb = parse_int_or_default(
+        os.getenv(ENV_DEMISTO_SDK_PERSISTENT_FILE_CACHE_MAX_MB),
+        DEFAULT_PERSISTENT_FILE_CACHE_MAX_MB,
+    )
+    cache = PersistentFileCache(
+        get_sdk_cache_dir() / PERSISTENT_FILE_CACHE_NAME,
+        max_size_bytes=max_size_mb * 1024 * 1024,
+    )
+    atexit.register(
+        lambda: logger.debug(f"Persistent file cache stats: {cache.stats()}")
+    )
+    return cache
+
+
+def invalidate_file_cache(file_path: Union[str, Path]):
+    """Removes a single file from the `get_file` cache, e.g. after writing it."""
+    get_file_cache().invalidate(Path(file_path).absolute())
+
+
+def _parse_file_content(file_path: Path, file_content: str, keep_order: bool):
+    type_of_file = file_path.suffix.lower()
+    if type_of_file.lstrip(".") in {"yml", "yaml"}:
+        if not keep_order:
+            # read-only callers get plain objects from the fast (libyaml) loader
+            return yaml_safe_load.load(file_content)
+        replaced = io.StringIO(
+            re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', file_content)
+        )
+        return yaml.load(replaced)
+    else:
+        result = json.load(io.StringIO(file_content))
+        # It's possible to that the result will be `str` after loading it. In this case, we need to load it again.
+        return json.loads(result) if isinstance(result, str) else result
+
+
 def get_file(
     file_path: Union[str, Path],
     clear_cache: bool = False,
     return_content: bool = False,
     keep_order: bool = True,
 ):
-    if clear_cache:
-        get_file.cache_clear()
+    """
+    Returns the parsed content of a yml/json file, or its raw text when `return_content` is set.
+
+    Results are cached in-process (see `get_file_cache`), and every call returns a new copy of the parsed content,
+    so callers may modify it. Cached entries are invalidated when the file size or modification time change,
+    `clear_cache` forces re-reading this file.
+    """
     file_path = Path(file_path)  # type: ignore[arg-type]
 
     type_of_file = file_path.suffix.lower()
@@ -813,29 +1002,49 @@ def get_file(
     if not file_path.exists():
         raise FileNotFoundError(file_path)
 
+    file_path = file_path.absolute()
+    file_cache = get_file_cache()
+    if clear_cache:
+        file_cache.invalidate(file_path)
+    try:
+        file_stat = file_path.stat()
+    except OSError as e:
+        logger.error(f"Could not read file {file_path}.\nError: {e}")
+        return {}
+    cache_variant = "content" if return_content else keep_order
+    found, cached = file_cache.get(file_path, cache_variant, file_stat)
+    if found:
+        return cached
+
+    persistent_cache = None if return_content else get_persistent_file_cache()
+    if persistent_cache and (
+        blob := persistent_cache.get(file_path, file_stat, keep_order)
+    ):
+        file_cache.set(file_path, cache_variant, file_stat, blob, is_serialized=True)
+        return deserialize(blob)
+
     try:
         file_content = _read_file(file_path)
         if return_content:
+            file_cache.set(
+                file_path, cache_variant, file_stat, file_content, is_serialized=False
+            )
             return file_content
     except IOError as e:
         logger.error(f"Could not read file {file_path}.\nError: {e}")
         return {}
     try:
-        if type_of_file.lstrip(".") in {"yml", "yaml"}:
-            replaced = io.StringIO(
-                re.sub(r"(simple: \s*\n*)(=)(\s*\n)", r'\1"\2"\3', file_content)
-            )
-
-            return yaml.load(replaced) if keep_order else yaml_safe_load.load(replaced)
-        else:
-            result = json.load(io.StringIO(file_content))
-            # It's possible to that the result will be `str` after loading it. In this case, we need to load it again.
-            return json.loads(result) if isinstance(result, str) else result
+        result = _parse_file_content(file_path, file_content, keep_order)
     except Exception as e:
         logger.error(
             f"{file_path} has a structure issue of file type {type_of_file}\n{e}"
         )
         return {}
+    if (blob := serialize(result)) is not None:
+        file_cache.set(file_path, cache_variant, file_stat, blob, is_serialized=True)
+        if persistent_cache:
+            persistent_cache.set(file_path, file_stat, keep_order, blob)
+    return result
 
 
 def get_file_or_remote(file_path: Path, clear_cache=False):
@@ -867,14 +1076,10 @@ def get_file_or_remote(file_path: Path, clear_cache=False):
 
 
 def get_yaml(file_path, cache_clear=False, keep_order: bool = True):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(file_path, clear_cache=cache_clear, keep_order=keep_order)
 
 
 def get_json(file_path, cache_clear=False):
-    if cache_clear:
-        get_file.cache_clear()
     return get_file(file_path, clear_cache=cache_clear)
 
 
@@ -1986,7 +2191,7 @@ def is_external_repository() -> bool:
 
 def get_content_id_set() -> dict:
     """Getting the ID Set from official content's bucket"""
-    return requests.get(OFFICIAL_CONTENT_ID_SET_PATH).json()
+    return http_get(OFFICIAL_CONTENT_ID_SET_PATH).json()
 
 
 def download_content_graph(
@@ -1996,7 +2201,7 @@ def download_content_graph(
     if output_path.is_dir():
         output_path = output_path / f"{marketplace.value}.zip"
     output_path.write_bytes(
-        requests.get(f"{OFFICIAL_CONTENT_GRAPH_PATH}/{marketplace.value}.zip").content
+        http_get(f"{OFFICIAL_CONTENT_GRAPH_PATH}/{marketplace.value}.zip").content
     )
     return output_path
 
@@ -2007,7 +2212,7 @@ def get_latest_upload_flow_commit_hash() -> str:
     Returns:
         str: the last commit hash of the upload flow
     """
-    response_json = requests.get(OFFICIAL_INDEX_JSON_PATH).json()
+    response_json = http_get(OFFICIAL_INDEX_JSON_PATH).json()
     if not isinstance(response_json, dict):
         raise ValueError(
             f"The index.json file is not in the expected format: {response_json}"
@@ -2525,10 +2730,17 @@ def camel_to_snake(camel: str) -> str:
 
 
 def open_id_set_file(id_set_path):
+    """
+    Returns the id_set at `id_set_path`.
+    An id_set store is not loaded, its sections are loaded when they are first accessed (see `IDSetStore`).
+    """
     id_set = {}
     try:
-        with open(id_set_path) as id_set_file:
-            id_set = json.load(id_set_file)
+        if is_id_set_store(id_set_path):
+            id_set = IDSetStore(id_set_path)
+        else:
+            with open(id_set_path) as id_set_file:
+                id_set = index_id_set_sections(json.load(id_set_file))
     except OSError:
         logger.info("[yellow]Could not open id_set file[/yellow]")
         raise
@@ -2598,22 +2810,26 @@ def get_file_version_suffix_if_exists(
     return None
 
 
-def get_all_incident_and_indicator_fields_from_id_set(id_set_file, entity_type):
-    fields_list = []
+def get_all_incident_and_indicator_fields_from_id_set(
+    id_set_file, entity_type
+) -> Set[str]:
+    """
+    Returns the ids (without their incident_/indicator_ prefix) of the incident and indicator fields of the id_set,
+    along with their names for mappers and old classifiers.
+    """
+    fields: Set[str] = set()
+    if entity_type not in ("mapper", "old classifier", "layout"):
+        return fields
+    id_set_index = IDSetIndex(id_set_file)
     for item in ["IncidentFields", "IndicatorFields"]:
-        all_item_fields = id_set_file.get(item)
-        for item_field in all_item_fields:
-            for field, field_info in item_field.items():
-                if entity_type == "mapper" or entity_type == "old classifier":
-                    fields_list.append(field_info.get("name", ""))
-                    fields_list.append(
-                        field.replace("incident_", "").replace("indicator_", "")
-                    )
-                elif entity_type == "layout":
-                    fields_list.append(
-                        field.replace("incident_", "").replace("indicator_", "")
-                    )
-    return fields_list
+        fields_index = id_set_index.section(item)
+        if entity_type != "layout":
+            fields.update(fields_index.names())
+        fields.update(
+            field.replace("incident_", "").replace("indicator_", "")
+            for field in fields_index.ids()
+        )
+    return fields
 
 
 def item_type_to_content_items_header(item_type):
@@ -3532,7 +3748,9 @@ def get_display_name(file_path, file_data={}) -> str:
 
 
 def get_invalid_incident_fields_from_mapper(
-    mapper_incident_fields: Dict[str, Dict], mapping_type: str, content_fields: List
+    mapper_incident_fields: Dict[str, Dict],
+    mapping_type: str,
+    content_fields: Collection[str],
 ) -> List[str]:
     """
     Get a list of incident fields which are not part of the content items (not part of id_json) from a specific
@@ -3541,7 +3759,7 @@ def get_invalid_incident_fields_from_mapper(
     Args:
         mapper_incident_fields (dict[str, dict]): a dict of incident fields which belongs to a specific interalMapping.
         mapping_type (str): type of the mapper, either 'mapping-incoming' or 'mapping-outgoing'.
-        content_fields (list[str]): list of available content fields.
+        content_fields (collection[str]): the available content fields.
 
     Returns:
         list[str]: all the invalid incident fields which are not part of the content items.
@@ -3580,7 +3798,7 @@ def get_invalid_incident_fields_from_mapper(
 
 
 def get_invalid_incident_fields_from_layout(
-    layout_incident_fields: List[Dict], content_fields: List[str]
+    layout_incident_fields: List[Dict], content_fields: Collection[str]
 ) -> List[str]:
     """
     Get a list of incident fields which are not part of the content items (not part of id_json) from a specific
@@ -3589,7 +3807,7 @@ def get_invalid_incident_fields_from_layout(
     Args:
         layout_incident_fields (list[dict]): a list of incident fields which
             belongs to a specific section/item in the layout.
-        content_fields (list[str]): list of available content fields.
+        content_fields (collection[str]): the available content fields.
 
     Returns:
         list[str]: all the invalid incident fields which are not part of the content items.
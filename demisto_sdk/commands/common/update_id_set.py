@@ -1,16 +1,16 @@
 import copy
-import glob
 import itertools
 import os
+import queue
 import re
 import time
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from enum import Enum
 from functools import partial
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
 
 import click
 import networkx
@@ -37,6 +37,7 @@ from demisto_sdk.commands.common.constants import (
     LISTS_DIR,
     MAPPERS_DIR,
     MODELING_RULES_DIR,
+    PACKS_DIR,
     PARSING_RULES_DIR,
     REPORTS_DIR,
     SCRIPTS_DIR,
@@ -55,8 +56,11 @@ from demisto_sdk.commands.common.content_constant_paths import (
     MP_V2_ID_SET_PATH,
     XPANSE_ID_SET_PATH,
 )
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
 from demisto_sdk.commands.common.cpu_count import cpu_count
+from demisto_sdk.commands.common.file_cache import get_sdk_version
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_store import load_id_set, write_id_set
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     find_type,
@@ -2222,6 +2226,10 @@ def process_test_playbook_path(
     return playbook, script
 
 
+def _repo_index() -> ContentRepoIndex:
+    return ContentRepoIndex.get(os.getcwd())
+
+
 def get_integrations_paths(pack_to_create):
     if pack_to_create:
         path_list = [[pack_to_create, "Integrations", "*"]]
@@ -2231,7 +2239,7 @@ def get_integrations_paths(pack_to_create):
 
     integration_files = list()
     for path in path_list:
-        integration_files.extend(glob.glob(os.path.join(*path)))
+        integration_files.extend(_repo_index().glob(os.path.join(*path)))
 
     return integration_files
 
@@ -2245,7 +2253,7 @@ def get_playbooks_paths(pack_to_create):
 
     playbook_files = list(pack_to_create) if pack_to_create else []
     for path in path_list:
-        playbook_files.extend(glob.glob(os.path.join(*path)))
+        playbook_files.extend(_repo_index().glob(os.path.join(*path)))
 
     return playbook_files
 
@@ -2257,7 +2265,7 @@ def get_pack_metadata_paths(pack_to_create):
     else:
         path_list = ["Packs", "*", "pack_metadata.json"]
 
-    return glob.glob(os.path.join(*path_list))
+    return _repo_index().glob(os.path.join(*path_list))
 
 
 def get_general_paths(path, pack_to_create):
@@ -2269,7 +2277,7 @@ def get_general_paths(path, pack_to_create):
 
     files = list()
     for path in path_list:
-        files.extend(glob.glob(os.path.join(*path)))
+        files.extend(_repo_index().glob(os.path.join(*path)))
 
     return files
 
@@ -2287,7 +2295,7 @@ def get_generic_entities_paths(path, pack_to_create):
 
     files = list()
     for path in path_list:
-        files.extend(glob.glob(os.path.join(*path)))
+        files.extend(_repo_index().glob(os.path.join(*path)))
 
     return files
 
@@ -2534,9 +2542,20 @@ class IDSetType(Enum):
         return value in cls._value2member_map_  # type: ignore
 
 
+def group_items_by_id(items: List[dict]) -> Dict[str, List[dict]]:
+    """Groups the items of an id_set list (single key dicts of {id: data}) by their id, in one pass."""
+    items_by_id: Dict[str, List[dict]] = defaultdict(list)
+    for item in items:
+        for item_id in item:
+            items_by_id[item_id].append(item)
+    return items_by_id
+
+
 class IDSet:
     def __init__(self, id_set_dict=None):
         self._id_set_dict = id_set_dict if id_set_dict else {}
+        # the items of every list by their id, along with the length of the list they were grouped at
+        self._items_by_id: Dict[str, Tuple[int, Dict[str, List[dict]]]] = {}
 
     def get_dict(self):
         return self._id_set_dict
@@ -2544,12 +2563,28 @@ class IDSet:
     def get_list(self, item_type):
         return self._id_set_dict.get(item_type, [])
 
+    def get_items_by_id(self, item_type) -> Dict[str, List[dict]]:
+        """The items of a list by their id, grouped again only if the list was changed not through `add_to_list`."""
+        items = self.get_list(item_type)
+        indexed = self._items_by_id.get(item_type)
+        if indexed is None or indexed[0] != len(items):
+            indexed = (len(items), group_items_by_id(items))
+            self._items_by_id[item_type] = indexed
+        return indexed[1]
+
     def add_to_list(self, object_type: IDSetType, obj):
         if not IDSetType.has_value(object_type):
             raise ValueError(f"Invalid IDSetType {object_type}")
 
-        if obj not in self._id_set_dict.get(object_type, {}):
+        items_by_id = self.get_items_by_id(object_type)
+        if not any(obj in items_by_id.get(obj_id, ()) for obj_id in obj):
             self._id_set_dict.setdefault(object_type, []).append(obj)
+            for obj_id in obj:
+                items_by_id.setdefault(obj_id, []).append(obj)
+            self._items_by_id[object_type] = (
+                len(self._id_set_dict[object_type]),
+                items_by_id,
+            )
 
     def add_pack_to_id_set_packs(self, object_type: IDSetType, obj_name, obj_value):
         self._id_set_dict.setdefault(object_type, {}).update({obj_name: obj_value})
@@ -2561,17 +2596,13 @@ def merge_id_sets_from_files(
     """
     Merges two id-sets. Loads them from files and saves the merged unified id_set into output_id_set_path.
     """
-    with open(first_id_set_path) as f1:
-        first_id_set = json.load(f1)
-
-    with open(second_id_set_path) as f2:
-        second_id_set = json.load(f2)
+    first_id_set = load_id_set(first_id_set_path)
+    second_id_set = load_id_set(second_id_set_path)
 
     unified_id_set, duplicates = merge_id_sets(first_id_set, second_id_set, print_logs)
 
     if unified_id_set:
-        with open(output_id_set_path, mode="w", encoding="utf-8") as f:
-            json.dump(unified_id_set.get_dict(), f, indent=4)
+        write_id_set(unified_id_set.get_dict(), output_id_set_path)
 
     return unified_id_set, duplicates
 
@@ -2589,13 +2620,13 @@ def merge_id_sets(
     second_id_set = IDSet(second_id_set_dict)
 
     for object_type, object_list in second_id_set.get_dict().items():
-        subset = first_id_set.get_list(object_type)
-
         if object_type != "Packs":
+            first_items_by_id = first_id_set.get_items_by_id(object_type)
             for obj in object_list:
                 obj_id = list(obj.keys())[0]
+                # only the items of the first id_set with the same id may be duplicates of the object
                 is_duplicate = has_duplicate(
-                    subset,
+                    first_items_by_id.get(obj_id, []),
                     obj_id,
                     object_type,
                     print_logs,
@@ -2617,7 +2648,1007 @@ def merge_id_sets(
     return united_id_set, []
 
 
-def re_create_id_set(  # noqa: C901
+class IdSetStage(NamedTuple):
+    """
+    A pass over the files of a content entity in `re_create_id_set`: `process` is called for every path listed by
+    `get_paths`, and the items it returns are added to the `items_key` list of the id_set, and to the `ContentItems`
+    of their packs under `content_items_key`.
+    """
+
+    name: str
+    # the entity in `objects_to_create` the stage belongs to
+    entity: str
+    label: str
+    get_paths: Callable[[Optional[str]], List[str]]
+    process: Callable
+    items_key: str
+    content_items_key: Optional[str]
+    process_kwargs: Dict = {}
+    # whether `process` returns the items along with the items excluded from the id_set
+    returns_excluded_items: bool = True
+    # the stage whose items are passed to `process`, and the argument they are passed as
+    dependency: Optional[Tuple[str, str]] = None
+
+
+# the stages of `re_create_id_set`, in the order their items are added to the id_set
+ID_SET_STAGES: Tuple[IdSetStage, ...] = (
+    IdSetStage(
+        "Integrations",
+        "Integrations",
+        "Integrations",
+        get_integrations_paths,
+        process_integration,
+        "integrations",
+        "integrations",
+    ),
+    IdSetStage(
+        "Playbooks",
+        "Playbooks",
+        "Playbooks",
+        get_playbooks_paths,
+        process_general_items,
+        "playbooks",
+        "playbooks",
+        {
+            "expected_file_types": (FileType.PLAYBOOK,),
+            "data_extraction_func": get_playbook_data,
+        },
+    ),
+    IdSetStage(
+        "Scripts",
+        "Scripts",
+        "Scripts",
+        partial(get_general_paths, SCRIPTS_DIR),
+        process_script,
+        "scripts",
+        "scripts",
+    ),
+    # the test playbooks stage adds the scripts of the test playbooks to the "scripts" list as well
+    IdSetStage(
+        "TestPlaybooks",
+        "TestPlaybooks",
+        "TestPlaybooks",
+        partial(get_general_paths, TEST_PLAYBOOKS_DIR),
+        process_test_playbook_path,
+        "TestPlaybooks",
+        None,
+        returns_excluded_items=False,
+    ),
+    IdSetStage(
+        "Classifiers",
+        "Classifiers",
+        "Classifiers",
+        partial(get_general_paths, CLASSIFIERS_DIR),
+        process_general_items,
+        "Classifiers",
+        "classifiers",
+        {
+            "expected_file_types": (FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
+            "data_extraction_func": get_classifier_data,
+        },
+    ),
+    IdSetStage(
+        "Dashboards",
+        "Dashboards",
+        "Dashboards",
+        partial(get_general_paths, DASHBOARDS_DIR),
+        process_general_items,
+        "Dashboards",
+        "dashboards",
+        {
+            "expected_file_types": (FileType.DASHBOARD,),
+            "data_extraction_func": get_dashboard_data,
+        },
+    ),
+    IdSetStage(
+        "IncidentTypes",
+        "IncidentTypes",
+        "Incident Types",
+        partial(get_general_paths, INCIDENT_TYPES_DIR),
+        process_general_items,
+        "IncidentTypes",
+        "incidentTypes",
+        {
+            "expected_file_types": (FileType.INCIDENT_TYPE,),
+            "data_extraction_func": get_incident_type_data,
+        },
+    ),
+    IdSetStage(
+        "IncidentFields",
+        "IncidentFields",
+        "Incident Fields",
+        partial(get_general_paths, INCIDENT_FIELDS_DIR),
+        process_incident_fields,
+        "IncidentFields",
+        "incidentFields",
+        dependency=("IncidentTypes", "incident_types"),
+    ),
+    IdSetStage(
+        "IndicatorFields",
+        "IndicatorFields",
+        "Indicator Fields",
+        partial(get_general_paths, INDICATOR_FIELDS_DIR),
+        process_general_items,
+        "IndicatorFields",
+        "indicatorFields",
+        {
+            "expected_file_types": (FileType.INDICATOR_FIELD,),
+            "data_extraction_func": get_general_data,
+        },
+    ),
+    IdSetStage(
+        "IndicatorTypes",
+        "IndicatorTypes",
+        "Indicator Types",
+        partial(get_general_paths, INDICATOR_TYPES_DIR),
+        process_indicator_types,
+        "IndicatorTypes",
+        "indicatorTypes",
+        dependency=("Integrations", "all_integrations"),
+    ),
+    IdSetStage(
+        "Layouts",
+        "Layouts",
+        "Layouts",
+        partial(get_general_paths, LAYOUTS_DIR),
+        process_general_items,
+        "Layouts",
+        None,
+        {
+            "expected_file_types": (FileType.LAYOUT,),
+            "data_extraction_func": get_layout_data,
+        },
+    ),
+    IdSetStage(
+        "LayoutsContainers",
+        "Layouts",
+        "Layouts Containers",
+        partial(get_general_paths, LAYOUTS_DIR),
+        process_layoutscontainers,
+        "Layouts",
+        "layouts",
+    ),
+    IdSetStage(
+        "Reports",
+        "Reports",
+        "Reports",
+        partial(get_general_paths, REPORTS_DIR),
+        process_general_items,
+        "Reports",
+        "reports",
+        {
+            "expected_file_types": (FileType.REPORT,),
+            "data_extraction_func": get_report_data,
+        },
+    ),
+    IdSetStage(
+        "Widgets",
+        "Widgets",
+        "Widgets",
+        partial(get_general_paths, WIDGETS_DIR),
+        process_general_items,
+        "Widgets",
+        "widgets",
+        {
+            "expected_file_types": (FileType.WIDGET,),
+            "data_extraction_func": get_widget_data,
+        },
+    ),
+    IdSetStage(
+        "Mappers",
+        "Mappers",
+        "Mappers",
+        partial(get_general_paths, MAPPERS_DIR),
+        process_general_items,
+        "Mappers",
+        "mappers",
+        {
+            "expected_file_types": (FileType.MAPPER,),
+            "data_extraction_func": get_mapper_data,
+        },
+    ),
+    IdSetStage(
+        "Lists",
+        "Lists",
+        "Lists",
+        partial(get_general_paths, LISTS_DIR),
+        process_general_items,
+        "Lists",
+        "lists",
+        {
+            "expected_file_types": (FileType.LISTS,),
+            "data_extraction_func": get_list_data,
+        },
+    ),
+    IdSetStage(
+        "GenericDefinitions",
+        "GenericDefinitions",
+        "Generic Definitions",
+        partial(get_general_paths, GENERIC_DEFINITIONS_DIR),
+        process_general_items,
+        "GenericDefinitions",
+        "genericDefinitions",
+        {
+            "expected_file_types": (FileType.GENERIC_DEFINITION,),
+            "data_extraction_func": get_general_data,
+        },
+    ),
+    IdSetStage(
+        "GenericModules",
+        "GenericModules",
+        "Generic Modules",
+        partial(get_general_paths, GENERIC_MODULES_DIR),
+        process_general_items,
+        "GenericModules",
+        "genericModules",
+        {
+            "expected_file_types": (FileType.GENERIC_MODULE,),
+            "data_extraction_func": get_generic_module_data,
+        },
+    ),
+    IdSetStage(
+        "GenericTypes",
+        "GenericTypes",
+        "Generic Types",
+        partial(get_generic_entities_paths, GENERIC_TYPES_DIR),
+        process_generic_items,
+        "GenericTypes",
+        "genericTypes",
+    ),
+    IdSetStage(
+        "GenericFields",
+        "GenericFields",
+        "Generic Fields",
+        partial(get_generic_entities_paths, GENERIC_FIELDS_DIR),
+        process_generic_items,
+        "GenericFields",
+        "genericFields",
+        dependency=("GenericTypes", "generic_types_list"),
+    ),
+    IdSetStage(
+        "Jobs",
+        "Jobs",
+        "Jobs",
+        partial(get_general_paths, JOBS_DIR),
+        process_jobs,
+        "Jobs",
+        "jobs",
+        returns_excluded_items=False,
+    ),
+    IdSetStage(
+        "ParsingRules",
+        "ParsingRules",
+        "Parsing Rules",
+        partial(get_general_paths, PARSING_RULES_DIR),
+        process_general_items,
+        "ParsingRules",
+        "parsingRules",
+        {
+            "expected_file_types": (FileType.PARSING_RULE,),
+            "data_extraction_func": get_parsing_rule_data,
+        },
+    ),
+    IdSetStage(
+        "ModelingRules",
+        "ModelingRules",
+        "Modeling Rules",
+        partial(get_general_paths, MODELING_RULES_DIR),
+        process_general_items,
+        "ModelingRules",
+        "modelingRules",
+        {
+            "expected_file_types": (FileType.MODELING_RULE,),
+            "data_extraction_func": get_modeling_rule_data,
+        },
+    ),
+    IdSetStage(
+        "CorrelationRules",
+        "CorrelationRules",
+        "Correlation Rules",
+        partial(get_general_paths, CORRELATION_RULES_DIR),
+        process_general_items,
+        "CorrelationRules",
+        "correlationRules",
+        {
+            "expected_file_types": (FileType.CORRELATION_RULE,),
+            "data_extraction_func": get_correlation_rule_data,
+        },
+    ),
+    IdSetStage(
+        "XSIAMDashboards",
+        "XSIAMDashboards",
+        "XSIAMDashboards",
+        partial(get_general_paths, XSIAM_DASHBOARDS_DIR),
+        process_general_items,
+        "XSIAMDashboards",
+        "xsiamdashboards",
+        {
+            "expected_file_types": (FileType.XSIAM_DASHBOARD,),
+            "data_extraction_func": get_xsiam_dashboard_data,
+        },
+    ),
+    IdSetStage(
+        "XSIAMReports",
+        "XSIAMReports",
+        "XSIAMReports",
+        partial(get_general_paths, XSIAM_REPORTS_DIR),
+        process_general_items,
+        "XSIAMReports",
+        "xsiamreports",
+        {
+            "expected_file_types": (FileType.XSIAM_REPORT,),
+            "data_extraction_func": get_xsiam_report_data,
+        },
+    ),
+    IdSetStage(
+        "Triggers",
+        "Triggers",
+        "Triggers",
+        partial(get_general_paths, TRIGGER_DIR),
+        process_general_items,
+        "Triggers",
+        "triggers",
+        {
+            "expected_file_types": (FileType.TRIGGER,),
+            "data_extraction_func": get_trigger_data,
+        },
+    ),
+    IdSetStage(
+        "Wizards",
+        "Wizards",
+        "Wizards",
+        partial(get_general_paths, WIZARDS_DIR),
+        process_wizards,
+        "Wizards",
+        "wizards",
+        returns_excluded_items=False,
+    ),
+    IdSetStage(
+        "XDRCTemplates",
+        "XDRCTemplates",
+        "XDRCTemplates",
+        partial(get_general_paths, XDRC_TEMPLATE_DIR),
+        process_general_items,
+        "XDRCTemplates",
+        "XDRCTemplates",
+        {
+            "expected_file_types": (FileType.XDRC_TEMPLATE),
+            "data_extraction_func": get_xdrc_template_data,
+            "suffix": "json",
+        },
+    ),
+    IdSetStage(
+        "LayoutRules",
+        "LayoutRules",
+        "LayoutRules",
+        partial(get_general_paths, LAYOUT_RULES_DIR),
+        process_general_items,
+        "LayoutRules",
+        "LayoutRules",
+        {
+            "expected_file_types": FileType.LAYOUT_RULE,
+            "data_extraction_func": get_layout_rule_data,
+            "suffix": "json",
+        },
+    ),
+)
+ID_SET_STAGES_BY_NAME: Dict[str, IdSetStage] = {
+    stage.name: stage for stage in ID_SET_STAGES
+}
+# the number of files sent to a worker process at once
+ID_SET_CHUNK_SIZE = 16
+
+
+def process_id_set_chunk(
+    stage_name: str,
+    paths: List[str],
+    packs: Dict[str, Dict],
+    marketplace: str,
+    print_logs: bool,
+    dependency_items: Optional[list] = None,
+) -> list:
+    """Processes a chunk of the files of a stage in a worker process, returning the result of every file."""
+    stage = ID_SET_STAGES_BY_NAME[stage_name]
+    kwargs = dict(stage.process_kwargs)
+    if stage.dependency:
+        kwargs[stage.dependency[1]] = dependency_items
+    return [
+        stage.process(
+            path, packs=packs, marketplace=marketplace, print_logs=print_logs, **kwargs
+        )
+        for path in paths
+    ]
+
+
+def process_id_set_stages(
+    pool,
+    processes: int,
+    stages: List[IdSetStage],
+    pack_to_create,
+    packs_dict: Dict[str, Dict],
+    marketplace: str,
+    print_logs: bool,
+    on_stage_done: Callable[[IdSetStage], None] = lambda stage: None,
+    include_path: Optional[Callable[[str], bool]] = None,
+    known_items: Optional[Dict[str, list]] = None,
+) -> Dict[str, list]:
+    """
+    Processes the files of all the stages through a single queue of the pool, and returns the results of every stage,
+    in the order of its paths.
+
+    Every chunk is sent with the marketplaces of the packs of its files only, rather than with the whole packs dict,
+    as the packs are only used to look up the marketplaces of an item by its pack.
+    A stage which depends on the items of another stage is queued once that stage is done.
+
+    Args:
+        include_path: Processes only the paths of the stages it returns True for, all of them by default.
+        known_items: The items of stages which are not processed again, by stage name, for the stages depending on them.
+            The items the dependency stage processes are added to them.
+    """
+    known_items = known_items or {}
+    pack_marketplaces = {
+        pack_name: {
+            "marketplaces": pack_data.get(
+                "marketplaces", [MarketplaceVersions.XSOAR.value]
+            )
+        }
+        for pack_name, pack_data in packs_dict.items()
+        if pack_data
+    }
+    stage_paths = {
+        stage.name: [
+            path
+            for path in stage.get_paths(pack_to_create)
+            if include_path is None or include_path(path)
+        ]
+        for stage in stages
+    }
+    dependents: Dict[str, List[IdSetStage]] = defaultdict(list)
+    for stage in stages:
+        if stage.dependency and stage.dependency[0] in stage_paths:
+            dependents[stage.dependency[0]].append(stage)
+
+    chunk_results: Dict[str, list] = {}
+    remaining_chunks: Dict[str, int] = {}
+    # the (stage name, chunk index, results, error) of every processed chunk
+    done_chunks: queue.Queue = queue.Queue()
+
+    def on_chunk_done(stage_name: str, index: int, results: list):
+        done_chunks.put((stage_name, index, results, None))
+
+    def on_chunk_error(stage_name: str, index: int, error: BaseException):
+        done_chunks.put((stage_name, index, None, error))
+
+    def stage_items(stage_name: str) -> list:
+        items: list = []
+        for arr, _ in itertools.chain.from_iterable(chunk_results[stage_name]):
+            items.extend(arr)
+        return items
+
+    def submit(stage: IdSetStage):
+        logger.info(f"\n[green]Starting iteration over {stage.label}[/green]")
+        paths = stage_paths[stage.name]
+        dependency_items = None
+        chunk_size = ID_SET_CHUNK_SIZE
+        if stage.dependency:
+            dependency_name = stage.dependency[0]
+            dependency_items = known_items.get(dependency_name, []) + (
+                stage_items(dependency_name) if dependency_name in stage_paths else []
+            )
+            # the items of the dependency are sent with every chunk, fewer and larger chunks are sent
+            chunk_size = max(chunk_size, -(-len(paths) // (processes * 2)))
+        chunks = [
+            paths[start : start + chunk_size]
+            for start in range(0, len(paths), chunk_size)
+        ]
+        chunk_results[stage.name] = [None] * len(chunks)
+        remaining_chunks[stage.name] = len(chunks)
+        if not chunks:
+            stage_done(stage)
+        for index, chunk in enumerate(chunks):
+            chunk_packs = {
+                pack_name: pack_marketplaces[pack_name]
+                for pack_name in {get_pack_name(path) for path in chunk}
+                if pack_name in pack_marketplaces
+            }
+            pool.apply_async(
+                process_id_set_chunk,
+                (
+                    stage.name,
+                    chunk,
+                    chunk_packs,
+                    marketplace,
+                    print_logs,
+                    dependency_items,
+                ),
+                callback=partial(on_chunk_done, stage.name, index),
+                error_callback=partial(on_chunk_error, stage.name, index),
+            )
+
+    def stage_done(stage: IdSetStage):
+        on_stage_done(stage)
+        for dependent in dependents.pop(stage.name, []):
+            submit(dependent)
+
+    # the stages other stages depend on are queued first, so their dependents are not delayed
+    for stage in sorted(stages, key=lambda stage: stage.name not in dependents):
+        if not (stage.dependency and stage.dependency[0] in stage_paths):
+            submit(stage)
+
+    while any(remaining_chunks.values()):
+        stage_name, index, results, error = done_chunks.get()
+        if error is not None:
+            raise error
+        chunk_results[stage_name][index] = results
+        remaining_chunks[stage_name] -= 1
+        if not remaining_chunks[stage_name]:
+            stage_done(ID_SET_STAGES_BY_NAME[stage_name])
+
+    return {
+        stage_name: list(itertools.chain.from_iterable(results))
+        for stage_name, results in chunk_results.items()
+    }
+
+
+def add_id_set_stage_results(
+    stage: IdSetStage,
+    results: list,
+    id_set_lists: Dict[str, list],
+    packs_dict: Dict[str, Dict],
+    excluded_items_by_pack: Dict[str, set],
+    excluded_items_by_type: Dict[str, set],
+):
+    """Adds the results of the files of a stage to the id_set lists, the packs and the excluded items."""
+    for result in results:
+        if stage.name == "TestPlaybooks":
+            test_playbook, script = result
+            if test_playbook:
+                id_set_lists[stage.items_key].append(test_playbook)
+            if script:
+                id_set_lists["scripts"].append(script)
+            continue
+
+        arr, excluded_items = result if stage.returns_excluded_items else (result, {})
+        if stage.content_items_key:
+            for _id, data in arr[0].items() if arr and isinstance(arr, list) else {}:
+                if data.get("pack"):
+                    packs_dict[data.get("pack")].setdefault(
+                        "ContentItems", {}
+                    ).setdefault(stage.content_items_key, []).append(_id)
+        id_set_lists[stage.items_key].extend(arr)
+        update_excluded_items_dict(
+            excluded_items_by_pack, excluded_items_by_type, excluded_items
+        )
+
+
+def get_id_set_refresh_interval() -> int:
+    """Returns the refresh interval of the id_set in minutes, set by DEMISTO_SDK_ID_SET_REFRESH_INTERVAL (-1 if unset)."""
+    try:
+        return int(os.getenv("DEMISTO_SDK_ID_SET_REFRESH_INTERVAL", -1))
+    except ValueError:
+        logger.info(
+            "[yellow]DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is set with value: "
+            f"{os.getenv('DEMISTO_SDK_ID_SET_REFRESH_INTERVAL')} which is an illegal integer."
+            "\nPlease modify or unset env var.[/yellow]"
+        )
+        return -1
+
+
+def is_id_set_stale(id_set_path) -> bool:
+    """Whether the id_set file is older than the refresh interval, when DEMISTO_SDK_ID_SET_REFRESH_INTERVAL is set."""
+    refresh_interval = get_id_set_refresh_interval()
+    return (
+        refresh_interval > 0
+        and os.path.getmtime(id_set_path) < time.time() - refresh_interval * 60
+    )
+
+
+def get_id_set_state_path(id_set_path) -> Path:
+    """Returns the path of the state saved along with an id_set, which allows updating it with `update_id_set_file`."""
+    return Path(id_set_path).with_suffix(".state.json")
+
+
+def save_id_set_state(
+    id_set_path,
+    created: float,
+    marketplace: str,
+    objects_to_create: list,
+    excluded_items_by_pack: Dict[str, set],
+):
+    """
+    Saves the state of an id_set: when its creation started, the arguments it was created with, and the items excluded
+    from it (which are not part of the id_set itself).
+    """
+    state_path = get_id_set_state_path(id_set_path)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with state_path.open("w") as state_file:
+        json.dump(
+            {
+                "sdk_version": get_sdk_version(),
+                "created": created,
+                "marketplace": marketplace,
+                "objects_to_create": list(objects_to_create),
+                "excluded_items_by_pack": {
+                    pack: sorted(map(list, items))
+                    for pack, items in excluded_items_by_pack.items()
+                },
+            },
+            state_file,
+            indent=4,
+        )
+
+
+def load_id_set_state(id_set_path) -> Optional[dict]:
+    """
+    Loads the state saved along with an id_set, returns None if there is none, or if it does not match the id_set:
+    it was saved by another demisto-sdk version, or the id_set was not written since its state was saved.
+    """
+    try:
+        with get_id_set_state_path(id_set_path).open() as state_file:
+            state = json.load(state_file)
+        id_set_mtime = os.path.getmtime(id_set_path)
+    except (OSError, ValueError):
+        return None
+    if state.get("sdk_version") != get_sdk_version() or id_set_mtime < state["created"]:
+        return None
+    state["excluded_items_by_pack"] = {
+        pack: {tuple(item) for item in items}
+        for pack, items in state["excluded_items_by_pack"].items()
+    }
+    return state
+
+
+def get_excluded_items_by_type(
+    excluded_items_by_pack: Dict[str, set]
+) -> Dict[str, set]:
+    excluded_items_by_type: Dict[str, set] = {}
+    update_excluded_items_dict({}, excluded_items_by_type, excluded_items_by_pack)
+    return excluded_items_by_type
+
+
+def get_id_set_packs(id_set: dict, excluded_items_by_pack: Dict[str, set]) -> Set[str]:
+    """Returns the names of the packs which have metadata, items or excluded items in the id_set."""
+    packs = set(id_set.get("Packs", {})) | set(excluded_items_by_pack)
+    for key, items in id_set.items():
+        if key != "Packs":
+            packs.update(data.get("pack") for item in items for data in item.values())
+    packs.discard(None)
+    return packs
+
+
+def get_packs_modified_since(
+    created: float, id_set: dict, excluded_items_by_pack: Dict[str, set]
+) -> Optional[Set[str]]:
+    """
+    Returns the packs whose files were modified since the id_set was created, or which were added or removed since,
+    or None if content which is not part of any pack was modified.
+    """
+    index = ContentRepoIndex.get(os.getcwd(), refresh=True).build()
+    packs = set()
+    for path in index.modified_since(int(created * 1e9)):
+        parts = path.split("/")
+        if parts[0] != PACKS_DIR:
+            return None
+        if len(parts) > 1:
+            packs.add(parts[1])
+    return packs | (
+        get_id_set_packs(id_set, excluded_items_by_pack) ^ set(index.packs())
+    )
+
+
+def get_dependency_signature(items: list) -> list:
+    """
+    Returns the part of the items of a stage used by the stages depending on it: the ids of the incident and generic
+    types, and the commands of the integrations.
+    """
+    return sorted(
+        (item_id, sorted(data.get("commands") or []))
+        for item in items
+        for item_id, data in item.items()
+    )
+
+
+def update_id_set_packs(
+    id_set: dict,
+    packs: Set[str],
+    excluded_items_by_pack: Dict[str, set],
+    objects_to_create: list,
+    print_logs: bool = True,
+    fail_on_duplicates: bool = False,
+    marketplace: str = "",
+):
+    """
+    Updates an id_set created by `re_create_id_set` with the current content of some of its packs.
+    The items and the excluded items of these packs are dropped, the packs are processed again, and only the ids of
+    their old and new items are checked for duplicates.
+    The stages which depend on the items of another stage (e.g. the incident fields, on the incident types) are
+    processed again for all the packs, only if the part of these items they use changed.
+
+    Args:
+        id_set: The id_set to update.
+        packs: The names of the packs to update, including the packs which were added or removed.
+        excluded_items_by_pack: The items excluded from the id_set when it was created, aggregated by packs.
+        objects_to_create: The content entities the id_set was created with.
+        print_logs: Whether to print logs or not
+        fail_on_duplicates: If value is True an error will be raised if duplicates are found
+        marketplace: The marketplace the id_set was created for.
+
+    Returns: The updated id_set, and its excluded items aggregated by packs and by types, like `re_create_id_set`.
+    """
+    start_time = time.time()
+    ContentRepoIndex.get(os.getcwd(), refresh=True).build()
+    stages = [stage for stage in ID_SET_STAGES if stage.entity in objects_to_create]
+    processes = int(cpu_count())
+
+    def is_in_packs(path: str) -> bool:
+        return get_pack_name(path) in packs
+
+    kept_lists: Dict[str, list] = {}
+    affected_ids = set()
+    for key, items in id_set.items():
+        if key == "Packs":
+            continue
+        kept_lists[key] = []
+        for item in items:
+            item_id, data = next(iter(item.items()))
+            if data.get("pack") in packs:
+                affected_ids.add(item_id)
+            else:
+                kept_lists[key].append(item)
+
+    packs_dict: Dict[str, Dict] = {}
+    id_set_lists: Dict[str, list] = defaultdict(list)
+    updated_excluded_items_by_pack = {
+        pack: set(items)
+        for pack, items in excluded_items_by_pack.items()
+        if pack not in packs
+    }
+    updated_excluded_items_by_type = get_excluded_items_by_type(
+        updated_excluded_items_by_pack
+    )
+
+    logger.info(
+        f"[green]Starting the update of the id_set for the packs: {', '.join(sorted(packs))}[/green]"
+    )
+    with Pool(processes=processes) as pool:
+        if "Packs" in objects_to_create:
+            for pack_data in pool.map(
+                partial(
+                    get_pack_metadata_data,
+                    print_logs=print_logs,
+                    marketplace=marketplace,
+                ),
+                [path for path in get_pack_metadata_paths(None) if is_in_packs(path)],
+            ):
+                packs_dict.update(pack_data)
+        all_packs_dict = {
+            **{
+                pack: pack_data
+                for pack, pack_data in id_set.get("Packs", {}).items()
+                if pack not in packs
+            },
+            **packs_dict,
+        }
+
+        def get_dependency_items(updated_lists: Dict[str, list]) -> Dict[str, list]:
+            return {
+                stage.dependency[0]: kept_lists.get(items_key, [])
+                + updated_lists.get(items_key, [])
+                for stage in stages
+                if stage.dependency
+                for items_key in [ID_SET_STAGES_BY_NAME[stage.dependency[0]].items_key]
+            }
+
+        stages_results = process_id_set_stages(
+            pool,
+            processes,
+            stages,
+            None,
+            all_packs_dict,
+            marketplace,
+            print_logs,
+            include_path=is_in_packs,
+            known_items=get_dependency_items({}),
+        )
+        for stage in stages:
+            add_id_set_stage_results(
+                stage,
+                stages_results[stage.name],
+                id_set_lists,
+                packs_dict,
+                updated_excluded_items_by_pack,
+                updated_excluded_items_by_type,
+            )
+
+        dependency_items = get_dependency_items(id_set_lists)
+        outdated_stages = [
+            stage
+            for stage in stages
+            if stage.dependency
+            and get_dependency_signature(
+                id_set.get(ID_SET_STAGES_BY_NAME[stage.dependency[0]].items_key, [])
+            )
+            != get_dependency_signature(dependency_items[stage.dependency[0]])
+        ]
+        if outdated_stages:
+            logger.info(
+                "[green]Updating the items which depend on the updated items: "
+                f"{', '.join(stage.label for stage in outdated_stages)}[/green]"
+            )
+            outdated_results = process_id_set_stages(
+                pool,
+                processes,
+                outdated_stages,
+                None,
+                all_packs_dict,
+                marketplace,
+                print_logs,
+                include_path=lambda path: not is_in_packs(path),
+                known_items=dependency_items,
+            )
+            for stage in outdated_stages:
+                # the items of the other packs are replaced, their packs and excluded items are not affected
+                kept_lists[stage.items_key] = []
+                add_id_set_stage_results(
+                    stage,
+                    outdated_results[stage.name],
+                    kept_lists,
+                    defaultdict(dict),
+                    {},
+                    {},
+                )
+
+    for items in id_set_lists.values():
+        affected_ids.update(itertools.chain.from_iterable(items))
+
+    # the items with the same id are sorted in the order they are created in, by their stages and paths
+    path_positions = {
+        stage.name: {
+            os.path.normpath(path): index
+            for index, path in enumerate(stage.get_paths(None))
+        }
+        for stage in stages
+    }
+
+    def get_creation_position(key: str, item: dict) -> Tuple[int, int]:
+        file_path = os.path.normpath(next(iter(item.values())).get("file_path", ""))
+        for stage_index, stage in enumerate(stages):
+            if key != stage.items_key and not (
+                key == "scripts" and stage.name == "TestPlaybooks"
+            ):
+                continue
+            # the paths of some stages are the directories of the files of their items
+            for path in (file_path, os.path.dirname(file_path)):
+                if path in path_positions[stage.name]:
+                    return stage_index, path_positions[stage.name][path]
+        return len(stages), 0
+
+    updated_id_set = OrderedDict()
+    for key in id_set:
+        if key == "Packs":
+            # in the order of the packs in the repository, as they are created
+            updated_id_set[key] = {
+                pack: all_packs_dict[pack]
+                for pack in map(get_pack_name, get_pack_metadata_paths(None))
+                if pack in all_packs_dict
+            }
+        else:
+            updated_id_set[key] = sorted(
+                kept_lists[key] + id_set_lists[key],
+                key=lambda item: (
+                    next(iter(item)).lower(),
+                    get_creation_position(key, item),
+                ),
+            )
+
+    exec_time = time.time() - start_time
+    logger.info(
+        f"[green]Finished the update of the id_set. Total time: {exec_time} seconds[/green]"
+    )
+
+    duplicates = find_duplicates(
+        updated_id_set, print_logs, marketplace, ids_to_check=affected_ids
+    )
+    if any(duplicates) and fail_on_duplicates:
+        raise Exception(
+            f"The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n"
+        )
+
+    return (
+        updated_id_set,
+        updated_excluded_items_by_pack,
+        updated_excluded_items_by_type,
+    )
+
+
+def update_id_set_file(
+    id_set_path,
+    packs: Optional[Set[str]] = None,
+    print_logs: bool = True,
+    fail_on_duplicates: bool = False,
+    marketplace: Optional[str] = None,
+    objects_to_create: Optional[list] = None,
+):
+    """
+    Updates the id_set at `id_set_path` with some of its packs, using the state saved along with it.
+    Note that the updated id_set is not written, only its state is.
+
+    Args:
+        id_set_path: The path of the id_set.
+        packs: The names of the packs to update, the default is the packs modified since the id_set was created.
+        print_logs: Whether to print logs or not
+        fail_on_duplicates: If value is True an error will be raised if duplicates are found
+        marketplace: If passed, the id_set is updated only if it was created for this marketplace.
+        objects_to_create: If passed, the id_set is updated only if it was created with these content entities.
+
+    Returns: The updated id_set and its excluded items, like `re_create_id_set`, or None if it cannot be updated:
+        it has no (matching) state, content which is not part of a pack was modified, or the items excluded from the
+        updated packs changed (the items of other packs depending on them were removed from the id_set).
+    """
+    state = load_id_set_state(id_set_path)
+    if (
+        not state
+        or (marketplace is not None and marketplace != state["marketplace"])
+        or (
+            objects_to_create is not None
+            and list(objects_to_create) != state["objects_to_create"]
+        )
+    ):
+        return None
+
+    # when explicit packs are updated, the other packs modified since the id_set was created are yet to be updated
+    created = time.time() if packs is None else state["created"]
+    id_set = load_id_set(id_set_path)
+    excluded_items_by_pack = state["excluded_items_by_pack"]
+    if packs is None:
+        packs = get_packs_modified_since(
+            state["created"], id_set, excluded_items_by_pack
+        )
+        if packs is None:
+            logger.info(
+                "[yellow]Content which is not part of a pack was modified since the id_set was created.[/yellow]"
+            )
+            return None
+
+    if packs:
+        (
+            id_set,
+            updated_excluded_items_by_pack,
+            excluded_items_by_type,
+        ) = update_id_set_packs(
+            id_set,
+            packs,
+            excluded_items_by_pack,
+            state["objects_to_create"],
+            print_logs=print_logs,
+            fail_on_duplicates=fail_on_duplicates,
+            marketplace=state["marketplace"],
+        )
+        if any(
+            updated_excluded_items_by_pack.get(pack, set())
+            != excluded_items_by_pack.get(pack, set())
+            for pack in packs
+        ):
+            logger.info(
+                "[yellow]The items excluded from the updated packs changed.[/yellow]"
+            )
+            return None
+        excluded_items_by_pack = updated_excluded_items_by_pack
+    else:
+        logger.info("[green]No pack was modified since the id_set was created.[/green]")
+        excluded_items_by_type = get_excluded_items_by_type(excluded_items_by_pack)
+
+    save_id_set_state(
+        id_set_path,
+        created,
+        state["marketplace"],
+        state["objects_to_create"],
+        excluded_items_by_pack,
+    )
+    return id_set, excluded_items_by_pack, excluded_items_by_type
+
+
+def re_create_id_set(
     id_set_path: Optional[Path] = DEFAULT_ID_SET_PATH,
     pack_to_create=None,
     objects_to_create: list = None,
@@ -2629,7 +3660,9 @@ def re_create_id_set(  # noqa: C901
 
     Args:
         id_set_path: If passed an empty string will use default path (dependeing on mp type).
-            Pass in None to avoid saving the id-set.
+            Pass in None to avoid saving the id-set. Otherwise, the state of the id-set is saved along with it,
+            and an existing id-set older than DEMISTO_SDK_ID_SET_REFRESH_INTERVAL is updated with the packs
+            modified since it was created, when possible (see `update_id_set_file`).
         pack_to_create: The input path. the default is the content repo.
         objects_to_create: The content items this id set will contain. Defaults are set
             depending on the mp type.
@@ -2654,16 +3687,7 @@ def re_create_id_set(  # noqa: C901
             objects_to_create = CONTENT_ENTITIES
 
     if id_set_path and Path(id_set_path).exists():
-        try:
-            refresh_interval = int(os.getenv("DEMISTO_SDK_ID_SET_REFRESH_INTERVAL", -1))
-        except ValueError:
-            refresh_interval = -1
-            logger.info(
-                "[yellow]Re-creating id_set.\n"
-                "DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is set with value: "
-                f"{os.getenv('DEMISTO_SDK_ID_SET_REFRESH_INTERVAL')} which is an illegal integer."
-                "\nPlease modify or unset env var.[/yellow]"
-            )
+        refresh_interval = get_id_set_refresh_interval()
         if (
             refresh_interval > 0
         ):  # if the file is newer than the refresh interval, use it as is
@@ -2677,14 +3701,34 @@ def re_create_id_set(  # noqa: C901
                     "doesn't require a refresh. Will use current id-set. "
                     "If you rather force an id-set refresh, unset DEMISTO_SDK_ID_SET_REFRESH_INTERVAL or set it to -1.[/green]"
                 )
-                with open(id_set_path) as f:
-                    return json.load(f)
-            else:
-                logger.info(
-                    f"[green]The DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is set, but current id_set: {id_set_path} "
-                    f"modify time: {mtime_dt} is older than the refresh interval. "
-                    "Re-generating id-set.[/green]"
+                id_set = load_id_set(id_set_path)
+                state = load_id_set_state(id_set_path)
+                excluded_items_by_pack = (
+                    state["excluded_items_by_pack"] if state else {}
+                )
+                return (
+                    id_set,
+                    excluded_items_by_pack,
+                    get_excluded_items_by_type(excluded_items_by_pack),
+                )
+            logger.info(
+                f"[green]The DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is set, but current id_set: {id_set_path} "
+                f"modify time: {mtime_dt} is older than the refresh interval. "
+                "Updating the packs modified since it was created.[/green]"
+            )
+            if not pack_to_create:
+                updated_id_set = update_id_set_file(
+                    id_set_path,
+                    print_logs=print_logs,
+                    fail_on_duplicates=fail_on_duplicates,
+                    marketplace=marketplace,
+                    objects_to_create=objects_to_create,
                 )
+                if updated_id_set is not None:
+                    return updated_id_set
+            logger.info(
+                "[green]The current id_set cannot be updated. Re-generating id-set.[/green]"
+            )
         else:
             logger.info(
                 "[green]Note: DEMISTO_SDK_ID_SET_REFRESH_INTERVAL env var is not enabled. "
@@ -2695,46 +3739,19 @@ def re_create_id_set(  # noqa: C901
         logger.info("")  # add an empty line for clarity
 
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    indicator_types_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-    mappers_list = []
-    generic_types_list = []
-    generic_fields_list = []
-    generic_modules_list = []
-    generic_definitions_list = []
-    lists_list = []
-    jobs_list = []
-    parsing_rules_list = []
-    modeling_rules_list = []
-    correlation_rules_list = []
-    xsiam_dashboards_list = []
-    xsiam_reports_list = []
-    triggers_list = []
-    wizards_list = []
-    xdrc_templates_list = []
-    layout_rules_list = []
+    # the content paths below are listed from a single, shared, scan of the repository
+    ContentRepoIndex.get(os.getcwd(), refresh=True).build()
     packs_dict: Dict[str, Dict] = {}
     excluded_items_by_pack: Dict[str, set] = {}
     excluded_items_by_type: Dict[str, set] = {}
-
-    pool = Pool(processes=int(cpu_count()))
+    id_set_lists: Dict[str, list] = defaultdict(list)
+    stages = [stage for stage in ID_SET_STAGES if stage.entity in objects_to_create]
+    processes = int(cpu_count())
 
     logger.info("[green]Starting the creation of the id_set[/green]")
 
-    with click.progressbar(
-        length=len(objects_to_create), label="Creating id-set"
+    with Pool(processes=processes) as pool, click.progressbar(
+        length=len(ID_SET_STAGES) + 1, label="Creating id-set"
     ) as progress_bar:
         if "Packs" in objects_to_create:
             logger.info("\n[green]Starting iteration over Packs[/green]")
@@ -2748,870 +3765,66 @@ def re_create_id_set(  # noqa: C901
             ):
                 packs_dict.update(pack_data)
 
-        progress_bar.update(1)
-
-        if "Integrations" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Integrations[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_integration,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_integrations_paths(pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("integrations", []).append(_id)
-                integration_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Playbooks" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Playbooks[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.PLAYBOOK,),
-                    data_extraction_func=get_playbook_data,
-                ),
-                get_playbooks_paths(pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("playbooks", []).append(_id)
-                playbooks_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Scripts" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Scripts[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_script,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_general_paths(SCRIPTS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("scripts", []).append(_id)
-                scripts_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "TestPlaybooks" in objects_to_create:
-            logger.info("\n[green]Starting iteration over TestPlaybooks[/green]")
-            for pair in pool.map(
-                partial(
-                    process_test_playbook_path,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_general_paths(TEST_PLAYBOOKS_DIR, pack_to_create),
-            ):
-                if pair[0]:
-                    testplaybooks_list.append(pair[0])
-                if pair[1]:
-                    scripts_list.append(pair[1])
-
-        progress_bar.update(1)
-
-        if "Classifiers" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Classifiers[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.CLASSIFIER, FileType.OLD_CLASSIFIER),
-                    data_extraction_func=get_classifier_data,
-                ),
-                get_general_paths(CLASSIFIERS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("classifiers", []).append(_id)
-                classifiers_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Dashboards" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Dashboards[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.DASHBOARD,),
-                    data_extraction_func=get_dashboard_data,
-                ),
-                get_general_paths(DASHBOARDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("dashboards", []).append(_id)
-                dashboards_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "IncidentTypes" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Incident Types[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.INCIDENT_TYPE,),
-                    data_extraction_func=get_incident_type_data,
-                ),
-                get_general_paths(INCIDENT_TYPES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("incidentTypes", []).append(_id)
-                incident_type_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        # Has to be called after 'IncidentTypes' is called
-        if "IncidentFields" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Incident Fields[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_incident_fields,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    incident_types=incident_type_list,
-                ),
-                get_general_paths(INCIDENT_FIELDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("incidentFields", []).append(_id)
-                incident_fields_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "IndicatorFields" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Indicator Fields[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.INDICATOR_FIELD,),
-                    data_extraction_func=get_general_data,
-                ),
-                get_general_paths(INDICATOR_FIELDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("indicatorFields", []).append(_id)
-                indicator_fields_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        # Has to be called after 'Integrations' is called
-        if "IndicatorTypes" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Indicator Types[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_indicator_types,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    all_integrations=integration_list,
-                ),
-                get_general_paths(INDICATOR_TYPES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("indicatorTypes", []).append(_id)
-                indicator_types_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Layouts" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Layouts[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.LAYOUT,),
-                    data_extraction_func=get_layout_data,
-                ),
-                get_general_paths(LAYOUTS_DIR, pack_to_create),
-            ):
-                layouts_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_layoutscontainers,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_general_paths(LAYOUTS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("layouts", []).append(_id)
-                layouts_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Reports" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Reports[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.REPORT,),
-                    data_extraction_func=get_report_data,
-                ),
-                get_general_paths(REPORTS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("reports", []).append(_id)
-                reports_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Widgets" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Widgets[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.WIDGET,),
-                    data_extraction_func=get_widget_data,
-                ),
-                get_general_paths(WIDGETS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("widgets", []).append(_id)
-                widgets_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Mappers" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Mappers[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.MAPPER,),
-                    data_extraction_func=get_mapper_data,
-                ),
-                get_general_paths(MAPPERS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("mappers", []).append(_id)
-                mappers_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Lists" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Lists[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.LISTS,),
-                    data_extraction_func=get_list_data,
-                ),
-                get_general_paths(LISTS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("lists", []).append(_id)
-                lists_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "GenericDefinitions" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Generic Definitions[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.GENERIC_DEFINITION,),
-                    data_extraction_func=get_general_data,
-                ),
-                get_general_paths(GENERIC_DEFINITIONS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("genericDefinitions", []).append(_id)
-                generic_definitions_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "GenericModules" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Generic Modules[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.GENERIC_MODULE,),
-                    data_extraction_func=get_generic_module_data,
-                ),
-                get_general_paths(GENERIC_MODULES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("genericModules", []).append(_id)
-                generic_modules_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "GenericTypes" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Generic Types[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_generic_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_generic_entities_paths(GENERIC_TYPES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("genericTypes", []).append(_id)
-                generic_types_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        # Has to be called after 'GenericTypes' is called
-        if "GenericFields" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Generic Fields[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_generic_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    generic_types_list=generic_types_list,
-                ),
-                get_generic_entities_paths(GENERIC_FIELDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("genericFields", []).append(_id)
-                generic_fields_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Jobs" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Jobs[/green]")
-            for arr in pool.map(
-                partial(
-                    process_jobs,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_general_paths(JOBS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("jobs", []).append(_id)
-                jobs_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if "ParsingRules" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Parsing Rules[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.PARSING_RULE,),
-                    data_extraction_func=get_parsing_rule_data,
-                ),
-                get_general_paths(PARSING_RULES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("parsingRules", []).append(_id)
-                parsing_rules_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "ModelingRules" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Modeling Rules[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.MODELING_RULE,),
-                    data_extraction_func=get_modeling_rule_data,
-                ),
-                get_general_paths(MODELING_RULES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("modelingRules", []).append(_id)
-                modeling_rules_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "CorrelationRules" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Correlation Rules[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.CORRELATION_RULE,),
-                    data_extraction_func=get_correlation_rule_data,
-                ),
-                get_general_paths(CORRELATION_RULES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("correlationRules", []).append(_id)
-                correlation_rules_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
+        progress_bar.update(1 + len(ID_SET_STAGES) - len(stages))
 
-        if "XSIAMDashboards" in objects_to_create:
-            logger.info("\n[green]Starting iteration over XSIAMDashboards[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.XSIAM_DASHBOARD,),
-                    data_extraction_func=get_xsiam_dashboard_data,
-                ),
-                get_general_paths(XSIAM_DASHBOARDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("xsiamdashboards", []).append(_id)
-                xsiam_dashboards_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "XSIAMReports" in objects_to_create:
-            logger.info("\n[green]Starting iteration over XSIAMReports[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.XSIAM_REPORT,),
-                    data_extraction_func=get_xsiam_report_data,
-                ),
-                get_general_paths(XSIAM_REPORTS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("xsiamreports", []).append(_id)
-                xsiam_reports_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Triggers" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Triggers[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.TRIGGER,),
-                    data_extraction_func=get_trigger_data,
-                ),
-                get_general_paths(TRIGGER_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("triggers", []).append(_id)
-                triggers_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
-
-        if "Wizards" in objects_to_create:
-            logger.info("\n[green]Starting iteration over Wizards[/green]")
-            for arr in pool.map(
-                partial(
-                    process_wizards,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                ),
-                get_general_paths(WIZARDS_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("wizards", []).append(_id)
-                wizards_list.extend(arr)
-
-        progress_bar.update(1)
-
-        if "XDRCTemplates" in objects_to_create:
-            logger.info("\n[green]Starting iteration over XDRCTemplates[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=(FileType.XDRC_TEMPLATE),
-                    data_extraction_func=get_xdrc_template_data,
-                    suffix="json",
-                ),
-                get_general_paths(XDRC_TEMPLATE_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("XDRCTemplates", []).append(_id)
-                xdrc_templates_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
-
-        progress_bar.update(1)
+        # the files of all the entities are processed at once, and their results are added to the id_set
+        # in the order of the entities, as if they were processed one entity after the other
+        stages_results = process_id_set_stages(
+            pool,
+            processes,
+            stages,
+            pack_to_create,
+            packs_dict,
+            marketplace,
+            print_logs,
+            on_stage_done=lambda stage: progress_bar.update(1),
+        )
 
-        if "LayoutRules" in objects_to_create:
-            logger.info("\n[green]Starting iteration over LayoutRules[/green]")
-            for arr, excluded_items_from_iteration in pool.map(
-                partial(
-                    process_general_items,
-                    packs=packs_dict,
-                    marketplace=marketplace,
-                    print_logs=print_logs,
-                    expected_file_types=FileType.LAYOUT_RULE,
-                    data_extraction_func=get_layout_rule_data,
-                    suffix="json",
-                ),
-                get_general_paths(LAYOUT_RULES_DIR, pack_to_create),
-            ):
-                for _id, data in (
-                    arr[0].items() if arr and isinstance(arr, list) else {}
-                ):
-                    if data.get("pack"):
-                        packs_dict[data.get("pack")].setdefault(
-                            "ContentItems", {}
-                        ).setdefault("LayoutRules", []).append(_id)
-                layout_rules_list.extend(arr)
-                update_excluded_items_dict(
-                    excluded_items_by_pack,
-                    excluded_items_by_type,
-                    excluded_items_from_iteration,
-                )
+    for stage in stages:
+        add_id_set_stage_results(
+            stage,
+            stages_results[stage.name],
+            id_set_lists,
+            packs_dict,
+            excluded_items_by_pack,
+            excluded_items_by_type,
+        )
 
-        progress_bar.update(1)
     new_ids_dict = OrderedDict()
     # we sort each time the whole set in case someone manually changed something
     # it shouldn't take too much time
-    new_ids_dict["scripts"] = sort(scripts_list)
-    new_ids_dict["playbooks"] = sort(playbooks_list)
-    new_ids_dict["integrations"] = sort(integration_list)
-    new_ids_dict["TestPlaybooks"] = sort(testplaybooks_list)
-    new_ids_dict["Classifiers"] = sort(classifiers_list)
-    new_ids_dict["IncidentFields"] = sort(incident_fields_list)
-    new_ids_dict["IncidentTypes"] = sort(incident_type_list)
-    new_ids_dict["IndicatorFields"] = sort(indicator_fields_list)
-    new_ids_dict["IndicatorTypes"] = sort(indicator_types_list)
-    new_ids_dict["Layouts"] = sort(layouts_list)
-    new_ids_dict["Lists"] = sort(lists_list)
-    new_ids_dict["Jobs"] = sort(jobs_list)
-    new_ids_dict["Mappers"] = sort(mappers_list)
-    new_ids_dict["ParsingRules"] = sort(parsing_rules_list)
-    new_ids_dict["ModelingRules"] = sort(modeling_rules_list)
-    new_ids_dict["CorrelationRules"] = sort(correlation_rules_list)
-    new_ids_dict["XSIAMDashboards"] = sort(xsiam_dashboards_list)
-    new_ids_dict["XSIAMReports"] = sort(xsiam_reports_list)
-    new_ids_dict["Triggers"] = sort(triggers_list)
-    new_ids_dict["Wizards"] = sort(wizards_list)
+    new_ids_dict["scripts"] = sort(id_set_lists["scripts"])
+    new_ids_dict["playbooks"] = sort(id_set_lists["playbooks"])
+    new_ids_dict["integrations"] = sort(id_set_lists["integrations"])
+    new_ids_dict["TestPlaybooks"] = sort(id_set_lists["TestPlaybooks"])
+    new_ids_dict["Classifiers"] = sort(id_set_lists["Classifiers"])
+    new_ids_dict["IncidentFields"] = sort(id_set_lists["IncidentFields"])
+    new_ids_dict["IncidentTypes"] = sort(id_set_lists["IncidentTypes"])
+    new_ids_dict["IndicatorFields"] = sort(id_set_lists["IndicatorFields"])
+    new_ids_dict["IndicatorTypes"] = sort(id_set_lists["IndicatorTypes"])
+    new_ids_dict["Layouts"] = sort(id_set_lists["Layouts"])
+    new_ids_dict["Lists"] = sort(id_set_lists["Lists"])
+    new_ids_dict["Jobs"] = sort(id_set_lists["Jobs"])
+    new_ids_dict["Mappers"] = sort(id_set_lists["Mappers"])
+    new_ids_dict["ParsingRules"] = sort(id_set_lists["ParsingRules"])
+    new_ids_dict["ModelingRules"] = sort(id_set_lists["ModelingRules"])
+    new_ids_dict["CorrelationRules"] = sort(id_set_lists["CorrelationRules"])
+    new_ids_dict["XSIAMDashboards"] = sort(id_set_lists["XSIAMDashboards"])
+    new_ids_dict["XSIAMReports"] = sort(id_set_lists["XSIAMReports"])
+    new_ids_dict["Triggers"] = sort(id_set_lists["Triggers"])
+    new_ids_dict["Wizards"] = sort(id_set_lists["Wizards"])
     new_ids_dict["Packs"] = packs_dict
-    new_ids_dict["XDRCTemplates"] = sort(xdrc_templates_list)
-    new_ids_dict["LayoutRules"] = sort(layout_rules_list)
+    new_ids_dict["XDRCTemplates"] = sort(id_set_lists["XDRCTemplates"])
+    new_ids_dict["LayoutRules"] = sort(id_set_lists["LayoutRules"])
 
     if marketplace != MarketplaceVersions.MarketplaceV2.value:
-        new_ids_dict["GenericTypes"] = sort(generic_types_list)
-        new_ids_dict["GenericFields"] = sort(generic_fields_list)
-        new_ids_dict["GenericModules"] = sort(generic_modules_list)
-        new_ids_dict["GenericDefinitions"] = sort(generic_definitions_list)
-        new_ids_dict["Reports"] = sort(reports_list)
-        new_ids_dict["Widgets"] = sort(widgets_list)
-        new_ids_dict["Dashboards"] = sort(dashboards_list)
+        new_ids_dict["GenericTypes"] = sort(id_set_lists["GenericTypes"])
+        new_ids_dict["GenericFields"] = sort(id_set_lists["GenericFields"])
+        new_ids_dict["GenericModules"] = sort(id_set_lists["GenericModules"])
+        new_ids_dict["GenericDefinitions"] = sort(id_set_lists["GenericDefinitions"])
+        new_ids_dict["Reports"] = sort(id_set_lists["Reports"])
+        new_ids_dict["Widgets"] = sort(id_set_lists["Widgets"])
+        new_ids_dict["Dashboards"] = sort(id_set_lists["Dashboards"])
     else:
         # a workaround for find-dependencies check (PackDependencies._collect_pack_items)
         new_ids_dict["GenericTypes"] = []
@@ -3633,10 +3846,24 @@ def re_create_id_set(  # noqa: C901
             f"The following ids were found duplicates\n{json.dumps(duplicates, indent=4)}\n"
         )
 
+    if id_set_path and not pack_to_create:
+        # allows updating only the modified packs of the id_set, instead of creating it again
+        save_id_set_state(
+            id_set_path,
+            start_time,
+            marketplace,
+            objects_to_create,
+            excluded_items_by_pack,
+        )
+
     return new_ids_dict, excluded_items_by_pack, excluded_items_by_type
 
 
-def find_duplicates(id_set, print_logs, marketplace):
+def find_duplicates(id_set, print_logs, marketplace, ids_to_check=None):
+    """
+    Returns the duplicate ids of every entity of the id_set, and of the incident and indicator fields together.
+    Pass `ids_to_check` to only check these ids, when the other ids are known to have no duplicates.
+    """
     lists_to_return = []
     entities = {
         MarketplaceVersions.MarketplaceV2.value: ID_SET_MP_V2_ENTITIES,
@@ -3646,13 +3873,13 @@ def find_duplicates(id_set, print_logs, marketplace):
     for object_type in entities:
         if print_logs:
             logger.info(f"[green]Checking diff for {object_type}[/green]")
-        objects = id_set.get(object_type)
-        ids = {list(specific_item.keys())[0] for specific_item in objects}
-
         dup_list = []
-        for id_to_check in ids:
-            if has_duplicate(
-                objects, id_to_check, object_type, print_logs, is_create_new=True
+        # only the items with the same id are compared, the ids of a single item have no duplicates
+        for id_to_check, items in group_items_by_id(id_set.get(object_type)).items():
+            if ids_to_check is not None and id_to_check not in ids_to_check:
+                continue
+            if len(items) > 1 and has_duplicate(
+                items, id_to_check, object_type, print_logs, is_create_new=True
             ):
                 dup_list.append(id_to_check)
         lists_to_return.append(dup_list)
@@ -3661,12 +3888,13 @@ def find_duplicates(id_set, print_logs, marketplace):
         logger.info("[green]Checking diff for Incident and Indicator Fields[/green]")
 
     fields = id_set["IncidentFields"] + id_set["IndicatorFields"]
-    field_ids = {list(field.keys())[0] for field in fields}
 
     field_list = []
-    for field_to_check in field_ids:
-        if has_duplicate(
-            fields,
+    for field_to_check, items in group_items_by_id(fields).items():
+        if ids_to_check is not None and field_to_check not in ids_to_check:
+            continue
+        if len(items) > 1 and has_duplicate(
+            items,
             field_to_check,
             "Indicator and Incident Fields",
             print_logs,
@@ -11,6 +11,7 @@ from demisto_sdk.commands.common.constants import (
     PACK_NAME_DEPRECATED_REGEX,
     MarketplaceVersions,
 )
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import capital_case, get_json
@@ -271,11 +272,12 @@ class PackParser(BaseContentParser, PackMetadataParser):
 
     def parse_pack_folders(self) -> None:
         """Parses all pack content items by iterating its folders."""
+        repo_index = ContentRepoIndex.get(self.path.parent.parent)
         for folder_path in ContentType.pack_folders(self.path):
-            for (
-                content_item_path
-            ) in folder_path.iterdir():  # todo: consider multiprocessing
-                self.parse_content_item(content_item_path)
+            for content_item_name in repo_index.listdir(
+                folder_path
+            ):  # todo: consider multiprocessing
+                self.parse_content_item(folder_path / content_item_name)
 
     def parse_content_item(self, content_item_path: Path) -> None:
         """Potentially parses a single content item.
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Iterator, List, Optional
 
 from demisto_sdk.commands.common.constants import PACKS_FOLDER
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.content_graph.parsers.pack import PackParser
@@ -29,7 +30,13 @@ class RepositoryParser:
         self.path: Path = path
         self.packs: List[PackParser] = []
 
+    @property
+    def repo_index(self) -> ContentRepoIndex:
+        return ContentRepoIndex.get(self.path)
+
     def parse(self, packs_to_parse: Optional[List[Path]] = None):
+        # list the whole repository once, the pool workers inherit the index
+        ContentRepoIndex.get(self.path, refresh=True).build()
         if not packs_to_parse:
             # if no packs to parse were provided, parse all packs
             packs_to_parse = list(self.iter_packs())
@@ -41,10 +48,9 @@ class RepositoryParser:
             logger.error(traceback.format_exc())
             raise
 
-    @staticmethod
-    def should_parse_pack(path: Path) -> bool:
+    def should_parse_pack(self, path: Path) -> bool:
         return (
-            path.is_dir()
+            self.repo_index.is_dir(path)
             and not path.name.startswith(".")
             and path.name not in IGNORED_PACKS_FOR_PARSING
         )
@@ -59,13 +65,14 @@ class RepositoryParser:
         if packs_to_parse:
             for pack in packs_to_parse:
                 path = packs_folder / pack
-                if not path.is_dir():
+                if not self.repo_index.is_dir(path):
                     raise FileNotFoundError(f"Pack {pack} does not exist.")
                 if self.should_parse_pack(path):
                     yield path
 
         else:
-            for path in packs_folder.iterdir():
+            for pack in self.repo_index.listdir(packs_folder):
+                path = packs_folder / pack
                 if self.should_parse_pack(path):
                     yield path
 
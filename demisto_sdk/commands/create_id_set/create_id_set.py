@@ -1,9 +1,8 @@
 import os
 from collections import OrderedDict
-from pathlib import Path
-from typing import Optional
-
 from genericpath import exists
+from pathlib import Path
+from typing import Iterable, Optional
 
 from demisto_sdk.commands.common.constants import (
     GENERIC_COMMANDS_NAMES,
@@ -14,9 +13,14 @@ from demisto_sdk.commands.common.content_constant_paths import (
     MP_V2_ID_SET_PATH,
     XPANSE_ID_SET_PATH,
 )
-from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_index import index_id_set_sections
+from demisto_sdk.commands.common.id_set_store import write_id_set
 from demisto_sdk.commands.common.tools import open_id_set_file
-from demisto_sdk.commands.common.update_id_set import re_create_id_set
+from demisto_sdk.commands.common.update_id_set import (
+    is_id_set_stale,
+    re_create_id_set,
+    update_id_set_file,
+)
 
 
 class IDSetCreator:
@@ -58,11 +62,38 @@ class IDSetCreator:
         self.save_id_set()
         return self.id_set, excluded_items_by_pack, excluded_items_by_type
 
+    def update_id_set(self, packs: Optional[Iterable[str]] = None):
+        """
+        Updates the id_set saved at the output path with some of its packs, and saves it.
+
+        Args:
+            packs (Iterable[str], optional): The packs to update, the default is the packs modified since the id_set
+             was created.
+
+        Returns:
+            The updated id_set and its excluded items like `create_id_set`, or None if it cannot be updated.
+        """
+        self.resolve_output()
+        updated_id_set = update_id_set_file(
+            self.output,
+            packs=set(packs) if packs is not None else None,
+            print_logs=self.print_logs,
+            fail_on_duplicates=self.fail_duplicates,
+        )
+        if updated_id_set is None:
+            return None
+        self.id_set, excluded_items_by_pack, excluded_items_by_type = updated_id_set
+
+        self.add_command_to_implementing_integrations_mapping()
+        self.save_id_set()
+        return self.id_set, excluded_items_by_pack, excluded_items_by_type
+
     def add_command_to_implementing_integrations_mapping(self):
         """
         Modifies playbook set in id_set dictionary once it was created.
         Each playbook that has "command_to_integration" field will be modified :
         - command name value will be a list of all integrations that implements this command (instead of use "" ).
+        The lists of an id_set which was already modified are replaced, as it may have been updated since.
         """
         command_name_to_implemented_integration_map = (
             self.create_command_to_implemented_integration_map()
@@ -74,9 +105,12 @@ class IDSetCreator:
             playbook_data = playbook_dict[playbook_name]
             commands_to_integration = playbook_data.get("command_to_integration", {})
             for command in commands_to_integration:
-                if commands_to_integration[command]:
+                if commands_to_integration[command] and not isinstance(
+                    commands_to_integration[command], list
+                ):
                     # only apply this logic when there is no specific brand
                     continue
+                commands_to_integration[command] = ""
                 is_command_implemented_in_integration = (
                     command in command_name_to_implemented_integration_map
                 )
@@ -107,7 +141,7 @@ class IDSetCreator:
                     ]
         return command_name_to_implemented_integration_map
 
-    def save_id_set(self):
+    def resolve_output(self):
         if not self.output:
             if self.marketplace == MarketplaceVersions.MarketplaceV2:
                 self.output = MP_V2_ID_SET_PATH
@@ -115,17 +149,21 @@ class IDSetCreator:
                 self.output = XPANSE_ID_SET_PATH
             else:
                 self.output = DEFAULT_ID_SET_PATH
+
+    def save_id_set(self):
+        self.resolve_output()
         if self.output:
             if not exists(self.output):
                 intermediate_dirs = os.path.dirname(os.path.abspath(self.output))
                 os.makedirs(intermediate_dirs, exist_ok=True)
-            with open(self.output, "w+") as id_set_file:
-                json.dump(self.id_set, id_set_file, indent=4)
+            write_id_set(self.id_set, self.output)
 
 
 def get_id_set(id_set_path: str) -> dict:
     """
     Parses the content of id_set_path and returns its content.
+    If the id_set is older than DEMISTO_SDK_ID_SET_REFRESH_INTERVAL, it is first updated with the packs modified since
+    it was created, when possible.
     Args:
         id_set_path: The path of the id_set file
 
@@ -133,7 +171,14 @@ def get_id_set(id_set_path: str) -> dict:
         The parsed content of id_set
     """
     if id_set_path:
+        if Path(id_set_path).is_file() and is_id_set_stale(id_set_path):
+            updated_id_set = IDSetCreator(
+                output=id_set_path, print_logs=False
+            ).update_id_set()
+            if updated_id_set is not None:
+                return index_id_set_sections(updated_id_set[0])
         id_set = open_id_set_file(id_set_path)
     else:
         id_set, _, _ = IDSetCreator(print_logs=False).create_id_set()
+        index_id_set_sections(id_set)
     return id_set
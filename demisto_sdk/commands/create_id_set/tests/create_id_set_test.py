@@ -299,6 +299,37 @@ def test_create_id_set_flow_xpanse(repo, mocker):
             assert len(entity_content_in_id_set)
 
 
+def test_update_id_set(repo, mocker):
+    """
+    Given
+        An id set created by create-id-set, and packs which were modified, added and removed since.
+    When
+        updating the id set.
+    Then
+        Make sure only the modified, added and removed packs are processed again.
+        Make sure the updated id set is the id set created from scratch.
+    """
+    import demisto_sdk.commands.common.update_id_set as uis
+
+    mocker.patch.dict(os.environ, {"DEMISTO_SDK_ID_SET_REFRESH_INTERVAL": "-1"})
+    repo.setup_content_repo(3)
+
+    with ChangeCWD(repo.path):
+        IDSetCreator(output=repo.id_set.path, print_logs=False).create_id_set()
+
+        repo.packs[0].scripts[0].yml.update({"comment": "updated"})
+        shutil.rmtree(repo.packs[1].path)
+        repo.setup_one_pack("pack_3")
+        update_id_set_packs = mocker.spy(uis, "update_id_set_packs")
+        assert IDSetCreator(output=repo.id_set.path, print_logs=False).update_id_set()
+        full_id_set_path = os.path.join(repo.path, "full_id_set.json")
+        IDSetCreator(output=full_id_set_path, print_logs=False).create_id_set()
+
+    assert update_id_set_packs.call_args.args[1] == {"pack_0", "pack_1", "pack_3"}
+    with open(full_id_set_path) as full_id_set_file:
+        assert repo.id_set.read_json_as_dict() == json.load(full_id_set_file)
+
+
 def setup_id_set():
     integration1 = {
         "Integration1": OrderedDict(
@@ -394,6 +425,36 @@ class TestAddCommandToImplementingIntegrationsMapping:
             "test-command_2"
         ] == ["Integration2"]
 
+    @staticmethod
+    def test_add_command_to_implementing_integrations_mapping_again():
+        """
+        Given
+        - an id_set whose playbooks commands were already mapped to the integrations implementing them
+        - an integration which was removed from the id_set since
+
+        When
+        - modify_id_set_command_to_integration_of_playbook is called again
+
+        Then
+        - Validates that the commands are mapped to the integrations which still implement them.
+
+        """
+        id_set_creator = setup_id_set()
+        id_set_creator.add_command_to_implementing_integrations_mapping()
+
+        id_set_creator.id_set["integrations"].pop(1)
+        id_set_creator.add_command_to_implementing_integrations_mapping()
+
+        playbook_set = id_set_creator.id_set["playbooks"]
+        assert playbook_set[0]["Playbook1"]["command_to_integration"] == {
+            "test-command": ["Integration1"],
+            "test-command_1": ["Integration1"],
+        }
+        assert playbook_set[1]["Playbook2"]["command_to_integration"] == {
+            "test-command": ["Integration1"],
+            "test-command_2": "",
+        }
+
     @staticmethod
     def test_do_not_modify_specific_brand(repo):
         """
@@ -19,6 +19,10 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.id_set_index import (
+    IDSetIndex,
+    index_id_set_sections,
+)
 from demisto_sdk.commands.common.logger import logger
 from demisto_sdk.commands.common.tools import (
     ProcessPoolHandler,
@@ -207,7 +211,7 @@ def get_merged_official_and_local_id_set(
         raise ValueError(
             "Found duplicates when merging local id_set with official id_set"
         )
-    return unified_id_set.get_dict()
+    return index_id_set_sections(unified_id_set.get_dict())
 
 
 class PackDependencies:
@@ -227,9 +231,7 @@ class PackDependencies:
         Returns:
             list: collection of content pack items.
         """
-        return list(
-            filter(lambda s: next(iter(s.values())).get("pack") == pack_id, items_list)
-        )
+        return IDSetIndex.of(items_list).by_pack(pack_id)
 
     @staticmethod
     def _should_add_item_as_dependency(
@@ -309,7 +311,7 @@ class PackDependencies:
             items_names = [items_names]
 
         pack_names = set()
-        for item in items_list:
+        for item in IDSetIndex.of(items_list).by_name(*items_names):
             item_id = list(item.keys())[0]
             item_details = list(item.values())[0]
 
@@ -388,7 +390,11 @@ class PackDependencies:
                     f"{item_name}-mapper",
                 ]
 
-            for item_from_id_set in items_list:
+            for item_from_id_set in IDSetIndex.of(items_list).find(
+                ids=item_possible_ids,
+                names=[item_name],
+                aliases=item_possible_ids if item_type == "incidentfield" else (),
+            ):
                 item_id = list(item_from_id_set.keys())[0]
                 item_details = list(item_from_id_set.values())[0]
                 id_set_item_aliases = set(item_details.get("aliases", []))
@@ -439,7 +445,7 @@ class PackDependencies:
         """
         packs_and_items_dict: dict = {}
         pack_names: set = set()
-        for item in id_set["integrations"]:
+        for item in IDSetIndex(id_set).section("integrations").by_command(command):
             item_id = list(item.keys())[0]
             item_details = list(item.values())[0]
 
@@ -2902,8 +2908,7 @@ class PackDependencies:
         """
 
         if id_set_path and Path(id_set_path).is_file():
-            with open(id_set_path) as id_set_file:
-                id_set = json.load(id_set_file)
+            id_set = get_id_set(id_set_path)
         else:
             if skip_id_set_creation:
                 return {}
@@ -24,6 +24,7 @@ from demisto_sdk.commands.common.constants import (
     DemistoException,
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
 from demisto_sdk.commands.common.docker_helper import init_global_docker_client
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.logger import logger
@@ -322,21 +323,18 @@ class LintManager:
         Returns:
             list: A list of integration, script and beta_integration names.
         """
-        # Get packages from main content path
-        content_main_pkgs: set = set(
-            Path(content_dir).glob(
-                [
-                    "Integrations/*/",
-                    "Scripts/*/",
-                ]
+        repo_index = ContentRepoIndex.get(content_dir, refresh=True)
+        # Get packages from main content path and from packs path
+        all_pkgs = {
+            Path(pkg)
+            for pattern in (
+                "Integrations/*/",
+                "Scripts/*/",
+                "Packs/*/Integrations/*/",
+                "Packs/*/Scripts/*/",
             )
-        )
-        # Get packages from packs path
-        packs_dir: Path = Path(content_dir) / "Packs"
-        content_packs_pkgs: set = set(
-            packs_dir.glob(["*/Integrations/*/", "*/Scripts/*/"])
-        )
-        all_pkgs = content_packs_pkgs.union(content_main_pkgs)
+            for pkg in repo_index.glob(os.path.join(content_dir, pattern))
+        }
 
         return list(all_pkgs)
 
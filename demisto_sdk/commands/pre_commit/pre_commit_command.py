@@ -19,7 +19,10 @@ from demisto_sdk.commands.common.constants import (
     SCRIPTS_DIR,
 )
 from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH, PYTHONPATH
-from demisto_sdk.commands.common.docker_helper import get_python_version
+from demisto_sdk.commands.common.docker_helper import (
+    get_python_version,
+    prefetch_python_versions,
+)
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.handlers import DEFAULT_YAML_HANDLER as yaml
 from demisto_sdk.commands.common.logger import logger
@@ -237,11 +240,17 @@ def group_by_python_version(files: Set[Path]) -> Dict[str, set]:
             BaseContent.from_path, integrations_scripts_mapping.keys()
         )
 
+    integrations_scripts = [
+        integration_script
+        for integration_script in integrations_scripts
+        if integration_script and isinstance(integration_script, IntegrationScript)
+    ]
+    prefetch_python_versions(
+        integration_script.docker_image
+        for integration_script in integrations_scripts
+        if not integration_script.deprecated
+    )
     for integration_script in integrations_scripts:
-        if not integration_script or not isinstance(
-            integration_script, IntegrationScript
-        ):
-            continue
         if integration_script.deprecated:
             logger.info(
                 f"Skipping pre-commit on deprecated integration {integration_script.name}"
@@ -0,0 +1,394 @@
+import io
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from contextlib import ExitStack, redirect_stdout
+from hashlib import sha1
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import (
+    PACKS_DIR,
+    PACKS_PACK_IGNORE_FILE_NAME,
+)
+from demisto_sdk.commands.common.errors import (
+    FOUND_FILES_AND_ERRORS,
+    FOUND_FILES_AND_IGNORED_ERRORS,
+)
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.schema_validation import (
+    SCHEMAS_DIR,
+    get_compiled_schema,
+)
+
+if TYPE_CHECKING:
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
+
+logger = logging.getLogger("demisto-sdk")
+
+VALIDATE_DAEMON_DIR = "validate_daemon"
+# how often the daemon checks whether the files its state was built from changed
+WATCH_INTERVAL_SECONDS = 1.0
+
+FileState = Optional[Tuple[int, int]]
+
+
+def get_daemon_socket_path(content_path: os.PathLike) -> Path:
+    """Returns the path of the socket the validation daemon of a content repository listens on."""
+    repo_key = sha1(os.path.abspath(content_path).encode()).hexdigest()[:16]
+    return get_sdk_cache_dir() / VALIDATE_DAEMON_DIR / f"{repo_key}.sock"
+
+
+def _file_state(path: Path) -> FileState:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class RepoWatcher(threading.Thread):
+    """
+    Polls the files the state of the daemon was built from, and calls `on_change` with the ones which were
+    added, modified or removed since the last poll.
+    The content files themselves are not watched, they are read again whenever they are validated (the parsed files
+    cache checks their size and mtime).
+    """
+
+    def __init__(
+        self,
+        watched_paths: Callable[[], List[Path]],
+        on_change: Callable[[List[Path]], None],
+        interval: float = WATCH_INTERVAL_SECONDS,
+    ):
+        super().__init__(name="validate-daemon-watcher", daemon=True)
+        self.watched_paths = watched_paths
+        self.on_change = on_change
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._states = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, FileState]:
+        return {path: _file_state(path) for path in self.watched_paths()}
+
+    def poll(self) -> List[Path]:
+        """Returns the watched files which changed since the last poll."""
+        states = self._snapshot()
+        changed = [
+            path
+            for path in states.keys() | self._states.keys()
+            if states.get(path) != self._states.get(path)
+        ]
+        self._states = states
+        return sorted(changed)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                if changed := self.poll():
+                    self.on_change(changed)
+            except Exception:
+                logger.debug("Failed handling the changed files", exc_info=True)
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class _LogRecordsSerializer(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: List[Dict[str, Any]] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append({"level": record.levelno, "message": record.getMessage()})
+
+
+class _DaemonServer(socketserver.ThreadingUnixStreamServer):
+    # connections kept open by editors must not keep the daemon from stopping
+    daemon_threads = True
+    block_on_close = False
+
+
+class ValidationDaemon:
+    """
+    Validates content paths on request, keeping warm everything a validate run otherwise sets up again: the imported
+    modules, the compiled schemas, the repository index, the git state, the id_set and conf.json, the `.pack-ignore`
+    ignored errors and the MDX server.
+
+    Requests are read from a unix socket, a JSON object per line:
+    - {"command": "validate", "paths": [...]} - validates the paths, like `validate -i` with the options the daemon
+      was started with. Answers with the exit code, the log records and the stdout of the validation, and the errors.
+    - {"command": "status"} - answers with the repository and the number of requests handled.
+    - {"command": "stop"} - stops the daemon.
+    A connection may send any number of requests (e.g. an editor validating on save), and they are handled one at
+    a time, as validations share the state of the validate manager.
+
+    A watcher reloads the state whenever the files it was built from change: a `.pack-ignore` drops the ignored errors
+    of its pack, the git index and remote refs drop the git objects and changes read so far, and any other watched
+    file (conf.json, the id_set, the git HEAD) creates a new validate manager. Any change also lets the hosts which
+    could not be connected to be tried again.
+    """
+
+    def __init__(
+        self,
+        create_validate_manager: Callable[[], "ValidateManager"],
+        content_path: os.PathLike,
+        socket_path: Optional[Path] = None,
+        watch_interval: float = WATCH_INTERVAL_SECONDS,
+    ):
+        self.create_validate_manager = create_validate_manager
+        self.content_path = Path(os.path.abspath(content_path))
+        self.socket_path = socket_path or get_daemon_socket_path(self.content_path)
+        self.watch_interval = watch_interval
+        self.lock = threading.Lock()
+        self.requests_handled = 0
+        self.server: Optional[_DaemonServer] = None
+        self.validate_manager = self._create_validate_manager()
+
+    def _create_validate_manager(self) -> "ValidateManager":
+        return self.create_validate_manager()
+
+    def watched_paths(self) -> List[Path]:
+        from demisto_sdk.commands.common.content_constant_paths import CONF_PATH
+
+        paths = [Path(CONF_PATH), Path(self.validate_manager.id_set_path)]
+        if self.validate_manager.git_util:
+            paths.append(Path(self.validate_manager.git_util.repo.git_dir) / "HEAD")
+            paths.extend(self.git_state_paths())
+        packs_path = self.content_path / PACKS_DIR
+        try:
+            with os.scandir(packs_path) as packs:
+                paths.extend(
+                    packs_path / pack.name / PACKS_PACK_IGNORE_FILE_NAME
+                    for pack in packs
+                    if pack.is_dir()
+                )
+        except OSError:
+            pass
+        return paths
+
+    def git_state_paths(self) -> List[Path]:
+        """
+        Returns the files git changes once the index or the remote branches change (e.g. by `git add` or
+        `git fetch`), as the changed files and the files of the remote branches are read through them.
+        """
+        git_dir = Path(self.validate_manager.git_util.repo.git_dir)
+        paths = [git_dir / "index", git_dir / "packed-refs", git_dir / "FETCH_HEAD"]
+        # a ref is updated by renaming a lock file over it, which changes the directory of the ref
+        paths.extend(
+            Path(directory) for directory, _, _ in os.walk(git_dir / "refs" / "remotes")
+        )
+        return paths
+
+    def on_change(self, changed: List[Path]):
+        from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+        from demisto_sdk.commands.common.http_client import get_http_client
+
+        with self.lock:
+            # a host which could not be connected to may be reachable by now
+            get_http_client().forget_unreachable_hosts()
+            git_state_paths = (
+                set(self.git_state_paths()) if self.validate_manager.git_util else set()
+            )
+            if any(path in git_state_paths for path in changed):
+                logger.debug(
+                    "Reloading the git state, as the index or a remote changed"
+                )
+                GitObjectReader.clear()
+                self.validate_manager.git_util.clear_change_snapshots()
+            if any(
+                path.name != PACKS_PACK_IGNORE_FILE_NAME and path not in git_state_paths
+                for path in changed
+            ):
+                logger.info(
+                    f"Reloading the validation state, as {', '.join(map(str, changed))} changed"
+                )
+                self.validate_manager = self._create_validate_manager()
+                return
+            for path in changed:
+                if path.name == PACKS_PACK_IGNORE_FILE_NAME:
+                    logger.debug(f"Reloading the ignored errors of {path}")
+                    self.validate_manager.pack_error_ignore_lists.pop(
+                        path.parent.name, None
+                    )
+
+    def warm_up(self):
+        """Loads what the first validations would otherwise load: the repository index and the schemas."""
+        from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+
+        start = time.perf_counter()
+        ContentRepoIndex.get(self.content_path, refresh=True).build()
+        for schema_path in SCHEMAS_DIR.glob("*.yml"):
+            try:
+                get_compiled_schema(schema_path.stem)
+            except Exception as e:
+                logger.debug(f"Could not compile the schema {schema_path}: {e}")
+        logger.debug(f"Warmed up in {time.perf_counter() - start:.2f} seconds")
+
+    def validate(self, paths: List[str]) -> Dict[str, Any]:
+        """Validates the paths, returning what validating them wrote instead of writing it."""
+        with self.lock:
+            validate_manager = self.validate_manager
+            # every request is reported on its own, like a separate validate run
+            del FOUND_FILES_AND_ERRORS[:]
+            del FOUND_FILES_AND_IGNORED_ERRORS[:]
+            validate_manager.ignored_files.clear()
+            validate_manager.file_path = ",".join(
+                os.path.abspath(path) for path in paths
+            )
+
+            serializer = _LogRecordsSerializer()
+            handlers, logger.handlers = logger.handlers, [serializer]
+            stdout = io.StringIO()
+            start = time.perf_counter()
+            try:
+                with redirect_stdout(stdout):
+                    exit_code = validate_manager.run_validation()
+            except Exception as e:
+                logger.exception(f"Failed validating {', '.join(paths)}: {e}")
+                exit_code = 1
+            finally:
+                logger.handlers = handlers
+            duration = time.perf_counter() - start
+            errors = list(FOUND_FILES_AND_ERRORS)
+            self.requests_handled += 1
+
+        logger.info(
+            f"Validated {', '.join(paths)} in {duration:.2f} seconds ({'valid' if not exit_code else 'invalid'})"
+        )
+        return {
+            "exit_code": exit_code,
+            "log_records": serializer.records,
+            "stdout": stdout.getvalue(),
+            "errors": errors,
+            "duration": duration,
+        }
+
+    def handle_request(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"error": "A request must be a JSON object"}
+        command = request.get("command")
+        if command == "validate":
+            paths = request.get("paths")
+            if not paths or not isinstance(paths, list):
+                return {"error": "The validate command requires a list of paths"}
+            return self.validate(paths)
+        if command == "status":
+            return {
+                "content_path": str(self.content_path),
+                "pid": os.getpid(),
+                "requests_handled": self.requests_handled,
+            }
+        if command == "stop":
+            if self.server is not None:
+                # shutdown waits for the server loop, which is waiting for this request
+                threading.Thread(target=self.server.shutdown).start()
+            return {"stopping": True}
+        return {"error": f"Unknown command {command}"}
+
+    def serve_forever(self) -> int:
+        """Serves requests until the daemon is stopped (by a stop request, or by ctrl+c)."""
+        from demisto_sdk.commands.common.hook_validations.readme import (
+            ReadMeValidator,
+        )
+
+        if not hasattr(socket, "AF_UNIX"):
+            logger.error("[red]The validation daemon requires unix sockets[/red]")
+            return 1
+        if self.socket_path.exists():
+            if request_daemon({"command": "status"}, self.socket_path) is not None:
+                logger.error(
+                    f"[red]A validation daemon is already running for {self.content_path}[/red]"
+                )
+                return 1
+            self.socket_path.unlink()  # left behind by a daemon which did not stop cleanly
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.warm_up()
+        daemon = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.handle_request(json.loads(line))
+                    except ValueError as e:
+                        response = {"error": f"Invalid request: {e}"}
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+
+        watcher = RepoWatcher(self.watched_paths, self.on_change, self.watch_interval)
+        with ExitStack() as stack:
+            if self.validate_manager.is_possible_validate_readme:
+                ReadMeValidator.add_node_env_vars()
+                try:
+                    stack.enter_context(
+                        ReadMeValidator.start_mdx_server(
+                            handle_error=self.validate_manager.handle_error
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"[yellow]Could not start the MDX server, it will be started for every README: {e}[/yellow]"
+                    )
+            self.server = stack.enter_context(
+                _DaemonServer(str(self.socket_path), RequestHandler)
+            )
+            stack.callback(self.socket_path.unlink, missing_ok=True)
+            os.chmod(self.socket_path, 0o600)
+            watcher.start()
+            stack.callback(watcher.stop)
+            logger.info(
+                f"[green]Validating {self.content_path} on request at {self.socket_path}[/green]"
+            )
+            try:
+                self.server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        logger.info("The validation daemon stopped")
+        return 0
+
+
+def request_daemon(
+    request: Dict[str, Any], socket_path: Path
+) -> Optional[Dict[str, Any]]:
+    """Sends a request to the daemon listening on `socket_path`, returns None if no daemon is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(socket_path))
+            with connection.makefile("rwb") as stream:
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                line = stream.readline()
+    except (OSError, AttributeError):  # AttributeError - no unix sockets
+        return None
+    return json.loads(line) if line else None
+
+
+def validate_with_daemon(
+    paths: List[str], content_path: os.PathLike, socket_path: Optional[Path] = None
+) -> Optional[int]:
+    """
+    Validates the paths with the daemon of the content repository, replaying what it wrote as if the paths were
+    validated by this process.
+
+    Returns:
+        The exit code of the validation, or None if no daemon is running for the repository.
+    """
+    response = request_daemon(
+        {"command": "validate", "paths": paths},
+        socket_path or get_daemon_socket_path(content_path),
+    )
+    if response is None:
+        return None
+    if "error" in response:
+        logger.error(f"[red]The validation daemon failed: {response['error']}[/red]")
+        return 1
+    for record in response["log_records"]:
+        logger.log(record["level"], record["message"])
+    if response["stdout"]:
+        print(response["stdout"], end="")  # noqa: T201
+    return response["exit_code"]
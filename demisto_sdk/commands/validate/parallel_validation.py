@@ -0,0 +1,456 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from collections import defaultdict
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+)
+
+import pebble
+
+from demisto_sdk.commands.common.constants import CONTENT_ENTITIES_DIRS
+from demisto_sdk.commands.common.errors import (
+    FOUND_FILES_AND_ERRORS,
+    FOUND_FILES_AND_IGNORED_ERRORS,
+)
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    collect_json_outputs,
+)
+from demisto_sdk.commands.common.timers import (
+    ValidationProfile,
+    get_validation_profiler,
+    set_validation_profiler,
+)
+
+if TYPE_CHECKING:
+    from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+    from demisto_sdk.commands.validate.validate_manager import ValidateManager
+
+logger = logging.getLogger("demisto-sdk")
+
+# validating fewer files than this in worker processes is slower than validating them in the main process
+MIN_FILES_FOR_PARALLEL_VALIDATION = 8
+VALIDATION_DURATIONS_CACHE_NAME = "validation_durations.json"
+# the estimated seconds validating a file takes, and every byte of it adds, before any duration was recorded.
+# once durations were recorded, only the ratio between the two matters
+FILE_VALIDATION_COST = 0.05
+BYTE_VALIDATION_COST = 0.0000005
+# a pack estimated to take more than this share of the time every worker has is validated as a task per directory
+SPLIT_PACK_WORKER_SHARE = 0.5
+# the weight of the last duration in the recorded one, which smooths a single slow (or fast) run
+DURATION_SMOOTHING = 0.5
+
+
+class FileValidationTask(NamedTuple):
+    """The arguments of `ValidateManager.run_validations_on_file`."""
+
+    file_path: str
+    pack_error_ignore_list: dict
+    is_modified: bool = False
+    old_file_path: Optional[str] = None
+    modified_files: Optional[Set[str]] = None
+    added_files: Optional[Set[str]] = None
+
+
+class FileValidationResult(NamedTuple):
+    """Everything validating a file in a worker process produced, to be collected by the main process."""
+
+    is_valid: bool
+    log_records: List[logging.LogRecord]
+    stdout: str  # e.g. GitHub annotations
+    found_errors: List[str]
+    found_ignored_errors: List[str]
+    ignored_files: Set[str]
+    packs_with_mp_change: Set[str]
+    json_outputs: list
+    error: Optional[str] = None
+    profile: Optional[ValidationProfile] = None
+
+
+class PackValidationTask(NamedTuple):
+    """
+    Validating a pack, or a part of it:
+    - None content_dir - the whole pack.
+    - An empty content_dir - the pack unique files (pack_metadata.json, README.md etc.).
+    - A content entity content_dir (e.g. Integrations) - the content in that directory.
+    """
+
+    pack_path: str
+    content_dir: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        """The path the duration of the task is recorded by."""
+        if self.content_dir is None:
+            return os.path.abspath(self.pack_path)
+        return os.path.join(os.path.abspath(self.pack_path), self.content_dir)
+
+
+class PackValidationResult(NamedTuple):
+    """The result of validating a pack in a worker process, with only the errors found in that pack."""
+
+    is_valid: bool
+    found_errors: List[str]
+    found_ignored_errors: List[str]
+    ignored_files: Set[str]
+    json_outputs: list
+    profile: Optional[ValidationProfile] = None
+    task: Optional[PackValidationTask] = None
+    duration: float = 0.0
+
+
+class ValidationDurationsStore:
+    """
+    How long validating packs (and parts of packs) took in earlier runs, keyed by their absolute paths,
+    so validate -a can start with the packs which take the longest.
+    Without a path, the store is kept in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._durations: Optional[Dict[str, float]] = None
+        self._updated_paths: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, float]:
+        if self.path is None:
+            return {}
+        try:
+            with self.path.open() as store_file:
+                return json.load(store_file)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Could not load the validation durations {self.path}: {e}")
+            return {}
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        with self._lock:
+            if self._durations is None:
+                self._durations = self._load()
+            return self._durations
+
+    def get(self, path: str) -> Optional[float]:
+        return self.durations.get(path)
+
+    def record(self, path: str, duration: float):
+        """Records the duration of validating a path, smoothed with the duration recorded before."""
+        durations = self.durations
+        with self._lock:
+            if (previous := durations.get(path)) is not None:
+                duration = (
+                    DURATION_SMOOTHING * duration + (1 - DURATION_SMOOTHING) * previous
+                )
+            durations[path] = duration
+            self._updated_paths.add(path)
+
+    def save(self):
+        """Writes the durations recorded by this process, on top of the ones written by others in the meantime."""
+        if self.path is None or not self._updated_paths:
+            return
+        with self._lock:
+            durations = self._load()
+            durations.update(
+                {path: self._durations[path] for path in self._updated_paths}  # type: ignore[index]
+            )
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with temp_path.open("w") as store_file:
+                    json.dump(durations, store_file)
+                os.replace(temp_path, self.path)
+                self._updated_paths.clear()
+            except OSError as e:
+                logger.debug(f"Could not save the validation durations: {e}")
+
+
+_validation_durations_store: Optional[ValidationDurationsStore] = None
+
+
+def get_validation_durations_store() -> ValidationDurationsStore:
+    """Returns the validation durations store shared by the whole process, kept under the SDK cache dir."""
+    global _validation_durations_store
+    if _validation_durations_store is None:
+        _validation_durations_store = ValidationDurationsStore(
+            get_sdk_cache_dir() / VALIDATION_DURATIONS_CACHE_NAME
+        )
+    return _validation_durations_store
+
+
+def set_validation_durations_store(store: Optional[ValidationDurationsStore]):
+    """Replaces the shared store (e.g. with an in-memory one), None resets it to the default."""
+    global _validation_durations_store
+    _validation_durations_store = store
+
+
+def schedule_pack_tasks(
+    pack_paths: Iterable[str],
+    workers: int,
+    repo_index: "ContentRepoIndex",
+    durations_store: ValidationDurationsStore,
+) -> List[PackValidationTask]:
+    """
+    Returns the tasks validating the packs, the longest first, so no long task starts when the other workers
+    are about to be idle.
+
+    A task is estimated by the duration recorded for it in earlier runs. Without one, it is estimated by the number and
+    size of its files, scaled to the durations recorded for the other tasks.
+    A pack estimated to take more than SPLIT_PACK_WORKER_SHARE of the time of a worker (when the work is split evenly)
+    is split into a task for its unique files, and a task for each of its content entity directories.
+    """
+    # pack path -> content dir ("" for the pack unique files) -> the heuristic cost of its files
+    heuristic_costs: Dict[str, Dict[str, float]] = {}
+    for pack_path in pack_paths:
+        pack_costs = heuristic_costs[pack_path] = defaultdict(float, {"": 0.0})
+        for file in repo_index.iter_files(pack_path):
+            content_dir = file.entity_dir or ""
+            if content_dir and content_dir not in CONTENT_ENTITIES_DIRS:
+                # not validated, like the other files outside the content entity directories
+                continue
+            pack_costs[content_dir] += (
+                FILE_VALIDATION_COST + BYTE_VALIDATION_COST * file.size
+            )
+
+    # calibrates the heuristic costs to the durations of the tasks which were recorded
+    recorded_duration = recorded_cost = 0.0
+    for pack_path, pack_costs in heuristic_costs.items():
+        if (
+            duration := durations_store.get(PackValidationTask(pack_path).path)
+        ) is not None:
+            recorded_duration += duration
+            recorded_cost += sum(pack_costs.values())
+            continue
+        for content_dir, cost in pack_costs.items():
+            task_path = PackValidationTask(pack_path, content_dir).path
+            if (duration := durations_store.get(task_path)) is not None:
+                recorded_duration += duration
+                recorded_cost += cost
+    scale = (
+        recorded_duration / recorded_cost
+        if recorded_duration and recorded_cost
+        else 1.0
+    )
+
+    pack_estimates: Dict[str, float] = {}
+    parts_estimates: Dict[str, Dict[PackValidationTask, float]] = {}
+    for pack_path, pack_costs in heuristic_costs.items():
+        pack_duration = durations_store.get(PackValidationTask(pack_path).path)
+        # parts of a pack which was validated as a whole take their share of its duration
+        part_scale = (
+            pack_duration / sum(pack_costs.values())
+            if pack_duration is not None and sum(pack_costs.values())
+            else scale
+        )
+        parts_estimates[pack_path] = {}
+        for content_dir, cost in pack_costs.items():
+            task = PackValidationTask(pack_path, content_dir)
+            duration = durations_store.get(task.path)
+            parts_estimates[pack_path][task] = (
+                duration if duration is not None else part_scale * cost
+            )
+        pack_estimates[pack_path] = (
+            pack_duration
+            if pack_duration is not None
+            else sum(parts_estimates[pack_path].values())
+        )
+
+    split_threshold = (
+        SPLIT_PACK_WORKER_SHARE * sum(pack_estimates.values()) / max(workers, 1)
+    )
+    estimated_tasks: Dict[PackValidationTask, float] = {}
+    for pack_path, pack_estimate in pack_estimates.items():
+        if (
+            workers > 1
+            and pack_estimate > split_threshold
+            and len(parts_estimates[pack_path]) > 1
+        ):
+            estimated_tasks.update(parts_estimates[pack_path])
+        else:
+            estimated_tasks[PackValidationTask(pack_path)] = pack_estimate
+    # sorted is stable, so tasks estimated the same keep the order of the packs
+    return sorted(estimated_tasks, key=estimated_tasks.__getitem__, reverse=True)
+
+
+def record_pack_durations(
+    durations_store: ValidationDurationsStore,
+    results: Iterable[PackValidationResult],
+):
+    """Records the durations of the tasks, and of every pack which was validated as several tasks."""
+    split_packs_durations: Dict[str, float] = defaultdict(float)
+    for result in results:
+        if result.task is None:
+            continue
+        durations_store.record(result.task.path, result.duration)
+        if result.task.content_dir is not None:
+            split_packs_durations[result.task.pack_path] += result.duration
+    for pack_path, duration in split_packs_durations.items():
+        durations_store.record(PackValidationTask(pack_path).path, duration)
+
+
+class _LogRecordsCollector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        # the records are pickled back to the main process, where the arguments may not be available
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+_worker_validate_manager: Optional["ValidateManager"] = None
+
+
+def init_worker(validate_manager: Optional["ValidateManager"], log_level: int):
+    """Runs once in every worker process, so the manager is not sent with every task."""
+    global _worker_validate_manager
+    if validate_manager is not None:
+        _worker_validate_manager = validate_manager
+    logger.setLevel(log_level)
+    profiler = _worker_validate_manager.profiler  # type: ignore[union-attr]
+    if profiler is not None:
+        # the times the manager measured before the pool started are reported by the main process
+        profiler.pop_profile()
+    set_validation_profiler(profiler)
+
+
+@contextmanager
+def validation_pool(
+    validate_manager: "ValidateManager", max_workers: int
+) -> Iterator[pebble.ProcessPool]:
+    """
+    A pool of worker processes validating with `validate_manager`.
+    The manager (with the id_set and git state) reaches every worker once: forked workers inherit it,
+    and otherwise it is pickled through the pool initializer.
+    """
+    global _worker_validate_manager
+    inherited = multiprocessing.get_start_method() == "fork"
+    if inherited:
+        # workers may be (re)started as long as the pool is open
+        _worker_validate_manager = validate_manager
+    try:
+        with pebble.ProcessPool(
+            max_workers=max_workers,
+            initializer=init_worker,
+            initargs=(
+                None if inherited else validate_manager,
+                logger.getEffectiveLevel(),
+            ),
+        ) as pool:
+            yield pool
+    finally:
+        _worker_validate_manager = None
+
+
+def validate_file_in_worker(task: FileValidationTask) -> FileValidationResult:
+    return validate_file(_worker_validate_manager, task)  # type: ignore[arg-type]
+
+
+def validate_file(
+    validate_manager: "ValidateManager", task: FileValidationTask
+) -> FileValidationResult:
+    """
+    Validates a file, collecting its logs, errors and json outputs instead of writing them,
+    so the main process can report them in a deterministic order.
+    """
+    collector = _LogRecordsCollector()
+    handlers, logger.handlers = logger.handlers, [collector]
+    found_errors_count = len(FOUND_FILES_AND_ERRORS)
+    found_ignored_errors_count = len(FOUND_FILES_AND_IGNORED_ERRORS)
+    ignored_files = set(validate_manager.ignored_files)
+    packs_with_mp_change = set(validate_manager.packs_with_mp_change)
+
+    stdout = io.StringIO()
+    is_valid, error = False, None
+    try:
+        with redirect_stdout(stdout), collect_json_outputs() as json_outputs:
+            is_valid = validate_manager.run_validations_on_file(**task._asdict())
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        logger.handlers = handlers
+
+    result = FileValidationResult(
+        is_valid=is_valid,
+        log_records=collector.records,
+        stdout=stdout.getvalue(),
+        found_errors=FOUND_FILES_AND_ERRORS[found_errors_count:],
+        found_ignored_errors=FOUND_FILES_AND_IGNORED_ERRORS[
+            found_ignored_errors_count:
+        ],
+        ignored_files=validate_manager.ignored_files - ignored_files,
+        packs_with_mp_change=validate_manager.packs_with_mp_change
+        - packs_with_mp_change,
+        json_outputs=json_outputs,
+        error=error,
+        profile=_pop_profile(),
+    )
+    # the worker keeps validating other files, which must not report the errors of this one again
+    del FOUND_FILES_AND_ERRORS[found_errors_count:]
+    del FOUND_FILES_AND_IGNORED_ERRORS[found_ignored_errors_count:]
+    validate_manager.ignored_files.intersection_update(ignored_files)
+    return result
+
+
+def validate_pack_in_worker(task: PackValidationTask) -> PackValidationResult:
+    """
+    Validates a pack (or a part of it), returning only the errors found in it, rather than all the errors found by
+    the worker so far. The logs are written by the worker as the pack is validated.
+    """
+    validate_manager: "ValidateManager" = _worker_validate_manager  # type: ignore[assignment]
+    found_errors_count = len(FOUND_FILES_AND_ERRORS)
+    found_ignored_errors_count = len(FOUND_FILES_AND_IGNORED_ERRORS)
+    ignored_files = set(validate_manager.ignored_files)
+
+    start = time.perf_counter()
+    with collect_json_outputs() as json_outputs:
+        if task.content_dir is None:
+            is_valid, _ = validate_manager.run_validations_on_pack(task.pack_path)
+        else:
+            is_valid = validate_manager.run_validations_on_pack_part(
+                task.pack_path, task.content_dir
+            )
+    duration = time.perf_counter() - start
+
+    result = PackValidationResult(
+        is_valid=is_valid,
+        found_errors=FOUND_FILES_AND_ERRORS[found_errors_count:],
+        found_ignored_errors=FOUND_FILES_AND_IGNORED_ERRORS[
+            found_ignored_errors_count:
+        ],
+        ignored_files=validate_manager.ignored_files - ignored_files,
+        json_outputs=json_outputs,
+        profile=_pop_profile(),
+        task=task,
+        duration=duration,
+    )
+    # like a file validated by `validate_file`, the errors of this pack are reported by the main process only
+    del FOUND_FILES_AND_ERRORS[found_errors_count:]
+    del FOUND_FILES_AND_IGNORED_ERRORS[found_ignored_errors_count:]
+    validate_manager.ignored_files.intersection_update(ignored_files)
+    return result
+
+
+def _pop_profile() -> Optional[ValidationProfile]:
+    profiler = get_validation_profiler()
+    return profiler.pop_profile() if profiler is not None else None
@@ -0,0 +1,253 @@
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from hashlib import sha1
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from demisto_sdk.commands.common.constants import (
+    PACKS_DIR,
+    PACKS_PACK_META_FILE_NAME,
+    RELEASE_NOTES_DIR,
+)
+from demisto_sdk.commands.common.content_hash_index import (
+    ContentHashIndex,
+    content_item_key,
+)
+from demisto_sdk.commands.common.file_cache import get_sdk_version
+from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
+from demisto_sdk.commands.validate.parallel_validation import (
+    FileValidationResult,
+    FileValidationTask,
+)
+
+logger = logging.getLogger("demisto-sdk")
+
+VALIDATION_RESULTS_CACHE_NAME = "validation_results.sqlite"
+RESULTS_CACHE_FORMAT_VERSION = 1
+DEFAULT_RESULTS_CACHE_MAX_MB = 256
+# results are replayed for a day at most, as some validations depend on remote state (e.g. the latest docker image)
+RESULTS_CACHE_TTL = 24 * 60 * 60
+# the fraction of the max size the cache is trimmed to, once it exceeds the max size
+EVICTION_TARGET_RATIO = 0.8
+# how many writes are done between two size checks
+EVICTION_CHECK_INTERVAL = 200
+SQLITE_TIMEOUT_SECONDS = 30
+
+
+def hash_json(data: Any) -> str:
+    return sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class ValidationResultsCache:
+    """
+    An on-disk cache of the results of validating files (validity, errors, logs and json outputs), shared between runs
+    and between worker processes, so files which did not change since an earlier run are not validated again.
+
+    The entries are keyed by `ValidationResultsKeys`, and are replayed for RESULTS_CACHE_TTL at most.
+    The cache is bounded by `max_size_bytes`, least recently used entries are evicted first.
+    Every process opens its own sqlite connection, and any sqlite error disables the cache for the rest of the process,
+    it is never allowed to fail a validation.
+    """
+
+    def __init__(
+        self,
+        cache_path: Union[Path, str],
+        max_size_bytes: int = DEFAULT_RESULTS_CACHE_MAX_MB * 1024 * 1024,
+        ttl: float = RESULTS_CACHE_TTL,
+    ):
+        self.cache_path = Path(cache_path)
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.disabled = False
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # sent to the worker processes, which open their own connection
+        state = self.__dict__.copy()
+        state["_connection"] = state["_connection_pid"] = None
+        return state
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None and self._connection_pid == os.getpid():
+            return self._connection
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            str(self.cache_path),
+            timeout=SQLITE_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, "
+            "data BLOB NOT NULL, "
+            "stored_at REAL NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access)"
+        )
+        self._connection = connection
+        self._connection_pid = os.getpid()
+        return connection
+
+    def _disable(self, error: Exception):
+        logger.debug(
+            f"Disabling the validation results cache at {self.cache_path}: {error}",
+            exc_info=True,
+        )
+        self.disabled = True
+
+    def get(self, key: str) -> Optional[FileValidationResult]:
+        """Returns the result stored under `key`, or None if there is no such result, or it expired."""
+        if self.disabled:
+            return None
+        try:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT data, stored_at FROM results WHERE key=?", (key,)
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                self.misses += 1
+                return None
+            connection.execute(
+                "UPDATE results SET last_access=? WHERE key=?", (time.time(), key)
+            )
+            result = pickle.loads(row[0])
+        except (sqlite3.Error, OSError, pickle.UnpicklingError) as e:
+            self._disable(e)
+            return None
+        self.hits += 1
+        return result
+
+    def set(self, key: str, result: FileValidationResult):
+        """Stores the result of validating a file, without its profile."""
+        if self.disabled:
+            return
+        try:
+            blob = pickle.dumps(
+                result._replace(profile=None), protocol=pickle.HIGHEST_PROTOCOL
+            )
+            now = time.time()
+            self._connect().execute(
+                "INSERT OR REPLACE INTO results (key, data, stored_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), now, now),
+            )
+            self.writes += 1
+            if self.writes % EVICTION_CHECK_INTERVAL == 1:
+                self.evict()
+        except (sqlite3.Error, OSError, pickle.PicklingError) as e:
+            self._disable(e)
+
+    def evict(self):
+        """Removes the expired entries, and then the least recently used ones, until the cache is below its target size."""
+        connection = self._connect()
+        connection.execute(
+            "DELETE FROM results WHERE stored_at<?", (time.time() - self.ttl,)
+        )
+        (total_size,) = connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM results"
+        ).fetchone()
+        if total_size <= self.max_size_bytes:
+            return
+        to_free = total_size - int(self.max_size_bytes * EVICTION_TARGET_RATIO)
+        freed = 0
+        stale_keys = []
+        for key, size in connection.execute(
+            "SELECT key, LENGTH(data) FROM results ORDER BY last_access"
+        ):
+            if freed >= to_free:
+                break
+            stale_keys.append((key,))
+            freed += size
+        connection.executemany("DELETE FROM results WHERE key=?", stale_keys)
+        logger.debug(
+            f"Evicted {len(stale_keys)} entries ({freed} bytes) from the validation results cache"
+        )
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        try:
+            self._connect().execute("DELETE FROM results")
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+
+class ValidationResultsKeys:
+    """
+    Builds the cache keys of validating files, which change whenever anything the validation of a file reads changes:
+    - The hashes of the content item of the file (its yml, code, README, description, image etc.),
+      or of the whole pack for pack level files and release notes.
+    - The hash of the pack metadata.
+    - The arguments of the validation, including the `.pack-ignore` section of the file.
+    - For modified files, the commit they are compared with.
+    - The run key: the validate options, the repository level files (conf.json, id_set), and the sdk version.
+
+    Files outside the packs are not cached.
+    """
+
+    def __init__(
+        self,
+        hash_index: ContentHashIndex,
+        run_key: str,
+        prev_ver_key: str = "",
+    ):
+        self.hash_index = hash_index
+        self.run_key = run_key
+        self.prev_ver_key = prev_ver_key
+
+    def _content_hashes(self, relative_path: str) -> Optional[Dict[str, Any]]:
+        parts = relative_path.split("/")
+        if len(parts) < 3 or parts[0] != PACKS_DIR:
+            return None
+        pack = parts[1]
+        item = content_item_key(relative_path)
+        if item is None or parts[2] == RELEASE_NOTES_DIR:
+            # pack level files and release notes are validated against the rest of the pack
+            content_hash = self.hash_index.pack_hash(pack)
+        else:
+            content_hash = self.hash_index.item_hash(item)
+        if content_hash is None:
+            return None
+        return {
+            "content": content_hash,
+            "metadata": self.hash_index.file_hash(
+                f"{PACKS_DIR}/{pack}/{PACKS_PACK_META_FILE_NAME}"
+            ),
+        }
+
+    def key(self, task: FileValidationTask) -> Optional[str]:
+        """Returns the key of validating a file, or None if its result should not be cached."""
+        abs_path = os.path.abspath(task.file_path)
+        root = str(self.hash_index.root)
+        if not abs_path.startswith(root + os.sep):
+            return None
+        relative_path = abs_path[len(root) + 1 :].replace(os.sep, "/")
+        if (content_hashes := self._content_hashes(relative_path)) is None:
+            return None
+        return hash_json(
+            {
+                "format_version": RESULTS_CACHE_FORMAT_VERSION,
+                "sdk_version": get_sdk_version(),
+                "run": self.run_key,
+                "task": {
+                    **task._asdict(),
+                    "modified_files": sorted(task.modified_files or ()),
+                    "added_files": sorted(task.added_files or ()),
+                },
+                "prev_ver": self.prev_ver_key if task.is_modified else "",
+                **content_hashes,
+            }
+        )
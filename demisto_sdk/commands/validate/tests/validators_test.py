@@ -1,7 +1,10 @@
 import contextlib
+import copy
 import logging
 import os
 import sys
+import threading
+import time
 from configparser import ConfigParser
 from io import StringIO
 from pathlib import Path
@@ -21,9 +24,13 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.content.content import Content
 from demisto_sdk.commands.common.content_constant_paths import CONF_PATH
-from demisto_sdk.commands.common.errors import Errors
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
+from demisto_sdk.commands.common.errors import FOUND_FILES_AND_ERRORS, Errors
 from demisto_sdk.commands.common.git_util import GitUtil
-from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
+from demisto_sdk.commands.common.hook_validations.base_validator import (
+    BaseValidator,
+    error_codes,
+)
 from demisto_sdk.commands.common.hook_validations.content_entity_validator import (
     ContentEntityValidator,
 )
@@ -69,12 +76,31 @@ from demisto_sdk.commands.common.hook_validations.xsiam_dashboard import (
     XSIAMDashboardValidator,
 )
 from demisto_sdk.commands.common.legacy_git_tools import git_path
+from demisto_sdk.commands.common.timers import (
+    profile_file_validation,
+    set_validation_profiler,
+)
+from demisto_sdk.commands.common.tools import get_json
 from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
     mock_integration,
 )
+from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 from demisto_sdk.commands.prepare_content.integration_script_unifier import (
     IntegrationScriptUnifier,
 )
+from demisto_sdk.commands.validate.daemon import (
+    RepoWatcher,
+    ValidationDaemon,
+    request_daemon,
+    validate_with_daemon,
+)
+from demisto_sdk.commands.validate.parallel_validation import (
+    FileValidationTask,
+    PackValidationTask,
+    ValidationDurationsStore,
+    get_validation_durations_store,
+    schedule_pack_tasks,
+)
 from demisto_sdk.commands.validate.validate_manager import ValidateManager
 from demisto_sdk.tests.constants_test import (
     CONF_JSON_MOCK_PATH,
@@ -896,13 +922,15 @@ class TestValidators:
         assert not result
 
     @staticmethod
-    def mock_unifier():
+    def mock_unifier(mocker):
         def get_script_or_integration_package_data_mock(*args, **kwargs):
             return VALID_SCRIPT_PATH, ""
 
         with patch.object(IntegrationScriptUnifier, "__init__", lambda a, b: None):
-            IntegrationScriptUnifier.get_script_or_integration_package_data = (
-                get_script_or_integration_package_data_mock
+            mocker.patch.object(
+                IntegrationScriptUnifier,
+                "get_script_or_integration_package_data",
+                get_script_or_integration_package_data_mock,
             )
             return IntegrationScriptUnifier("")
 
@@ -923,7 +951,7 @@ class TestValidators:
             ScriptValidator, "is_there_separators_in_names", return_value=True
         )
         mocker.patch.object(ScriptValidator, "is_docker_image_valid", return_value=True)
-        self.mock_unifier()
+        self.mock_unifier(mocker)
         validate_manager = ValidateManager(skip_conf_json=True)
         is_valid = validate_manager.validate_added_files([VALID_SCRIPT_PATH], None)
         assert is_valid
@@ -3299,3 +3327,560 @@ def test_get_all_files_edited_in_pack_ignore_with_git_error(mocker):
         {"Packs/test/.pack-ignore"}
     ) == {"Packs/test/Integrations/test/test.yml"}
     assert logger_warning.called
+
+
+class OutOfOrderValidateManager(ValidateManager):
+    """
+    Validates the first files slower, so parallel workers finish them last.
+    The invalid files also get a json output from a validator built with the manager, like IDSetValidations.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.other_validator = BaseValidator(json_file_path=self.json_file_path)
+
+    def run_validations_on_file(self, file_path, pack_error_ignore_list, **kwargs):
+        index = int(Path(file_path).stem)
+        time.sleep(0.02 * (10 - index))
+        logging.getLogger("demisto-sdk").info(f"Validated {file_path}")
+        if index % 2:
+            self.other_validator.json_output(file_path, "BA102", "error", False)
+            return not self.handle_error("error", "BA101", file_path=file_path)
+        self.ignored_files.add(file_path)
+        return True
+
+
+@pytest.mark.parametrize("multiprocessing", [False, True])
+def test_run_validations_on_files(tmp_path, multiprocessing):
+    """
+    Given
+        - 10 files, the odd ones are invalid, and the first ones take longer to validate
+    When
+        - Validating the files with and without multiprocessing
+    Then
+        - Ensure the results, logs, errors, ignored files and json outputs of the files are reported in the order of
+          the files, regardless of which file finished first
+    """
+    from demisto_sdk.commands.validate.parallel_validation import FileValidationTask
+
+    files = []
+    for i in range(10):
+        files.append(tmp_path / f"{i}.yml")
+        files[-1].write_text("id: test")
+    json_file_path = tmp_path / "validate_outputs.json"
+    validate_manager = OutOfOrderValidateManager(
+        multiprocessing=multiprocessing, jobs=4, json_file_path=str(json_file_path)
+    )
+    logs = StringIO()
+    handler = logging.StreamHandler(logs)
+    demisto_logger = logging.getLogger("demisto-sdk")
+    level = demisto_logger.level
+    demisto_logger.addHandler(handler)
+    demisto_logger.setLevel(logging.INFO)
+    FOUND_FILES_AND_ERRORS.clear()
+
+    try:
+        results = list(
+            validate_manager.run_validations_on_files(
+                [FileValidationTask(str(file), {}) for file in files]
+            )
+        )
+    finally:
+        demisto_logger.removeHandler(handler)
+        demisto_logger.setLevel(level)
+
+    assert results == [i % 2 == 0 for i in range(10)]
+    assert [line for line in logs.getvalue().splitlines() if "Validated" in line] == [
+        f"Validated {file}" for file in files
+    ]
+    assert FOUND_FILES_AND_ERRORS == [f"{file} - [BA101]" for file in files[1::2]]
+    assert validate_manager.ignored_files == {str(file) for file in files[::2]}
+    assert [
+        (output["filePath"], output["errorCode"])
+        for output in get_json(json_file_path)
+        if output["errorCode"] in ("BA101", "BA102")
+    ] == [
+        (str(file), error_code)
+        for file in files[1::2]
+        for error_code in ("BA102", "BA101")
+    ]
+    FOUND_FILES_AND_ERRORS.clear()
+
+
+class RecordingValidateManager(ValidateManager):
+    """Records the files it validates in `validated.txt`, and finds an error in the odd files."""
+
+    def run_validations_on_file(self, file_path, pack_error_ignore_list, **kwargs):
+        with open("validated.txt", "a") as validated:
+            validated.write(f"{file_path}\n")
+        logging.getLogger("demisto-sdk").info(f"Validated {file_path}")
+        if int(Path(file_path).stem) % 2:
+            return not self.handle_error("error", "BA101", file_path=file_path)
+        return True
+
+
+@pytest.mark.parametrize("multiprocessing", [False, True])
+def test_run_validations_on_files_with_cache(tmp_path, monkeypatch, multiprocessing):
+    """
+    Given
+        - 10 scripts in a pack, the odd ones are invalid
+    When
+        - Validating the scripts with --use-cache 3 times, with and without multiprocessing:
+          first with an empty cache, then again, and then after a script and the pack metadata are modified
+    Then
+        - Ensure the second run validates none of the scripts, and reports the same results, logs and errors
+        - Ensure the third run validates only the modified script, and all the scripts of the pack once
+          the pack metadata is modified
+    """
+    monkeypatch.setenv("DEMISTO_SDK_CACHE_DIR", str(tmp_path / "cache"))
+    repo_path = tmp_path / "content"
+    scripts = repo_path / "Packs" / "Pack" / "Scripts"
+    scripts.mkdir(parents=True)
+    (repo_path / "Packs" / "Pack" / "pack_metadata.json").write_text("{}")
+    files = [f"Packs/Pack/Scripts/{i}.yml" for i in range(10)]
+    for file in files:
+        (repo_path / file).write_text("id: script")
+    demisto_logger = logging.getLogger("demisto-sdk")
+
+    def validate_files():
+        validate_manager = RecordingValidateManager(
+            multiprocessing=multiprocessing, jobs=4, use_cache=True
+        )
+        validate_manager.results_keys = validate_manager.get_validation_results_keys()
+        logs = StringIO()
+        handler = logging.StreamHandler(logs)
+        demisto_logger.addHandler(handler)
+        FOUND_FILES_AND_ERRORS.clear()
+        try:
+            results = list(
+                validate_manager.run_validations_on_files(
+                    [FileValidationTask(file, {}) for file in files]
+                )
+            )
+        finally:
+            demisto_logger.removeHandler(handler)
+        validated = Path("validated.txt")
+        validated_files = validated.read_text().split() if validated.exists() else []
+        validated.unlink(missing_ok=True)
+        assert results == [i % 2 == 0 for i in range(10)]
+        assert [
+            line for line in logs.getvalue().splitlines() if "Validated" in line
+        ] == [f"Validated {file}" for file in files]
+        assert FOUND_FILES_AND_ERRORS == [f"{file} - [BA101]" for file in files[1::2]]
+        FOUND_FILES_AND_ERRORS.clear()
+        return sorted(validated_files)
+
+    level = demisto_logger.level
+    demisto_logger.setLevel(logging.INFO)
+    try:
+        with ChangeCWD(str(repo_path)):
+            assert validate_files() == sorted(files)
+            assert validate_files() == []
+            (repo_path / files[3]).write_text("id: modified")
+            assert validate_files() == [files[3]]
+            (repo_path / "Packs" / "Pack" / "pack_metadata.json").write_text('{"a": 1}')
+            assert validate_files() == sorted(files)
+    finally:
+        demisto_logger.setLevel(level)
+
+
+def test_validation_results_keys_with_created_id_set(tmp_path, mocker):
+    """
+    Given
+        - An id_set created in memory by validate --create-id-set, with no id_set file
+    When
+        - Getting the keys of the validation results before and after a script of another pack is added
+    Then
+        - Ensure the run key changes, so the results cached with the previous id_set are not used
+    """
+    id_set = {"scripts": [{"Script": {"name": "Script", "pack": "Pack"}}]}
+    mocker.patch.object(
+        IDSetCreator,
+        "create_id_set",
+        side_effect=lambda: (copy.deepcopy(id_set), {}, {}),
+    )
+
+    def get_run_key():
+        validate_manager = ValidateManager(
+            create_id_set=True, id_set_path=str(tmp_path / "id_set.json")
+        )
+        return validate_manager.get_validation_results_keys().run_key
+
+    run_key = get_run_key()
+    assert get_run_key() == run_key
+    id_set["scripts"].append(
+        {"OtherScript": {"name": "OtherScript", "pack": "OtherPack"}}
+    )
+    assert get_run_key() != run_key
+
+
+class ErrorPerPackValidateManager(ValidateManager):
+    """Finds a single error in every pack."""
+
+    def run_validations_on_pack(self, pack_path, skip_files=None):
+        self.handle_error("error", "BA101", file_path=f"{pack_path}/pack_metadata.json")
+        return False, FOUND_FILES_AND_ERRORS
+
+
+def test_validate_packs_with_multiprocessing():
+    """
+    Given
+        - 10 packs with an error in each, validated by 2 worker processes
+    When
+        - Validating the packs, like validate -a
+    Then
+        - Ensure every error is reported once, although each worker validated several packs
+    """
+    packs = [f"Packs/Pack{i}" for i in range(10)]
+    validate_manager = ErrorPerPackValidateManager(multiprocessing=True, jobs=2)
+    FOUND_FILES_AND_ERRORS.clear()
+
+    assert not validate_manager.validate_packs(packs, set(), 1, len(packs))
+
+    assert sorted(FOUND_FILES_AND_ERRORS) == sorted(
+        f"{pack}/pack_metadata.json - [BA101]" for pack in packs
+    )
+    FOUND_FILES_AND_ERRORS.clear()
+
+
+def create_pack_files(pack_path: Path, files_per_dir: dict):
+    pack_path.mkdir(parents=True)
+    for content_dir, files in files_per_dir.items():
+        (pack_path / content_dir).mkdir(parents=True, exist_ok=True)
+        for i in range(files):
+            (pack_path / content_dir / f"file{i}.yml").write_text("id: file")
+    (pack_path / "pack_metadata.json").write_text("{}")
+
+
+def test_schedule_pack_tasks(tmp_path):
+    """
+    Given
+        - A large pack with integrations and scripts, and 3 small packs
+    When
+        - Scheduling the packs for 2 workers, without durations of earlier runs, and then with them
+    Then
+        - Ensure the large pack is split into its unique files and content entity directories, scheduled first
+        - Ensure a pack which took longer than the others in an earlier run is split and scheduled first,
+          and the large pack which was fast is not split
+    """
+    packs = [str(tmp_path / "Packs" / name) for name in ("A", "B", "Large", "C")]
+    create_pack_files(
+        Path(packs[2]), {"Integrations": 20, "Scripts": 10, "ReleaseNotes": 50}
+    )
+    for pack in packs[:2] + packs[3:]:
+        create_pack_files(Path(pack), {"Scripts": 1})
+    repo_index = ContentRepoIndex(tmp_path)
+    durations_store = ValidationDurationsStore()
+
+    assert schedule_pack_tasks(packs, 2, repo_index, durations_store) == [
+        PackValidationTask(packs[2], "Integrations"),
+        PackValidationTask(packs[2], "Scripts"),
+        PackValidationTask(packs[0]),
+        PackValidationTask(packs[1]),
+        PackValidationTask(packs[3]),
+        PackValidationTask(packs[2], ""),
+    ]
+
+    for pack, duration in zip(packs, (1, 1, 1, 5)):
+        durations_store.record(PackValidationTask(pack).path, duration)
+    assert schedule_pack_tasks(packs, 2, repo_index, durations_store) == [
+        PackValidationTask(packs[3], "Scripts"),
+        PackValidationTask(packs[3], ""),
+        PackValidationTask(packs[0]),
+        PackValidationTask(packs[1]),
+        PackValidationTask(packs[2]),
+    ]
+
+
+class PartsValidateManager(ValidateManager):
+    """Validates packs and parts of packs without validating anything."""
+
+    def run_validations_on_pack(self, pack_path, skip_files=None):
+        return True, FOUND_FILES_AND_ERRORS
+
+    def run_validations_on_pack_part(self, pack_path, content_dir):
+        return True
+
+
+def test_validate_packs_records_durations(tmp_path):
+    """
+    Given
+        - A large pack and a small pack, validated by 2 worker processes
+    When
+        - Validating the packs, like validate -a
+    Then
+        - Ensure the durations of the large pack directories, of the large pack and of the small pack are recorded
+    """
+    packs = [str(tmp_path / "Packs" / "Large"), str(tmp_path / "Packs" / "Small")]
+    create_pack_files(Path(packs[0]), {"Integrations": 10, "Scripts": 10})
+    create_pack_files(Path(packs[1]), {})
+    validate_manager = PartsValidateManager(multiprocessing=True, jobs=2)
+
+    with ChangeCWD(str(tmp_path)):
+        assert validate_manager.validate_packs(packs, set(), 1, len(packs))
+
+    assert set(get_validation_durations_store().durations) == {
+        PackValidationTask(packs[0], "").path,
+        PackValidationTask(packs[0], "Integrations").path,
+        PackValidationTask(packs[0], "Scripts").path,
+        PackValidationTask(packs[0]).path,
+        PackValidationTask(packs[1]).path,
+    }
+
+
+class SlowCheckValidator(BaseValidator):
+    @error_codes("BA101")
+    def is_valid_slowly(self):
+        time.sleep(0.01)
+        return True
+
+
+class ProfiledValidateManager(ValidateManager):
+    """Validates a script in every pack with a single slow check."""
+
+    @profile_file_validation
+    def run_validations_on_file(self, file_path, pack_error_ignore_list, **kwargs):
+        return SlowCheckValidator().is_valid_slowly()
+
+    def run_validations_on_pack(self, pack_path, skip_files=None):
+        return (
+            self.run_validations_on_file(f"{pack_path}/Scripts/script.yml", {}),
+            FOUND_FILES_AND_ERRORS,
+        )
+
+
+@pytest.mark.parametrize("multiprocessing", [False, True])
+def test_profile_validations(tmp_path, multiprocessing):
+    """
+    Given
+        - 10 packs with a script in each, validated by a slow check
+    When
+        - Validating the packs with --profile and --profile-trace, with and without multiprocessing
+    Then
+        - Ensure the check is measured once per pack, and attributed to the script file type and to every pack
+        - Ensure the trace has an event for every script and every check, from the processes which validated them
+    """
+    packs = []
+    for i in range(10):
+        script = tmp_path / "Packs" / f"Pack{i}" / "Scripts" / "script.yml"
+        script.parent.mkdir(parents=True)
+        script.write_text("commonfields:\n  id: script\nscript: ''\ntype: python\n")
+        packs.append(str(tmp_path / "Packs" / f"Pack{i}"))
+    report_path, trace_path = tmp_path / "profile.json", tmp_path / "trace.json"
+    validate_manager = ProfiledValidateManager(
+        multiprocessing=multiprocessing,
+        jobs=2,
+        profile_path=str(report_path),
+        profile_trace_path=str(trace_path),
+    )
+
+    set_validation_profiler(validate_manager.profiler)
+    try:
+        assert validate_manager.validate_packs(packs, set(), 1, len(packs))
+    finally:
+        set_validation_profiler(None)
+    validate_manager.profiler.write_report(str(report_path), str(trace_path))
+
+    report = get_json(report_path)
+    assert [
+        (check["validator"], check["check"], check["calls"])
+        for check in report["checks"]
+    ] == [("SlowCheckValidator", "is_valid_slowly", 10)]
+    assert report["checks"][0]["self_time"] >= 0.1
+    assert [
+        (file_type["file_type"], file_type["files"])
+        for file_type in report["file_types"]
+    ] == [("script", 10)]
+    assert sorted(pack["pack"] for pack in report["packs"]) == sorted(
+        f"Pack{i}" for i in range(10)
+    )
+    assert {check["pack"] for check in report["checks_by_pack"]} == {
+        f"Pack{i}" for i in range(10)
+    }
+    events = get_json(trace_path)["traceEvents"]
+    assert sorted(event["cat"] for event in events) == ["check"] * 10 + ["script"] * 10
+    assert (os.getpid() not in {event["pid"] for event in events}) is multiprocessing
+
+
+def test_should_run_validator(repo):
+    """
+    Given
+        - A docker image validation selected with --run-specific-validations
+    When
+        - Deciding up front whether to run the docker image, README and id_set validators on an integration
+    Then
+        - Ensure the docker image and README validators run, as they do not declare all of their error codes
+        - Ensure the id_set validator, which declares all of its error codes, does not run
+    """
+    from demisto_sdk.commands.common.hook_validations.docker import (
+        DockerImageValidator,
+    )
+    from demisto_sdk.commands.common.hook_validations.id import IDSetValidations
+
+    integration = repo.create_pack("pack").create_integration("integration")
+    validate_manager = ValidateManager(specific_validations="DO106")
+
+    with ChangeCWD(repo.path):
+        assert validate_manager.should_run_validator(
+            DockerImageValidator, integration.yml.rel_path, {}
+        )
+        assert validate_manager.should_run_validator(
+            ReadMeValidator, integration.yml.rel_path, {}
+        )
+        assert not validate_manager.should_run_validator(
+            IDSetValidations, integration.yml.rel_path, {}
+        )
+
+
+class PackIgnoreValidateManager(ValidateManager):
+    """Finds an error in every file, unless its pack ignores it."""
+
+    def run_validations_on_file(self, file_path, pack_error_ignore_list, **kwargs):
+        logging.getLogger("demisto-sdk").info(f"Validated {file_path}")
+        if "BA101" in pack_error_ignore_list.get(Path(file_path).name, []):
+            return True
+        return not self.handle_error("error", "BA101", file_path=file_path)
+
+
+def test_validation_daemon(tmp_path):
+    """
+    Given
+        - A validation daemon serving a content repository
+    When
+        - Requesting to validate a script, before and after its pack ignores the error found in it, and stopping it
+    Then
+        - Ensure the requesting process reports the logs of the validation and its exit code
+        - Ensure the daemon reloads the ignored errors of the pack once its .pack-ignore changed
+        - Ensure the daemon stops and removes its socket
+    """
+    repo_path = tmp_path / "content"
+    script = repo_path / "Packs" / "Pack" / "Scripts" / "script.yml"
+    script.parent.mkdir(parents=True)
+    script.write_text("id: script")
+    socket_path = tmp_path / "daemon.sock"
+
+    def create_validate_manager():
+        validate_manager = PackIgnoreValidateManager(multiprocessing=False)
+        validate_manager.is_possible_validate_readme = False
+        return validate_manager
+
+    def validate_script():
+        logs = StringIO()
+        handler = logging.StreamHandler(logs)
+        demisto_logger.addHandler(handler)
+        try:
+            exit_code = validate_with_daemon([str(script)], repo_path, socket_path)
+        finally:
+            demisto_logger.removeHandler(handler)
+        return exit_code, logs.getvalue()
+
+    demisto_logger = logging.getLogger("demisto-sdk")
+    level = demisto_logger.level
+    demisto_logger.setLevel(logging.INFO)
+    try:
+        with ChangeCWD(str(repo_path)):
+            daemon = ValidationDaemon(
+                create_validate_manager, repo_path, socket_path, watch_interval=0.05
+            )
+            daemon_thread = threading.Thread(target=daemon.serve_forever)
+            daemon_thread.start()
+            for _ in range(100):
+                if request_daemon({"command": "status"}, socket_path):
+                    break
+                time.sleep(0.1)
+
+            exit_code, logs = validate_script()
+            assert exit_code == 1
+            assert f"Validated {script}" in logs
+            assert f"{script} - [BA101]" in logs
+
+            (script.parent.parent / ".pack-ignore").write_text(
+                "[file:script.yml]\nignore=BA101\n"
+            )
+            time.sleep(0.5)
+            exit_code, logs = validate_script()
+            assert exit_code == 0
+            assert "The files are valid" in logs
+
+            assert (
+                request_daemon({"command": "status"}, socket_path)["requests_handled"]
+                == 2
+            )
+            assert request_daemon({"command": "stop"}, socket_path) == {
+                "stopping": True
+            }
+            daemon_thread.join(timeout=10)
+    finally:
+        demisto_logger.setLevel(level)
+    assert not daemon_thread.is_alive()
+    assert not socket_path.exists()
+    assert validate_with_daemon([str(script)], repo_path, socket_path) is None
+
+
+def test_validation_daemon_reloads_git_state(mocker, tmp_path):
+    """
+    Given
+        - A validation daemon of a git repository, which read git objects, the changes of its branch and found an
+          unreachable host
+    When
+        - Staging a file, and fetching a new remote branch
+    Then
+        - Ensure the watcher finds the changes of the git index and the remote refs
+        - Ensure the git objects, the changes and the unreachable hosts are dropped, keeping the validate manager
+    """
+    from git import Repo
+
+    from demisto_sdk.commands.common.git_object_reader import GitObjectReader
+    from demisto_sdk.commands.common.http_client import get_http_client
+
+    Repo.init(tmp_path / "origin", bare=True)
+    repo_path = tmp_path / "repo"
+    repo = Repo.init(repo_path)
+    repo.git.checkout("-b", "master")
+    repo.git.config("user.email", "automatic@example.com")
+    repo.git.config("user.name", "AutomaticTest")
+    repo.create_remote("origin", str(tmp_path / "origin"))
+    (repo_path / "initial.txt").write_text("initial")
+    repo.git.add(".")
+    repo.git.commit("-m", "initial commit")
+    repo.git.push("origin", "master")
+    repo.git.fetch("origin")
+    git_util = GitUtil(repo)
+    validate_manager = mocker.MagicMock(
+        git_util=git_util,
+        id_set_path=str(tmp_path / "id_set.json"),
+        pack_error_ignore_lists={},
+    )
+    create_validate_manager = mocker.MagicMock(return_value=validate_manager)
+    daemon = ValidationDaemon(
+        create_validate_manager, repo_path, tmp_path / "daemon.sock"
+    )
+    watcher = RepoWatcher(daemon.watched_paths, daemon.on_change)
+    http_client = get_http_client()
+
+    def read_git_state():
+        GitObjectReader.get(repo_path)
+        git_util.change_snapshot("master")
+        http_client._unreachable_hosts["unreachable.com"] = time.monotonic() + 60
+
+    git_dir = Path(repo.git_dir)
+    read_git_state()
+    (repo_path / "new.txt").write_text("new")
+    repo.git.add("new.txt")
+    changed = watcher.poll()
+    assert git_dir / "index" in changed
+    daemon.on_change(changed)
+    assert not GitObjectReader._readers
+    assert not git_util._change_snapshots
+    assert not http_client._unreachable_hosts
+
+    read_git_state()
+    repo.git.push("origin", "master:branch")
+    repo.git.fetch("origin")
+    changed = watcher.poll()
+    assert git_dir / "refs" / "remotes" / "origin" in changed
+    daemon.on_change(changed)
+    assert not GitObjectReader._readers
+    assert not git_util._change_snapshots
+    assert not http_client._unreachable_hosts
+    assert create_validate_manager.call_count == 1
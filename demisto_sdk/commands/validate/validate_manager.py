@@ -1,10 +1,11 @@
+import copy
 import os
 from concurrent.futures._base import Future, as_completed
 from configparser import ConfigParser
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Callable, List, Optional, Set, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-import pebble
 from git import GitCommandError, InvalidGitRepositoryError
 from packaging import version
 
@@ -30,9 +31,12 @@ from demisto_sdk.commands.common.constants import (
 )
 from demisto_sdk.commands.common.content import Content
 from demisto_sdk.commands.common.content_constant_paths import (
+    CONF_PATH,
     CONTENT_PATH,
     DEFAULT_ID_SET_PATH,
 )
+from demisto_sdk.commands.common.content_hash_index import ContentHashIndex
+from demisto_sdk.commands.common.content_repo_index import ContentRepoIndex
 from demisto_sdk.commands.common.cpu_count import cpu_count
 from demisto_sdk.commands.common.errors import (
     FOUND_FILES_AND_ERRORS,
@@ -42,13 +46,16 @@ from demisto_sdk.commands.common.errors import (
     Errors,
     get_all_error_codes,
 )
+from demisto_sdk.commands.common.file_cache import get_sdk_cache_dir
 from demisto_sdk.commands.common.git_util import GitUtil
 from demisto_sdk.commands.common.hook_validations.author_image import (
     AuthorImageValidator,
 )
 from demisto_sdk.commands.common.hook_validations.base_validator import (
     BaseValidator,
+    append_json_outputs,
     error_codes,
+    get_validator_error_codes,
 )
 from demisto_sdk.commands.common.hook_validations.classifier import ClassifierValidator
 from demisto_sdk.commands.common.hook_validations.conf_json import ConfJsonValidator
@@ -62,6 +69,7 @@ from demisto_sdk.commands.common.hook_validations.deprecation import (
 from demisto_sdk.commands.common.hook_validations.description import (
     DescriptionValidator,
 )
+from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator
 from demisto_sdk.commands.common.hook_validations.generic_definition import (
     GenericDefinitionValidator,
 )
@@ -140,7 +148,13 @@ from demisto_sdk.commands.common.hook_validations.xsiam_report import (
 from demisto_sdk.commands.common.hook_validations.xsoar_config_json import (
     XSOARConfigJsonValidator,
 )
+from demisto_sdk.commands.common.id_set_store import IDSetStore
 from demisto_sdk.commands.common.logger import get_log_file, logger
+from demisto_sdk.commands.common.timers import (
+    ValidationProfiler,
+    profile_file_validation,
+    set_validation_profiler,
+)
 from demisto_sdk.commands.common.tools import (
     _get_file_id,
     find_type,
@@ -148,16 +162,30 @@ from demisto_sdk.commands.common.tools import (
     get_api_module_ids,
     get_file,
     get_pack_ignore_content,
+    get_pack_ignore_file_path,
     get_pack_name,
     get_pack_names_from_files,
     get_relative_path_from_packs_dir,
     get_remote_file,
     get_yaml,
     is_file_in_pack,
-    open_id_set_file,
+    prefetch_remote_files,
     run_command_os,
+    sha1_file,
+)
+from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator, get_id_set
+from demisto_sdk.commands.validate import parallel_validation
+from demisto_sdk.commands.validate.parallel_validation import (
+    MIN_FILES_FOR_PARALLEL_VALIDATION,
+    FileValidationResult,
+    FileValidationTask,
+)
+from demisto_sdk.commands.validate.results_cache import (
+    VALIDATION_RESULTS_CACHE_NAME,
+    ValidationResultsCache,
+    ValidationResultsKeys,
+    hash_json,
 )
-from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
 SKIPPED_FILES = [
     "CommonServerUserPython.py",
@@ -197,6 +225,10 @@ class ValidateManager:
         quiet_bc=False,
         multiprocessing=True,
         specific_validations=None,
+        jobs=None,
+        profile_path=None,
+        profile_trace_path=None,
+        use_cache=False,
     ):
         # General configuration
         self.skip_docker_checks = False
@@ -222,6 +254,20 @@ class ValidateManager:
         self.check_is_unskipped = check_is_unskipped
         self.conf_json_data = {}
         self.run_with_multiprocessing = multiprocessing
+        self.jobs = jobs or cpu_count()
+        self.profile_path = profile_path
+        self.profile_trace_path = profile_trace_path
+        self.profiler = (
+            ValidationProfiler(trace=bool(profile_trace_path))
+            if profile_path or profile_trace_path
+            else None
+        )
+        self.results_cache = (
+            ValidationResultsCache(get_sdk_cache_dir() / VALIDATION_RESULTS_CACHE_NAME)
+            if use_cache
+            else None
+        )
+        self.results_keys: Optional[ValidationResultsKeys] = None
         self.packs_with_mp_change = set()
         self.is_possible_validate_readme = (
             self.is_node_exist() or ReadMeValidator.is_docker_available()
@@ -289,6 +335,8 @@ class ValidateManager:
         self.always_valid = False
         self.ignored_files = set()
         self.new_packs = set()
+        # the parsed .pack-ignore of every pack, along with the content it was parsed from
+        self.pack_error_ignore_lists: Dict[str, Tuple[bytes, dict]] = {}
         self.skipped_file_types = (
             FileType.CHANGELOG,
             FileType.DOC_IMAGE,
@@ -377,21 +425,95 @@ class ValidateManager:
             )
             return 1
 
+    @property
+    def repo_index(self) -> ContentRepoIndex:
+        return ContentRepoIndex.get(os.getcwd())
+
     def run_validation(self):
         """Initiates validation in accordance with mode (i,g,a)"""
-        if self.validate_all:
-            is_valid = self.run_validation_on_all_packs()
-        elif self.use_git:
-            is_valid = self.run_validation_using_git()
-        elif self.file_path:
-            is_valid = self.run_validation_on_specific_files()
-        else:
-            # default validate to -g --post-commit
-            self.use_git = True
-            self.is_circle = True
-            is_valid = self.run_validation_using_git()
+        # the index may have been loaded by a previous run in this process, or by a previous command
+        ContentRepoIndex.get(os.getcwd(), refresh=True)
+        if self.results_cache:
+            self.results_keys = self.get_validation_results_keys()
+        set_validation_profiler(self.profiler)
+        try:
+            if self.validate_all:
+                is_valid = self.run_validation_on_all_packs()
+            elif self.use_git:
+                is_valid = self.run_validation_using_git()
+            elif self.file_path:
+                is_valid = self.run_validation_on_specific_files()
+            else:
+                # default validate to -g --post-commit
+                self.use_git = True
+                self.is_circle = True
+                is_valid = self.run_validation_using_git()
+        finally:
+            set_validation_profiler(None)
+        if self.profiler:
+            self.profiler.write_report(self.profile_path, self.profile_trace_path)
+        if self.results_cache:
+            logger.debug(
+                f"Validation results cache stats: {self.results_cache.stats()}"
+            )
         return self.print_final_report(is_valid)
 
+    def get_validation_results_keys(self) -> ValidationResultsKeys:
+        """Returns the keys of the results of this run, with the options and repository files every file depends on."""
+        repo_files = [CONF_PATH, *Path(CONF_PATH).parent.glob("Marketplace/*.json")]
+        id_set_key = None
+        if self.id_set_validations or self.id_set_file:
+            # The id_set may have been created in memory (no id_set file), so the loaded one is hashed.
+            # An id_set store is loaded lazily, so its file is hashed instead.
+            id_set_key = (
+                sha1_file(self.id_set_path)
+                if isinstance(self.id_set_file, IDSetStore)
+                else hash_json(self.id_set_file)
+            )
+        run_key = hash_json(
+            {
+                "options": {
+                    option: getattr(self, option, None)
+                    for option in (
+                        "skip_docker_checks",
+                        "skip_conf_json",
+                        "is_backward_check",
+                        "is_circle",
+                        "validate_all",
+                        "use_git",
+                        "skip_pack_rn_validation",
+                        "skip_dependencies",
+                        "skip_schema_check",
+                        "pykwalify_logs",
+                        "quiet_bc",
+                        "check_is_unskipped",
+                        "specific_validations",
+                        "is_external_repo",
+                        "check_only_schema",
+                        "print_percent",
+                        "is_possible_validate_readme",
+                        "branch_name",
+                    )
+                },
+                "json_file": bool(self.json_file_path),
+                "id_set_validations": bool(self.id_set_validations),
+                "id_set": id_set_key,
+                "log_level": logger.getEffectiveLevel(),
+                "repo_files": {
+                    str(path): sha1_file(path) for path in repo_files if path.is_file()
+                },
+            }
+        )
+        prev_ver_key = self.prev_ver or ""
+        if self.git_util and self.prev_ver:
+            try:
+                prev_ver_key = self.git_util.repo.commit(self.prev_ver).hexsha
+            except Exception as e:
+                logger.debug(f"Could not resolve {self.prev_ver}: {e}")
+        return ValidationResultsKeys(
+            ContentHashIndex.get(os.getcwd(), persistent=True), run_key, prev_ver_key
+        )
+
     @staticmethod
     def detect_file_level(file_path: str) -> PathLevel:
         """
@@ -429,18 +551,28 @@ class ValidateManager:
         if self.use_git:
             self.setup_git_params()
         files_to_validate = self.file_path.split(",")
+        paths_levels = [
+            (path, self.detect_file_level(path)) for path in files_to_validate
+        ]
+        # the files are validated ahead (possibly in parallel), and their results are reported in the input order
+        files_results = self.run_validations_on_files(
+            [
+                FileValidationTask(
+                    path, self.get_error_ignore_list(get_pack_name(path))
+                )
+                for path, file_level in paths_levels
+                if file_level == PathLevel.FILE
+            ]
+        )
 
-        for path in files_to_validate:
+        for path, file_level in paths_levels:
             error_ignore_list = self.get_error_ignore_list(get_pack_name(path))
-            file_level = self.detect_file_level(path)
 
             if file_level == PathLevel.FILE:
                 logger.info(
                     f"\n[cyan]================= Validating file {path} =================[/cyan]"
                 )
-                files_validation_result.add(
-                    self.run_validations_on_file(path, error_ignore_list)
-                )
+                files_validation_result.add(next(files_results))
 
             elif file_level == PathLevel.CONTENT_ENTITY_DIR:
                 logger.info(
@@ -485,6 +617,143 @@ class ValidateManager:
 
         return all(files_validation_result)
 
+    def should_validate_files_in_parallel(
+        self, tasks: List[FileValidationTask]
+    ) -> bool:
+        return (
+            self.run_with_multiprocessing
+            and self.jobs > 1
+            and len(tasks) >= MIN_FILES_FOR_PARALLEL_VALIDATION
+        )
+
+    def run_validations_on_files(
+        self, tasks: List[FileValidationTask]
+    ) -> Iterator[bool]:
+        """Validates files, in worker processes when there are enough of them. (g,i)
+
+        Args:
+            tasks: the files to validate, with the arguments of `run_validations_on_file`.
+
+        Returns:
+            Iterator[bool]. whether each file is valid, in the order of the tasks.
+            The logs and errors of a file are reported when its result is taken, so the output is ordered like the
+            tasks no matter which worker finished first.
+        """
+        cached_results = [
+            self.get_cached_file_validation_result(task) for task in tasks
+        ]
+        tasks_to_validate = [
+            task for task, (_, result) in zip(tasks, cached_results) if result is None
+        ]
+        if not self.should_validate_files_in_parallel(tasks_to_validate):
+            for task, cached_result in zip(tasks, cached_results):
+                yield self.run_cached_validations_on_file(task, cached_result)
+            return
+
+        logger.debug(
+            f"Validating {len(tasks_to_validate)} files with {self.jobs} processes"
+        )
+        with ExitStack() as stack:
+            if self.is_possible_validate_readme and any(
+                find_type(task.file_path) == FileType.README
+                for task in tasks_to_validate
+            ):
+                # started once here, rather than by every worker validating a README
+                ReadMeValidator.add_node_env_vars()
+                stack.enter_context(
+                    ReadMeValidator.start_mdx_server(handle_error=self.handle_error)
+                )
+            executor = stack.enter_context(
+                parallel_validation.validation_pool(
+                    self, max_workers=min(self.jobs, len(tasks_to_validate))
+                )
+            )
+            futures = iter(
+                [
+                    executor.schedule(
+                        parallel_validation.validate_file_in_worker, args=(task,)
+                    )
+                    for task in tasks_to_validate
+                ]
+            )
+            for task, (key, result) in zip(tasks, cached_results):
+                if result is None:
+                    result = next(futures).result()
+                    if key is not None and result.error is None:
+                        self.results_cache.set(key, result)  # type: ignore[union-attr]
+                yield self.collect_file_validation_result(task, result)
+
+    def get_cached_file_validation_result(
+        self, task: FileValidationTask
+    ) -> Tuple[Optional[str], Optional[FileValidationResult]]:
+        """Returns the results cache key of validating a file (None when it is not cached), and its cached result."""
+        if (
+            self.results_cache is None
+            or self.results_keys is None
+            or (key := self.results_keys.key(task)) is None
+        ):
+            return None, None
+        return key, self.results_cache.get(key)
+
+    def run_cached_validations_on_file(
+        self,
+        task: FileValidationTask,
+        cached_result: Optional[
+            Tuple[Optional[str], Optional[FileValidationResult]]
+        ] = None,
+    ) -> bool:
+        """Runs `run_validations_on_file`, or replays its result from an earlier run when nothing it depends on changed.
+
+        Args:
+            task: the file to validate, with the arguments of `run_validations_on_file`.
+            cached_result: the result of `get_cached_file_validation_result`, if it was already looked up.
+
+        Returns:
+            bool. true if file is valid, false otherwise.
+        """
+        key, result = cached_result or self.get_cached_file_validation_result(task)
+        if key is None:
+            return self.run_validations_on_file(**task._asdict())
+        if result is None:
+            result = parallel_validation.validate_file(self, task)
+            if result.error is None:
+                self.results_cache.set(key, result)  # type: ignore[union-attr]
+        return self.collect_file_validation_result(task, result)
+
+    def collect_file_validation_result(
+        self,
+        task: FileValidationTask,
+        result: parallel_validation.FileValidationResult,
+    ) -> bool:
+        """Reports what validating a file in a worker process produced, as if it was validated by this process."""
+        for record in result.log_records:
+            logger.handle(record)
+        if result.stdout:
+            print(result.stdout, end="")  # noqa: T201
+        FOUND_FILES_AND_ERRORS.extend(result.found_errors)
+        FOUND_FILES_AND_IGNORED_ERRORS.extend(result.found_ignored_errors)
+        self.ignored_files.update(result.ignored_files)
+        self.packs_with_mp_change.update(result.packs_with_mp_change)
+        if self.profiler and result.profile:
+            self.profiler.merge(result.profile)
+        if result.json_outputs:
+            append_json_outputs(self.json_file_path, result.json_outputs)
+        if result.error:
+            raise RuntimeError(f"Failed validating {task.file_path}:\n{result.error}")
+        return result.is_valid
+
+    def collect_pack_validation_result(
+        self, result: parallel_validation.PackValidationResult
+    ):
+        """Adds what validating a pack in a worker process found to the results of this process."""
+        FOUND_FILES_AND_ERRORS.extend(result.found_errors)
+        FOUND_FILES_AND_IGNORED_ERRORS.extend(result.found_ignored_errors)
+        self.ignored_files.update(result.ignored_files)
+        if self.profiler and result.profile:
+            self.profiler.merge(result.profile)
+        if result.json_outputs:
+            append_json_outputs(self.json_file_path, result.json_outputs)
+
     def wait_futures_complete(self, futures_list: List[Future], done_fn: Callable):
         """Wait for all futures to complete, Raise exception if occurred.
         Args:
@@ -495,8 +764,7 @@ class ValidateManager:
         """
         for future in as_completed(futures_list):
             try:
-                result = future.result()
-                done_fn(result[0], result[1])
+                done_fn(future.result())
             except Exception as e:
                 logger.info(
                     f"[red]An error occurred while tried to collect result, Error: {e}[/red]"
@@ -518,13 +786,10 @@ class ValidateManager:
             all_packs_valid.add(self.conf_json_validator.is_valid_conf_json())
 
         count = 1
+        # list the whole repo once, before the packs are validated (possibly by forked workers)
+        ContentRepoIndex.get(os.getcwd(), refresh=True).build()
         # Filter non-pack files that might exist locally (e.g, .DS_STORE on MacOS)
-        all_packs = list(
-            filter(
-                os.path.isdir,
-                [os.path.join(PACKS_DIR, p) for p in os.listdir(PACKS_DIR)],
-            )
-        )
+        all_packs = [os.path.join(PACKS_DIR, p) for p in self.repo_index.packs()]
         num_of_packs = len(all_packs)
         all_packs.sort(key=str.lower)
 
@@ -542,21 +807,29 @@ class ValidateManager:
     ) -> bool:
 
         if self.run_with_multiprocessing:
-            with pebble.ProcessPool(max_workers=cpu_count()) as executor:
-                futures = []
-                for pack_path in all_packs:
-                    futures.append(
-                        executor.schedule(
-                            self.run_validations_on_pack, args=(pack_path,)
-                        )
+            durations_store = parallel_validation.get_validation_durations_store()
+            tasks = parallel_validation.schedule_pack_tasks(
+                all_packs, self.jobs, self.repo_index, durations_store
+            )
+            results: List[parallel_validation.PackValidationResult] = []
+            with parallel_validation.validation_pool(self, self.jobs) as executor:
+                # the pool runs the tasks in the order they are scheduled, the longest first
+                futures = [
+                    executor.schedule(
+                        parallel_validation.validate_pack_in_worker, args=(task,)
                     )
+                    for task in tasks
+                ]
                 self.wait_futures_complete(
                     futures_list=futures,
-                    done_fn=lambda x, y: (
-                        all_packs_valid.add(x),  # type: ignore
-                        FOUND_FILES_AND_ERRORS.extend(y),  # type: ignore[func-returns-value]
+                    done_fn=lambda result: (
+                        results.append(result),  # type: ignore[func-returns-value]
+                        all_packs_valid.add(result.is_valid),  # type: ignore
+                        self.collect_pack_validation_result(result),  # type: ignore[func-returns-value]
                     ),
                 )
+            parallel_validation.record_pack_durations(durations_store, results)
+            durations_store.save()
         else:
             for pack_path in all_packs:
                 self.completion_percentage = format((count / num_of_packs) * 100, ".2f")  # type: ignore
@@ -599,7 +872,7 @@ class ValidateManager:
             self.validate_pack_unique_files(pack_path, pack_error_ignore_list)
         )
 
-        for content_dir in os.listdir(pack_path):
+        for content_dir in self.repo_index.listdir(pack_path):
             content_entity_path = os.path.join(pack_path, content_dir)
             if content_entity_path not in skip_files:
                 if content_dir in CONTENT_ENTITIES_DIRS:
@@ -613,6 +886,28 @@ class ValidateManager:
 
         return all(pack_entities_validation_results), FOUND_FILES_AND_ERRORS
 
+    def run_validations_on_pack_part(self, pack_path: str, content_dir: str) -> bool:
+        """Runs the validations of `run_validations_on_pack` on a part of a pack, so a large pack can be split between
+        processes.
+
+        Args:
+            pack_path: the path to the pack.
+            content_dir: a content entity directory of the pack, or an empty string for the pack unique files.
+
+        Returns:
+            bool. true if all files in the part are valid, false otherwise.
+        """
+        pack_error_ignore_list = self.get_error_ignore_list(os.path.basename(pack_path))
+        if content_dir:
+            return self.run_validation_on_content_entities(
+                os.path.join(pack_path, content_dir), pack_error_ignore_list
+            )
+
+        for pack_entry in self.repo_index.listdir(pack_path):
+            if pack_entry not in CONTENT_ENTITIES_DIRS:
+                self.ignored_files.add(os.path.join(pack_path, pack_entry))
+        return self.validate_pack_unique_files(pack_path, pack_error_ignore_list)
+
     def run_validation_on_content_entities(
         self, content_entity_dir_path, pack_error_ignore_list
     ):
@@ -625,9 +920,9 @@ class ValidateManager:
         if content_entity_dir_path.endswith(
             GENERIC_FIELDS_DIR
         ) or content_entity_dir_path.endswith(GENERIC_TYPES_DIR):
-            for dir_name in os.listdir(content_entity_dir_path):
+            for dir_name in self.repo_index.listdir(content_entity_dir_path):
                 dir_path = os.path.join(content_entity_dir_path, dir_name)
-                if not Path(dir_path).is_file():
+                if not self.repo_index.is_file(dir_path):
                     # should be only directories (not files) in generic types/fields directory
                     content_entities_validation_results.add(
                         self.run_validation_on_generic_entities(
@@ -637,9 +932,9 @@ class ValidateManager:
                 else:
                     self.ignored_files.add(dir_path)
         else:
-            for file_name in os.listdir(content_entity_dir_path):
+            for file_name in self.repo_index.listdir(content_entity_dir_path):
                 file_path = os.path.join(content_entity_dir_path, file_name)
-                if Path(file_path).is_file():
+                if self.repo_index.is_file(file_path):
                     if (
                         file_path.endswith(".json")
                         or file_path.endswith(".yml")
@@ -650,8 +945,8 @@ class ValidateManager:
                         )
                     ):
                         content_entities_validation_results.add(
-                            self.run_validations_on_file(
-                                file_path, pack_error_ignore_list
+                            self.run_cached_validations_on_file(
+                                FileValidationTask(file_path, pack_error_ignore_list)
                             )
                         )
                     else:
@@ -677,10 +972,12 @@ class ValidateManager:
 
     def run_validation_on_package(self, package_path, pack_error_ignore_list):
         package_entities_validation_results = set()
-        for file_name in os.listdir(package_path):
+        for file_name in self.repo_index.listdir(package_path):
             file_path = os.path.join(package_path, file_name)
             package_entities_validation_results.add(
-                self.run_validations_on_file(file_path, pack_error_ignore_list)
+                self.run_cached_validations_on_file(
+                    FileValidationTask(file_path, pack_error_ignore_list)
+                )
             )
 
         return all(package_entities_validation_results)
@@ -695,11 +992,13 @@ class ValidateManager:
         """
         package_entities_validation_results = set()
 
-        for file_name in os.listdir(dir_path):
+        for file_name in self.repo_index.listdir(dir_path):
             file_path = os.path.join(dir_path, file_name)
             if file_path.endswith(".json"):  # generic types/fields are jsons
                 package_entities_validation_results.add(
-                    self.run_validations_on_file(file_path, pack_error_ignore_list)
+                    self.run_cached_validations_on_file(
+                        FileValidationTask(file_path, pack_error_ignore_list)
+                    )
                 )
             else:
                 self.ignored_files.add(file_path)
@@ -769,6 +1068,34 @@ class ValidateManager:
         )
 
     # flake8: noqa: C901
+    def should_run_validator(
+        self, validator_class: type, file_path: str, pack_error_ignore_list: dict
+    ) -> bool:
+        """Decides up front whether any of the errors a validator may report would be reported for a file.
+
+        Args:
+            validator_class: the validator to run.
+            file_path: the file to validate.
+            pack_error_ignore_list: A dictionary of all pack ignored errors
+
+        Returns:
+            bool. False if all the error codes declared by the validator were not selected or are ignored for the
+            file, True for a validator which does not declare all of its error codes.
+        """
+        validator_error_codes = get_validator_error_codes(validator_class)
+        if validator_error_codes is None:
+            return True
+        should_run = BaseValidator(
+            ignored_errors=pack_error_ignore_list,
+            specific_validations=self.specific_validations,
+        ).should_report_any(validator_error_codes, file_path)
+        if not should_run:
+            logger.debug(
+                f"Skipping {validator_class.__name__} for {file_path}, none of its errors would be reported"
+            )
+        return should_run
+
+    @profile_file_validation
     def run_validations_on_file(
         self,
         file_path,
@@ -867,6 +1194,9 @@ class ValidateManager:
         # id_set validation
         if (
             self.id_set_validations
+            and self.should_run_validator(
+                IDSetValidations, file_path, pack_error_ignore_list
+            )
             and not self.id_set_validations.is_file_valid_in_set(
                 file_path, file_type, pack_error_ignore_list
             )
@@ -916,6 +1246,10 @@ class ValidateManager:
             return self.validate_description(file_path, pack_error_ignore_list)
 
         elif file_type == FileType.README:
+            if not self.should_run_validator(
+                ReadMeValidator, file_path, pack_error_ignore_list
+            ):
+                return True
             if not self.is_possible_validate_readme:
                 error_message, error_code = Errors.error_uninstall_node()
                 if self.handle_error(
@@ -1287,6 +1621,7 @@ class ValidateManager:
 
         validation_results = {valid_git_setup, valid_types}
 
+        self.prefetch_old_files(modified_files | old_format_files)
         validation_results.add(
             self.validate_modified_files(modified_files | old_format_files)
         )
@@ -1502,7 +1837,12 @@ class ValidateManager:
         integration_validator = IntegrationValidator(
             structure_validator,
             ignored_errors=pack_error_ignore_list,
-            skip_docker_check=self.skip_docker_checks,
+            skip_docker_check=self.skip_docker_checks
+            or not self.should_run_validator(
+                DockerImageValidator,
+                structure_validator.file_path,
+                pack_error_ignore_list,
+            ),
             json_file_path=self.json_file_path,
             validate_all=self.validate_all,
             deprecation_validator=self.deprecation_validator,
@@ -1546,7 +1886,12 @@ class ValidateManager:
         script_validator = ScriptValidator(
             structure_validator,
             ignored_errors=pack_error_ignore_list,
-            skip_docker_check=self.skip_docker_checks,
+            skip_docker_check=self.skip_docker_checks
+            or not self.should_run_validator(
+                DockerImageValidator,
+                structure_validator.file_path,
+                pack_error_ignore_list,
+            ),
             json_file_path=self.json_file_path,
             validate_all=self.validate_all,
             deprecation_validator=self.deprecation_validator,
@@ -1578,7 +1923,12 @@ class ValidateManager:
         integration_validator = IntegrationValidator(
             structure_validator,
             ignored_errors=pack_error_ignore_list,
-            skip_docker_check=self.skip_docker_checks,
+            skip_docker_check=self.skip_docker_checks
+            or not self.should_run_validator(
+                DockerImageValidator,
+                structure_validator.file_path,
+                pack_error_ignore_list,
+            ),
             json_file_path=self.json_file_path,
             validate_all=self.validate_all,
             using_git=self.use_git,
@@ -1909,6 +2259,7 @@ class ValidateManager:
 
         return generic_definition_validator.is_valid_file(validate_rn=False)
 
+    @profile_file_validation
     def validate_pack_unique_files(
         self, pack_path: str, pack_error_ignore_list: dict, should_version_raise=False
     ) -> bool:
@@ -1982,6 +2333,23 @@ class ValidateManager:
         """
         return file_path[:2] if isinstance(file_path, tuple) else (file_path, file_path)
 
+    def prefetch_old_files(self, modified_files: set):
+        """
+        Reads the previous version of the modified files, and of the metadata of their packs, in a single batch.
+        The backward compatibility checks of the files then get them without spawning git for every file.
+        Args:
+            modified_files: The modified files.
+        """
+        old_file_paths = set()
+        for file_path in modified_files:
+            old_file_path, _ = self.get_old_file_path(file_path)
+            old_file_paths.add(str(old_file_path))
+            if pack_name := get_pack_name(str(old_file_path)):
+                old_file_paths.add(
+                    os.path.join(PACKS_DIR, pack_name, PACKS_PACK_META_FILE_NAME)
+                )
+        prefetch_remote_files(old_file_paths, tag=self.prev_ver)
+
     def get_all_files_edited_in_pack_ignore(self, modified_files: set) -> set:
         """
         Extract all the files the file paths of files that there pack-ignore section was ignored somehow.
@@ -2049,17 +2417,17 @@ class ValidateManager:
         logger.info(
             "\n[cyan]================= Running validation on modified files =================[/cyan]"
         )
-        valid_files = set()
         all_files_edited_in_pack_ignore = self.get_all_files_edited_in_pack_ignore(
             modified_files
         )
+        tasks = []
         for file_path in modified_files.union(all_files_edited_in_pack_ignore):
             # handle renamed files
             old_file_path, file_path = self.get_old_file_path(file_path)
 
             pack_name = get_pack_name(file_path)
-            valid_files.add(
-                self.run_validations_on_file(
+            tasks.append(
+                FileValidationTask(
                     file_path,
                     self.get_error_ignore_list(pack_name),
                     is_modified=file_path in modified_files,
@@ -2067,26 +2435,24 @@ class ValidateManager:
                 )
             )
 
-        return all(valid_files)
+        return all(set(self.run_validations_on_files(tasks)))
 
     def validate_added_files(self, added_files, modified_files):
         logger.info(
             "\n[cyan]================= Running validation on newly added files =================[/cyan]"
         )
 
-        valid_files = set()
-        for file_path in added_files:
-            pack_name = get_pack_name(file_path)
-            valid_files.add(
-                self.run_validations_on_file(
-                    file_path,
-                    self.get_error_ignore_list(pack_name),
-                    is_modified=False,
-                    modified_files=modified_files,
-                    added_files=added_files,
-                )
+        tasks = [
+            FileValidationTask(
+                file_path,
+                self.get_error_ignore_list(get_pack_name(file_path)),
+                is_modified=False,
+                modified_files=modified_files,
+                added_files=added_files,
             )
-        return all(valid_files)
+            for file_path in added_files
+        ]
+        return all(set(self.run_validations_on_files(tasks)))
 
     @staticmethod
     def should_raise_pack_version(pack: str) -> bool:
@@ -2766,6 +3132,22 @@ class ValidateManager:
             )
 
     def get_error_ignore_list(self, pack_name="", config=None):
+        # the .pack-ignore of a pack is parsed again only once it changed, as the ignore list is read for every file
+        if pack_name:
+            try:
+                pack_ignore_content = Path(
+                    get_pack_ignore_file_path(pack_name)
+                ).read_bytes()
+            except OSError:
+                return self.read_error_ignore_list(pack_name)
+            cached = self.pack_error_ignore_lists.get(pack_name)
+            if cached is None or cached[0] != pack_ignore_content:
+                cached = (pack_ignore_content, self.read_error_ignore_list(pack_name))
+                self.pack_error_ignore_lists[pack_name] = cached
+            return copy.deepcopy(cached[1])
+        return self.read_error_ignore_list(pack_name, config)
+
+    def read_error_ignore_list(self, pack_name="", config=None):
         ignored_errors_list: dict = {}
         if pack_name:
             config = get_pack_ignore_content(pack_name)
@@ -2901,7 +3283,7 @@ class ValidateManager:
                 id_set, _, _ = IDSetCreator(print_logs=False).create_id_set()
 
         else:
-            id_set = open_id_set_file(id_set_path)
+            id_set = get_id_set(id_set_path)
 
         if not id_set and not self.no_configuration_prints:
             error_message, error_code = Errors.no_id_set_file()
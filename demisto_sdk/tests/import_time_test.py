@@ -0,0 +1,108 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+# modules that are only needed by specific commands, and must never be imported by the CLI entry point
+HEAVY_MODULES = (
+    "demisto_client",
+    "demisto_sdk.commands.common.content_constant_paths",
+    "demisto_sdk.commands.common.tools",
+    "demisto_sdk.commands.content_graph",
+    "demisto_sdk.commands.test_content",
+    "demisto_sdk.commands.validate",
+    "git",
+    "neo4j",
+    "typer",
+)
+# cumulative import time of the CLI entry point, generous enough not to be flaky on CI machines
+IMPORT_TIME_BUDGET_MS = int(os.getenv("DEMISTO_SDK_IMPORT_TIME_BUDGET_MS", 1000))
+
+
+def get_import_times(module: str) -> Dict[str, int]:
+    """
+    Imports a module in a fresh interpreter, with `python -X importtime`.
+
+    Returns:
+        The cumulative import time (in microseconds) of every module that was imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+@pytest.fixture(scope="module")
+def main_import_times() -> Dict[str, int]:
+    return get_import_times("demisto_sdk.__main__")
+
+
+def test_command_implementations_are_not_imported(main_import_times):
+    """
+    Given
+        - The demisto-sdk CLI entry point
+    When
+        - Importing it (e.g. when running `demisto-sdk --help`)
+    Then
+        - Ensure the implementations of the commands are not imported
+    """
+    imported_heavy_modules = sorted(
+        name
+        for name in main_import_times
+        if any(
+            name == heavy_module or name.startswith(f"{heavy_module}.")
+            for heavy_module in HEAVY_MODULES
+        )
+    )
+    assert not imported_heavy_modules
+
+
+def test_import_time_budget(main_import_times):
+    """
+    Given
+        - The demisto-sdk CLI entry point
+    When
+        - Importing it
+    Then
+        - Ensure it is imported within the startup latency budget
+    """
+    import_time_ms = main_import_times["demisto_sdk.__main__"] / 1000
+    assert import_time_ms < IMPORT_TIME_BUDGET_MS
+
+
+def test_commands_help():
+    """
+    Given
+        - The demisto-sdk CLI entry point, with commands that are loaded lazily
+    When
+        - Running `demisto-sdk --help`
+    Then
+        - Ensure every command is listed with a help line
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "demisto_sdk", "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+    commands = result.stdout.split("Commands:\n", 1)[1]
+    # a command row starts with its name, the wrapped lines of its help are indented further
+    rows = [
+        line.split(maxsplit=1) for line in commands.splitlines() if line[2:3].strip()
+    ]
+    assert "generate-modeling-rules" in [row[0] for row in rows]
+    assert [row[0] for row in rows if len(row) < 2] == []
@@ -0,0 +1,67 @@
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import click
+
+
+class LazyCommand(NamedTuple):
+    loader: Callable[[], click.Command]
+    hidden: bool
+    short_help: str
+
+
+class LazyGroup(click.Group):
+    """
+    A click group whose sub commands can be registered lazily.
+
+    A lazy command is registered with a loader, which imports its implementation and returns the click command.
+    The loader is called only when the command is run, the group help lists it without loading it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, LazyCommand] = {}
+
+    def add_lazy_command(
+        self,
+        name: str,
+        loader: Callable[[], click.Command],
+        hidden: bool = False,
+        short_help: str = "",
+    ):
+        self.lazy_commands[name] = LazyCommand(loader, hidden, short_help)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self.lazy_commands[cmd_name].loader(), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """Like click.Group.format_commands, with the registered help of the lazy commands that were not loaded."""
+        commands = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_commands and name not in self.commands:
+                lazy_command = self.lazy_commands[name]
+                if not lazy_command.hidden:
+                    commands.append((name, lazy_command.short_help))
+                continue
+            command = self.get_command(ctx, name)
+            if command is None or command.hidden:
+                continue
+            commands.append((name, command))
+        if not commands:
+            return
+        limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+        rows = [
+            (
+                name,
+                command
+                if isinstance(command, str)
+                else command.get_short_help_str(limit),
+            )
+            for name, command in commands
+        ]
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
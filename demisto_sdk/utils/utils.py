@@ -1,22 +1,26 @@
 from configparser import ConfigParser, MissingSectionHeaderError
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.json_content_object import (
-    JSONContentObject,
-)
-from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_content_object import (
-    YAMLContentObject,
-)
-from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_unify_content_object import (
-    YAMLContentUnifiedObject,
-)
-from demisto_sdk.commands.common.content.objects.pack_objects.pack import Pack
+if TYPE_CHECKING:
+    # the content objects are heavy to import, and this module is imported by the CLI entry point
+    from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.json_content_object import (
+        JSONContentObject,
+    )
+    from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_content_object import (
+        YAMLContentObject,
+    )
+    from demisto_sdk.commands.common.content.objects.pack_objects.abstract_pack_objects.yaml_unify_content_object import (
+        YAMLContentUnifiedObject,
+    )
+    from demisto_sdk.commands.common.content.objects.pack_objects.pack import Pack
 
-ContentEntity = Union[YAMLContentUnifiedObject, YAMLContentObject, JSONContentObject]
+ContentEntity = Union[
+    "YAMLContentUnifiedObject", "YAMLContentObject", "JSONContentObject"
+]
 
 
-def get_containing_pack(content_entity: ContentEntity) -> Pack:
+def get_containing_pack(content_entity: ContentEntity) -> "Pack":
     """Get pack object that contains the content entity.
 
     Args:
@@ -25,6 +29,8 @@ def get_containing_pack(content_entity: ContentEntity) -> Pack:
     Returns:
         Pack: Pack object that contains the content entity.
     """
+    from demisto_sdk.commands.common.content.objects.pack_objects.pack import Pack
+
     pack_path = content_entity.path
     while pack_path.parent.name.casefold() != "packs":
         pack_path = pack_path.parent